@@ -149,10 +149,13 @@ from .ops.ops_alpha_manager import (
 from .ops.ops_shots import (
     LIME_OT_new_shot,
     LIME_OT_duplicate_shot,
+    LIME_OT_make_shot_data_unique,
     LIME_OT_activate_shot,
     LIME_OT_delete_shot,
     LIME_OT_jump_to_first_shot_marker,
     LIME_OT_render_shots_from_markers,
+    LIME_OT_render_shots_background_cancel,
+    LIME_OT_render_shots_background_retry,
 )
 from .ops.ops_add_missing import (
     LIME_OT_add_missing_collections,
@@ -283,10 +286,13 @@ NON_PANEL_CLASSES = (
     LIME_TB_OT_noise_group_paste,
     LIME_OT_new_shot,
     LIME_OT_duplicate_shot,
+    LIME_OT_make_shot_data_unique,
     LIME_OT_activate_shot,
     LIME_OT_delete_shot,
     LIME_OT_jump_to_first_shot_marker,
     LIME_OT_render_shots_from_markers,
+    LIME_OT_render_shots_background_cancel,
+    LIME_OT_render_shots_background_retry,
     LIME_OT_add_missing_collections,
     LIME_OT_rev_prev,
     LIME_OT_rev_next,
@@ -573,6 +579,12 @@ def register():
     if _on_load_post not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(_on_load_post)
 
+    try:
+        from .core.validate_scene import register_hierarchy_handlers
+        register_hierarchy_handlers()
+    except Exception:
+        pass
+
     try:
         ensure_auto_bg_live_updates(scene=bpy.context.scene, force_update=False)
     except Exception:
@@ -636,6 +648,16 @@ def unregister():
         bpy.app.handlers.load_post.remove(_on_load_post)
     except Exception:
         pass
+    try:
+        from .core.validate_scene import unregister_hierarchy_handlers
+        unregister_hierarchy_handlers()
+    except Exception:
+        pass
+    try:
+        from .ops.ops_shots import shutdown_background_render
+        shutdown_background_render()
+    except Exception:
+        pass
 
 @persistent
 def _on_load_post(dummy):
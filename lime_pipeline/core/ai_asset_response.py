@@ -45,6 +45,30 @@ def parse_items_from_response(parsed: Optional[Dict[str, object]]) -> Optional[L
     return None
 
 
+def validate_id_coverage(returned_ids: List[str], expected_ids: Iterable[str]) -> Optional[str]:
+    """Return an error unless returned_ids covers expected_ids exactly once each."""
+    expected_list = [str(value or "").strip() for value in list(expected_ids)]
+    expected_list = [value for value in expected_list if value]
+    expected_set = set(expected_list)
+    if len(expected_set) != len(expected_list):
+        return "Internal error: expected IDs contain duplicates"
+    seen_ids = set(returned_ids)
+    missing = sorted(expected_set.difference(seen_ids))
+    unexpected = sorted(seen_ids.difference(expected_set))
+    if missing or unexpected:
+        if missing and unexpected:
+            return (
+                "AI response IDs mismatch. "
+                f"Missing: {', '.join(missing[:8])}. Unexpected: {', '.join(unexpected[:8])}."
+            )
+        if missing:
+            return f"AI response missing IDs: {', '.join(missing[:8])}."
+        return f"AI response returned unexpected IDs: {', '.join(unexpected[:8])}."
+    if len(returned_ids) != len(expected_list):
+        return "AI response must include exactly one item per requested ID"
+    return None
+
+
 def validate_items_payload(
     items: Optional[List[Dict[str, object]]],
     *,
@@ -92,24 +116,9 @@ def validate_items_payload(
         seen_ids.add(item_id)
 
     if expected_ids is not None:
-        expected_list = [str(value or "").strip() for value in list(expected_ids)]
-        expected_list = [value for value in expected_list if value]
-        expected_set = set(expected_list)
-        if len(expected_set) != len(expected_list):
-            return None, "Internal error: expected IDs contain duplicates"
-        missing = sorted(expected_set.difference(seen_ids))
-        unexpected = sorted(seen_ids.difference(expected_set))
-        if missing or unexpected:
-            if missing and unexpected:
-                return None, (
-                    "AI response IDs mismatch. "
-                    f"Missing: {', '.join(missing[:8])}. Unexpected: {', '.join(unexpected[:8])}."
-                )
-            if missing:
-                return None, f"AI response missing IDs: {', '.join(missing[:8])}."
-            return None, f"AI response returned unexpected IDs: {', '.join(unexpected[:8])}."
-        if len(out) != len(expected_list):
-            return None, "AI response must include exactly one item per requested ID"
+        coverage_error = validate_id_coverage([entry["id"] for entry in out], expected_ids)
+        if coverage_error:
+            return None, coverage_error
 
     return out, None
 
@@ -134,5 +143,6 @@ __all__ = [
     "parse_items_from_response",
     "parse_items_from_response_strict",
     "validate_items_payload",
+    "validate_id_coverage",
     "sanitize_target_collection_hint",
 ]
@@ -0,0 +1,283 @@
+"""Scheduling state for multi-frame AI render conversions (no Blender dependency).
+
+The AI Render Converter queue keeps a bounded number of remote jobs in flight
+and polls every active job from a single timer. This module owns the
+bookkeeping only: which jobs to submit next, which are due for a status poll,
+and a backoff shared by the whole queue so a rate limit (HTTP 429) slows every
+request down instead of each job backing off on its own.
+
+Rules:
+- Do not import bpy here; network calls and file I/O live in the operator.
+- Callers pass ``now`` explicitly (``time.monotonic()``) so behavior is testable.
+- Statuses passed in are the normalized ones used by the converter
+  (QUEUED, PROCESSING, COMPLETED, FAILED, CANCELLED).
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import random
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+JOB_PENDING = "PENDING"
+JOB_SUBMITTING = "SUBMITTING"
+JOB_QUEUED = "QUEUED"
+JOB_PROCESSING = "PROCESSING"
+JOB_DOWNLOADING = "DOWNLOADING"
+JOB_COMPLETED = "COMPLETED"
+JOB_FAILED = "FAILED"
+JOB_CANCELLED = "CANCELLED"
+
+# Jobs that occupy a service slot (count against max_in_flight).
+IN_FLIGHT_STATUSES = frozenset({JOB_SUBMITTING, JOB_QUEUED, JOB_PROCESSING})
+REMOTE_STATUSES = frozenset({JOB_QUEUED, JOB_PROCESSING})
+TERMINAL_STATUSES = frozenset({JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED})
+
+DEFAULT_MAX_IN_FLIGHT = 3
+DEFAULT_POLL_INTERVAL = 2.0
+DEFAULT_MAX_POLL_INTERVAL = 15.0
+DEFAULT_MAX_SUBMIT_ATTEMPTS = 5
+
+
+def parse_frame_list(text: str) -> List[int]:
+    """Parse ``"1, 12, 20-24"`` into sorted unique frames; raises ValueError on bad tokens."""
+    frames = set()
+    for raw in (text or "").replace(";", ",").split(","):
+        token = raw.strip()
+        if not token:
+            continue
+        head, sep, tail = token.partition("-")
+        if sep and head.strip():
+            start, end = int(head), int(tail)
+            if end < start:
+                start, end = end, start
+            frames.update(range(start, end + 1))
+        else:
+            frames.add(int(token))
+    return sorted(frames)
+
+
+def cancel_when_submitted(future: Future, cancel: Callable[[str], None]) -> None:
+    """Cancel the remote job a submit future creates once it resolves.
+
+    Used when the queue is cancelled while a submission is still in flight: the request
+    cannot be interrupted, so the job it creates is cancelled as soon as its id is known.
+    Futures that were cancelled before running, failed, or returned no job id are ignored.
+    """
+
+    def _on_done(done: Future) -> None:
+        if done.cancelled() or done.exception() is not None:
+            return
+        result = done.result()
+        job_id = str(result.get("job_id") or "") if isinstance(result, dict) else ""
+        if job_id:
+            cancel(job_id)
+
+    future.add_done_callback(_on_done)
+
+
+@dataclass
+class ConversionJob:
+    """One frame to convert. ``payload`` carries caller data (context, paths, prompt)."""
+
+    key: str
+    frame: int
+    payload: Dict[str, object] = field(default_factory=dict)
+    status: str = JOB_PENDING
+    job_id: str = ""
+    message: str = ""
+    submit_attempts: int = 0
+    poll_interval: float = DEFAULT_POLL_INTERVAL
+    next_poll_at: float = 0.0
+
+
+class SharedBackoff:
+    """Jittered exponential backoff shared by every job of a queue."""
+
+    def __init__(self, *, base_delay: float = 2.0, max_delay: float = 60.0, rng: Optional[random.Random] = None) -> None:
+        self.base_delay = max(0.01, float(base_delay))
+        self.max_delay = max(self.base_delay, float(max_delay))
+        self.level = 0
+        self.blocked_until = 0.0
+        self._rng = rng or random.Random()
+
+    def ready(self, now: float) -> bool:
+        return now >= self.blocked_until
+
+    def penalize(self, now: float) -> float:
+        """Register a rate limit; repeated hits inside the current window do not stack."""
+        if now < self.blocked_until:
+            return self.blocked_until
+        self.level += 1
+        delay = min(self.max_delay, self.base_delay * (2 ** (self.level - 1)))
+        # "Equal jitter": keep at least half of the delay, randomize the rest.
+        self.blocked_until = now + delay / 2.0 + self._rng.uniform(0.0, delay / 2.0)
+        return self.blocked_until
+
+    def relax(self) -> None:
+        if self.level > 0:
+            self.level -= 1
+
+
+class ConversionQueue:
+    """Bounded-concurrency scheduler for conversion jobs."""
+
+    def __init__(
+        self,
+        jobs: Sequence[ConversionJob],
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        max_submit_attempts: int = DEFAULT_MAX_SUBMIT_ATTEMPTS,
+        backoff: Optional[SharedBackoff] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.jobs: List[ConversionJob] = list(jobs)
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.poll_interval = max(0.1, float(poll_interval))
+        self.max_poll_interval = max(self.poll_interval, float(max_poll_interval))
+        self.max_submit_attempts = max(1, int(max_submit_attempts))
+        self._rng = rng or random.Random()
+        self.backoff = backoff or SharedBackoff(rng=self._rng)
+
+    def _jittered(self, interval: float) -> float:
+        return interval * self._rng.uniform(0.8, 1.2)
+
+    def in_flight(self) -> int:
+        return sum(1 for job in self.jobs if job.status in IN_FLIGHT_STATUSES)
+
+    def take_submissions(self, now: float) -> List[ConversionJob]:
+        """Mark pending jobs as SUBMITTING up to the concurrency limit and return them."""
+        if not self.backoff.ready(now):
+            return []
+        free = self.max_in_flight - self.in_flight()
+        taken: List[ConversionJob] = []
+        for job in self.jobs:
+            if free <= 0:
+                break
+            if job.status != JOB_PENDING:
+                continue
+            job.status = JOB_SUBMITTING
+            job.submit_attempts += 1
+            job.message = "Submitting"
+            taken.append(job)
+            free -= 1
+        return taken
+
+    def mark_submitted(self, job: ConversionJob, job_id: str, status: str, now: float) -> None:
+        job.job_id = job_id
+        job.status = JOB_PROCESSING if status == JOB_PROCESSING else JOB_QUEUED
+        job.message = f"Job created: {job_id}"
+        job.poll_interval = self.poll_interval
+        job.next_poll_at = now + self._jittered(job.poll_interval)
+        self.backoff.relax()
+
+    def mark_submit_failed(self, job: ConversionJob, message: str, now: float, *, rate_limited: bool = False) -> None:
+        """Return a rate-limited submission to the pending pool, or fail the job."""
+        if rate_limited and job.submit_attempts < self.max_submit_attempts:
+            self.backoff.penalize(now)
+            job.status = JOB_PENDING
+            job.message = "Rate limited, waiting to resubmit"
+            return
+        job.status = JOB_FAILED
+        job.message = message
+
+    def due_for_poll(self, now: float) -> List[ConversionJob]:
+        if not self.backoff.ready(now):
+            return []
+        return [job for job in self.jobs if job.status in REMOTE_STATUSES and job.next_poll_at <= now]
+
+    def record_poll(self, job: ConversionJob, status: str, now: float, *, message: str = "") -> None:
+        """Apply a normalized poll status. Running jobs slow their own polling down gradually."""
+        if job.status not in REMOTE_STATUSES:
+            return
+        self.backoff.relax()
+        if status in (JOB_QUEUED, JOB_PROCESSING):
+            job.status = status
+            job.message = message or f"{status.title()} on service"
+            job.poll_interval = min(self.max_poll_interval, job.poll_interval * 1.5)
+            job.next_poll_at = now + self._jittered(job.poll_interval)
+            return
+        if status == JOB_COMPLETED:
+            job.status = JOB_DOWNLOADING
+            job.message = "Downloading results"
+            return
+        job.status = JOB_CANCELLED if status == JOB_CANCELLED else JOB_FAILED
+        job.message = message or ("Cancelled on service" if status == JOB_CANCELLED else "Job failed")
+
+    def record_rate_limited(self, job: ConversionJob, now: float) -> None:
+        until = self.backoff.penalize(now)
+        job.message = "Rate limited, retrying"
+        job.next_poll_at = max(job.next_poll_at, until)
+
+    def mark_completed(self, job: ConversionJob, message: str = "Completed") -> None:
+        job.status = JOB_COMPLETED
+        job.message = message
+
+    def mark_failed(self, job: ConversionJob, message: str) -> None:
+        job.status = JOB_FAILED
+        job.message = message
+
+    def cancel_all(self) -> List[ConversionJob]:
+        """Cancel every unfinished job; returns the ones that exist remotely (need a cancel request)."""
+        remote: List[ConversionJob] = []
+        for job in self.jobs:
+            if job.status in TERMINAL_STATUSES:
+                continue
+            if job.job_id and job.status in REMOTE_STATUSES:
+                remote.append(job)
+            job.status = JOB_CANCELLED
+            job.message = "Cancelled by user"
+        return remote
+
+    def is_done(self) -> bool:
+        return all(job.status in TERMINAL_STATUSES for job in self.jobs)
+
+    def counts(self) -> Dict[str, int]:
+        out = {
+            "total": len(self.jobs),
+            "pending": 0,
+            "active": 0,
+            "downloading": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+        }
+        for job in self.jobs:
+            if job.status == JOB_PENDING:
+                out["pending"] += 1
+            elif job.status in IN_FLIGHT_STATUSES:
+                out["active"] += 1
+            elif job.status == JOB_DOWNLOADING:
+                out["downloading"] += 1
+            elif job.status == JOB_COMPLETED:
+                out["completed"] += 1
+            elif job.status == JOB_FAILED:
+                out["failed"] += 1
+            elif job.status == JOB_CANCELLED:
+                out["cancelled"] += 1
+        return out
+
+
+__all__ = [
+    "ConversionJob",
+    "ConversionQueue",
+    "DEFAULT_MAX_IN_FLIGHT",
+    "IN_FLIGHT_STATUSES",
+    "JOB_CANCELLED",
+    "JOB_COMPLETED",
+    "JOB_DOWNLOADING",
+    "JOB_FAILED",
+    "JOB_PENDING",
+    "JOB_PROCESSING",
+    "JOB_QUEUED",
+    "JOB_SUBMITTING",
+    "REMOTE_STATUSES",
+    "SharedBackoff",
+    "TERMINAL_STATUSES",
+    "cancel_when_submitted",
+    "parse_frame_list",
+]
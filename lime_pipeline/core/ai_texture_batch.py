@@ -0,0 +1,195 @@
+"""Prompt/schema helpers for batched AI texture naming (no Blender dependency).
+
+Packs several textures into one chat completion keyed by item ID and validates
+that the response covers every requested ID exactly once (same contract as
+``core.ai_asset_response``).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .ai_asset_response import validate_id_coverage
+from .texture_naming import sanitize_filename_stem
+
+
+TEXTURE_BATCH_MAX_ITEMS = 24
+TEXTURE_BATCH_CHAR_BUDGET = 160_000
+_ITEM_BASE_CHARS = 240
+_MAX_SOCKET_TARGETS = 10
+_MAX_STEM_LEN = 96
+
+
+def texture_item_id(index: int) -> str:
+    """Return the batch-local ID used for the item at index (0-based)."""
+    return f"tx_{int(index) + 1:03d}"
+
+
+def schema_texture_batch() -> Dict[str, object]:
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "texture_namer_batch",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "required": ["items"],
+                "additionalProperties": False,
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "required": ["id", "stem", "map_type"],
+                            "additionalProperties": False,
+                            "properties": {
+                                "id": {"type": "string"},
+                                "stem": {"type": "string"},
+                                "map_type": {"type": "string"},
+                                "explanation": {"type": "string"},
+                                "image_summary": {"type": "string"},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+
+def texture_batch_system_prompt() -> str:
+    return "\n".join(
+        [
+            "You help a Blender pipeline simplify texture filenames.",
+            "Return ONLY JSON: {\"items\": [{\"id\", \"stem\", \"map_type\", \"explanation\"}]}.",
+            "Return exactly one entry per input texture id; never invent or drop ids.",
+            "stem must be filename-safe using letters, digits, underscore only.",
+            "Keep context from the original filename and avoid generic map-only names.",
+            "If a manual hint is provided, prioritize that intent while keeping it concise.",
+            "map_type must be one of Generic, BaseColor, Normal, Roughness, Metallic, AO, Alpha, Height, Emission.",
+            "Preview images, when attached, are each preceded by a 'Preview for <id>:' line.",
+        ]
+    )
+
+
+def texture_batch_entry(
+    item_id: str,
+    *,
+    original_filename: str,
+    material_name: str,
+    map_type: str,
+    socket_targets: Sequence[str],
+    manual_hint: str = "",
+    prior_suggestion: str = "",
+    has_preview: bool = False,
+) -> Dict[str, object]:
+    entry: Dict[str, object] = {
+        "id": item_id,
+        "original_filename": original_filename or "",
+        "material": material_name or "",
+        "map_type": map_type or "Generic",
+        "socket_targets": [str(v) for v in list(socket_targets or [])[:_MAX_SOCKET_TARGETS]],
+    }
+    if manual_hint:
+        entry["manual_hint"] = manual_hint
+    if prior_suggestion:
+        entry["prior_suggestion"] = prior_suggestion
+    if has_preview:
+        entry["preview"] = True
+    return entry
+
+
+def build_texture_batch_text(entries: Sequence[Mapping[str, object]]) -> str:
+    return "Textures:\n" + json.dumps({"textures": list(entries)}, ensure_ascii=False, separators=(",", ":"))
+
+
+def estimate_entry_chars(entry: Mapping[str, object], *, preview_chars: int = 0) -> int:
+    return _ITEM_BASE_CHARS + len(json.dumps(entry, ensure_ascii=False)) + max(0, int(preview_chars))
+
+
+def plan_texture_batches(
+    costs: Sequence[int],
+    *,
+    budget_chars: int = TEXTURE_BATCH_CHAR_BUDGET,
+    max_items: int = TEXTURE_BATCH_MAX_ITEMS,
+) -> List[List[int]]:
+    """Group item indices into batches bounded by a char budget and an item cap.
+
+    Order is preserved; an item larger than the budget gets a batch of its own.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    cap = max(1, int(max_items))
+    budget = max(1, int(budget_chars))
+    for index, cost in enumerate(costs):
+        cost = max(0, int(cost))
+        if current and (len(current) >= cap or used + cost > budget):
+            batches.append(current)
+            current = []
+            used = 0
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_texture_batch_response(
+    parsed: Optional[Mapping[str, object]],
+    *,
+    expected_ids: Iterable[str],
+) -> Tuple[Optional[Dict[str, Dict[str, str]]], Optional[str]]:
+    """Validate a batch response; returns ``{id: {stem, map_type, explanation, image_summary}}``."""
+    if not isinstance(parsed, Mapping):
+        return None, "AI response did not contain a JSON object"
+    items = parsed.get("items")
+    if not isinstance(items, list):
+        return None, "AI response did not include a valid items list"
+
+    out: Dict[str, Dict[str, str]] = {}
+    returned_ids: List[str] = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            return None, f"AI response item at index {index} is not an object"
+        item_id_raw = item.get("id")
+        stem_raw = item.get("stem")
+        if not isinstance(item_id_raw, str) or not isinstance(stem_raw, str):
+            return None, f"AI response item at index {index} must include string 'id' and 'stem'"
+        item_id = item_id_raw.strip()
+        stem = stem_raw.strip()
+        if not item_id:
+            return None, f"AI response item at index {index} has empty id"
+        if item_id in out:
+            return None, f"AI response contains duplicated id '{item_id}'"
+        if len(stem) > _MAX_STEM_LEN:
+            # Over-long names are trimmed rather than failing the whole batch.
+            stem = sanitize_filename_stem(stem, max_len=_MAX_STEM_LEN)[:_MAX_STEM_LEN]
+        entry = {"stem": stem}
+        for key in ("map_type", "explanation", "image_summary"):
+            value = item.get(key)
+            if value is not None and not isinstance(value, str):
+                return None, f"AI response item '{item_id}' has non-string {key}"
+            entry[key] = (value or "").strip()
+        out[item_id] = entry
+        returned_ids.append(item_id)
+
+    coverage_error = validate_id_coverage(returned_ids, expected_ids)
+    if coverage_error:
+        return None, coverage_error
+    return out, None
+
+
+__all__ = [
+    "TEXTURE_BATCH_CHAR_BUDGET",
+    "TEXTURE_BATCH_MAX_ITEMS",
+    "build_texture_batch_text",
+    "estimate_entry_chars",
+    "parse_texture_batch_response",
+    "plan_texture_batches",
+    "schema_texture_batch",
+    "texture_batch_entry",
+    "texture_batch_system_prompt",
+    "texture_item_id",
+]
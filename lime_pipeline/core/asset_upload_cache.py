@@ -0,0 +1,143 @@
+"""Persistent content-hash cache of uploaded AI service assets (no Blender dependency).
+
+Maps the SHA-256 of a file to the asset reference (id/url) returned by the
+service, so unchanged source renders and style references are uploaded once
+and reused by retries and batch runs while the reference is still valid.
+
+Rules:
+- Do not import bpy here.
+- Entries expire after ``ttl_seconds`` (wall clock, persisted across sessions);
+  callers validate a reference once per session before trusting it
+  (``needs_validation`` / ``mark_validated``) and ``invalidate`` it on failure.
+- File digests are memoized by size/mtime so unchanged files are not rehashed.
+- Safe to share between worker threads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Dict, Optional, Set
+
+from .jsonl_log import atomic_write_json
+
+
+DEFAULT_TTL_SECONDS = 12 * 3600
+_CACHE_VERSION = 1
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class AssetUploadCache:
+    """Digest -> uploaded asset reference, stored as a small JSON file."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = max(1.0, float(ttl_seconds))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._assets: Dict[str, Dict[str, object]] = {}
+        self._files: Dict[str, Dict[str, str]] = {}
+        self._validated: Set[str] = set()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return
+        assets = data.get("assets")
+        files = data.get("files")
+        if isinstance(assets, dict):
+            self._assets = {str(k): v for k, v in assets.items() if isinstance(v, dict)}
+        if isinstance(files, dict):
+            self._files = {str(k): v for k, v in files.items() if isinstance(v, dict)}
+
+    def _save_locked(self) -> None:
+        now = self._clock()
+        self._assets = {k: v for k, v in self._assets.items() if float(v.get("expires_at", 0) or 0) > now}
+        live_digests = set(self._assets)
+        self._files = {k: v for k, v in self._files.items() if v.get("sha256") in live_digests}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(self.path, {"version": _CACHE_VERSION, "assets": self._assets, "files": self._files})
+        except OSError:
+            pass
+
+    def file_digest(self, file_path: Path) -> str:
+        """Return the SHA-256 of file_path, reusing the stored digest when size/mtime are unchanged."""
+        file_path = Path(file_path)
+        st = os.stat(file_path)
+        signature = f"{int(st.st_size)}:{int(st.st_mtime_ns)}"
+        key = str(file_path)
+        with self._lock:
+            known = self._files.get(key)
+            if known and known.get("sig") == signature and known.get("sha256"):
+                return str(known["sha256"])
+        digest = _sha256_file(file_path)
+        with self._lock:
+            self._files[key] = {"sig": signature, "sha256": digest}
+        return digest
+
+    def lookup(self, digest: str) -> Optional[Dict[str, str]]:
+        """Return the cached ``{"id", "url"}`` for digest, or None when missing/expired."""
+        with self._lock:
+            entry = self._assets.get(digest)
+            if entry is None:
+                return None
+            if float(entry.get("expires_at", 0) or 0) <= self._clock():
+                self._assets.pop(digest, None)
+                self._validated.discard(digest)
+                return None
+            return {"id": str(entry.get("id") or ""), "url": str(entry.get("url") or "")}
+
+    def needs_validation(self, digest: str) -> bool:
+        with self._lock:
+            return digest not in self._validated
+
+    def mark_validated(self, digest: str) -> None:
+        with self._lock:
+            self._validated.add(digest)
+
+    def store(self, digest: str, ref: Dict[str, str]) -> None:
+        """Record a fresh upload; it counts as validated for this session."""
+        now = self._clock()
+        with self._lock:
+            self._assets[digest] = {
+                "id": str(ref.get("id") or ""),
+                "url": str(ref.get("url") or ""),
+                "uploaded_at": now,
+                "expires_at": now + self.ttl_seconds,
+            }
+            self._validated.add(digest)
+            self._save_locked()
+
+    def invalidate(self, digest: str) -> None:
+        with self._lock:
+            self._assets.pop(digest, None)
+            self._validated.discard(digest)
+            self._save_locked()
+
+
+__all__ = [
+    "AssetUploadCache",
+    "DEFAULT_TTL_SECONDS",
+]
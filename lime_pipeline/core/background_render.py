@@ -0,0 +1,261 @@
+"""Background render jobs: render task lists in parallel worker processes (no Blender dependency).
+
+A job splits JSON-friendly render tasks (each with a unique ``key``) into
+shards, writes one manifest per shard and starts one process per shard. The
+processes are headless Blender instances running a worker script that appends
+one progress record per task (``{"key", "status", "error"}``) to its progress
+file. ``poll`` reads the new records and notices workers that exited: tasks a
+worker never reported are failed with its exit code. Failed and cancelled
+tasks can be started again with ``retry_failed``. ``cancel`` only terminates the
+workers (the next ``poll`` reaps them) and ``discard`` deletes the work dir.
+
+Rules:
+- Do not import bpy here; the operator builds tasks and the worker command line.
+- Workers own their output files; this module only tracks task keys.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import shutil
+import subprocess
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .jsonl_log import atomic_write_json
+
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+DEFAULT_WORKERS = 2
+CANCELLED_ERROR = "cancelled"
+
+
+def shard_tasks(tasks: Sequence[dict], shards: int) -> List[List[dict]]:
+    """Split tasks round-robin into at most ``shards`` non-empty lists (order kept within a shard)."""
+    shards = max(1, min(int(shards), len(tasks)))
+    out: List[List[dict]] = [[] for _ in range(shards)]
+    for i, task in enumerate(tasks):
+        out[i % shards].append(task)
+    return [shard for shard in out if shard]
+
+
+def worker_threads(workers: int, cpu_count: Optional[int] = None) -> int:
+    """Render threads per worker so that all workers together use every core."""
+    cpus = cpu_count if cpu_count is not None else (os.cpu_count() or 1)
+    return max(1, int(cpus) // max(1, int(workers)))
+
+
+def read_progress(path: Path, offset: int = 0) -> Tuple[List[dict], int]:
+    """Records appended to path since offset; a trailing partial line is left for the next read."""
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(offset)
+            data = fh.read()
+    except OSError:
+        return [], offset
+    end = data.rfind(b"\n")
+    if end < 0:
+        return [], offset
+    records: List[dict] = []
+    for line in data[: end + 1].splitlines():
+        try:
+            record = json.loads(line.decode("utf-8"))
+        except ValueError:
+            continue
+        if isinstance(record, dict) and record.get("key") is not None:
+            records.append(record)
+    return records, offset + end + 1
+
+
+class _Worker:
+    def __init__(self, name: str, tasks: List[dict], manifest: Path, progress: Path, log: Path) -> None:
+        self.name = name
+        self.tasks = tasks
+        self.manifest = manifest
+        self.progress = progress
+        self.log = log
+        self.process = None
+        self.offset = 0
+        self.reported: set = set()
+        self.exit_code: Optional[int] = None
+
+
+class BackgroundRenderJob:
+    """Tracks render tasks run by worker processes; see the module docstring."""
+
+    def __init__(
+        self,
+        work_dir: Path,
+        command: Callable[[Path], List[str]],
+        *,
+        workers: int = DEFAULT_WORKERS,
+        manifest_extra: Optional[Dict[str, object]] = None,
+        popen: Callable[..., object] = subprocess.Popen,
+    ) -> None:
+        self.work_dir = Path(work_dir)
+        self.command = command
+        self.workers = max(1, int(workers))
+        self.manifest_extra = dict(manifest_extra or {})
+        self._popen = popen
+        self._tasks: Dict[str, dict] = {}
+        self._workers: List[_Worker] = []
+        self._attempt = 0
+        self.done: Dict[str, dict] = {}
+        self.failed: Dict[str, str] = {}
+        self.cancelled = False
+
+    # -- lifecycle ---------------------------------------------------------------------------
+
+    def start(self, tasks: Sequence[dict]) -> int:
+        """Start workers for tasks; returns the number of processes started."""
+        for task in tasks:
+            self._tasks[str(task["key"])] = dict(task)
+        return self._spawn([self._tasks[str(task["key"])] for task in tasks])
+
+    def retry_failed(self) -> int:
+        """Start the failed and cancelled tasks again; returns the number of processes started."""
+        if self.running:
+            return 0
+        tasks = [self._tasks[key] for key in self._tasks if key in self.failed]
+        for task in tasks:
+            self.failed.pop(str(task["key"]), None)
+        self.cancelled = False
+        return self._spawn(tasks)
+
+    def cancel(self, *, wait: bool = False) -> None:
+        """Terminate the workers; `poll` reaps them unless wait reaps them here."""
+        self.cancelled = True
+        for worker in self._workers:
+            proc = worker.process
+            if proc is None or proc.poll() is not None:
+                continue
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+        if wait:
+            for worker in self._workers:
+                self._reap(worker, wait=True)
+
+    def discard(self) -> None:
+        """Stop any running workers and delete the work dir (snapshot, manifests, logs)."""
+        if self.running:
+            self.cancel(wait=True)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _spawn(self, tasks: List[dict]) -> int:
+        if not tasks:
+            return 0
+        self._attempt += 1
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        started = 0
+        for i, shard in enumerate(shard_tasks(tasks, self.workers)):
+            name = f"a{self._attempt:02d}_w{i:02d}"
+            worker = _Worker(
+                name,
+                shard,
+                self.work_dir / f"{name}.json",
+                self.work_dir / f"{name}.progress.jsonl",
+                self.work_dir / f"{name}.log",
+            )
+            manifest = dict(self.manifest_extra)
+            manifest.update({"progress": worker.progress.as_posix(), "tasks": shard})
+            atomic_write_json(worker.manifest, manifest, indent=2)
+            try:
+                with open(worker.log, "w", encoding="utf-8") as log:
+                    kwargs = {"stdout": log, "stderr": subprocess.STDOUT, "stdin": subprocess.DEVNULL}
+                    if os.name == "nt":
+                        kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                    worker.process = self._popen(self.command(worker.manifest), **kwargs)
+                started += 1
+            except Exception as ex:
+                for task in shard:
+                    self.failed[str(task["key"])] = f"could not start worker: {ex}"
+                continue
+            self._workers.append(worker)
+        return started
+
+    # -- progress ----------------------------------------------------------------------------
+
+    def poll(self) -> List[dict]:
+        """Read new progress records and reap exited workers; returns the new records."""
+        events: List[dict] = []
+        for worker in self._workers:
+            if worker.exit_code is not None:
+                continue
+            events.extend(self._read(worker))
+            self._reap(worker, wait=False)
+        return events
+
+    def _read(self, worker: _Worker) -> List[dict]:
+        records, worker.offset = read_progress(worker.progress, worker.offset)
+        for record in records:
+            key = str(record["key"])
+            worker.reported.add(key)
+            if record.get("status") == STATUS_DONE:
+                self.done[key] = record
+                self.failed.pop(key, None)
+            else:
+                self.failed[key] = str(record.get("error") or "render failed")
+        return records
+
+    def _reap(self, worker: _Worker, *, wait: bool) -> None:
+        proc = worker.process
+        if proc is None or worker.exit_code is not None:
+            return
+        code = proc.poll()
+        if code is None and wait:
+            try:
+                code = proc.wait(timeout=10)
+            except Exception:
+                try:
+                    proc.kill()
+                    code = proc.wait(timeout=5)
+                except Exception:
+                    code = -1
+        if code is None:
+            return
+        worker.exit_code = int(code)
+        self._read(worker)
+        reason = CANCELLED_ERROR if self.cancelled else f"worker exited with code {code} (see {worker.log.name})"
+        for task in worker.tasks:
+            key = str(task["key"])
+            if key not in worker.reported and key not in self.done:
+                self.failed[key] = reason
+
+    # -- summary -----------------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return any(worker.exit_code is None and worker.process is not None for worker in self._workers)
+
+    @property
+    def total(self) -> int:
+        return len(self._tasks)
+
+    def task(self, key: str) -> Optional[dict]:
+        """The task started under key (with any extra fields the caller stored on it)."""
+        return self._tasks.get(str(key))
+
+    def summary(self) -> str:
+        text = f"{len(self.done)}/{self.total} rendered"
+        if self.failed:
+            text += f", {len(self.failed)} failed"
+        if self.running:
+            text += f" ({sum(1 for w in self._workers if w.exit_code is None)} worker(s) running)"
+        return text
+
+
+__all__ = [
+    "BackgroundRenderJob",
+    "CANCELLED_ERROR",
+    "DEFAULT_WORKERS",
+    "STATUS_DONE",
+    "STATUS_FAILED",
+    "read_progress",
+    "shard_tasks",
+    "worker_threads",
+]
@@ -0,0 +1,93 @@
+"""Collection ancestry index for SHOT resolution (no Blender dependency).
+
+Built from a scene's master collection in one traversal: a parent map (a
+collection can be linked under several parents) and, for every reachable
+collection, the SHOT roots whose subtree contains it, in SHOT priority order.
+Lookups are dictionary hits instead of a subtree search per SHOT.
+
+Objects only need ``children`` (and ``as_pointer()`` when available), so the
+index works with Blender collections and with plain test doubles.
+
+Rules:
+- Do not import bpy here; caching and invalidation live in `validate_scene`.
+- An index is a snapshot: rebuild it when the collection hierarchy changes.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+
+def collection_key(coll) -> int:
+    try:
+        return int(coll.as_pointer())
+    except Exception:
+        return id(coll)
+
+
+def _children(coll) -> List[object]:
+    try:
+        return list(coll.children)
+    except Exception:
+        return []
+
+
+class CollectionHierarchy:
+    """Parent map plus collection -> containing SHOT roots, for one scene."""
+
+    def __init__(self, root, shot_roots: Sequence[object]) -> None:
+        self.shot_roots = list(shot_roots)
+        self._parents: Dict[int, List[object]] = {collection_key(root): []}
+        self._shots: Dict[int, List[object]] = {collection_key(root): []}
+
+        queue = deque([root])
+        seen = {collection_key(root)}
+        while queue:
+            parent = queue.popleft()
+            for child in _children(parent):
+                key = collection_key(child)
+                self._parents.setdefault(key, []).append(parent)
+                if key not in seen:
+                    seen.add(key)
+                    self._shots[key] = []
+                    queue.append(child)
+
+        for shot in self.shot_roots:
+            stack = [shot]
+            visited = set()
+            while stack:
+                coll = stack.pop()
+                key = collection_key(coll)
+                if key in visited:
+                    continue
+                visited.add(key)
+                self._shots.setdefault(key, []).append(shot)
+                stack.extend(_children(coll))
+
+    def __contains__(self, coll) -> bool:
+        return collection_key(coll) in self._shots
+
+    def __len__(self) -> int:
+        return len(self._shots)
+
+    def parents_of(self, coll) -> List[object]:
+        return list(self._parents.get(collection_key(coll), ()))
+
+    def shots_of(self, coll) -> List[object]:
+        """SHOT roots containing coll (itself included), in SHOT priority order."""
+        return list(self._shots.get(collection_key(coll), ()))
+
+    def shot_root_of(self, coll) -> Optional[object]:
+        shots = self._shots.get(collection_key(coll))
+        return shots[0] if shots else None
+
+    def mark_outside(self, coll) -> None:
+        """Remember that coll is not reachable from this scene (avoids repeated rebuilds)."""
+        self._shots.setdefault(collection_key(coll), [])
+
+
+__all__ = [
+    "CollectionHierarchy",
+    "collection_key",
+]
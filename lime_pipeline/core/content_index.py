@@ -0,0 +1,197 @@
+"""Persistent SHA-256 index of a folder's files for duplicate detection (no Blender dependency).
+
+The index maps file names to their content digest and the stat signature
+(size + mtime) the digest was computed for, plus a digest -> name lookup.
+While the folder's mtime matches the one seen at the last full sync, a
+duplicate lookup only stats the one file the digest points to. Otherwise the
+folder is listed once, every entry whose signature is unchanged is trusted,
+and only new or modified files of the same size as the candidate are hashed.
+Imports update the index (and the synced mtime) directly, so repeated imports
+into a folder nobody else touches never list it again.
+
+Rules:
+- Do not import bpy here.
+- Safe to share between threads (one lock per index).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Dict, Iterable, Optional, Set
+
+from .jsonl_log import atomic_write_json
+
+
+_INDEX_VERSION = 1
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _signature(st: os.stat_result) -> str:
+    return f"{int(st.st_size)}:{int(st.st_mtime_ns)}"
+
+
+class ContentIndex:
+    """File name -> {sig, size, sha256} for one folder, stored as JSON."""
+
+    def __init__(self, folder: Path, index_path: Path, *, extensions: Optional[Iterable[str]] = None) -> None:
+        self.folder = Path(folder)
+        self.index_path = Path(index_path)
+        self.extensions = frozenset(ext.lower() for ext in extensions) if extensions else None
+        self._lock = threading.Lock()
+        self._files: Dict[str, Dict[str, object]] = {}
+        self._dirty = False
+        self._by_digest: Dict[str, str] = {}
+        self._unhashed_sizes: Set[int] = set()
+        # Folder mtime at the last full sync (this session only: saving the index changes it).
+        self._synced_mtime: Optional[int] = None
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict) and data.get("version") == _INDEX_VERSION and isinstance(data.get("files"), dict):
+            self._files = {str(k): v for k, v in data["files"].items() if isinstance(v, dict)}
+        self._rebuild_lookup_locked()
+
+    def _accepts(self, name: str) -> bool:
+        if self.extensions is None:
+            return True
+        return os.path.splitext(name)[1].lower() in self.extensions
+
+    def _folder_mtime(self) -> Optional[int]:
+        try:
+            return int(os.stat(self.folder).st_mtime_ns)
+        except OSError:
+            return None
+
+    def _rebuild_lookup_locked(self) -> None:
+        self._by_digest = {}
+        self._unhashed_sizes = set()
+        for name, entry in self._files.items():
+            digest = str(entry.get("sha256") or "")
+            if digest:
+                self._by_digest.setdefault(digest, name)
+            else:
+                self._unhashed_sizes.add(int(entry.get("size") or 0))
+
+    def find_duplicate(self, digest: str, size: int) -> Optional[Path]:
+        """Return a file of the folder with this content, or None."""
+        with self._lock:
+            mtime = self._folder_mtime()
+            if mtime is not None and mtime == self._synced_mtime:
+                name = self._by_digest.get(digest)
+                if name is not None:
+                    entry = self._files.get(name) or {}
+                    path = self.folder / name
+                    try:
+                        if entry.get("sig") == _signature(os.stat(path)):
+                            return path
+                    except OSError:
+                        pass
+                    # Edited or deleted in place: fall back to a full sync below.
+                elif not (self._unhashed_sizes if size < 0 else size in self._unhashed_sizes):
+                    return None
+            return self._sync_locked(digest, size)
+
+    def _sync_locked(self, digest: str, size: int) -> Optional[Path]:
+        try:
+            with os.scandir(self.folder) as it:
+                listing = {item.name: item for item in it if self._accepts(item.name)}
+        except OSError:
+            return None
+        for name in [name for name in self._files if name not in listing]:
+            del self._files[name]
+            self._dirty = True
+        match: Optional[Path] = None
+        for name, item in listing.items():
+            try:
+                if not item.is_file():
+                    continue
+                st = item.stat()
+            except OSError:
+                continue
+            signature = _signature(st)
+            entry = self._files.get(name)
+            if entry is None or entry.get("sig") != signature:
+                # New or modified file: its digest is computed only if a same-size candidate needs it.
+                entry = {"sig": signature, "size": int(st.st_size), "sha256": ""}
+                self._files[name] = entry
+                self._dirty = True
+            if size >= 0 and int(st.st_size) != size:
+                continue
+            if not entry.get("sha256"):
+                try:
+                    entry["sha256"] = sha256_file(Path(item.path))
+                except OSError:
+                    continue
+                self._dirty = True
+            if match is None and entry["sha256"] == digest:
+                match = Path(item.path)
+        self._save_locked()
+        self._rebuild_lookup_locked()
+        self._synced_mtime = self._folder_mtime()
+        return match
+
+    def add(self, path: Path, digest: str = "") -> None:
+        """Record a file just written into the folder (digest computed when not given)."""
+        path = Path(path)
+        try:
+            st = os.stat(path)
+            digest = digest or sha256_file(path)
+        except OSError:
+            return
+        with self._lock:
+            previous = self._files.get(path.name)
+            self._files[path.name] = {"sig": _signature(st), "size": int(st.st_size), "sha256": digest}
+            self._dirty = True
+            self._save_locked()
+            if previous is not None and self._by_digest.get(str(previous.get("sha256") or "")) == path.name:
+                # The replaced content may have another copy the lookup does not point to.
+                self._rebuild_lookup_locked()
+            self._by_digest.setdefault(digest, path.name)
+            if self._synced_mtime is not None:
+                # The folder changed because of this file; files dropped in by hand since the
+                # last sync are picked up at the next full sync (remove() or a new session).
+                self._synced_mtime = self._folder_mtime()
+
+    def remove(self, path: Path) -> None:
+        with self._lock:
+            entry = self._files.pop(Path(path).name, None)
+            if entry is not None:
+                self._dirty = True
+                self._save_locked()
+                self._rebuild_lookup_locked()
+            self._synced_mtime = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+            self._dirty = True
+            self._save_locked()
+            self._rebuild_lookup_locked()
+            self._synced_mtime = None
+
+    def _save_locked(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            atomic_write_json(self.index_path, {"version": _INDEX_VERSION, "files": self._files})
+            self._dirty = False
+        except OSError:
+            pass
+
+
+__all__ = [
+    "ContentIndex",
+    "sha256_file",
+]
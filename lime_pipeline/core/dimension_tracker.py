@@ -0,0 +1,129 @@
+"""Dependency tracking for live Dimension Checker envelopes (no Blender dependency).
+
+``DimensionTracker`` keeps the target -> envelope registry that the live update
+handler reads to map ``depsgraph.updates`` to envelopes. It holds:
+- the registry (envelope name -> target names, and the reverse index);
+- the set of dirty envelopes that the next coalesced update must recompute;
+- one cached value per target (the add-on stores the local-space hull points
+  and moments there) that stays valid while only the target's transform changes.
+
+A geometry change drops the target's cache; a transform change keeps it. Keys are
+object names, which is how envelopes already store their targets.
+
+Rules:
+- Do not import bpy here; `ops_dimensions` feeds names in and reads names out.
+- Syncing the registry marks only new or re-targeted envelopes dirty.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+class DimensionTracker:
+    """Target -> envelope registry, dirty envelopes and per-target caches."""
+
+    def __init__(self) -> None:
+        self._envelopes: Dict[str, Tuple[str, ...]] = {}
+        self._targets: Dict[str, Set[str]] = {}
+        self._dirty: Set[str] = set()
+        self._cache: Dict[str, object] = {}
+
+    def __len__(self) -> int:
+        return len(self._envelopes)
+
+    def __contains__(self, envelope: str) -> bool:
+        return envelope in self._envelopes
+
+    @property
+    def has_dirty(self) -> bool:
+        return bool(self._dirty)
+
+    def targets_of(self, envelope: str) -> Tuple[str, ...]:
+        return self._envelopes.get(envelope, ())
+
+    def envelopes_for(self, target: str) -> FrozenSet[str]:
+        return frozenset(self._targets.get(target, ()))
+
+    def is_target(self, target: str) -> bool:
+        return target in self._targets
+
+    def set_envelope(self, envelope: str, targets: Iterable[str], *, dirty: bool = True) -> bool:
+        """Register envelope with its targets; returns True when the registry changed."""
+        names = tuple(dict.fromkeys(name for name in targets if name))
+        if self._envelopes.get(envelope) == names:
+            return False
+        self._unlink(envelope)
+        self._envelopes[envelope] = names
+        for name in names:
+            self._targets.setdefault(name, set()).add(envelope)
+        if dirty:
+            self._dirty.add(envelope)
+        return True
+
+    def remove_envelope(self, envelope: str) -> None:
+        self._unlink(envelope)
+        self._envelopes.pop(envelope, None)
+        self._dirty.discard(envelope)
+
+    def sync(self, mapping: Mapping[str, Iterable[str]]) -> int:
+        """Replace the registry with mapping; returns the number of envelopes added or changed."""
+        for envelope in [name for name in self._envelopes if name not in mapping]:
+            self.remove_envelope(envelope)
+        changed = sum(1 for envelope, targets in mapping.items() if self.set_envelope(envelope, targets))
+        for target in [name for name in self._cache if name not in self._targets]:
+            del self._cache[target]
+        return changed
+
+    def mark_target(self, target: str, *, geometry: bool) -> int:
+        """Flag the envelopes measuring target; returns how many envelopes that is."""
+        envelopes = self._targets.get(target)
+        if not envelopes:
+            return 0
+        if geometry:
+            self._cache.pop(target, None)
+        self._dirty.update(envelopes)
+        return len(envelopes)
+
+    def mark_envelope(self, envelope: str) -> None:
+        if envelope in self._envelopes:
+            self._dirty.add(envelope)
+
+    def mark_all(self, *, geometry: bool = True) -> None:
+        if geometry:
+            self._cache.clear()
+        self._dirty.update(self._envelopes)
+
+    def take_dirty(self) -> List[str]:
+        """Dirty envelope names (sorted); the dirty set is cleared."""
+        dirty = sorted(self._dirty)
+        self._dirty.clear()
+        return dirty
+
+    def cached(self, target: str) -> Optional[object]:
+        return self._cache.get(target)
+
+    def store(self, target: str, value: object) -> None:
+        if target in self._targets:
+            self._cache[target] = value
+
+    def clear(self) -> None:
+        self._envelopes.clear()
+        self._targets.clear()
+        self._dirty.clear()
+        self._cache.clear()
+
+    def _unlink(self, envelope: str) -> None:
+        for name in self._envelopes.get(envelope, ()):
+            owners = self._targets.get(name)
+            if owners is None:
+                continue
+            owners.discard(envelope)
+            if not owners:
+                del self._targets[name]
+                self._cache.pop(name, None)
+
+
+__all__ = [
+    "DimensionTracker",
+]
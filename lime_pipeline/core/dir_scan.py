@@ -0,0 +1,156 @@
+"""Incremental directory listings for asset panels (no Blender dependency).
+
+``DirectoryScanner.scan`` lists a folder with ``os.scandir`` and remembers the
+result together with the folder's mtime. While the mtime is unchanged the
+cached listing is returned without touching the entries, so repeated refreshes
+cost one ``stat`` per folder. When the folder did change, entries already seen
+reuse their cached stat and only new names are stat'ed.
+
+Caveats handled here:
+- Overwriting a file in place does not change the folder mtime, so a full
+  revalidation (every entry re-stat'ed) runs after ``revalidate_after`` seconds
+  or when ``force=True``.
+- Folders with a coarse mtime (SMB/FAT) can change twice within one tick; a
+  listing taken within ``mtime_granularity`` of the folder mtime is not trusted.
+
+Rules:
+- Do not import bpy here.
+- Safe to call from a worker thread (one lock per scanner).
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+
+DEFAULT_MTIME_GRANULARITY = 2.0
+DEFAULT_REVALIDATE_AFTER = 30.0
+
+_TOKENS = itertools.count(1)
+
+
+class ScanEntry(NamedTuple):
+    path: str
+    name: str
+    size: int
+    mtime: float
+
+
+class DirectoryListing(NamedTuple):
+    """Entries of a folder. ``token`` changes whenever the entry set or any stat changes."""
+
+    entries: Tuple[ScanEntry, ...]
+    token: str
+    rescanned: bool
+
+
+class _FolderState:
+    __slots__ = ("dir_mtime_ns", "trusted", "scanned_at", "entries", "token")
+
+    def __init__(self) -> None:
+        self.dir_mtime_ns = -1
+        self.trusted = False
+        self.scanned_at = 0.0
+        self.entries: Dict[str, ScanEntry] = {}
+        self.token = ""
+
+
+class DirectoryScanner:
+    """Caches folder listings keyed by folder path."""
+
+    def __init__(
+        self,
+        extensions: Optional[Iterable[str]] = None,
+        *,
+        mtime_granularity: float = DEFAULT_MTIME_GRANULARITY,
+        revalidate_after: float = DEFAULT_REVALIDATE_AFTER,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.extensions = frozenset(ext.lower() for ext in extensions) if extensions else None
+        self.mtime_granularity = max(0.0, float(mtime_granularity))
+        self.revalidate_after = max(0.0, float(revalidate_after))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._folders: Dict[str, _FolderState] = {}
+
+    def _accepts(self, name: str) -> bool:
+        if self.extensions is None:
+            return True
+        return os.path.splitext(name)[1].lower() in self.extensions
+
+    def scan(self, folder: Path, *, force: bool = False) -> DirectoryListing:
+        """Return the current listing of folder (files only, filtered by extension)."""
+        folder = Path(folder)
+        key = folder.as_posix()
+        with self._lock:
+            state = self._folders.setdefault(key, _FolderState())
+            try:
+                dir_mtime_ns = int(os.stat(folder).st_mtime_ns)
+            except OSError:
+                return self._store(state, {}, -1, trusted=True)
+            now = self._clock()
+            stale = (now - state.scanned_at) >= self.revalidate_after
+            if not force and not stale and state.trusted and dir_mtime_ns == state.dir_mtime_ns:
+                return DirectoryListing(self._ordered(state), state.token, False)
+
+            # Same folder mtime means only in-place rewrites can have happened: restat everything.
+            restat_all = force or stale or dir_mtime_ns == state.dir_mtime_ns
+            previous = state.entries
+            entries: Dict[str, ScanEntry] = {}
+            try:
+                with os.scandir(folder) as it:
+                    for item in it:
+                        if not self._accepts(item.name):
+                            continue
+                        try:
+                            if not item.is_file():
+                                continue
+                            known = previous.get(item.name)
+                            if known is not None and not restat_all:
+                                entries[item.name] = known
+                                continue
+                            st = item.stat()
+                        except OSError:
+                            continue
+                        entries[item.name] = ScanEntry(
+                            Path(item.path).as_posix(), item.name, int(st.st_size), float(st.st_mtime)
+                        )
+            except OSError:
+                return self._store(state, {}, -1, trusted=False)
+            trusted = (now - dir_mtime_ns / 1e9) > self.mtime_granularity
+            return self._store(state, entries, dir_mtime_ns, trusted=trusted)
+
+    def _store(self, state: _FolderState, entries: Dict[str, ScanEntry], dir_mtime_ns: int, *, trusted: bool) -> DirectoryListing:
+        if entries != state.entries or not state.token:
+            state.token = str(next(_TOKENS))
+        state.entries = entries
+        state.dir_mtime_ns = dir_mtime_ns
+        state.trusted = trusted
+        state.scanned_at = self._clock()
+        return DirectoryListing(self._ordered(state), state.token, True)
+
+    @staticmethod
+    def _ordered(state: _FolderState) -> Tuple[ScanEntry, ...]:
+        return tuple(state.entries[name] for name in sorted(state.entries))
+
+    def forget(self, folder: Optional[Path] = None) -> None:
+        """Drop the cached listing of folder (or of every folder) so the next scan is full."""
+        with self._lock:
+            if folder is None:
+                self._folders.clear()
+            else:
+                self._folders.pop(Path(folder).as_posix(), None)
+
+
+__all__ = [
+    "DEFAULT_MTIME_GRANULARITY",
+    "DEFAULT_REVALIDATE_AFTER",
+    "DirectoryListing",
+    "DirectoryScanner",
+    "ScanEntry",
+]
@@ -0,0 +1,68 @@
+"""Draw-scoped memoization of derived UI state (no Blender dependency).
+
+Panels, list rows and operator polls drawn in one redraw ask the same
+questions (active SHOT, SHOT roots, camera collection). ``DrawMemo`` keeps one
+answer per ``(scope, name)`` where the scope identifies the drawing area and
+the state the answer depends on (window, area, selection...). Handlers call
+``invalidate`` when the scene changes, which drops every stored answer.
+
+Rules:
+- Do not import bpy here; scope keys are built by `validate_scene`.
+- Failed computations are not stored: exceptions propagate to the caller.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, TypeVar
+
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SCOPES = 16
+
+
+class DrawMemo:
+    """Answers memoized per scope; the least recently used scopes are dropped first."""
+
+    def __init__(self, max_scopes: int = DEFAULT_MAX_SCOPES) -> None:
+        self.max_scopes = max(1, int(max_scopes))
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._scopes: "OrderedDict[Hashable, Dict[str, object]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._scopes)
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._scopes.clear()
+
+    def get(self, scope: Hashable, name: str, compute: Callable[[], T]) -> T:
+        """Return the answer stored for (scope, name), computing and storing it on a miss."""
+        values = self._scopes.get(scope)
+        if values is not None:
+            self._scopes.move_to_end(scope)
+            if name in values:
+                self.hits += 1
+                return values[name]  # type: ignore[return-value]
+        generation = self.generation
+        value = compute()
+        self.misses += 1
+        if generation != self.generation:
+            # Invalidated while computing (e.g. compute triggered a handler): do not store.
+            return value
+        if values is None:
+            values = {}
+            self._scopes[scope] = values
+            while len(self._scopes) > self.max_scopes:
+                self._scopes.popitem(last=False)
+        values[name] = value
+        return value
+
+
+__all__ = [
+    "DEFAULT_MAX_SCOPES",
+    "DrawMemo",
+]
@@ -0,0 +1,286 @@
+"""Append-only index of AI render generations (no Blender dependency).
+
+Every generation is one JSON line in ``manifests/generations.jsonl``; the file
+is replayed once into in-memory indexes (by frame key, camera, mode, version
+and output path), so appends are O(1) and lookups never re-read per-frame
+manifests or glob ``outputs/``. Deleting outputs appends a ``delete`` record;
+``compact`` rewrites the log with only the live state once enough superseded
+lines accumulate. Per-frame JSON manifests are still produced from the index
+(``frame_manifest``) for compatibility with existing tools.
+
+Rules:
+- Do not import bpy here.
+- Safe to share between worker threads (one lock per index).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .jsonl_log import JsonlWriter, dumps_compact, iter_jsonl_records
+
+
+INDEX_FILENAME = "generations.jsonl"
+DEFAULT_COMPACT_THRESHOLD = 200
+
+_OUTPUT_VERSION_RE = re.compile(r"^(?P<base>.+)_V(?P<version>\d+)_Rev_(?P<rev>[A-Za-z0-9]+)(?:_\d+)?$")
+
+FrameKey = Tuple[int, int, int]
+
+# Keys of a record that form the legacy per-frame manifest "generations" entry.
+MANIFEST_ENTRY_KEYS = (
+    "generation_id",
+    "timestamp",
+    "mode",
+    "prompt_final",
+    "model",
+    "job_id",
+    "status",
+    "result_urls",
+    "output_paths",
+    "asset_urls",
+)
+
+
+def frame_key(record: Dict[str, object]) -> FrameKey:
+    """Return (shot_idx, cam_idx, frame) for a generation record."""
+    return (int(record.get("shot_idx") or 0), int(record.get("cam_idx") or 0), int(record.get("frame") or 0))
+
+
+def parse_output_version(output_name: str) -> Optional[Tuple[str, str, int]]:
+    """Return (base_stem, rev, version) from ``<base>_V<NN>_Rev_<rev>[_<idx>]``, or None."""
+    match = _OUTPUT_VERSION_RE.match(Path(output_name).stem)
+    if match is None:
+        return None
+    return match.group("base"), match.group("rev"), int(match.group("version"))
+
+
+class GenerationIndex:
+    """In-memory view of the generation log with O(1) append."""
+
+    def __init__(self, path: Path, *, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD) -> None:
+        self.path = Path(path)
+        self.compact_threshold = max(1, int(compact_threshold))
+        self._lock = threading.RLock()
+        self._writer: Optional[JsonlWriter] = None
+        self._reset_memory()
+        for record in iter_jsonl_records(self.path):
+            self._apply(record)
+
+    def _reset_memory(self) -> None:
+        self._records: List[Dict[str, object]] = []
+        self._by_frame: Dict[FrameKey, List[int]] = {}
+        self._by_frame_number: Dict[int, List[int]] = {}
+        self._by_mode: Dict[str, List[int]] = {}
+        self._by_output: Dict[str, int] = {}
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._dead_lines = 0
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _note_version(self, base_stem: str, rev: str, version: int) -> None:
+        key = (base_stem, rev)
+        if version > self._versions.get(key, 0):
+            self._versions[key] = version
+
+    def _apply(self, record: Dict[str, object]) -> None:
+        kind = record.get("kind")
+        if kind == "delete":
+            self._dead_lines += 1
+            for raw in record.get("output_paths") or []:
+                idx = self._by_output.pop(str(raw), None)
+                if idx is None:
+                    continue
+                outputs = self._records[idx].get("output_paths") or []
+                self._records[idx]["output_paths"] = [p for p in outputs if p != raw]
+            return
+        if kind != "generation":
+            return
+        idx = len(self._records)
+        self._records.append(record)
+        self._by_frame.setdefault(frame_key(record), []).append(idx)
+        self._by_frame_number.setdefault(int(record.get("frame") or 0), []).append(idx)
+        self._by_mode.setdefault(str(record.get("mode") or ""), []).append(idx)
+        for raw in record.get("output_paths") or []:
+            self._by_output[str(raw)] = idx
+            parsed = parse_output_version(str(raw))
+            if parsed is not None:
+                self._note_version(*parsed)
+        version = record.get("version")
+        if isinstance(version, int) and record.get("base_stem") and record.get("rev"):
+            self._note_version(str(record["base_stem"]), str(record["rev"]), version)
+
+    def _ensure_writer(self) -> JsonlWriter:
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = JsonlWriter(self.path, fsync_every=1)
+        return self._writer
+
+    def append(self, record: Dict[str, object]) -> Dict[str, object]:
+        """Persist and index a generation record (``kind`` is set to ``generation``)."""
+        record = dict(record)
+        record["kind"] = "generation"
+        with self._lock:
+            self._ensure_writer().write(record)
+            self._apply(record)
+        return record
+
+    def import_records(self, records: Iterable[Dict[str, object]]) -> int:
+        """Bulk-append generation records (used to seed the log from legacy manifests)."""
+        count = 0
+        with self._lock:
+            writer = self._ensure_writer()
+            for raw in records:
+                record = dict(raw)
+                record["kind"] = "generation"
+                writer.write(record)
+                self._apply(record)
+                count += 1
+            writer.sync()
+        return count
+
+    def record_deleted_outputs(self, output_paths: Iterable[str]) -> None:
+        with self._lock:
+            paths = [str(p) for p in output_paths if str(p) in self._by_output]
+            if not paths:
+                return
+            self._ensure_writer().write({"kind": "delete", "output_paths": paths, "at": time.time()})
+            self._apply({"kind": "delete", "output_paths": paths})
+
+    def query(
+        self,
+        *,
+        frame: Optional[int] = None,
+        shot_idx: Optional[int] = None,
+        cam_idx: Optional[int] = None,
+        mode: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> List[Dict[str, object]]:
+        """Return generation records matching every given filter, oldest first."""
+        with self._lock:
+            if frame is not None and shot_idx is not None and cam_idx is not None:
+                candidates = self._by_frame.get((int(shot_idx), int(cam_idx), int(frame)), [])
+            elif frame is not None:
+                candidates = self._by_frame_number.get(int(frame), [])
+            elif mode is not None:
+                candidates = self._by_mode.get(str(mode), [])
+            else:
+                candidates = range(len(self._records))
+            out = []
+            for idx in candidates:
+                record = self._records[idx]
+                if shot_idx is not None and int(record.get("shot_idx") or 0) != int(shot_idx):
+                    continue
+                if cam_idx is not None and int(record.get("cam_idx") or 0) != int(cam_idx):
+                    continue
+                if mode is not None and record.get("mode") != mode:
+                    continue
+                if version is not None and record.get("version") != version:
+                    continue
+                out.append(record)
+            return out
+
+    def record_for_output(self, output_path: str) -> Optional[Dict[str, object]]:
+        with self._lock:
+            idx = self._by_output.get(str(output_path))
+            return None if idx is None else self._records[idx]
+
+    def latest_version(self, base_stem: str, rev: str) -> int:
+        with self._lock:
+            return self._versions.get((base_stem, rev), 0)
+
+    def reserve_version(self, base_stem: str, rev: str) -> int:
+        """Return the next version for (base_stem, rev) and reserve it for the caller."""
+        with self._lock:
+            version = self._versions.get((base_stem, rev), 0) + 1
+            self._versions[(base_stem, rev)] = version
+            return version
+
+    def frame_manifest(self, key: FrameKey) -> Dict[str, object]:
+        """Build the legacy per-frame manifest payload from indexed records."""
+        with self._lock:
+            records = [self._records[idx] for idx in self._by_frame.get(key, [])]
+        manifest: Dict[str, object] = {}
+        if not records:
+            return manifest
+        first = records[0]
+        latest = records[-1]
+        manifest["frame"] = first.get("frame")
+        manifest["context"] = {
+            "project_name": first.get("project_name"),
+            "sc_number": first.get("sc_number"),
+            "rev": first.get("rev"),
+            "shot_idx": first.get("shot_idx"),
+            "cam_idx": first.get("cam_idx"),
+        }
+        if isinstance(latest.get("source"), dict):
+            manifest["source"] = latest["source"]
+        style = latest.get("style")
+        if isinstance(style, dict) and style.get("path"):
+            manifest["style"] = style
+        manifest["generations"] = [
+            {name: record[name] for name in MANIFEST_ENTRY_KEYS if name in record} for record in records
+        ]
+        manifest["updated_at"] = latest.get("updated_at") or ""
+        return manifest
+
+    def needs_compaction(self) -> bool:
+        return self._dead_lines >= self.compact_threshold
+
+    def compact(self) -> None:
+        """Rewrite the log with current state only (drops delete records) and swap it in atomically."""
+        with self._lock:
+            self.close()
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8", newline="\n") as handle:
+                for record in self._records:
+                    handle.write(dumps_compact(record))
+                    handle.write("\n")
+                handle.flush()
+                try:
+                    os.fsync(handle.fileno())
+                except OSError:
+                    pass
+            os.replace(tmp, self.path)
+            self._dead_lines = 0
+
+    def reset(self) -> None:
+        """Forget every record and delete the log file."""
+        with self._lock:
+            self.close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+            self._reset_memory()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def frame_keys(self) -> Set[FrameKey]:
+        with self._lock:
+            return set(self._by_frame)
+
+
+__all__ = [
+    "DEFAULT_COMPACT_THRESHOLD",
+    "FrameKey",
+    "GenerationIndex",
+    "INDEX_FILENAME",
+    "MANIFEST_ENTRY_KEYS",
+    "frame_key",
+    "parse_output_version",
+]
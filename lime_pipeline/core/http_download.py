@@ -0,0 +1,210 @@
+"""Streaming, resumable HTTP downloads (no Blender dependency).
+
+Responses are written to ``<dest>.part`` in fixed-size chunks, so memory use
+stays constant regardless of file size. After a dropped connection the
+download resumes with an HTTP ``Range`` request from the bytes already on disk;
+a partial response that does not start at that offset restarts the download.
+The finished file is verified (expected size, plus SHA-256 when the caller or
+the server provides one) and renamed onto the destination atomically.
+
+Rules:
+- Do not import bpy here.
+- Never leave a partially written file under the final destination name.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import http.client
+import os
+from pathlib import Path
+import re
+import time
+import urllib.error
+import urllib.request
+from typing import Callable, Dict, Optional
+
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+DEFAULT_MAX_RETRIES = 4
+PART_SUFFIX = ".part"
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)", re.IGNORECASE)
+_RETRYABLE_HTTP = {408, 425, 429, 500, 502, 503, 504}
+
+
+class DownloadError(RuntimeError):
+    """Raised when a download cannot be completed or fails verification."""
+
+
+class _RangeMismatch(DownloadError):
+    """A 206 response whose Content-Range does not start at the requested offset."""
+
+
+def part_path_for(dest_path: Path) -> Path:
+    return dest_path.with_name(dest_path.name + PART_SUFFIX)
+
+
+def _header(resp, name: str) -> str:
+    headers = getattr(resp, "headers", None)
+    if headers is None:
+        return ""
+    try:
+        return str(headers.get(name) or "")
+    except Exception:
+        return ""
+
+
+def _range_start(resp) -> Optional[int]:
+    match = _CONTENT_RANGE_RE.search(_header(resp, "Content-Range"))
+    return int(match.group(1)) if match else None
+
+
+def _discard(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _expected_total(resp, offset: int, resumed: bool) -> Optional[int]:
+    if resumed:
+        match = _CONTENT_RANGE_RE.search(_header(resp, "Content-Range"))
+        if match and match.group(3) != "*":
+            return int(match.group(3))
+    length = _header(resp, "Content-Length")
+    if length.isdigit():
+        return offset + int(length) if resumed else int(length)
+    return None
+
+
+def server_sha256(resp) -> str:
+    """Return a hex SHA-256 advertised by the server (Digest / x-amz-checksum-sha256), if any."""
+    candidates = []
+    for name in ("Repr-Digest", "Digest"):
+        raw = _header(resp, name)
+        for part in raw.split(","):
+            key, _sep, value = part.strip().partition("=")
+            if key.strip().lower() == "sha-256" and value:
+                candidates.append(value.strip().strip(":"))
+    amz = _header(resp, "x-amz-checksum-sha256")
+    if amz:
+        candidates.append(amz.strip())
+    for value in candidates:
+        try:
+            raw_bytes = base64.b64decode(value, validate=True)
+        except Exception:
+            continue
+        if len(raw_bytes) == 32:
+            return raw_bytes.hex()
+    return ""
+
+
+def _sha256_path(path: Path, chunk_size: int) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def download_to_file(
+    url: str,
+    dest_path: Path,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 60,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    expected_sha256: str = "",
+    opener: Callable = urllib.request.urlopen,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Download url to dest_path; returns the number of bytes written.
+
+    A stale ``.part`` file from an earlier call is discarded: its bytes may
+    belong to a different response, so only retries within this call resume.
+    """
+    dest_path = Path(dest_path)
+    part = part_path_for(dest_path)
+    _discard(part)
+    offset = 0
+    total: Optional[int] = None
+    advertised_sha = ""
+    failures = 0
+
+    while True:
+        request_headers = dict(headers or {})
+        request_headers.setdefault("User-Agent", "LimePipeline")
+        if offset > 0:
+            request_headers["Range"] = f"bytes={offset}-"
+        req = urllib.request.Request(url, headers=request_headers)
+        error: Optional[BaseException] = None
+        try:
+            with opener(req, timeout=timeout) as resp:
+                status = int(getattr(resp, "status", 200) or 200)
+                resumed = offset > 0 and status == 206
+                if offset > 0 and not resumed:
+                    # Server ignored the Range header: start over.
+                    offset = 0
+                if resumed and _range_start(resp) != offset:
+                    raise _RangeMismatch(f"Server sent range {_header(resp, 'Content-Range')!r}, expected start {offset}")
+                total = _expected_total(resp, offset, resumed)
+                advertised_sha = server_sha256(resp) or advertised_sha
+                with open(part, "ab" if resumed else "wb") as handle:
+                    while True:
+                        chunk = resp.read(chunk_size)
+                        if not chunk:
+                            break
+                        handle.write(chunk)
+                        offset += len(chunk)
+        except _RangeMismatch as ex:
+            # Appending a different range would corrupt the file: start over.
+            offset = 0
+            _discard(part)
+            error = ex
+        except urllib.error.HTTPError as ex:
+            if ex.code == 416 and offset > 0:
+                # Range no longer satisfiable (remote file changed): discard the partial file.
+                offset = 0
+                _discard(part)
+                error = ex
+            elif ex.code in _RETRYABLE_HTTP:
+                error = ex
+            else:
+                _discard(part)
+                raise DownloadError(f"Download failed (HTTP {ex.code}): {url}") from ex
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as ex:
+            error = ex
+
+        if error is None and (total is None or offset >= total):
+            break
+        if error is None:
+            error = DownloadError(f"Connection closed at {offset}/{total} bytes")
+        failures += 1
+        if failures > max(0, int(max_retries)):
+            _discard(part)
+            raise DownloadError(f"Download failed after {failures} attempts: {error}") from error
+        sleep(min(8.0, 0.5 * (2 ** (failures - 1))))
+
+    if total is not None and offset != total:
+        _discard(part)
+        raise DownloadError(f"Downloaded size mismatch: {offset} != {total}")
+    expected = (expected_sha256 or advertised_sha).lower()
+    if expected and _sha256_path(part, chunk_size) != expected:
+        _discard(part)
+        raise DownloadError("Downloaded file failed SHA-256 verification")
+    os.replace(part, dest_path)
+    return offset
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_MAX_RETRIES",
+    "DownloadError",
+    "PART_SUFFIX",
+    "download_to_file",
+    "part_path_for",
+    "server_sha256",
+]
@@ -0,0 +1,135 @@
+"""Append-only JSON Lines logs and atomic JSON writes (no Blender dependency).
+
+Used for reports that must survive interrupted runs: every record is one
+compact JSON object per line, appended as soon as it is produced, and the file
+is fsynced periodically. Readers tolerate a truncated last line, and writers
+reopening such a file terminate it before appending.
+
+Rules:
+- Do not import bpy here.
+- Writers never rewrite earlier lines; compaction writes a new file and swaps it
+  in atomically.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+
+DEFAULT_FSYNC_EVERY = 25
+
+
+def dumps_compact(payload: object) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _terminate_partial_line(path: Path) -> None:
+    """End a last line cut off by a crash so appended records start on their own line."""
+    try:
+        with open(path, "rb+") as fh:
+            fh.seek(0, os.SEEK_END)
+            if fh.tell() == 0:
+                return
+            fh.seek(-1, os.SEEK_END)
+            if fh.read(1) != b"\n":
+                fh.write(b"\n")
+    except OSError:
+        pass
+
+
+class JsonlWriter:
+    """Append records to a JSONL file, flushing each line and fsyncing every N records."""
+
+    def __init__(self, path: Path, *, fsync_every: int = DEFAULT_FSYNC_EVERY) -> None:
+        self.path = Path(path)
+        self.fsync_every = max(1, int(fsync_every))
+        self.records_written = 0
+        self._pending_sync = 0
+        _terminate_partial_line(self.path)
+        self._fh = open(self.path, "a", encoding="utf-8", newline="\n")
+
+    def write(self, record: Dict[str, object]) -> None:
+        self._fh.write(dumps_compact(record))
+        self._fh.write("\n")
+        self._fh.flush()
+        self.records_written += 1
+        self._pending_sync += 1
+        if self._pending_sync >= self.fsync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        if self._fh.closed:
+            return
+        self._fh.flush()
+        try:
+            os.fsync(self._fh.fileno())
+        except OSError:
+            pass
+        self._pending_sync = 0
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        self.sync()
+        self._fh.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def iter_jsonl_records(path: Path) -> Iterator[Dict[str, object]]:
+    """Yield JSON object records from path, skipping blank or truncated lines."""
+    try:
+        fh = open(path, "r", encoding="utf-8")
+    except OSError:
+        return
+    with fh:
+        for line in fh:
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                record = json.loads(text)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+def last_record_of_kind(path: Path, kind: str) -> Optional[Dict[str, object]]:
+    found: Optional[Dict[str, object]] = None
+    for record in iter_jsonl_records(path):
+        if record.get("kind") == kind:
+            found = record
+    return found
+
+
+def atomic_write_json(path: Path, payload: object, *, indent: Optional[int] = None) -> None:
+    """Write JSON to a sibling temp file, fsync it, then replace path atomically."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    text = json.dumps(payload, ensure_ascii=False, indent=indent) if indent else dumps_compact(payload)
+    with open(tmp, "w", encoding="utf-8", newline="\n") as fh:
+        fh.write(text)
+        fh.flush()
+        try:
+            os.fsync(fh.fileno())
+        except OSError:
+            pass
+    os.replace(tmp, path)
+
+
+__all__ = [
+    "DEFAULT_FSYNC_EVERY",
+    "JsonlWriter",
+    "atomic_write_json",
+    "dumps_compact",
+    "iter_jsonl_records",
+    "last_record_of_kind",
+]
@@ -0,0 +1,144 @@
+"""View-layer index and batched flag changes for SHOT isolation (no Blender dependency).
+
+``LayerCollectionIndex`` walks a view layer's LayerCollection tree once, in
+the same depth-first order as a recursive search, and maps each collection
+pointer to its first LayerCollection. Subtrees are contiguous slices of that
+order, so "the target SHOT and everything below it" needs no second walk.
+
+``FlagBatch`` sets attributes on many owners and remembers each original value
+once. Values that already match are not written (every ``exclude`` write makes
+Blender resync the view layer), and ``restore`` puts the originals back in
+reverse order.
+
+Objects only need ``collection`` and ``children`` (and ``as_pointer()`` when
+available), so both helpers work with Blender data and with plain test doubles.
+
+Rules:
+- Do not import bpy here; `validate_scene.isolate_shots_temporarily` drives them.
+- An index is a snapshot: build one per isolation.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .collection_hierarchy import collection_key
+
+
+def _children(layer) -> List[object]:
+    try:
+        return list(layer.children)
+    except Exception:
+        return []
+
+
+class LayerCollectionIndex:
+    """Collection pointer -> LayerCollection, plus subtree slices, for one view layer."""
+
+    def __init__(self, root) -> None:
+        self._order: List[object] = []
+        self._end: List[int] = []
+        self._pos: Dict[int, int] = {}
+        if root is None:
+            return
+
+        parents: List[int] = []
+        stack: List[Tuple[object, int]] = [(root, -1)]
+        while stack:
+            layer, parent = stack.pop()
+            index = len(self._order)
+            self._order.append(layer)
+            parents.append(parent)
+            try:
+                key = collection_key(layer.collection)
+            except Exception:
+                key = None
+            if key is not None and key not in self._pos:
+                self._pos[key] = index
+            for child in reversed(_children(layer)):
+                stack.append((child, index))
+
+        self._end = [i + 1 for i in range(len(self._order))]
+        for index in range(len(self._order) - 1, 0, -1):
+            parent = parents[index]
+            if self._end[index] > self._end[parent]:
+                self._end[parent] = self._end[index]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, coll) -> bool:
+        return collection_key(coll) in self._pos
+
+    def get(self, coll) -> Optional[object]:
+        """First LayerCollection showing coll (None when coll is not in this view layer)."""
+        if coll is None:
+            return None
+        index = self._pos.get(collection_key(coll))
+        return None if index is None else self._order[index]
+
+    def subtree(self, coll) -> Iterator[object]:
+        """LayerCollection of coll followed by all its descendants (nothing when coll is missing)."""
+        if coll is None:
+            return iter(())
+        index = self._pos.get(collection_key(coll))
+        if index is None:
+            return iter(())
+        return iter(self._order[index : self._end[index]])
+
+
+class FlagBatch:
+    """Attribute changes that can be undone together; see the module docstring."""
+
+    def __init__(self) -> None:
+        self._saved: List[Tuple[object, str, object]] = []
+        self._seen: set = set()
+        self.writes = 0
+
+    def __len__(self) -> int:
+        return len(self._saved)
+
+    def set(self, owner, attr: str, value) -> bool:
+        """Set owner.attr to value (saving the original once); returns True when it was written."""
+        try:
+            current = getattr(owner, attr)
+        except Exception:
+            return False
+        key = (collection_key(owner), attr)
+        if key not in self._seen:
+            self._seen.add(key)
+            self._saved.append((owner, attr, current))
+        if current == value:
+            return False
+        try:
+            setattr(owner, attr, value)
+        except Exception:
+            return False
+        self.writes += 1
+        return True
+
+    def set_many(self, owners, values: Dict[str, object]) -> int:
+        """Apply every attr -> value of values to each owner; returns the number of writes."""
+        written = 0
+        for owner in owners:
+            for attr, value in values.items():
+                if self.set(owner, attr, value):
+                    written += 1
+        return written
+
+    def restore(self) -> None:
+        """Put every saved value back (reverse order); unchanged values are not rewritten."""
+        for owner, attr, value in reversed(self._saved):
+            try:
+                if getattr(owner, attr) != value:
+                    setattr(owner, attr, value)
+            except Exception:
+                pass
+        self._saved.clear()
+        self._seen.clear()
+
+
+__all__ = [
+    "FlagBatch",
+    "LayerCollectionIndex",
+]
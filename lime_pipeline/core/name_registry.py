@@ -0,0 +1,98 @@
+"""Duplication-scoped registry of data-block names (no Blender dependency).
+
+Renaming many IDs after a SHOT or scene duplication needs "is this name free?"
+and "first free suffix for this base" over and over. ``NameRegistry`` snapshots
+the names of one ID collection once (``bpy.data.objects.keys()``...), answers
+both questions with set lookups and is told about every rename, so the caller
+never lists the collection again. A per-base cursor lets repeated requests for
+the same base resume after the suffixes already handed out.
+
+Rules:
+- Do not import bpy here.
+- Report the name Blender actually assigned (it may truncate or suffix) through ``rename``.
+"""
+
+from __future__ import annotations
+
+import string
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+SuffixScheme = Callable[[int], str]
+
+
+def letter_suffix(position: int) -> str:
+    """_A ... _Z, then _1, _2, ..."""
+    if position < len(string.ascii_uppercase):
+        return f"_{string.ascii_uppercase[position]}"
+    return f"_{position - len(string.ascii_uppercase) + 1}"
+
+
+def numbered_suffix(position: int) -> str:
+    """_2, _3, ... (the unsuffixed name counts as the first)."""
+    return f"_{position + 2}"
+
+
+def _suffix_base(name: str) -> Optional[str]:
+    """Base of a name produced by one of the suffix schemes, or None."""
+    head, sep, tail = name.rpartition("_")
+    if not sep or not head:
+        return None
+    if tail.isdigit() or (len(tail) == 1 and tail in string.ascii_uppercase):
+        return head
+    return None
+
+
+class NameRegistry:
+    """Set of names in use for one ID collection, kept current by the caller."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._names = {str(name) for name in names}
+        self._cursors: Dict[Tuple[str, SuffixScheme], int] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def is_available(self, name: str, current: Optional[str] = None) -> bool:
+        """True when name is unused or is current (the owner's own name)."""
+        return name == current or name not in self._names
+
+    def add(self, name: str) -> None:
+        self._names.add(name)
+
+    def discard(self, name: str) -> None:
+        if name in self._names:
+            self._names.discard(name)
+            base = _suffix_base(name)
+            if base is not None:
+                # A suffixed name was freed: later searches for its base restart from the beginning.
+                for key in [key for key in self._cursors if key[0] == base]:
+                    del self._cursors[key]
+
+    def rename(self, old: Optional[str], new: str) -> None:
+        if old is not None and old != new:
+            self.discard(old)
+        self.add(new)
+
+    def unique(self, base: str, *, current: Optional[str] = None, suffix: SuffixScheme = letter_suffix) -> str:
+        """base itself when available, else base + the first free suffix of the scheme."""
+        if self.is_available(base, current):
+            return base
+        key = (base, suffix)
+        position = self._cursors.get(key, 0)
+        while True:
+            candidate = f"{base}{suffix(position)}"
+            if self.is_available(candidate, current):
+                self._cursors[key] = position
+                return candidate
+            position += 1
+
+
+__all__ = [
+    "NameRegistry",
+    "letter_suffix",
+    "numbered_suffix",
+]
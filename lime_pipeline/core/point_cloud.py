@@ -0,0 +1,424 @@
+"""Point clouds as (N, 3) NumPy arrays for the Dimension Checker (no Blender dependency).
+
+The Dimension Checker measures the world-space vertices of its targets. Points
+are kept in one contiguous float64 array instead of one ``mathutils.Vector``
+per vertex: coordinates read with ``foreach_get`` are transformed with one
+matrix multiply, sampled with a slice and reduced to covariance and oriented
+bounds with array operations.
+
+Orientation engine (axes are returned as 3x3 arrays whose columns are X, Y, Z):
+- ``principal_axes`` / ``principal_axes_xy``: PCA through ``numpy.linalg.eigh``
+  (3D) or the closed-form 2x2 solution with Z kept up.
+- ``extreme_points``: hull reduction; the points that are extreme along a fixed
+  set of directions (always including the world axes). They are convex hull
+  vertices, so a few hundred points stand in for millions during a search.
+- ``convex_hull_2d`` + ``min_area_rectangle``: exact planar hull (extreme-polygon
+  filter, then monotone chain) and rotating calipers over its edges.
+- ``PointMoments``: count, mean and scatter of a cloud. They follow a linear
+  transform exactly and combine across clouds, so PCA of a moved object needs
+  no pass over its points.
+- ``min_volume_axes``: calipers around candidate up axes. With Z locked the
+  result is the exact minimum-volume Z-up box; otherwise it is the best box over
+  the PCA and world up axes, refined around the axes of the best box found.
+
+Rules:
+- Do not import bpy or mathutils here; `ops.ops_dimensions` converts matrices with ``np.asarray``.
+- NumPy ships with Blender; tests skip when it is missing.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+EMPTY_POINTS = np.empty((0, 3), dtype=np.float64)
+
+EPSILON = 1e-6
+EXTREME_DIRECTIONS = 64
+HULL_FILTER_DIRECTIONS = 16
+MIN_VOLUME_REFINE_ROUNDS = 4
+_CHUNK_ROWS = 1 << 16
+
+
+def as_points(values) -> np.ndarray:
+    """(N, 3) float64 view or copy of values (anything array-like with 3 floats per point)."""
+    points = np.asarray(values, dtype=np.float64)
+    if points.size == 0:
+        return EMPTY_POINTS
+    return points.reshape(-1, 3)
+
+
+def transform_points(coords, matrix) -> np.ndarray:
+    """Apply a 4x4 (or 3x3) matrix to (N, 3) coordinates in one multiply."""
+    points = as_points(coords)
+    mat = np.asarray(matrix, dtype=np.float64)
+    if not len(points):
+        return EMPTY_POINTS
+    out = points @ mat[:3, :3].T
+    if mat.shape[0] >= 4 and mat.shape[1] >= 4:
+        out += mat[:3, 3]
+    return out
+
+
+def concat_points(chunks) -> np.ndarray:
+    chunks = [chunk for chunk in chunks if chunk is not None and len(chunk)]
+    if not chunks:
+        return EMPTY_POINTS
+    if len(chunks) == 1:
+        return chunks[0]
+    return np.concatenate(chunks, axis=0)
+
+
+def subsample_points(points: np.ndarray, limit: Optional[int]) -> np.ndarray:
+    """Every k-th point so that at most limit points remain (no-op without a positive limit)."""
+    if not limit or limit <= 0 or len(points) <= limit:
+        return points
+    step = max(1, len(points) // int(limit))
+    return points[::step][: int(limit)]
+
+
+def centroid_and_covariance(points: np.ndarray, dims: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """Centroid and sample covariance (divided by N - 1) of the first dims coordinates."""
+    data = as_points(points)[:, :dims]
+    centroid = data.mean(axis=0)
+    centered = data - centroid
+    cov = centered.T @ centered
+    if len(data) > 1:
+        cov /= float(len(data) - 1)
+    return centroid, cov
+
+
+def oriented_bounds(points, rotation) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Min and max corners of points expressed in the frame of a 3x3 rotation (None when empty)."""
+    data = as_points(points)
+    if not len(data):
+        return None
+    rot = np.asarray(rotation, dtype=np.float64)[:3, :3]
+    try:
+        world_to_ref = np.linalg.inv(rot)
+    except np.linalg.LinAlgError:
+        world_to_ref = np.identity(3)
+    local = data @ world_to_ref.T
+    return local.min(axis=0), local.max(axis=0)
+
+
+# -- orientation engine ------------------------------------------------------------------------
+
+
+def _right_handed(x_axis: np.ndarray, y_axis: np.ndarray) -> np.ndarray:
+    z_axis = np.cross(x_axis, y_axis)
+    return np.column_stack((x_axis, y_axis, z_axis))
+
+
+def _canonical_sign(axis: np.ndarray) -> np.ndarray:
+    """Flip axis so its largest component is positive (eigenvector signs are arbitrary)."""
+    return -axis if axis[int(np.argmax(np.abs(axis)))] < 0.0 else axis
+
+
+class PointMoments(NamedTuple):
+    """Point count, mean and scatter matrix (sum of centered outer products) of a cloud."""
+
+    count: int
+    mean: np.ndarray
+    scatter: np.ndarray
+
+    @classmethod
+    def of(cls, points) -> "PointMoments":
+        data = as_points(points)
+        if not len(data):
+            return cls(0, np.zeros(3), np.zeros((3, 3)))
+        mean = data.mean(axis=0)
+        centered = data - mean
+        return cls(len(data), mean, centered.T @ centered)
+
+    def transformed(self, matrix) -> "PointMoments":
+        """Moments of the cloud after a 4x4 (or 3x3) transform."""
+        mat = np.asarray(matrix, dtype=np.float64)
+        linear = mat[:3, :3]
+        mean = linear @ self.mean
+        if mat.shape[0] >= 4 and mat.shape[1] >= 4:
+            mean = mean + mat[:3, 3]
+        return PointMoments(self.count, mean, linear @ self.scatter @ linear.T)
+
+    def covariance(self) -> np.ndarray:
+        """Sample covariance (divided by N - 1), as `centroid_and_covariance` computes it."""
+        return self.scatter / float(self.count - 1) if self.count > 1 else self.scatter.copy()
+
+
+def combine_moments(parts: Iterable[PointMoments]) -> PointMoments:
+    """Moments of the union of several clouds."""
+    parts = [part for part in parts if part.count]
+    if not parts:
+        return PointMoments(0, np.zeros(3), np.zeros((3, 3)))
+    count = sum(part.count for part in parts)
+    mean = sum(part.mean * part.count for part in parts) / float(count)
+    scatter = np.zeros((3, 3))
+    for part in parts:
+        offset = part.mean - mean
+        scatter += part.scatter + part.count * np.outer(offset, offset)
+    return PointMoments(count, mean, scatter)
+
+
+def axes_from_covariance(cov) -> Optional[np.ndarray]:
+    """PCA axes of a 3x3 covariance, sorted by decreasing variance, right-handed."""
+    cov = np.asarray(cov, dtype=np.float64)
+    if not np.all(np.isfinite(cov)):
+        return None
+    _, vectors = np.linalg.eigh(cov)
+    x_axis = _canonical_sign(vectors[:, 2])
+    y_axis = _canonical_sign(vectors[:, 1])
+    return _right_handed(x_axis, y_axis)
+
+
+def principal_axes(points) -> Optional[np.ndarray]:
+    """PCA axes sorted by decreasing variance, right-handed (None for fewer than 3 points)."""
+    data = as_points(points)
+    if len(data) < 3:
+        return None
+    return axes_from_covariance(centroid_and_covariance(data)[1])
+
+
+def principal_axes_xy(points) -> Optional[np.ndarray]:
+    """PCA of the XY spread with Z kept as the up axis; X points towards +X world."""
+    data = as_points(points)
+    if not len(data):
+        return None
+    return axes_xy_from_covariance(centroid_and_covariance(data, dims=2)[1])
+
+
+def axes_xy_from_covariance(cov) -> np.ndarray:
+    """Z-up PCA axes from the XY block of a covariance (closed-form 2x2 solution)."""
+    cov = np.asarray(cov, dtype=np.float64)
+    cov_xx, cov_xy, cov_yy = float(cov[0, 0]), float(cov[0, 1]), float(cov[1, 1])
+    diff = cov_xx - cov_yy
+    lambda1 = 0.5 * (cov_xx + cov_yy + math.sqrt(max(0.0, diff * diff + 4.0 * cov_xy * cov_xy)))
+    if abs(cov_xy) > EPSILON:
+        vec = np.array([lambda1 - cov_yy, cov_xy])
+    else:
+        vec = np.array([1.0, 0.0]) if cov_xx >= cov_yy else np.array([0.0, 1.0])
+    length = float(np.hypot(vec[0], vec[1]))
+    if length <= EPSILON:
+        vec, length = np.array([1.0, 0.0]), 1.0
+    x_axis = np.array([vec[0] / length, vec[1] / length, 0.0])
+    if x_axis[0] < 0.0:
+        x_axis = -x_axis
+    y_axis = np.cross([0.0, 0.0, 1.0], x_axis)
+    return _right_handed(x_axis, y_axis)
+
+
+def sphere_directions(count: int = EXTREME_DIRECTIONS) -> np.ndarray:
+    """Unit vectors spread over a hemisphere (Fibonacci lattice) plus the world axes."""
+    count = max(1, int(count))
+    index = np.arange(count, dtype=np.float64) + 0.5
+    z = index / count
+    radius = np.sqrt(1.0 - z * z)
+    theta = math.pi * (3.0 - math.sqrt(5.0)) * index
+    lattice = np.column_stack((radius * np.cos(theta), radius * np.sin(theta), z))
+    return np.vstack((np.identity(3), lattice))
+
+
+def extreme_points(points, directions: Optional[np.ndarray] = None) -> np.ndarray:
+    """Points with the lowest or highest projection on any direction (all are convex hull vertices)."""
+    data = as_points(points)
+    if len(data) <= 8:
+        return data
+    dirs = sphere_directions() if directions is None else np.asarray(directions, dtype=np.float64)
+    best_max = np.full(len(dirs), -np.inf)
+    best_min = np.full(len(dirs), np.inf)
+    arg_max = np.zeros(len(dirs), dtype=np.int64)
+    arg_min = np.zeros(len(dirs), dtype=np.int64)
+    rows = np.arange(len(dirs))
+    for start in range(0, len(data), _CHUNK_ROWS):
+        # One row per direction keeps the argmax/argmin reductions contiguous
+        proj = dirs @ data[start : start + _CHUNK_ROWS].T
+        hi = proj.argmax(axis=1)
+        lo = proj.argmin(axis=1)
+        hi_val = proj[rows, hi]
+        lo_val = proj[rows, lo]
+        better = hi_val > best_max
+        best_max[better] = hi_val[better]
+        arg_max[better] = hi[better] + start
+        better = lo_val < best_min
+        best_min[better] = lo_val[better]
+        arg_min[better] = lo[better] + start
+    return data[np.unique(np.concatenate((arg_max, arg_min)))]
+
+
+def _cross_2d(origin, a, b) -> float:
+    return (a[0] - origin[0]) * (b[1] - origin[1]) - (a[1] - origin[1]) * (b[0] - origin[0])
+
+
+def _filter_inside_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Drop points strictly inside a convex CCW polygon (they cannot be hull vertices)."""
+    edges = np.roll(polygon, -1, axis=0) - polygon
+    # Inward normals of every edge at once: a point is inside when it is left of all edges
+    normals = np.stack((-edges[:, 1], edges[:, 0]))
+    offsets = np.einsum("ij,ji->i", polygon, normals)
+    tolerance = EPSILON * max(1.0, float(np.abs(edges).max()))
+    keep: List[np.ndarray] = []
+    for start in range(0, len(points), _CHUNK_ROWS):
+        chunk = points[start : start + _CHUNK_ROWS]
+        inside = ((chunk @ normals - offsets) > tolerance).all(axis=1)
+        keep.append(chunk[~inside])
+    return np.concatenate(keep, axis=0) if keep else points
+
+
+def convex_hull_2d(points) -> np.ndarray:
+    """Convex hull of (N, 2) points in counter-clockwise order, without collinear points."""
+    data = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(data) > 64:
+        angles = np.linspace(0.0, 2.0 * math.pi, HULL_FILTER_DIRECTIONS, endpoint=False)
+        dirs = np.column_stack((np.cos(angles), np.sin(angles)))
+        best = np.full(len(dirs), -np.inf)
+        arg = np.zeros(len(dirs), dtype=np.int64)
+        for start in range(0, len(data), _CHUNK_ROWS):
+            proj = dirs @ data[start : start + _CHUNK_ROWS].T
+            hi = proj.argmax(axis=1)
+            hi_val = proj[np.arange(len(dirs)), hi]
+            better = hi_val > best
+            best[better] = hi_val[better]
+            arg[better] = hi[better] + start
+        polygon = data[arg]
+        changed = np.any(polygon != np.roll(polygon, 1, axis=0), axis=1)
+        polygon = polygon[changed] if changed.any() else polygon[:1]
+        if len(polygon) >= 3:
+            data = _filter_inside_polygon(data, polygon)
+    data = np.unique(data, axis=0)
+    if len(data) < 3:
+        return data
+    ordered = data.tolist()
+    lower: List[List[float]] = []
+    for point in ordered:
+        while len(lower) >= 2 and _cross_2d(lower[-2], lower[-1], point) <= 0.0:
+            lower.pop()
+        lower.append(point)
+    upper: List[List[float]] = []
+    for point in reversed(ordered):
+        while len(upper) >= 2 and _cross_2d(upper[-2], upper[-1], point) <= 0.0:
+            upper.pop()
+        upper.append(point)
+    return np.array(lower[:-1] + upper[:-1], dtype=np.float64)
+
+
+def min_area_rectangle(hull) -> Tuple[float, float]:
+    """Rotating calipers: (angle, area) of the smallest rectangle around a 2D convex hull."""
+    hull = np.asarray(hull, dtype=np.float64).reshape(-1, 2)
+    if len(hull) < 2:
+        return 0.0, 0.0
+    edges = np.roll(hull, -1, axis=0) - hull
+    edges = edges[np.hypot(edges[:, 0], edges[:, 1]) > EPSILON]
+    if not len(edges):
+        return 0.0, 0.0
+    angles = np.unique(np.mod(np.arctan2(edges[:, 1], edges[:, 0]), math.pi / 2.0))
+    best_angle, best_area = 0.0, math.inf
+    step = max(1, _CHUNK_ROWS // max(1, len(hull)))
+    for start in range(0, len(angles), step):
+        chunk = angles[start : start + step]
+        cos, sin = np.cos(chunk)[:, None], np.sin(chunk)[:, None]
+        u = hull[:, 0] * cos + hull[:, 1] * sin
+        v = hull[:, 1] * cos - hull[:, 0] * sin
+        areas = np.ptp(u, axis=1) * np.ptp(v, axis=1)
+        idx = int(np.argmin(areas))
+        if areas[idx] < best_area:
+            best_angle, best_area = float(chunk[idx]), float(areas[idx])
+    return best_angle, best_area
+
+
+def _perpendicular_basis(up: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    helper = np.zeros(3)
+    helper[int(np.argmin(np.abs(up)))] = 1.0
+    e1 = np.cross(helper, up)
+    e1 /= np.linalg.norm(e1)
+    return e1, np.cross(up, e1)
+
+
+def min_volume_axes(
+    points,
+    *,
+    lock_z_up: bool = False,
+    up_axes: Optional[Sequence[Sequence[float]]] = None,
+    reduce: bool = True,
+) -> Optional[Tuple[np.ndarray, float]]:
+    """Axes of the smallest box found by calipers around each up axis, with its volume.
+
+    The candidates are world Z when lock_z_up is set, otherwise up_axes, or the PCA
+    and world axes by default; without the lock, the axes of the best box are tried
+    again for a few rounds. With reduce (3D search only), the search runs on ``extreme_points``;
+    the caller should measure the final bounds on all points.
+    """
+    data = as_points(points)
+    if len(data) < 2:
+        return None
+    # The planar hull is exact on all points, so the Z-up search needs no reduction
+    search = extreme_points(data) if reduce and not lock_z_up else data
+    if lock_z_up:
+        candidates = [np.array([0.0, 0.0, 1.0])]
+    elif up_axes is not None:
+        candidates = [np.asarray(axis, dtype=np.float64) for axis in up_axes]
+    else:
+        candidates = list(np.identity(3))
+        pca = principal_axes(data)
+        if pca is not None:
+            candidates = list(pca.T) + candidates
+    best: Optional[Tuple[np.ndarray, float]] = None
+    for round_index in range(1 if lock_z_up else 1 + MIN_VOLUME_REFINE_ROUNDS):
+        if round_index:
+            # Refine: the best box's own axes are usually closer to an optimal up axis
+            candidates = list(best[0].T)
+        improved = False
+        for up in candidates:
+            norm = float(np.linalg.norm(up))
+            if norm <= EPSILON:
+                continue
+            up = up / norm
+            e1, e2 = _perpendicular_basis(up)
+            planar = np.column_stack((search @ e1, search @ e2))
+            angle, area = min_area_rectangle(convex_hull_2d(planar))
+            volume = area * float(np.ptp(search @ up))
+            if best is not None and volume >= best[1] - EPSILON * max(1.0, best[1]):
+                continue
+            x_axis = math.cos(angle) * e1 + math.sin(angle) * e2
+            best = (np.column_stack((x_axis, np.cross(up, x_axis), up)), volume)
+            improved = True
+        if best is None or not improved:
+            break
+    if best is None:
+        return None
+    return _sorted_box_axes(best[0], search, lock_z_up=lock_z_up), best[1]
+
+
+def _sorted_box_axes(axes: np.ndarray, points: np.ndarray, *, lock_z_up: bool) -> np.ndarray:
+    """Order box axes by decreasing extent (only X/Y when Z is locked), right-handed, canonical signs."""
+    extents = np.ptp(points @ axes, axis=0)
+    if lock_z_up:
+        x_axis = axes[:, 0] if extents[0] >= extents[1] else axes[:, 1]
+        if x_axis[0] < -EPSILON or (abs(x_axis[0]) <= EPSILON and x_axis[1] < 0.0):
+            x_axis = -x_axis
+        return _right_handed(x_axis, np.cross([0.0, 0.0, 1.0], x_axis))
+    order = np.argsort(-extents, kind="stable")
+    return _right_handed(_canonical_sign(axes[:, order[0]]), _canonical_sign(axes[:, order[1]]))
+
+
+__all__ = [
+    "EMPTY_POINTS",
+    "PointMoments",
+    "as_points",
+    "axes_from_covariance",
+    "axes_xy_from_covariance",
+    "centroid_and_covariance",
+    "combine_moments",
+    "concat_points",
+    "convex_hull_2d",
+    "extreme_points",
+    "min_area_rectangle",
+    "min_volume_axes",
+    "oriented_bounds",
+    "principal_axes",
+    "principal_axes_xy",
+    "sphere_directions",
+    "subsample_points",
+    "transform_points",
+]
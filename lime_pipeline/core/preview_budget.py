@@ -0,0 +1,153 @@
+"""Memory-bounded bookkeeping for lazily loaded thumbnails (no Blender dependency).
+
+``LruBudget`` tracks which previews are decoded, their approximate memory cost
+and when they were last used. Callers evict what ``touch`` returns and call
+``make_room`` before decoding something new (it evicts only idle entries), so a grid that shows more images
+than fit in the budget does not evict and reload the same entries on every redraw.
+The thumbnail helpers name and size the low-resolution copies kept on disk.
+
+Rules:
+- Do not import bpy here.
+- Callers pass ``now`` explicitly (``time.monotonic()``) so behavior is testable.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+
+DEFAULT_THUMBNAIL_SIZE = 256
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def thumbnail_cost(width: int, height: int, channels: int = 4) -> int:
+    """Approximate decoded size in bytes of a width x height RGBA(8-bit) preview."""
+    return max(1, int(width)) * max(1, int(height)) * max(1, int(channels))
+
+
+def thumbnail_dimensions(width: int, height: int, max_size: int = DEFAULT_THUMBNAIL_SIZE) -> Tuple[int, int]:
+    """Fit (width, height) inside max_size x max_size keeping aspect; never upscales."""
+    width = max(1, int(width))
+    height = max(1, int(height))
+    longest = max(width, height)
+    if longest <= max_size:
+        return width, height
+    scale = float(max_size) / float(longest)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def thumbnail_name(source_path: str, mtime: float, max_size: int = DEFAULT_THUMBNAIL_SIZE) -> str:
+    """Stable cache file name for a source image version (path hash + mtime + size)."""
+    digest = hashlib.sha1(str(source_path).encode("utf-8")).hexdigest()[:16]
+    return f"{digest}_{int(mtime)}_{int(max_size)}.png"
+
+
+def stale_thumbnails(thumbs_dir: Path, keep_names: Iterable[str]) -> List[Path]:
+    """Return cached thumbnails that no longer match a live source version."""
+    keep = set(keep_names)
+    try:
+        return [p for p in Path(thumbs_dir).iterdir() if p.suffix.lower() == ".png" and p.name not in keep]
+    except OSError:
+        return []
+
+
+class LruBudget:
+    """Least-recently-used keys whose summed cost stays within ``budget``."""
+
+    def __init__(self, budget: int = DEFAULT_BUDGET_BYTES) -> None:
+        self.budget = max(1, int(budget))
+        self._entries: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self.total = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> List[str]:
+        """Keys from least to most recently used."""
+        return list(self._entries)
+
+    def set_budget(self, budget: int) -> List[str]:
+        """Change the budget; returns keys evicted to fit it."""
+        self.budget = max(1, int(budget))
+        return self._evict(protect=None)
+
+    def touch(self, key: str, now: float, cost: Optional[int] = None) -> List[str]:
+        """Mark key as used (adding it with cost when new); returns keys evicted to stay in budget."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.total -= previous[0]
+            if cost is None:
+                cost = previous[0]
+        cost = max(1, int(cost or 1))
+        self._entries[key] = (cost, now)
+        self.total += cost
+        return self._evict(protect=key)
+
+    def discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total -= entry[0]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total = 0
+
+    def can_admit(self, cost: int, now: float, min_idle: float = 1.0) -> bool:
+        """True when cost fits, possibly by evicting entries unused for at least min_idle seconds."""
+        free = self.budget - self.total
+        if cost <= free:
+            return True
+        for entry_cost, last_used in self._entries.values():
+            if now - last_used < min_idle:
+                break
+            free += entry_cost
+            if cost <= free:
+                return True
+        return False
+
+    def make_room(self, cost: int, now: float, min_idle: float = 1.0) -> Optional[List[str]]:
+        """Evict least recently used entries idle for min_idle seconds until cost fits.
+
+        Returns the evicted keys, or None (evicting nothing) when only recently
+        used entries stand in the way.
+        """
+        if not self.can_admit(cost, now, min_idle):
+            return None
+        evicted: List[str] = []
+        while self._entries and self.total + cost > self.budget:
+            key = next(iter(self._entries))
+            entry_cost, _last_used = self._entries.pop(key)
+            self.total -= entry_cost
+            evicted.append(key)
+        return evicted
+
+    def _evict(self, protect: Optional[str]) -> List[str]:
+        evicted: List[str] = []
+        while self.total > self.budget and self._entries:
+            key = next(iter(self._entries))
+            if key == protect:
+                if len(self._entries) == 1:
+                    break
+                self._entries.move_to_end(key)
+                continue
+            cost, _last_used = self._entries.pop(key)
+            self.total -= cost
+            evicted.append(key)
+        return evicted
+
+
+__all__ = [
+    "DEFAULT_BUDGET_BYTES",
+    "DEFAULT_THUMBNAIL_SIZE",
+    "LruBudget",
+    "stale_thumbnails",
+    "thumbnail_cost",
+    "thumbnail_dimensions",
+    "thumbnail_name",
+]
@@ -0,0 +1,112 @@
+"""Render fingerprints: skip re-rendering outputs whose inputs did not change (no Blender dependency).
+
+A fingerprint is a SHA-256 over a JSON description of everything that affects
+one rendered image (frame, camera, render settings, visible objects...). The
+Blender side builds that description; this module only normalizes and hashes
+it, and stores ``output key -> fingerprint`` next to the outputs together with
+the size/mtime of the file that was written. A task can be skipped when both
+the fingerprint and the output file still match.
+
+Rules:
+- Do not import bpy here.
+- Floats are rounded before hashing so evaluation noise does not invalidate outputs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from .jsonl_log import atomic_write_json
+
+
+FLOAT_PLACES = 5
+_STORE_VERSION = 1
+
+
+def quantize(value, places: int = FLOAT_PLACES):
+    """Return a JSON-friendly copy of value with floats rounded and tuples/sets as lists."""
+    if isinstance(value, float):
+        rounded = round(value, places)
+        return 0.0 if rounded == 0 else rounded
+    if isinstance(value, dict):
+        return {str(k): quantize(v, places) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [quantize(v, places) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(quantize(v, places) for v in value)
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    return str(value)
+
+
+def stable_digest(parts) -> str:
+    """SHA-256 of the quantized, key-sorted JSON form of parts."""
+    payload = json.dumps(quantize(parts), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _file_signature(path: Path) -> Optional[Dict[str, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return {"size": int(st.st_size), "mtime_ns": int(st.st_mtime_ns)}
+
+
+class FingerprintStore:
+    """``key -> (fingerprint, output signature)`` persisted as one JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, object]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == _STORE_VERSION and isinstance(data.get("entries"), dict):
+            self._entries = {str(k): v for k, v in data["entries"].items() if isinstance(v, dict)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_current(self, key: str, fingerprint: str, output_path: Path) -> bool:
+        """True when key was rendered with fingerprint and its output file is unchanged since."""
+        entry = self._entries.get(key)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+        signature = _file_signature(Path(output_path))
+        return signature is not None and signature == entry.get("output")
+
+    def record(self, key: str, fingerprint: str, output_path: Path) -> bool:
+        """Remember fingerprint for key; returns False (and forgets key) when the output is missing."""
+        signature = _file_signature(Path(output_path))
+        if signature is None:
+            self.forget(key)
+            return False
+        self._entries[key] = {"fingerprint": fingerprint, "output": signature}
+        self._dirty = True
+        return True
+
+    def forget(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self.path, {"version": _STORE_VERSION, "entries": self._entries})
+        self._dirty = False
+
+
+__all__ = [
+    "FLOAT_PLACES",
+    "FingerprintStore",
+    "quantize",
+    "stable_digest",
+]
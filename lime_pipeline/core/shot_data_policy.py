@@ -0,0 +1,100 @@
+"""Data-block sharing policy for SHOT duplication (no Blender dependency).
+
+Duplicating a SHOT copies its objects; this module decides, per object,
+whether the duplicate gets its own copy of the object data (``COPY``) or keeps
+using the source data block (``LINK``, a linked duplicate). In ``SHARED`` mode
+cameras, lights, rigs and animated data are copied while static geometry
+(meshes, curves, text...) stays linked, so a file with many SHOTs stores one
+copy of heavy product meshes. Materials follow the data they are assigned to.
+
+Overrides, nearest first, always win: a ``lime_dup_data`` custom property set
+to ``COPY`` or ``LINK`` on the object, then on its collections (innermost
+first). ``FULL`` mode restores the previous behavior of copying everything.
+
+Rules:
+- Do not import bpy here; `scene.scene_utils.duplicate_shot` gathers the facts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, Optional
+
+
+COPY = "COPY"
+LINK = "LINK"
+
+MODE_SHARED = "SHARED"
+MODE_FULL = "FULL"
+
+OVERRIDE_PROP = "lime_dup_data"
+
+# Object types whose data is edited per SHOT by design.
+ALWAYS_COPY_TYPES: FrozenSet[str] = frozenset(
+    {"CAMERA", "LIGHT", "LIGHT_PROBE", "ARMATURE", "SPEAKER", "LATTICE", "GPENCIL", "GREASEPENCIL"}
+)
+DEFAULT_LINK_TYPES: FrozenSet[str] = frozenset({"MESH", "CURVE", "SURFACE", "FONT", "META", "CURVES"})
+
+
+def parse_type_list(text: str) -> FrozenSet[str]:
+    """Parse 'MESH, curve ,FONT' into {'MESH', 'CURVE', 'FONT'}."""
+    return frozenset(token.strip().upper() for token in (text or "").replace(";", ",").split(",") if token.strip())
+
+
+def normalize_override(value) -> Optional[str]:
+    if not isinstance(value, str):
+        return None
+    value = value.strip().upper()
+    return value if value in (COPY, LINK) else None
+
+
+def first_override(values: Iterable[object]) -> Optional[str]:
+    """First valid COPY/LINK override among values, ordered nearest first."""
+    for value in values:
+        override = normalize_override(value)
+        if override is not None:
+            return override
+    return None
+
+
+@dataclass(frozen=True)
+class ShotDataPolicy:
+    """How object data is treated when a SHOT is duplicated."""
+
+    mode: str = MODE_SHARED
+    link_types: FrozenSet[str] = DEFAULT_LINK_TYPES
+
+    @classmethod
+    def from_settings(cls, mode: str, link_types: str = "") -> "ShotDataPolicy":
+        mode = (mode or MODE_SHARED).upper()
+        if mode not in (MODE_SHARED, MODE_FULL):
+            mode = MODE_SHARED
+        types = parse_type_list(link_types) if link_types and link_types.strip() else DEFAULT_LINK_TYPES
+        return cls(mode=mode, link_types=types)
+
+    def data_action(self, obj_type: str, *, animated: bool = False, override: Optional[str] = None) -> str:
+        """COPY or LINK for an object of obj_type (animated: its data or shape keys are animated)."""
+        override = normalize_override(override)
+        if override is not None:
+            return override
+        if self.mode == MODE_FULL:
+            return COPY
+        obj_type = (obj_type or "").upper()
+        if obj_type in ALWAYS_COPY_TYPES or animated:
+            return COPY
+        return LINK if obj_type in self.link_types else COPY
+
+
+__all__ = [
+    "ALWAYS_COPY_TYPES",
+    "COPY",
+    "DEFAULT_LINK_TYPES",
+    "LINK",
+    "MODE_FULL",
+    "MODE_SHARED",
+    "OVERRIDE_PROP",
+    "ShotDataPolicy",
+    "first_override",
+    "normalize_override",
+    "parse_type_list",
+]
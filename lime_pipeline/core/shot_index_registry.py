@@ -0,0 +1,201 @@
+"""SHOT index registry: which SHOT numbers a file already uses (no Blender dependency).
+
+Creating or duplicating a SHOT needs the highest SHOT index in use. Instead of
+matching every collection and scene name on each request, the registry keeps
+the classified name of each collection and scene, counts indices per kind and
+answers max/next index from those counts. ``set_collection`` / ``set_scene``
+apply one added or renamed data-block; ``sync_collections`` / ``sync_scenes``
+compare a full listing with the stored names and only classify what changed.
+
+Name kinds:
+- SHOT root: ``SHOT 01`` / ``SHOT 123`` exactly (``SHOT_ROOT_PATTERN``).
+- Loose SHOT name: ``shot 7``, ``Shot 012.001`` (any case, Blender suffix ignored).
+- SH prefix: ``SH01_00_CAM``, ``sh123_Props``.
+
+Rules:
+- Do not import bpy here; `validate_scene` keeps one registry in sync (depsgraph
+  updates feed renames, a full sync runs when data-blocks were added or removed).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+
+SHOT_ROOT_PATTERN = re.compile(r"^SHOT (\d{2,3})$")
+
+
+def _strip_numeric_suffix(name: str) -> str:
+    head, sep, tail = name.rpartition(".")
+    if sep and len(tail) == 3 and tail.isdigit():
+        return head
+    return name
+
+
+@dataclass(frozen=True)
+class ShotNameInfo:
+    """SHOT indices encoded in one name (None when the name is not of that kind)."""
+
+    shot: Optional[int] = None
+    loose: Optional[int] = None
+    prefixed: Optional[int] = None
+
+
+_NO_INFO = ShotNameInfo()
+
+
+@lru_cache(maxsize=8192)
+def classify_name(name: str) -> ShotNameInfo:
+    name = name or ""
+    match = SHOT_ROOT_PATTERN.match(name)
+    shot = int(match.group(1)) if match else None
+
+    base = _strip_numeric_suffix(name).strip()
+    loose = None
+    parts = base.split()
+    if len(parts) == 2 and parts[0].lower() == "shot" and parts[1].isdigit():
+        loose = int(parts[1])
+
+    prefixed = None
+    if len(base) >= 4 and base[:2].upper() == "SH":
+        digits = base.partition("_")[0][2:]
+        if digits.isdigit():
+            prefixed = int(digits)
+
+    if shot is None and loose is None and prefixed is None:
+        return _NO_INFO
+    return ShotNameInfo(shot=shot, loose=loose, prefixed=prefixed)
+
+
+class ShotIndexRegistry:
+    """Counts of SHOT indices used by collection and scene names, kept in sync incrementally."""
+
+    def __init__(self) -> None:
+        self._collections: Dict[int, Tuple[str, ShotNameInfo]] = {}
+        self._scenes: Dict[int, Tuple[str, ShotNameInfo]] = {}
+        self._shot = Counter()
+        self._any = Counter()
+        self._max: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._collections)
+
+    def clear(self) -> None:
+        self._collections.clear()
+        self._scenes.clear()
+        self._shot.clear()
+        self._any.clear()
+        self._max.clear()
+
+    # -- maintenance ---------------------------------------------------------------------------
+
+    @staticmethod
+    def _bump(counter: Counter, key: Optional[int], delta: int) -> None:
+        if key is None:
+            return
+        counter[key] += delta
+        if counter[key] <= 0:
+            del counter[key]
+
+    def _count(self, info: ShotNameInfo, delta: int, *, collection: bool) -> None:
+        if collection:
+            self._bump(self._shot, info.shot, delta)
+            self._bump(self._any, info.prefixed, delta)
+        self._bump(self._any, info.loose, delta)
+        self._max.clear()
+
+    def set_collection(self, key: int, name: str) -> bool:
+        """Add or rename a collection; returns True when the stored name changed."""
+        previous = self._collections.get(key)
+        if previous is not None and previous[0] == name:
+            return False
+        if previous is not None:
+            self._count(previous[1], -1, collection=True)
+        info = classify_name(name)
+        self._collections[key] = (name, info)
+        self._count(info, +1, collection=True)
+        return True
+
+    def remove_collection(self, key: int) -> bool:
+        previous = self._collections.pop(key, None)
+        if previous is None:
+            return False
+        self._count(previous[1], -1, collection=True)
+        return True
+
+    def sync_collections(self, items: Iterable[Tuple[int, str]]) -> int:
+        """Make the registry match (key, name) pairs; returns the number of adds, renames and removals."""
+        changes = 0
+        seen = set()
+        for key, name in items:
+            seen.add(key)
+            if self.set_collection(key, name):
+                changes += 1
+        for key in [key for key in self._collections if key not in seen]:
+            self.remove_collection(key)
+            changes += 1
+        return changes
+
+    def set_scene(self, key: int, name: str) -> bool:
+        """Add or rename a scene; returns True when the stored name changed."""
+        previous = self._scenes.get(key)
+        if previous is not None and previous[0] == name:
+            return False
+        if previous is not None:
+            self._count(previous[1], -1, collection=False)
+        info = classify_name(name)
+        self._scenes[key] = (name, info)
+        self._count(info, +1, collection=False)
+        return True
+
+    def remove_scene(self, key: int) -> bool:
+        previous = self._scenes.pop(key, None)
+        if previous is None:
+            return False
+        self._count(previous[1], -1, collection=False)
+        return True
+
+    def sync_scenes(self, items: Iterable[Tuple[int, str]]) -> int:
+        """Make the registry match (key, scene name) pairs; returns the number of adds, renames and removals."""
+        changes = 0
+        seen = set()
+        for key, name in items:
+            seen.add(key)
+            if self.set_scene(key, name):
+                changes += 1
+        for key in [key for key in self._scenes if key not in seen]:
+            self.remove_scene(key)
+            changes += 1
+        return changes
+
+    # -- queries -------------------------------------------------------------------------------
+
+    def _cached_max(self, name: str, counter: Counter) -> int:
+        value = self._max.get(name)
+        if value is None:
+            value = max(counter) if counter else 0
+            self._max[name] = value
+        return value
+
+    def max_shot_index(self) -> int:
+        """Highest index among collections named exactly like a SHOT root (0 when none)."""
+        return self._cached_max("shot", self._shot)
+
+    def next_shot_index(self) -> int:
+        return self.max_shot_index() + 1
+
+    def max_any_index(self) -> int:
+        """Highest index among SHOT roots, loose SHOT names (collections and scenes) and SH prefixes."""
+        return max(self._cached_max("any", self._any), self.max_shot_index())
+
+
+__all__ = [
+    "SHOT_ROOT_PATTERN",
+    "ShotIndexRegistry",
+    "ShotNameInfo",
+    "classify_name",
+]
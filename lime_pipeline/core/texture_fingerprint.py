@@ -0,0 +1,130 @@
+"""Texture analysis fingerprints (no Blender dependency).
+
+Incremental Analyze stores one fingerprint per texture item and compares it
+with the current scene to decide whether an item can keep its previous
+classification and reviewed suggestions.
+
+Rules:
+- Do not import bpy here; usages are read through duck-typed attributes.
+- Fingerprints must be deterministic for the same inputs and cheap to compute
+  (one ``os.stat`` per file, no content hashing).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .udim_tiles import UDIM_TOKEN, enumerate_udim_tiles
+
+
+def file_stat_signature(path: Optional[Path | str]) -> str:
+    """Return a size/mtime signature for path, or ``missing`` when it cannot be read.
+
+    UDIM paths combine the size/mtime of every tile so the signature changes
+    when any tile is added, removed or rewritten.
+    """
+    if path is None:
+        return "missing"
+    raw = str(path)
+    if not raw:
+        return "missing"
+    if UDIM_TOKEN in raw:
+        parts = []
+        for tile in enumerate_udim_tiles(raw):
+            try:
+                st = os.stat(tile.path)
+            except OSError:
+                continue
+            parts.append(f"{tile.number}:{int(st.st_size)}:{int(st.st_mtime_ns)}")
+        if not parts:
+            return "missing"
+        return "udim:" + hashlib.sha1("|".join(parts).encode("ascii")).hexdigest()
+    try:
+        st = os.stat(raw)
+    except OSError:
+        return "missing"
+    return f"{int(st.st_size)}:{int(st.st_mtime_ns)}"
+
+
+def usage_signature(usages: Iterable[object]) -> str:
+    """Return an order-independent signature of texture usages."""
+    rows = []
+    for usage in list(usages or []):
+        rows.append(
+            (
+                str(getattr(usage, "material_name", "") or ""),
+                str(getattr(usage, "map_type", "") or ""),
+                bool(getattr(usage, "material_is_linked", False)),
+                tuple(str(v) for v in (getattr(usage, "socket_targets", ()) or ())),
+            )
+        )
+    rows.sort()
+    payload = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def texture_fingerprint(
+    *,
+    image_name: str,
+    image_source: str,
+    raw_filepath: str,
+    abs_filepath: str,
+    stat_signature: str,
+    usage_sig: str,
+    flags: Iterable[str] = (),
+    context_signature: str = "",
+) -> str:
+    """Combine the per-image inputs of Analyze into a single fingerprint.
+
+    ``context_signature`` captures scan-wide inputs (project root, texture root,
+    protected roots, project token); changing any of them invalidates every item.
+    """
+    payload = json.dumps(
+        [
+            1,
+            image_name or "",
+            (image_source or "").upper(),
+            raw_filepath or "",
+            abs_filepath or "",
+            stat_signature or "",
+            usage_sig or "",
+            sorted(str(f) for f in (flags or ())),
+            context_signature or "",
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def scan_context_signature(
+    *,
+    project_root: Optional[Path],
+    texture_root: Path,
+    protected_roots: Iterable[Path],
+    project_token: str,
+) -> str:
+    """Return a signature for scan-wide inputs that affect classification and naming."""
+    payload = json.dumps(
+        [
+            str(project_root) if project_root is not None else "",
+            str(texture_root),
+            sorted(str(p) for p in (protected_roots or ())),
+            project_token or "",
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+__all__ = [
+    "file_stat_signature",
+    "scan_context_signature",
+    "texture_fingerprint",
+    "usage_signature",
+]
@@ -0,0 +1,156 @@
+"""Per-scan node graph index for texture usage collection (no Blender dependency).
+
+Walks every node tree (material trees and shared node groups) at most once per
+scan and caches its Image Texture nodes, their link targets and the text used
+for map-type inference. Material-level usages are then composed from the cached
+per-tree results instead of re-walking shared groups for every material.
+
+Rules:
+- Do not import bpy here; node trees are read through duck-typed attributes.
+- An index is only valid while the node graphs it has seen are unchanged; build
+  a fresh one per scan.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from .texture_naming import map_type_from_socket_links
+
+
+@dataclass(frozen=True, slots=True)
+class ImageNodeEntry:
+    node: Any
+    image: Any
+    node_name: str
+    node_label: str
+    socket_targets: Tuple[str, ...]
+    link_socket_names: Tuple[str, ...]
+    fallback_text: str
+
+    def map_type_for(self, material_name: str, image: Any = None) -> str:
+        """Return the inferred map type for this node inside a material."""
+        img = self.image if image is None else image
+        text = " ".join(
+            (
+                material_name or "",
+                self.node_name,
+                self.node_label,
+                getattr(img, "name", "") or "",
+                getattr(img, "filepath", "") or "",
+                self.fallback_text,
+            )
+        )
+        return map_type_from_socket_links(self.link_socket_names, fallback_text=text)
+
+
+def pointer_key(value: object) -> int:
+    """Return a stable identity key for a Blender ID/struct (or any object)."""
+    try:
+        return int(value.as_pointer())  # type: ignore[attr-defined]
+    except Exception:
+        return id(value)
+
+
+def _node_links(node: Any) -> Tuple[Tuple[str, ...], Tuple[str, ...], str]:
+    targets: List[str] = []
+    seen_targets: Set[str] = set()
+    socket_names: List[str] = []
+    parts: List[str] = []
+    try:
+        for output in list(getattr(node, "outputs", []) or []):
+            parts.append(getattr(output, "name", "") or "")
+            for link in list(getattr(output, "links", []) or []):
+                to_socket = getattr(link, "to_socket", None)
+                to_node = getattr(link, "to_node", None)
+                socket_name = getattr(to_socket, "name", "") or ""
+                parts.append(socket_name)
+                parts.append(getattr(to_node, "type", "") or "")
+                parts.append(getattr(to_node, "name", "") or "")
+                if socket_name:
+                    socket_names.append(socket_name)
+                clean = socket_name.strip()
+                if clean and clean.lower() not in seen_targets:
+                    seen_targets.add(clean.lower())
+                    targets.append(clean)
+    except Exception:
+        pass
+    return tuple(targets), tuple(socket_names), " ".join(parts)
+
+
+class TextureNodeGraphIndex:
+    """Cache of Image Texture nodes per node tree, shared across materials."""
+
+    def __init__(self) -> None:
+        # tree key -> ordered items; each item is ("IMAGE", entry) or ("GROUP", tree)
+        self._tree_items: Dict[int, Tuple[Tuple[str, Any], ...]] = {}
+        self.trees_walked = 0
+
+    def _items_for_tree(self, tree: Any) -> Tuple[Tuple[str, Any], ...]:
+        key = pointer_key(tree)
+        cached = self._tree_items.get(key)
+        if cached is not None:
+            return cached
+        items: List[Tuple[str, Any]] = []
+        for node in list(getattr(tree, "nodes", []) or []):
+            ntype = getattr(node, "type", "") or ""
+            if ntype == "TEX_IMAGE":
+                image = getattr(node, "image", None)
+                if image is None:
+                    continue
+                targets, socket_names, fallback = _node_links(node)
+                items.append(
+                    (
+                        "IMAGE",
+                        ImageNodeEntry(
+                            node=node,
+                            image=image,
+                            node_name=getattr(node, "name", "") or "",
+                            node_label=getattr(node, "label", "") or "",
+                            socket_targets=targets,
+                            link_socket_names=socket_names,
+                            fallback_text=fallback,
+                        ),
+                    )
+                )
+            elif ntype == "GROUP":
+                group_tree = getattr(node, "node_tree", None)
+                if group_tree is not None:
+                    items.append(("GROUP", group_tree))
+        result = tuple(items)
+        self._tree_items[key] = result
+        self.trees_walked += 1
+        return result
+
+    def image_entries(self, node_tree: Any) -> List[ImageNodeEntry]:
+        """Return Image Texture entries reachable from node_tree (each tree once)."""
+        out: List[ImageNodeEntry] = []
+        if node_tree is None:
+            return out
+        visited: Set[int] = set()
+        stack: List[Iterable[Tuple[str, Any]]] = []
+        visited.add(pointer_key(node_tree))
+        stack.append(iter(self._items_for_tree(node_tree)))
+        while stack:
+            try:
+                kind, value = next(stack[-1])  # type: ignore[call-overload]
+            except StopIteration:
+                stack.pop()
+                continue
+            if kind == "IMAGE":
+                out.append(value)
+                continue
+            key = pointer_key(value)
+            if key in visited:
+                continue
+            visited.add(key)
+            stack.append(iter(self._items_for_tree(value)))
+        return out
+
+
+__all__ = [
+    "ImageNodeEntry",
+    "TextureNodeGraphIndex",
+    "pointer_key",
+]
@@ -0,0 +1,237 @@
+"""UDIM tile set helpers (no Blender dependency).
+
+A UDIM image is stored as a filename template containing ``<UDIM>`` (for
+example ``Skin_BaseColor.<UDIM>.png``) plus one file per tile on disk
+(``Skin_BaseColor.1001.png``, ``Skin_BaseColor.1002.png``...). Texture Scan/Adopt
+treats the whole tile set as one unit: tiles are enumerated with a single
+directory scan, hashed and copied concurrently, and deduplicated through a
+combined digest.
+
+Rules:
+- Do not import bpy here.
+- Tile order is always ascending by tile number so digests are deterministic.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+import re
+import shutil
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+UDIM_TOKEN = "<UDIM>"
+UDIM_TILE_MIN = 1001
+UDIM_TILE_MAX = 2000
+DEFAULT_TILE_WORKERS = 8
+
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass(frozen=True, slots=True)
+class UdimTile:
+    number: int
+    path: Path
+
+
+@dataclass(frozen=True, slots=True)
+class UdimTileDigest:
+    number: int
+    sha256: str
+    size: int
+
+
+def is_udim_path(value: str | Path | None) -> bool:
+    return UDIM_TOKEN in str(value or "")
+
+
+def _template_regex(template_name: str) -> re.Pattern[str]:
+    head, _sep, tail = template_name.partition(UDIM_TOKEN)
+    return re.compile(rf"^{re.escape(head)}(\d{{4}}){re.escape(tail)}$")
+
+
+def enumerate_udim_tiles(template_path: str | Path) -> List[UdimTile]:
+    """Return existing tiles for a ``<UDIM>`` path using a single directory scan."""
+    template = Path(template_path)
+    if UDIM_TOKEN not in template.name:
+        return []
+    pattern = _template_regex(template.name)
+    tiles: List[UdimTile] = []
+    try:
+        with os.scandir(template.parent) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match is None:
+                    continue
+                number = int(match.group(1))
+                if number < UDIM_TILE_MIN or number > UDIM_TILE_MAX:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                tiles.append(UdimTile(number=number, path=Path(entry.path)))
+    except OSError:
+        return []
+    tiles.sort(key=lambda tile: tile.number)
+    return tiles
+
+
+def tile_path(template_path: str | Path, number: int) -> Path:
+    template = Path(template_path)
+    return template.with_name(template.name.replace(UDIM_TOKEN, f"{int(number):04d}"))
+
+
+def udim_template_filename(stem: str, ext: str) -> str:
+    clean_ext = ext if ext.startswith(".") else f".{ext}"
+    return f"{stem}.{UDIM_TOKEN}{clean_ext.lower()}"
+
+
+def udim_source_stem(template_name: str) -> str:
+    """Return the template stem without the UDIM token and its separator."""
+    stem = Path(template_name).stem.replace(UDIM_TOKEN, "")
+    return stem.strip("._- ")
+
+
+def _sha256_path(path: Path) -> Tuple[str, int]:
+    h = hashlib.sha256()
+    total = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                break
+            total += len(chunk)
+            h.update(chunk)
+    return h.hexdigest(), total
+
+
+def _run_parallel(
+    tiles: Sequence[UdimTile],
+    job: Callable[[UdimTile], object],
+    *,
+    max_workers: int,
+    progress: Optional[ProgressCallback],
+) -> List[object]:
+    total = len(tiles)
+    results: List[object] = [None] * total
+    if total == 0:
+        return results
+    workers = max(1, min(int(max_workers), total))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lime_udim") as pool:
+        futures = {pool.submit(job, tile): idx for idx, tile in enumerate(tiles)}
+        done = 0
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            done += 1
+            if progress is not None:
+                progress(done, total)
+    return results
+
+
+def hash_udim_tiles(
+    tiles: Sequence[UdimTile],
+    *,
+    max_workers: int = DEFAULT_TILE_WORKERS,
+    progress: Optional[ProgressCallback] = None,
+) -> List[UdimTileDigest]:
+    """Hash tiles concurrently; raises the first I/O error encountered."""
+
+    def _job(tile: UdimTile) -> UdimTileDigest:
+        digest, size = _sha256_path(tile.path)
+        return UdimTileDigest(number=tile.number, sha256=digest, size=size)
+
+    results = _run_parallel(tiles, _job, max_workers=max_workers, progress=progress)
+    return sorted((r for r in results if isinstance(r, UdimTileDigest)), key=lambda r: r.number)
+
+
+def combined_udim_digest(tile_digests: Sequence[UdimTileDigest]) -> str:
+    """Return a digest for the tile set as a unit (tile numbers + per-tile digests)."""
+    h = hashlib.sha256()
+    h.update(b"udim-v1\n")
+    for tile in sorted(tile_digests, key=lambda t: t.number):
+        h.update(f"{tile.number:04d}:{tile.sha256}\n".encode("ascii"))
+    return h.hexdigest()
+
+
+def udim_tile_set_exists(dest_template: Path, tile_digests: Sequence[UdimTileDigest]) -> bool:
+    for tile in tile_digests:
+        try:
+            if tile_path(dest_template, tile.number).stat().st_size != tile.size:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def unique_udim_destination(dest_root: Path, stem: str, ext: str, tile_numbers: Sequence[int]) -> Path:
+    """Return a template path under dest_root whose tiles do not collide with existing files."""
+
+    def _free(template: Path) -> bool:
+        return not any(tile_path(template, number).exists() for number in tile_numbers)
+
+    candidate = dest_root / udim_template_filename(stem, ext)
+    if _free(candidate):
+        return candidate
+    for idx in range(2, 1000):
+        candidate = dest_root / udim_template_filename(f"{stem}_{idx:02d}", ext)
+        if _free(candidate):
+            return candidate
+    return candidate
+
+
+def copy_udim_tiles(
+    tiles: Sequence[UdimTile],
+    dest_template: Path,
+    *,
+    max_workers: int = DEFAULT_TILE_WORKERS,
+    progress: Optional[ProgressCallback] = None,
+) -> Dict[int, Path]:
+    """Copy tiles concurrently next to dest_template; returns tile number -> destination.
+
+    When any copy fails, the tiles this call wrote are removed before the error
+    is re-raised, so no half-populated tile set is left for a later Apply to adopt.
+    """
+    written: List[Path] = []
+
+    def _job(tile: UdimTile) -> Tuple[int, Path]:
+        target = tile_path(dest_template, tile.number)
+        if not target.exists():
+            written.append(target)
+        shutil.copy2(str(tile.path), str(target))
+        return tile.number, target
+
+    try:
+        # _run_parallel only returns or raises after every started copy has finished
+        results = _run_parallel(tiles, _job, max_workers=max_workers, progress=progress)
+    except BaseException:
+        for target in written:
+            try:
+                os.remove(target)
+            except OSError:
+                pass
+        raise
+    return {number: target for number, target in (r for r in results if isinstance(r, tuple))}
+
+
+__all__ = [
+    "DEFAULT_TILE_WORKERS",
+    "UDIM_TOKEN",
+    "UdimTile",
+    "UdimTileDigest",
+    "combined_udim_digest",
+    "copy_udim_tiles",
+    "enumerate_udim_tiles",
+    "hash_udim_tiles",
+    "is_udim_path",
+    "tile_path",
+    "udim_source_stem",
+    "udim_template_filename",
+    "udim_tile_set_exists",
+    "unique_udim_destination",
+]
@@ -24,14 +24,19 @@ Key Features:
 
 from __future__ import annotations
 
-import re
-from typing import Optional, Tuple, List
-import re
+from typing import Dict, Optional, Tuple, List
 
 import bpy
+try:
+    from bpy.app.handlers import persistent
+except ImportError:
+    def persistent(func):
+        return func
 
-
-SHOT_ROOT_PATTERN = re.compile(r"^SHOT (\d{2,3})$")
+from .collection_hierarchy import CollectionHierarchy, collection_key
+from .draw_memo import DrawMemo
+from .layer_index import FlagBatch, LayerCollectionIndex
+from .shot_index_registry import SHOT_ROOT_PATTERN, ShotIndexRegistry
 
 
 def is_shot_name(name: str) -> bool:
@@ -43,19 +48,6 @@ def parse_shot_index(name: str) -> Optional[int]:
     return int(m.group(1)) if m else None
 
 
-def _collection_contains(ancestor: bpy.types.Collection, descendant: bpy.types.Collection) -> bool:
-    if ancestor == descendant:
-        return True
-    # BFS search over children
-    stack = list(ancestor.children)
-    while stack:
-        child = stack.pop()
-        if child == descendant:
-            return True
-        stack.extend(child.children)
-    return False
-
-
 def list_shot_roots(scene: bpy.types.Scene) -> List[tuple[bpy.types.Collection, int]]:
     roots: List[tuple[bpy.types.Collection, int]] = []
     for coll in scene.collection.children:
@@ -66,51 +58,184 @@ def list_shot_roots(scene: bpy.types.Scene) -> List[tuple[bpy.types.Collection,
     return roots
 
 
+# SHOT indices used by the file's collection and scene names. Depsgraph updates
+# apply renamed collections and scenes one by one; a full sync runs only when
+# collections or scenes were added or removed (their counts changed) and after
+# undo and file load.
+_SHOT_INDEX = ShotIndexRegistry()
+_SHOT_INDEX_STATE: Dict[str, object] = {"dirty": True, "stamp": None}
+
+
+def invalidate_shot_index(reset: bool = False) -> None:
+    _SHOT_INDEX_STATE["dirty"] = True
+    if reset:
+        _SHOT_INDEX.clear()
+
+
+def _shot_index_stamp() -> Optional[tuple]:
+    try:
+        return (len(bpy.data.collections), len(bpy.data.scenes))
+    except Exception:
+        return None
+
+
+def _apply_shot_index_updates(depsgraph) -> None:
+    """Feed collections and scenes reported by a depsgraph update into the registry."""
+    if _SHOT_INDEX_STATE["dirty"] or _shot_index_stamp() != _SHOT_INDEX_STATE["stamp"]:
+        # Added or removed data-blocks are not reported as updates: leave it to the next full sync.
+        return
+    for update in depsgraph.updates:
+        data = getattr(update.id, "original", update.id)
+        if isinstance(data, bpy.types.Collection):
+            # Scene master collections (embedded data) are not in bpy.data.collections
+            if not getattr(data, "is_embedded_data", False):
+                _SHOT_INDEX.set_collection(collection_key(data), data.name)
+        elif isinstance(data, bpy.types.Scene):
+            _SHOT_INDEX.set_scene(collection_key(data), data.name)
+
+
+def shot_index_registry() -> ShotIndexRegistry:
+    """Return the SHOT index registry, fully synced with bpy.data when data-blocks were added or removed."""
+    stamp = _shot_index_stamp()
+    if _SHOT_INDEX_STATE["dirty"] or stamp != _SHOT_INDEX_STATE["stamp"]:
+        _SHOT_INDEX.sync_collections((collection_key(c), c.name) for c in bpy.data.collections)
+        _SHOT_INDEX.sync_scenes((collection_key(sc), sc.name) for sc in bpy.data.scenes)
+        _SHOT_INDEX_STATE["dirty"] = False
+        _SHOT_INDEX_STATE["stamp"] = stamp
+    return _SHOT_INDEX
+
+
 def next_shot_index(scene: bpy.types.Scene) -> int:
-    max_idx = 0
+    # Every scene's SHOT roots are in bpy.data.collections, so the registry covers all scenes.
     try:
-        all_scenes = list(bpy.data.scenes)
+        return shot_index_registry().next_shot_index()
     except Exception:
-        all_scenes = [scene]
-    for sc in all_scenes:
-        try:
-            for _shot, idx in list_shot_roots(sc):
-                if idx is not None:
-                    max_idx = max(max_idx, idx)
-        except Exception:
-            pass
+        return max((idx for _shot, idx in list_shot_roots(scene)), default=0) + 1
+
+
+# Collection ancestry index, one per scene. Rebuilt lazily when the hierarchy
+# changes: handlers bump the generation on collection updates, undo and load,
+# and the key also covers the collection count and the scene's root children.
+_HIERARCHY_CACHE: Dict[int, Tuple[tuple, CollectionHierarchy]] = {}
+_HIERARCHY_GENERATION = 0
+
+# SHOT state shared by the panels, list rows and operator polls of one redraw.
+# Answers are keyed on window/area plus the selection state they derive from and
+# dropped by the hierarchy handlers on every depsgraph update, undo and load.
+_DRAW_MEMO = DrawMemo()
+
+
+def invalidate_collection_hierarchy() -> None:
+    global _HIERARCHY_GENERATION
+    _HIERARCHY_GENERATION += 1
+    _HIERARCHY_CACHE.clear()
+    _DRAW_MEMO.invalidate()
+
+
+def _hierarchy_key(scene: bpy.types.Scene) -> tuple:
     try:
-        for coll in bpy.data.collections:
-            idx = parse_shot_index(getattr(coll, 'name', '') or '')
-            if idx is not None:
-                max_idx = max(max_idx, idx)
+        collection_count = len(bpy.data.collections)
     except Exception:
-        pass
-    return (max_idx + 1) if max_idx else 1
+        collection_count = -1
+    roots = tuple((collection_key(c), c.name) for c in scene.collection.children)
+    return (_HIERARCHY_GENERATION, collection_count, roots)
 
 
-def find_shot_root_for_collection(coll: bpy.types.Collection, scene: Optional[bpy.types.Scene] = None) -> Optional[bpy.types.Collection]:
+def collection_hierarchy(scene: bpy.types.Scene) -> CollectionHierarchy:
+    """Return the (cached) collection ancestry index of scene."""
+    key = _hierarchy_key(scene)
+    cached = _HIERARCHY_CACHE.get(collection_key(scene))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    index = CollectionHierarchy(scene.collection, [shot for shot, _idx in list_shot_roots(scene)])
+    _HIERARCHY_CACHE[collection_key(scene)] = (key, index)
+    return index
+
+
+def shots_containing(coll: bpy.types.Collection, scene: Optional[bpy.types.Scene] = None) -> List[bpy.types.Collection]:
+    """SHOT roots whose subtree contains coll, lowest SHOT index first."""
     scene = scene or bpy.context.scene
-    for shot, _idx in list_shot_roots(scene):
-        if _collection_contains(shot, coll):
-            return shot
-    return None
+    index = collection_hierarchy(scene)
+    if coll not in index:
+        # Unknown collection: the hierarchy changed without a handler noticing.
+        _HIERARCHY_CACHE.pop(collection_key(scene), None)
+        index = collection_hierarchy(scene)
+        if coll not in index:
+            index.mark_outside(coll)
+    return index.shots_of(coll)
+
+
+def shot_root_of(coll: bpy.types.Collection, scene: Optional[bpy.types.Scene] = None) -> Optional[bpy.types.Collection]:
+    shots = shots_containing(coll, scene)
+    return shots[0] if shots else None
+
+
+@persistent
+def _hierarchy_depsgraph_handler(scene, depsgraph=None):
+    # Any update (selection included) may change the active SHOT shown by the UI.
+    _DRAW_MEMO.invalidate()
+    try:
+        if depsgraph is None:
+            invalidate_collection_hierarchy()
+            invalidate_shot_index()
+            return
+        collections = depsgraph.id_type_updated("COLLECTION")
+        if collections:
+            invalidate_collection_hierarchy()
+        if collections or depsgraph.id_type_updated("SCENE"):
+            _apply_shot_index_updates(depsgraph)
+    except Exception:
+        invalidate_collection_hierarchy()
+        invalidate_shot_index()
+
+
+@persistent
+def _hierarchy_reset_handler(*_args):
+    invalidate_collection_hierarchy()
+    # Data-block pointers are not stable across undo and load: rebuild from scratch.
+    invalidate_shot_index(reset=True)
+
+
+def register_hierarchy_handlers() -> None:
+    handlers = bpy.app.handlers
+    if _hierarchy_depsgraph_handler not in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.append(_hierarchy_depsgraph_handler)
+    for handler_list in (handlers.undo_post, handlers.redo_post, handlers.load_post):
+        if _hierarchy_reset_handler not in handler_list:
+            handler_list.append(_hierarchy_reset_handler)
+
+
+def unregister_hierarchy_handlers() -> None:
+    handlers = bpy.app.handlers
+    for handler_list, handler in (
+        (handlers.depsgraph_update_post, _hierarchy_depsgraph_handler),
+        (handlers.undo_post, _hierarchy_reset_handler),
+        (handlers.redo_post, _hierarchy_reset_handler),
+        (handlers.load_post, _hierarchy_reset_handler),
+    ):
+        try:
+            handler_list.remove(handler)
+        except ValueError:
+            pass
+    invalidate_collection_hierarchy()
+
+
+def find_shot_root_for_collection(coll: bpy.types.Collection, scene: Optional[bpy.types.Scene] = None) -> Optional[bpy.types.Collection]:
+    return shot_root_of(coll, scene)
 
 
 def active_shot_context(ctx) -> Optional[bpy.types.Collection]:
     scene = ctx.scene
-    shots = list_shot_roots(scene)
-    if not shots:
+    if not any(is_shot_name(c.name) for c in scene.collection.children):
         return None
 
     # Priority 1: active layer collection (if a collection is selected in Outliner)
     try:
         alc = ctx.view_layer.active_layer_collection
         if alc and alc.collection:
-            c = alc.collection
-            for shot, _ in shots:
-                if _collection_contains(shot, c):
-                    return shot
+            shot = shot_root_of(alc.collection, scene)
+            if shot is not None:
+                return shot
     except Exception:
         pass
 
@@ -127,9 +252,9 @@ def active_shot_context(ctx) -> Optional[bpy.types.Collection]:
 
     for ob in check_objs:
         for c in ob.users_collection:
-            for shot, _ in shots:
-                if _collection_contains(shot, c):
-                    return shot
+            shot = shot_root_of(c, scene)
+            if shot is not None:
+                return shot
 
     # Priority 3: scene's active camera (for cases like duplicated cameras in Image Editor context)
     try:
@@ -138,9 +263,7 @@ def active_shot_context(ctx) -> Optional[bpy.types.Collection]:
             # Find all valid shots that contain collections where the camera resides
             candidate_shots = []
             for c in active_cam.users_collection:
-                for shot, _ in shots:
-                    if _collection_contains(shot, c):
-                        candidate_shots.append(shot)
+                candidate_shots.extend(shots_containing(c, scene))
 
             # If we found candidate shots, return the one with highest index (most recent)
             if candidate_shots:
@@ -154,6 +277,70 @@ def active_shot_context(ctx) -> Optional[bpy.types.Collection]:
     return None
 
 
+def _pointer(value) -> int:
+    if value is None:
+        return 0
+    try:
+        return int(value.as_pointer())
+    except Exception:
+        return id(value)
+
+
+def _draw_scope(ctx) -> Optional[tuple]:
+    """Scope key for ctx, or None outside of UI drawing (no window/area)."""
+    window = getattr(ctx, "window", None)
+    area = getattr(ctx, "area", None)
+    scene = getattr(ctx, "scene", None)
+    if window is None or area is None or scene is None:
+        return None
+    view_layer = getattr(ctx, "view_layer", None)
+    try:
+        active_layer = view_layer.active_layer_collection.collection if view_layer is not None else None
+    except Exception:
+        active_layer = None
+    return (
+        _pointer(window),
+        _pointer(area),
+        _pointer(scene),
+        _pointer(view_layer),
+        _pointer(active_layer),
+        _pointer(getattr(ctx, "active_object", None)),
+        _pointer(getattr(scene, "camera", None)),
+    )
+
+
+def draw_cached(ctx, name: str, compute):
+    """Return compute() memoized for the current redraw of ctx's area (uncached outside drawing)."""
+    scope = _draw_scope(ctx)
+    if scope is None:
+        return compute()
+    return _DRAW_MEMO.get(scope, name, compute)
+
+
+def invalidate_draw_state() -> None:
+    _DRAW_MEMO.invalidate()
+
+
+def active_shot_for_draw(ctx) -> Optional[bpy.types.Collection]:
+    """`active_shot_context` resolved once per redraw, for panels, UI lists and polls."""
+    return draw_cached(ctx, "active_shot", lambda: active_shot_context(ctx))
+
+
+def shot_roots_for_draw(ctx) -> List[tuple[bpy.types.Collection, int]]:
+    """`list_shot_roots` of ctx.scene resolved once per redraw (do not mutate the result)."""
+    return draw_cached(ctx, "shot_roots", lambda: list_shot_roots(ctx.scene))
+
+
+def active_shot_child_for_draw(ctx, base_name: str) -> Optional[bpy.types.Collection]:
+    """Child collection base_name (e.g. the camera collection) of the active SHOT, once per redraw."""
+
+    def _compute():
+        shot = active_shot_for_draw(ctx)
+        return get_shot_child_by_basename(shot, base_name) if shot is not None else None
+
+    return draw_cached(ctx, f"shot_child:{base_name}", _compute)
+
+
 def can_create_new_shot(scene: bpy.types.Scene) -> Tuple[bool, str]:
     return True, ""
 
@@ -195,155 +382,44 @@ def isolate_shots_temporarily(scene: bpy.types.Scene, target_shot: bpy.types.Col
 
     Returns a restore() function that reverts visibility/exclusion state.
     If include_all is True or target_shot is None, it's a no-op.
+    The view layer is indexed once; flags that already have the wanted value are not written.
     """
     try:
         if include_all or target_shot is None:
             return lambda: None
 
-        def _find_layer_collection(layer: bpy.types.LayerCollection | None, coll: bpy.types.Collection | None):
-            if layer is None or coll is None:
-                return None
-            if layer.collection == coll:
-                return layer
-            for ch in getattr(layer, 'children', []) or []:
-                found = _find_layer_collection(ch, coll)
-                if found:
-                    return found
-            return None
-
         def _iter_coll_subtree(root: bpy.types.Collection):
             stack = [root]
+            seen = set()
             while stack:
                 c = stack.pop()
+                key = collection_key(c)
+                if key in seen:
+                    continue
+                seen.add(key)
                 yield c
                 try:
                     stack.extend(list(c.children))
                 except Exception:
                     pass
 
-        def _iter_layer_subtree(root_layer: bpy.types.LayerCollection | None):
-            if root_layer is None:
-                return
-            stack = [root_layer]
-            while stack:
-                lc = stack.pop()
-                yield lc
-                try:
-                    stack.extend(list(lc.children))
-                except Exception:
-                    pass
-
         shots = list_shot_roots(scene)
         others = [s for s, _ in shots if s != target_shot]
+        flags = FlagBatch()
 
-        # Save and hide other shots (root level only)
-        saved_others_coll = []
-        for c in others:
-            try:
-                saved_others_coll.append((c, bool(getattr(c, 'hide_viewport', False)), bool(getattr(c, 'hide_render', False))))
-                c.hide_viewport = True
-            except Exception:
-                pass
-            try:
-                c.hide_render = True
-            except Exception:
-                pass
-
-        saved_others_layers = []
-        try:
-            vl = bpy.context.view_layer
-            base = vl.layer_collection if vl else None
-            for c in others:
-                lc = _find_layer_collection(base, c)
-                if lc is not None:
-                    saved_others_layers.append((lc, bool(getattr(lc, 'exclude', False)), bool(getattr(lc, 'hide_viewport', False))))
-                    try:
-                        lc.exclude = True
-                    except Exception:
-                        pass
-                    try:
-                        lc.hide_viewport = True
-                    except Exception:
-                        pass
-        except Exception:
-            pass
-
-        # Ensure target shot subtree is visible/unexcluded
-        saved_target_coll = []
-        try:
-            for c in _iter_coll_subtree(target_shot):
-                saved_target_coll.append((c, bool(getattr(c, 'hide_viewport', False)), bool(getattr(c, 'hide_render', False))))
-                try:
-                    c.hide_viewport = False
-                except Exception:
-                    pass
-                try:
-                    c.hide_render = False
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        saved_target_layers = []
+        # Hide other shots (root level only), then make the target subtree visible
+        flags.set_many(others, {"hide_viewport": True, "hide_render": True})
         try:
             vl = bpy.context.view_layer
-            base = vl.layer_collection if vl else None
-            target_lc = _find_layer_collection(base, target_shot)
-            if target_lc is not None:
-                for lc in _iter_layer_subtree(target_lc):
-                    saved_target_layers.append((lc, bool(getattr(lc, 'exclude', False)), bool(getattr(lc, 'hide_viewport', False))))
-                    try:
-                        lc.exclude = False
-                    except Exception:
-                        pass
-                    try:
-                        lc.hide_viewport = False
-                    except Exception:
-                        pass
+            layers = LayerCollectionIndex(vl.layer_collection if vl else None)
         except Exception:
-            pass
-
-        def _restore():
-            # Restore other shots
-            for c, hv, hr in saved_others_coll:
-                try:
-                    c.hide_viewport = hv
-                except Exception:
-                    pass
-                try:
-                    c.hide_render = hr
-                except Exception:
-                    pass
-            for lc, ex, hv in saved_others_layers:
-                try:
-                    lc.exclude = ex
-                except Exception:
-                    pass
-                try:
-                    lc.hide_viewport = hv
-                except Exception:
-                    pass
-            # Restore target shot subtree
-            for c, hv, hr in saved_target_coll:
-                try:
-                    c.hide_viewport = hv
-                except Exception:
-                    pass
-                try:
-                    c.hide_render = hr
-                except Exception:
-                    pass
-            for lc, ex, hv in saved_target_layers:
-                try:
-                    lc.exclude = ex
-                except Exception:
-                    pass
-                try:
-                    lc.hide_viewport = hv
-                except Exception:
-                    pass
+            layers = LayerCollectionIndex(None)
+        other_layers = [lc for lc in (layers.get(c) for c in others) if lc is not None]
+        flags.set_many(other_layers, {"exclude": True, "hide_viewport": True})
+        flags.set_many(_iter_coll_subtree(target_shot), {"hide_viewport": False, "hide_render": False})
+        flags.set_many(layers.subtree(target_shot), {"exclude": False, "hide_viewport": False})
 
-        return _restore
+        return flags.restore
     except Exception:
         return lambda: None
 
@@ -14,7 +14,9 @@ from .ops import (
     LIME_OT_ai_render_delete_batch,
     LIME_OT_ai_render_delete_selected,
     LIME_OT_ai_render_frame,
+    LIME_OT_ai_render_frames_batch,
     LIME_OT_ai_render_generate,
+    LIME_OT_ai_render_generate_queue,
     LIME_OT_ai_render_import_style,
     LIME_OT_ai_render_open_outputs_folder,
     LIME_OT_ai_render_open_preview,
@@ -33,7 +35,9 @@ from .ui import LIME_PT_ai_render_converter
 CLASSES = (
     LIME_OT_ai_render_refresh,
     LIME_OT_ai_render_frame,
+    LIME_OT_ai_render_frames_batch,
     LIME_OT_ai_render_generate,
+    LIME_OT_ai_render_generate_queue,
     LIME_OT_ai_render_retry,
     LIME_OT_ai_render_cancel,
     LIME_OT_ai_render_test_connection,
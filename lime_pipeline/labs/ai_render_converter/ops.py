@@ -7,6 +7,7 @@ and optional prompt rewriting via OpenRouter.
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 import base64
 from pathlib import Path
@@ -14,17 +15,34 @@ import re
 import hashlib
 import json
 import shutil
+import threading
 import time
+import types
 import urllib.request
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import bpy
 from bpy.types import Operator, Scene
 from bpy.props import BoolProperty, EnumProperty, StringProperty
 
 from ...core import validate_scene
+from ...core.asset_upload_cache import AssetUploadCache
+from ...core.content_index import ContentIndex
+from ...core.dir_scan import DirectoryListing, DirectoryScanner, ScanEntry
+from ...core.generation_index import INDEX_FILENAME, GenerationIndex, frame_key, parse_output_version
+from ...core.http_download import download_to_file
+from ...core.jsonl_log import atomic_write_json
+from ...core.render_fingerprint import FingerprintStore
+from ...core.ai_render_queue import (
+    ConversionJob,
+    ConversionQueue,
+    JOB_FAILED,
+    cancel_when_submitted,
+    parse_frame_list,
+)
 from ...ops.ops_save_templates import _ensure_editables_dir, _resolve_prj_rev_sc, _camera_index_for_shot
 from ...prefs import LimePipelinePrefs
+from ...scene.render_state import apply_preview_samples, content_extra, render_fingerprint
 from .props import update_ai_render_asset_cache
 from ...ops.ai_http import (
     has_krea_api_key,
@@ -43,6 +61,7 @@ from ...ops.ai_http import (
 KREA_GENERATE_PATH = "/generate/image"
 KREA_ASSETS_PATH = "/assets"
 KREA_JOBS_PATH = "/jobs"
+KREA_ASSET_CACHE_FILENAME = "krea_asset_cache.json"
 
 STYLE_PROMPT = (
     "Generate a storyboard style black and white illustration based on the analyzed object and the provided "
@@ -91,6 +110,7 @@ class AiRenderPaths:
     outputs_dir: Path
     tmp_dir: Path
     manifests_dir: Path
+    thumbs_dir: Path
 
 
 def _addon_prefs(context) -> LimePipelinePrefs | None:
@@ -124,6 +144,25 @@ def _krea_cancel_url(prefs: LimePipelinePrefs, job_id: str) -> str:
     return f"{_krea_base_url(prefs)}{KREA_JOBS_PATH}/{job_id}"
 
 
+_PREFS_SNAPSHOT_ATTRS = (
+    "krea_base_url",
+    "krea_model",
+    "krea_debug",
+    "openrouter_model",
+    "http_referer",
+    "x_title",
+)
+
+
+class KreaRateLimitError(RuntimeError):
+    """Raised when Krea answers a request with HTTP 429."""
+
+
+def _prefs_snapshot(prefs: LimePipelinePrefs) -> types.SimpleNamespace:
+    """Copy the preference values used by the Krea/OpenRouter helpers for use in worker threads."""
+    return types.SimpleNamespace(**{name: getattr(prefs, name, "") for name in _PREFS_SNAPSHOT_ATTRS})
+
+
 def _debug_log(prefs: LimePipelinePrefs | None, message: str) -> None:
     try:
         if not prefs or not getattr(prefs, "krea_debug", False):
@@ -141,7 +180,8 @@ def _ensure_ai_dirs(state) -> AiRenderPaths:
     outputs_dir = ai_root / "outputs"
     tmp_dir = ai_root / "tmp"
     manifests_dir = ai_root / "manifests"
-    for folder in (ai_root, sources_dir, styles_dir, outputs_dir, tmp_dir, manifests_dir):
+    thumbs_dir = ai_root / "thumbs"
+    for folder in (ai_root, sources_dir, styles_dir, outputs_dir, tmp_dir, manifests_dir, thumbs_dir):
         folder.mkdir(parents=True, exist_ok=True)
     return AiRenderPaths(
         ai_root=ai_root,
@@ -150,16 +190,20 @@ def _ensure_ai_dirs(state) -> AiRenderPaths:
         outputs_dir=outputs_dir,
         tmp_dir=tmp_dir,
         manifests_dir=manifests_dir,
+        thumbs_dir=thumbs_dir,
     )
 
 
 def _frame_context(context) -> FrameContext:
     scene = context.scene
-    project_name, sc_number, rev = _resolve_prj_rev_sc(context.window_manager.lime_pipeline)
     shot = validate_scene.active_shot_context(context)
+    return _frame_context_for(context, shot, scene.camera, int(getattr(scene, "frame_current", 0) or 0))
+
+
+def _frame_context_for(context, shot, camera, frame: int) -> FrameContext:
+    project_name, sc_number, rev = _resolve_prj_rev_sc(context.window_manager.lime_pipeline)
     shot_idx = validate_scene.parse_shot_index(shot.name) if shot else 0
-    cam_idx = _camera_index_for_shot(shot, scene.camera) if shot and scene.camera else 1
-    frame = int(getattr(scene, "frame_current", 0) or 0)
+    cam_idx = _camera_index_for_shot(shot, camera) if shot and camera else 1
     if sc_number <= 0:
         raise RuntimeError("Scene number not configured. Set SC in Project Organization.")
     if not rev:
@@ -284,40 +328,40 @@ def _file_sha256(path: Path) -> str:
     return h.hexdigest()
 
 
+STYLE_INDEX_FILENAME = ".style_index.json"
+_STYLE_INDEXES: Dict[str, ContentIndex] = {}
+_STYLE_INDEXES_LOCK = threading.Lock()
+
+
+def _style_index(styles_dir: Path) -> ContentIndex:
+    """Return the persistent digest index of a styles folder (one instance per folder per session)."""
+    key = styles_dir.as_posix()
+    with _STYLE_INDEXES_LOCK:
+        index = _STYLE_INDEXES.get(key)
+        if index is None:
+            index = ContentIndex(styles_dir, styles_dir / STYLE_INDEX_FILENAME, extensions=_IMAGE_EXTS)
+            _STYLE_INDEXES[key] = index
+        return index
+
+
 def _persist_style_image(src_path: Path, dest_dir: Path) -> Path:
     if dest_dir in src_path.parents:
         return src_path
-    try:
-        src_size = src_path.stat().st_size
-    except Exception:
-        src_size = -1
+    index = _style_index(dest_dir)
     src_hash = ""
     try:
+        src_size = src_path.stat().st_size
         src_hash = _file_sha256(src_path)
     except Exception:
-        src_hash = ""
+        src_size = -1
     if src_hash:
-        try:
-            for existing in dest_dir.iterdir():
-                if not existing.is_file():
-                    continue
-                if existing.suffix.lower() not in _IMAGE_EXTS:
-                    continue
-                try:
-                    if src_size > 0 and existing.stat().st_size != src_size:
-                        continue
-                except Exception:
-                    pass
-                try:
-                    if _file_sha256(existing) == src_hash:
-                        return existing
-                except Exception:
-                    continue
-        except Exception:
-            pass
+        existing = index.find_duplicate(src_hash, src_size)
+        if existing is not None:
+            return existing
     stamp = time.strftime("%Y%m%d_%H%M%S")
     dest = dest_dir / f"Style_{stamp}{src_path.suffix or '.png'}"
     shutil.copy2(src_path, dest)
+    index.add(dest, src_hash)
     return dest
 
 
@@ -331,15 +375,54 @@ def _read_manifest(path: Path) -> Dict[str, object]:
 
 
 def _write_manifest(path: Path, data: Dict[str, object]) -> None:
-    path.write_text(json.dumps(data, indent=2, sort_keys=False), encoding="utf-8")
+    atomic_write_json(path, data, indent=2)
+
 
+_GENERATION_INDEXES: Dict[str, GenerationIndex] = {}
+_GENERATION_INDEXES_LOCK = threading.Lock()
 
-def _append_generation(manifest: Dict[str, object], entry: Dict[str, object]) -> None:
-    generations = manifest.get("generations")
-    if not isinstance(generations, list):
-        generations = []
-    generations.append(entry)
-    manifest["generations"] = generations
+
+def _legacy_manifest_records(manifests_dir: Path) -> Iterable[Dict[str, object]]:
+    """Yield index records for generations stored only in per-frame JSON manifests."""
+    for path in sorted(_list_manifests(manifests_dir)):
+        manifest = _read_manifest(path)
+        context = manifest.get("context") if isinstance(manifest.get("context"), dict) else {}
+        generations = manifest.get("generations")
+        if not isinstance(generations, list):
+            continue
+        for entry in generations:
+            if not isinstance(entry, dict):
+                continue
+            record: Dict[str, object] = dict(context)
+            record.update(entry)
+            record["frame"] = manifest.get("frame", 0)
+            if isinstance(manifest.get("source"), dict):
+                record["source"] = manifest["source"]
+            if isinstance(manifest.get("style"), dict):
+                record["style"] = manifest["style"]
+            record["updated_at"] = manifest.get("updated_at", "")
+            yield record
+
+
+def _generation_index(paths: AiRenderPaths) -> GenerationIndex:
+    """Return the shared generation index of an AI folder, seeding it from legacy manifests once."""
+    key = paths.manifests_dir.as_posix()
+    with _GENERATION_INDEXES_LOCK:
+        index = _GENERATION_INDEXES.get(key)
+        if index is None:
+            index = GenerationIndex(paths.manifests_dir / INDEX_FILENAME)
+            if not index.exists:
+                index.import_records(_legacy_manifest_records(paths.manifests_dir))
+            _GENERATION_INDEXES[key] = index
+        return index
+
+
+def _drop_generation_index(paths: AiRenderPaths) -> None:
+    with _GENERATION_INDEXES_LOCK:
+        index = _GENERATION_INDEXES.pop(paths.manifests_dir.as_posix(), None)
+    if index is None:
+        index = GenerationIndex(paths.manifests_dir / INDEX_FILENAME)
+    index.reset()
 
 
 def _guess_mimetype(path: Path) -> str:
@@ -393,17 +476,105 @@ def _sort_sources(paths: List[Path]) -> List[Path]:
     return sorted(paths, key=sort_key)
 
 
-def _sort_by_mtime(paths: List[Path]) -> List[Path]:
-    def sort_key(path: Path):
+def _sort_entries_by_mtime(entries: Iterable[ScanEntry]) -> List[Path]:
+    return [Path(entry.path) for entry in sorted(entries, key=lambda entry: entry.mtime, reverse=True)]
+
+
+_ASSET_SCANNER = DirectoryScanner(_IMAGE_EXTS)
+_ASSET_SCAN_LOCK = threading.Lock()
+_ASSET_SCAN_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_ASSET_SCAN_PENDING: Dict[str, Tuple[Future, float, AiRenderPaths]] = {}
+_ASSET_SCAN_TICK_SECONDS = 0.25
+
+
+def _scan_ai_assets(paths: AiRenderPaths, *, force: bool = False) -> Tuple[DirectoryListing, ...]:
+    return tuple(
+        _ASSET_SCANNER.scan(folder, force=force)
+        for folder in (paths.sources_dir, paths.styles_dir, paths.outputs_dir)
+    )
+
+
+def _apply_asset_listings(
+    state, paths: AiRenderPaths, listings: Tuple[DirectoryListing, ...], *, force: bool, now: float
+) -> None:
+    """Push scanned listings into the panel state; unchanged listings leave the state untouched."""
+    token = "|".join(listing.token for listing in listings)
+    if not force and token == getattr(state, "assets_scan_token", ""):
+        state.assets_last_scan = now
+        return
+    sources, styles, results = listings
+    mtimes = {entry.path: entry.mtime for listing in listings for entry in listing.entries}
+    update_ai_render_asset_cache(
+        state,
+        _sort_sources([Path(entry.path) for entry in sources.entries]),
+        _sort_entries_by_mtime(styles.entries),
+        _sort_entries_by_mtime(results.entries),
+        force_reload=force,
+        mtimes=mtimes,
+        thumbs_dir=paths.thumbs_dir,
+    )
+    state.assets_scan_token = token
+    state.assets_last_scan = now
+
+
+def _apply_background_asset_scans() -> Optional[float]:
+    """Timer callback: apply finished background scans on the main thread."""
+    with _ASSET_SCAN_LOCK:
+        finished = [(name, item) for name, item in _ASSET_SCAN_PENDING.items() if item[0].done()]
+        for name, _item in finished:
+            _ASSET_SCAN_PENDING.pop(name, None)
+        remaining = bool(_ASSET_SCAN_PENDING)
+    for scene_name, (future, submitted_at, paths) in finished:
+        if future.exception() is not None:
+            continue
+        scene = bpy.data.scenes.get(scene_name)
+        state = getattr(scene, "lime_ai_render", None) if scene is not None else None
+        if state is None:
+            continue
+        if float(getattr(state, "assets_last_scan", 0.0) or 0.0) > submitted_at:
+            # A synchronous refresh ran meanwhile; this listing may be older.
+            continue
         try:
-            return float(path.stat().st_mtime)
+            _apply_asset_listings(state, paths, future.result(), force=False, now=time.monotonic())
         except Exception:
-            return 0.0
+            pass
+    return _ASSET_SCAN_TICK_SECONDS if remaining else None
+
+
+def _submit_background_asset_scan(scene, paths: AiRenderPaths) -> None:
+    global _ASSET_SCAN_EXECUTOR
+    with _ASSET_SCAN_LOCK:
+        if scene.name in _ASSET_SCAN_PENDING:
+            return
+        if _ASSET_SCAN_EXECUTOR is None:
+            _ASSET_SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LimeAIAssetScan")
+        _ASSET_SCAN_PENDING[scene.name] = (_ASSET_SCAN_EXECUTOR.submit(_scan_ai_assets, paths), time.monotonic(), paths)
+    if not bpy.app.timers.is_registered(_apply_background_asset_scans):
+        bpy.app.timers.register(_apply_background_asset_scans, first_interval=_ASSET_SCAN_TICK_SECONDS)
+
+
+def _shutdown_asset_scans() -> None:
+    global _ASSET_SCAN_EXECUTOR
+    try:
+        if bpy.app.timers.is_registered(_apply_background_asset_scans):
+            bpy.app.timers.unregister(_apply_background_asset_scans)
+    except Exception:
+        pass
+    with _ASSET_SCAN_LOCK:
+        _ASSET_SCAN_PENDING.clear()
+        executor, _ASSET_SCAN_EXECUTOR = _ASSET_SCAN_EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+    _ASSET_SCANNER.forget()
 
-    return sorted(paths, key=sort_key, reverse=True)
 
+def refresh_ai_render_assets(context, *, force: bool = False, background: bool = False) -> None:
+    """Refresh the source/style/result listings shown by the panel.
 
-def refresh_ai_render_assets(context, *, force: bool = False) -> None:
+    Folders whose mtime is unchanged are not re-listed. With ``background=True``
+    the scan runs on a worker thread and a timer applies the result; forced
+    refreshes always scan synchronously and reload previews.
+    """
     scene = context.scene
     state = getattr(scene, "lime_ai_render", None)
     if state is None:
@@ -415,17 +586,87 @@ def refresh_ai_render_assets(context, *, force: bool = False) -> None:
         paths = _ensure_ai_dirs(context.window_manager.lime_pipeline)
     except Exception:
         return
-    sources = _sort_sources(_list_images(paths.sources_dir))
-    styles = _sort_by_mtime(_list_images(paths.styles_dir))
-    results = _sort_by_mtime(_list_images(paths.outputs_dir))
+    if background and not force:
+        _submit_background_asset_scan(scene, paths)
+        return
     try:
-        update_ai_render_asset_cache(state, sources, styles, results, force_reload=force)
-        state.assets_last_scan = now
+        _apply_asset_listings(state, paths, _scan_ai_assets(paths, force=force), force=force, now=now)
     except Exception:
         pass
 
 
-def _upload_krea_asset(prefs: LimePipelinePrefs, path: Path) -> Dict[str, str]:
+_ASSET_CACHES: Dict[str, AssetUploadCache] = {}
+
+
+def _krea_asset_cache(paths: AiRenderPaths) -> AssetUploadCache:
+    """Return the persistent upload cache of an AI folder (one instance per folder per session)."""
+    key = paths.ai_root.as_posix()
+    cache = _ASSET_CACHES.get(key)
+    if cache is None:
+        cache = AssetUploadCache(paths.ai_root / KREA_ASSET_CACHE_FILENAME)
+        _ASSET_CACHES[key] = cache
+    return cache
+
+
+SOURCE_FINGERPRINTS_FILENAME = "source_fingerprints.json"
+
+
+def _source_fingerprints(paths: AiRenderPaths) -> FingerprintStore:
+    return FingerprintStore(paths.ai_root / SOURCE_FINGERPRINTS_FILENAME)
+
+
+def _source_content_extra(context):
+    """Content digests (evaluated geometry, materials, lights) for source fingerprints; one per batch."""
+    try:
+        depsgraph = context.evaluated_depsgraph_get()
+    except Exception:
+        depsgraph = None
+    return content_extra(depsgraph)
+
+
+def _render_source_still(scene, source_path: Path) -> bool:
+    """Render the current frame of scene to source_path; returns False when cancelled."""
+    prev_path = scene.render.filepath
+    try:
+        source_path.parent.mkdir(parents=True, exist_ok=True)
+        scene.render.filepath = source_path.as_posix()
+        result = bpy.ops.render.render(write_still=True)
+        return not (result == {"CANCELLED"} or ("CANCELLED" in result and "FINISHED" not in result))
+    finally:
+        scene.render.filepath = prev_path
+
+
+def _asset_url_reachable(url: str) -> bool:
+    """Probe a cached asset URL with a one-byte ranged GET (signed URLs often reject HEAD)."""
+    try:
+        req = urllib.request.Request(url, headers={"User-Agent": "LimePipeline", "Range": "bytes=0-0"})
+        with urllib.request.urlopen(req, timeout=15) as resp:
+            return 200 <= int(getattr(resp, "status", 200) or 200) < 300
+    except Exception:
+        return False
+
+
+def _upload_krea_asset(
+    prefs: LimePipelinePrefs,
+    path: Path,
+    *,
+    cache: Optional[AssetUploadCache] = None,
+) -> Dict[str, str]:
+    digest = ""
+    if cache is not None:
+        try:
+            digest = cache.file_digest(path)
+        except OSError:
+            digest = ""
+        cached = cache.lookup(digest) if digest else None
+        if cached and cached.get("url"):
+            if not cache.needs_validation(digest) or _asset_url_reachable(cached["url"]):
+                cache.mark_validated(digest)
+                _debug_log(prefs, f"Upload cache hit: {path.name}")
+                return cached
+            _debug_log(prefs, f"Upload cache entry no longer valid: {path.name}")
+            cache.invalidate(digest)
+
     url = f"{_krea_base_url(prefs)}{KREA_ASSETS_PATH}"
     _debug_log(prefs, f"Upload asset: {path.name} -> {url}")
     data = path.read_bytes()
@@ -442,7 +683,10 @@ def _upload_krea_asset(prefs: LimePipelinePrefs, path: Path) -> Dict[str, str]:
         raise RuntimeError(f"Krea asset upload failed: {resp.error}")
     if not resp.data:
         raise RuntimeError("Krea asset upload returned no data")
-    return _parse_asset_ref(resp.data)
+    ref = _parse_asset_ref(resp.data)
+    if cache is not None and digest and ref.get("url"):
+        cache.store(digest, ref)
+    return ref
 
 
 def _parse_asset_ref(data: Dict[str, object]) -> Dict[str, str]:
@@ -522,6 +766,7 @@ def _create_krea_job(
     source_path: Optional[Path] = None,
     source_strength: float = 1.6,
     style_strength: float = 0.6,
+    source_size: Optional[tuple[int, int]] = None,
 ) -> tuple[str, str]:
     url = _krea_generate_url(prefs)
     _debug_log(prefs, f"Create job: {url}")
@@ -540,7 +785,7 @@ def _create_krea_job(
         payload["styleImages"] = style_images
         strengths = [img.get("strength") for img in style_images]
         _debug_log(prefs, f"Style images: {len(style_images)} strengths={strengths} source_first={bool(source_url)}")
-    width, height = _resolve_source_size(source_path)
+    width, height = source_size if source_size is not None else _resolve_source_size(source_path)
     if width > 0 and height > 0:
         payload["width"] = width
         payload["height"] = height
@@ -549,6 +794,8 @@ def _create_krea_job(
     _debug_log(prefs, f"Create job response status={resp.status} error={bool(resp.error)}")
 
     if resp.error:
+        if int(resp.status or 0) == 429:
+            raise KreaRateLimitError(f"Krea job creation rate limited: {resp.error}")
         raise RuntimeError(f"Krea job creation failed: {resp.error}")
     if not resp.data:
         raise RuntimeError("Krea job creation returned no data")
@@ -634,20 +881,21 @@ def _extract_urls(data: Dict[str, object]) -> List[str]:
 
 
 def _download_url(url: str, dest_path: Path) -> None:
-    req = urllib.request.Request(url, headers={"User-Agent": "LimePipeline"})
-    with urllib.request.urlopen(req, timeout=60) as resp:
-        dest_path.write_bytes(resp.read())
+    # Streams to <dest>.part, resumes with Range requests, verifies, then renames atomically.
+    download_to_file(url, dest_path, headers={"User-Agent": "LimePipeline"}, timeout=60)
+
 
+def _next_version(paths: AiRenderPaths, base_stem: str, rev: str) -> int:
+    """Reserve the next output version from the generation index (no directory glob).
 
-def _next_version(outputs_dir: Path, base_stem: str, rev: str) -> int:
-    max_version = 0
-    for path in outputs_dir.glob(f"{base_stem}_V*_Rev_{rev}.png"):
-        stem = path.stem
-        parts = stem.split("_")
-        for part in parts:
-            if part.startswith("V") and part[1:].isdigit():
-                max_version = max(max_version, int(part[1:]))
-    return max_version + 1
+    Outputs written outside the index (e.g. copied in by hand) are skipped with a
+    single existence check per candidate.
+    """
+    index = _generation_index(paths)
+    while True:
+        version = index.reserve_version(base_stem, rev)
+        if not (paths.outputs_dir / f"{base_stem}_V{version:02d}_Rev_{rev}.png").exists():
+            return version
 
 
 def _normalized_status(status_raw: str) -> str:
@@ -697,6 +945,20 @@ def refresh_ai_render_state(context, *, force: bool = False) -> None:
         pass
 
 
+def _set_job_status(state, status: str, message: str = "") -> None:
+    try:
+        if state.job_status != status:
+            state.job_status = status
+    except Exception:
+        pass
+    if message:
+        try:
+            if state.job_message != message:
+                state.job_message = message
+        except Exception:
+            pass
+
+
 def _frame_change_handler(scene: Scene) -> None:
     try:
         ctx = bpy.context
@@ -720,6 +982,7 @@ def unregister_ai_render_handlers() -> None:
         bpy.app.handlers.frame_change_post.remove(_frame_change_handler)
     except Exception:
         pass
+    _shutdown_asset_scans()
 
 
 class LIME_OT_ai_render_refresh(Operator):
@@ -753,23 +1016,25 @@ class LIME_OT_ai_render_frame(Operator):
             self.report({"ERROR"}, str(ex))
             return {"CANCELLED"}
 
-        prev_path = scene.render.filepath
         try:
-            source_path.parent.mkdir(parents=True, exist_ok=True)
-            scene.render.filepath = source_path.as_posix()
-            result = bpy.ops.render.render(write_still=True)
-            if result == {"CANCELLED"} or ("CANCELLED" in result and "FINISHED" not in result):
+            if not _render_source_still(scene, source_path):
                 self.report({"ERROR"}, "Render cancelled")
                 return {"CANCELLED"}
         except Exception as ex:
             self.report({"ERROR"}, f"Render failed: {ex}")
             return {"CANCELLED"}
-        finally:
-            scene.render.filepath = prev_path
 
         if not source_path.exists():
             self.report({"ERROR"}, "Render completed but output file was not found")
             return {"CANCELLED"}
+        try:
+            # Lets a later batch pass skip this frame while the scene stays unchanged.
+            store = _source_fingerprints(paths)
+            fingerprint = render_fingerprint(scene, scene.camera, object_extra=_source_content_extra(context))
+            store.record(source_path.name, fingerprint, source_path)
+            store.save()
+        except Exception:
+            pass
 
         new_path = source_path.as_posix()
         if state.source_image_path != new_path:
@@ -780,6 +1045,175 @@ class LIME_OT_ai_render_frame(Operator):
         return {"FINISHED"}
 
 
+class LIME_OT_ai_render_frames_batch(Operator):
+    bl_idname = "lime.ai_render_frames_batch"
+    bl_label = "AI: Render Source Frames"
+    bl_description = (
+        "Render the source frames of the active SHOT's camera markers (or the Queue Frames list) in one pass. "
+        "Frames whose source exists and whose scene state is unchanged are skipped"
+    )
+    bl_options = {"REGISTER"}
+
+    frame_source: EnumProperty(
+        name="Frames",
+        items=[
+            ("MARKERS", "Camera Markers", "Every camera marker of the active SHOT"),
+            ("LIST", "Frame List", "Frames listed in Queue Frames"),
+        ],
+        default="MARKERS",
+    )
+
+    _timer = None
+    _tasks: List[Tuple[int, object, Path]] = []
+    _index = 0
+    _rendered = 0
+    _skipped = 0
+    _failed = 0
+    _store: Optional[FingerprintStore] = None
+    _content_extra = None
+    _restore_samples = None
+    _prev_frame = 0
+    _prev_camera = None
+
+    def _collect_tasks(self, context, state, paths: AiRenderPaths) -> List[Tuple[int, object, Path]]:
+        scene = context.scene
+        shot = validate_scene.active_shot_context(context)
+        if self.frame_source == "LIST":
+            frames = [(frame, _camera_at_frame(scene, frame)) for frame in parse_frame_list(state.queue_frames or "")]
+        else:
+            if shot is None:
+                raise RuntimeError("No active SHOT. Select a SHOT to render its camera markers.")
+            frames = _shot_camera_markers(scene, shot)
+        tasks = []
+        seen = set()
+        for frame, camera in frames:
+            if camera is None:
+                continue
+            source_path = paths.sources_dir / _build_source_filename(_frame_context_for(context, shot, camera, frame))
+            if source_path.name in seen:
+                continue
+            seen.add(source_path.name)
+            tasks.append((frame, camera, source_path))
+        return tasks
+
+    def invoke(self, context, event):
+        scene = context.scene
+        state = getattr(scene, "lime_ai_render", None)
+        if state is None:
+            self.report({"ERROR"}, "AI Render state not available")
+            return {"CANCELLED"}
+        if state.is_busy:
+            self.report({"WARNING"}, "AI job already running")
+            return {"CANCELLED"}
+        try:
+            paths = _ensure_ai_dirs(context.window_manager.lime_pipeline)
+            self._tasks = self._collect_tasks(context, state, paths)
+        except ValueError:
+            self.report({"ERROR"}, "Invalid frame list. Use values like 1, 12, 20-24")
+            return {"CANCELLED"}
+        except Exception as ex:
+            self.report({"ERROR"}, str(ex))
+            return {"CANCELLED"}
+        if not self._tasks:
+            self.report({"ERROR"}, "No camera frames to render")
+            return {"CANCELLED"}
+
+        self._store = _source_fingerprints(paths)
+        self._content_extra = _source_content_extra(context)
+        self._index = 0
+        self._rendered = self._skipped = self._failed = 0
+        self._prev_frame = int(scene.frame_current)
+        self._prev_camera = scene.camera
+        self._restore_samples = None
+        if getattr(state, "batch_low_samples", False):
+            self._restore_samples = apply_preview_samples(scene, int(getattr(state, "batch_preview_samples", 16) or 16))
+
+        state.is_busy = True
+        state.batch_active = True
+        state.cancel_requested = False
+        state.last_error = ""
+        _set_job_status(state, "PROCESSING", f"Rendering sources 0/{len(self._tasks)}")
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def _render_next(self, context, state) -> None:
+        scene = context.scene
+        frame, camera, source_path = self._tasks[self._index]
+        self._index += 1
+        scene.frame_set(frame)
+        scene.camera = camera
+        fingerprint = render_fingerprint(scene, camera, object_extra=self._content_extra)
+        if getattr(state, "batch_skip_unchanged", True) and self._store.is_current(source_path.name, fingerprint, source_path):
+            self._skipped += 1
+            return
+        try:
+            ok = _render_source_still(scene, source_path)
+        except Exception as ex:
+            ok = False
+            state.last_error = f"Frame {frame}: {ex}"
+        if not ok or not source_path.exists():
+            self._failed += 1
+            self._store.forget(source_path.name)
+            return
+        self._store.record(source_path.name, fingerprint, source_path)
+        self._store.save()
+        self._rendered += 1
+
+    def _finish(self, context, state, cancelled: bool) -> None:
+        scene = context.scene
+        if self._timer is not None:
+            try:
+                context.window_manager.event_timer_remove(self._timer)
+            except Exception:
+                pass
+            self._timer = None
+        if self._restore_samples is not None:
+            self._restore_samples()
+            self._restore_samples = None
+        try:
+            scene.frame_set(self._prev_frame)
+            scene.camera = self._prev_camera
+        except Exception:
+            pass
+        try:
+            self._store.save()
+        except Exception:
+            pass
+        self._content_extra = None
+        state.is_busy = False
+        state.batch_active = False
+        state.cancel_requested = False
+        summary = f"{self._rendered} rendered, {self._skipped} unchanged, {self._failed} failed"
+        _set_job_status(state, "CANCELLED" if cancelled else ("FAILED" if self._failed else "COMPLETED"), summary)
+        refresh_ai_render_state(context, force=True)
+        refresh_ai_render_assets(context, force=True)
+        self.report({"WARNING" if cancelled or self._failed else "INFO"}, f"Source frames: {summary}")
+
+    def modal(self, context, event):
+        state = getattr(context.scene, "lime_ai_render", None)
+        if state is None:
+            return {"CANCELLED"}
+        if event.type == "ESC" or state.cancel_requested:
+            self._finish(context, state, cancelled=True)
+            return {"CANCELLED"}
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+        try:
+            self._render_next(context, state)
+        except Exception as ex:
+            state.last_error = str(ex)
+            self._finish(context, state, cancelled=True)
+            return {"CANCELLED"}
+        _set_job_status(state, "PROCESSING", f"Rendering sources {self._index}/{len(self._tasks)}")
+        if self._index >= len(self._tasks):
+            self._finish(context, state, cancelled=False)
+            return {"FINISHED"}
+        return {"PASS_THROUGH"}
+
+
 class LIME_OT_ai_render_generate(Operator):
     bl_idname = "lime.ai_render_generate"
     bl_label = "AI: Generate Storyboard"
@@ -803,17 +1237,7 @@ class LIME_OT_ai_render_generate(Operator):
     _last_status_raw: str = ""
 
     def _set_status(self, state, status: str, message: str = "") -> None:
-        try:
-            if state.job_status != status:
-                state.job_status = status
-        except Exception:
-            pass
-        if message:
-            try:
-                if state.job_message != message:
-                    state.job_message = message
-            except Exception:
-                pass
+        _set_job_status(state, status, message)
 
     def invoke(self, context, event):
         scene = context.scene
@@ -890,13 +1314,14 @@ class LIME_OT_ai_render_generate(Operator):
         self._set_status(state, "UPLOADING", "Uploading assets to Krea")
 
         try:
-            source_asset = _upload_krea_asset(prefs, source_path)
+            asset_cache = _krea_asset_cache(self._paths)
+            source_asset = _upload_krea_asset(prefs, source_path, cache=asset_cache)
             source_url = source_asset.get("url", "")
             style_url = ""
             if style_path and style_path.exists():
                 style_saved = _persist_style_image(style_path, self._paths.styles_dir)
                 self._style_path = style_saved
-                style_asset = _upload_krea_asset(prefs, style_saved)
+                style_asset = _upload_krea_asset(prefs, style_saved, cache=asset_cache)
                 style_url = style_asset.get("url", "")
             self._asset_urls = {
                 "source_url": source_url,
@@ -1055,12 +1480,23 @@ def _save_results(
     state,
     urls: Iterable[str],
 ) -> List[Path]:
-    mode_token = _mode_token(state.last_mode or state.mode)
+    return _download_results(paths, ctx, state.last_mode or state.mode, state.retry_strategy, list(urls))
+
+
+def _download_results(
+    paths: AiRenderPaths,
+    ctx: FrameContext,
+    mode: str,
+    retry_strategy: str,
+    urls: List[str],
+) -> List[Path]:
+    """Download job outputs into outputs/. Does not touch Blender data (safe in worker threads)."""
+    mode_token = _mode_token(mode)
     base_stem = _build_output_stem(ctx, mode_token)
     results: List[Path] = []
     version = None
-    if state.retry_strategy == "VERSION":
-        version = _next_version(paths.outputs_dir, base_stem, ctx.rev)
+    if retry_strategy == "VERSION":
+        version = _next_version(paths, base_stem, ctx.rev)
     for idx, url in enumerate(urls, 1):
         if version is not None:
             stem = f"{base_stem}_V{version:02d}_Rev_{ctx.rev}"
@@ -1084,21 +1520,33 @@ def _record_manifest(
     output_paths: Iterable[Path],
     asset_urls: Optional[Dict[str, str]] = None,
 ) -> None:
-    manifest_path = _manifest_path(paths, ctx)
-    manifest = _read_manifest(manifest_path)
-    manifest.setdefault("frame", ctx.frame)
-    manifest.setdefault(
-        "context",
-        {
-            "project_name": ctx.project_name,
-            "sc_number": ctx.sc_number,
-            "rev": ctx.rev,
-            "shot_idx": ctx.shot_idx,
-            "cam_idx": ctx.cam_idx,
-        },
-    )
     source_path = Path(state.last_source_path or state.source_image_path or "")
     style_path = Path(state.last_style_path or state.style_image_path or "") if (state.last_style_path or state.style_image_path) else None
+    entry = {
+        "generation_id": generation_id,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "mode": state.last_mode or state.mode,
+        "prompt_final": state.last_prompt or state.prompt_final or "",
+        "model": model_slug,
+        "job_id": state.job_id,
+        "status": state.job_status,
+        "result_urls": list(urls),
+        "output_paths": [p.as_posix() for p in output_paths],
+    }
+    if asset_urls:
+        entry["asset_urls"] = asset_urls
+    _write_manifest_entry(paths, ctx, source_path=source_path, style_path=style_path, entry=entry)
+
+
+def _write_manifest_entry(
+    paths: AiRenderPaths,
+    ctx: FrameContext,
+    *,
+    source_path: Optional[Path],
+    style_path: Optional[Path],
+    entry: Dict[str, object],
+) -> None:
+    """Append a generation to the index and refresh the per-frame JSON export. No Blender data."""
     source_info = {
         "path": source_path.as_posix() if source_path else "",
         "hash": _file_sha256(source_path) if source_path and source_path.exists() else "",
@@ -1107,26 +1555,468 @@ def _record_manifest(
         "path": style_path.as_posix() if style_path else "",
         "hash": _file_sha256(style_path) if style_path and style_path.exists() else "",
     }
-    manifest["source"] = source_info
+    record: Dict[str, object] = {
+        "project_name": ctx.project_name,
+        "sc_number": ctx.sc_number,
+        "rev": ctx.rev,
+        "shot_idx": ctx.shot_idx,
+        "cam_idx": ctx.cam_idx,
+        "frame": ctx.frame,
+    }
+    record.update(entry)
+    outputs = [str(p) for p in entry.get("output_paths") or []]
+    parsed = parse_output_version(outputs[0]) if outputs else None
+    if parsed is not None:
+        record["base_stem"], _rev, record["version"] = parsed
+    record["source"] = source_info
     if style_info["path"]:
-        manifest["style"] = style_info
+        record["style"] = style_info
+    record["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
 
-    entry = {
-        "generation_id": generation_id,
+    index = _generation_index(paths)
+    record = index.append(record)
+    _write_manifest(_manifest_path(paths, ctx), index.frame_manifest(frame_key(record)))
+    if index.needs_compaction():
+        index.compact()
+
+
+_QUEUE_TICK_SECONDS = 0.25
+
+
+class _SharedStyleUpload:
+    """Upload the style reference once and share its URL with every queue job."""
+
+    def __init__(self, style_path: Optional[Path], cache: Optional[AssetUploadCache] = None) -> None:
+        self.style_path = style_path
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._url: Optional[str] = None
+
+    def url(self, prefs) -> str:
+        if self.style_path is None:
+            return ""
+        with self._lock:
+            if self._url is None:
+                self._url = _upload_krea_asset(prefs, self.style_path, cache=self.cache).get("url", "")
+            return self._url
+
+
+def _shot_camera_markers(scene, shot) -> List[Tuple[int, object]]:
+    """Return (frame, camera) for timeline markers bound to cameras of shot, one per frame."""
+    try:
+        cameras = {obj for obj in shot.all_objects if getattr(obj, "type", None) == "CAMERA"}
+    except Exception:
+        cameras = set()
+    result: Dict[int, object] = {}
+    for marker in list(getattr(scene, "timeline_markers", []) or []):
+        cam = getattr(marker, "camera", None)
+        if cam is None or cam not in cameras:
+            continue
+        result.setdefault(int(marker.frame), cam)
+    return sorted(result.items(), key=lambda item: item[0])
+
+
+def _camera_at_frame(scene, frame: int):
+    """Return the camera bound by the last marker at or before frame (scene camera otherwise)."""
+    best_frame = None
+    camera = None
+    for marker in list(getattr(scene, "timeline_markers", []) or []):
+        cam = getattr(marker, "camera", None)
+        marker_frame = int(getattr(marker, "frame", 0))
+        if cam is None or marker_frame > frame:
+            continue
+        if best_frame is None or marker_frame >= best_frame:
+            best_frame = marker_frame
+            camera = cam
+    return camera or getattr(scene, "camera", None)
+
+
+def _queue_submit_job(
+    prefs,
+    payload: Dict[str, object],
+    style_upload: _SharedStyleUpload,
+    cache: Optional[AssetUploadCache],
+) -> Dict[str, object]:
+    source_path = payload["source_path"]
+    prompt = str(payload["prompt"])
+    if payload.get("rewrite_details"):
+        detail_opt = _rewrite_details_with_llm(prefs, str(payload["detail_text"]), source_path)
+        prompt = _build_prompt(str(payload["mode"]), detail_opt, bool(payload["has_style"]), bool(payload["use_style"]))
+    source_url = _upload_krea_asset(prefs, source_path, cache=cache).get("url", "")
+    style_url = style_upload.url(prefs)
+    job_id, status_raw = _create_krea_job(
+        prefs,
+        prompt,
+        source_url,
+        style_url,
+        source_path=source_path,
+        source_strength=float(payload["source_strength"]),
+        style_strength=float(payload["style_strength"]),
+        source_size=payload["source_size"],
+    )
+    return {
+        "job_id": job_id,
+        "status_raw": status_raw,
+        "prompt": prompt,
+        "asset_urls": {"source_url": source_url, "style_url": style_url},
+    }
+
+
+def _queue_poll_jobs(prefs, targets: List[Tuple[str, str]]) -> List[Tuple[str, Dict[str, object]]]:
+    """Poll each (key, job_id) in turn; stops at the first rate limit so the queue can back off."""
+    results: List[Tuple[str, Dict[str, object]]] = []
+    for key, job_id in targets:
+        info = _krea_job_status(prefs, job_id)
+        results.append((key, info))
+        if info.get("status") == "error" and int(info.get("http_status") or 0) == 429:
+            break
+    return results
+
+
+def _queue_download_job(paths: AiRenderPaths, job: ConversionJob, urls: List[str]) -> List[Path]:
+    payload = job.payload
+    ctx = payload["ctx"]
+    output_paths = _download_results(paths, ctx, str(payload["mode"]), str(payload["retry_strategy"]), urls)
+    entry: Dict[str, object] = {
+        "generation_id": payload["generation_id"],
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "mode": state.last_mode or state.mode,
-        "prompt_final": state.last_prompt or state.prompt_final or "",
-        "model": model_slug,
-        "job_id": state.job_id,
-        "status": state.job_status,
+        "mode": payload["mode"],
+        "prompt_final": payload.get("prompt_used") or payload["prompt"],
+        "model": payload["model_path"],
+        "job_id": job.job_id,
+        "status": "COMPLETED",
         "result_urls": list(urls),
         "output_paths": [p.as_posix() for p in output_paths],
     }
-    if asset_urls:
-        entry["asset_urls"] = asset_urls
-    _append_generation(manifest, entry)
-    manifest["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
-    _write_manifest(manifest_path, manifest)
+    if payload.get("asset_urls"):
+        entry["asset_urls"] = payload["asset_urls"]
+    _write_manifest_entry(
+        paths,
+        ctx,
+        source_path=payload["source_path"],
+        style_path=payload.get("style_path"),
+        entry=entry,
+    )
+    return output_paths
+
+
+def _queue_cancel_jobs(prefs, job_ids: List[str]) -> None:
+    for job_id in job_ids:
+        resp = http_delete_json_with_status(_krea_cancel_url(prefs, job_id), headers=krea_headers(prefs), timeout=30)
+        _debug_log(prefs, f"Queue cancel {job_id} status={resp.status} error={bool(resp.error)}")
+
+
+def _start_queue_cancel(prefs, job_ids: List[str]) -> None:
+    # Own daemon thread: the queue pool is shut down with cancel_futures, which would drop a
+    # queued cancel while workers are busy and leave the jobs billing.
+    threading.Thread(target=_queue_cancel_jobs, args=(prefs, list(job_ids)), daemon=True).start()
+
+
+class LIME_OT_ai_render_generate_queue(Operator):
+    bl_idname = "lime.ai_render_generate_queue"
+    bl_label = "AI: Convert Frame Queue"
+    bl_description = (
+        "Convert many frames in one action. Keeps a limited number of Krea jobs running and polls them "
+        "from a single timer with shared backoff"
+    )
+    bl_options = {"REGISTER"}
+
+    frame_source: EnumProperty(
+        name="Frames",
+        items=[
+            ("MARKERS", "Camera Markers", "Every camera marker of the active SHOT"),
+            ("LIST", "Frame List", "Frames listed in Queue Frames"),
+        ],
+        default="MARKERS",
+    )
+
+    _timer = None
+    _queue: Optional[ConversionQueue] = None
+    _pool: Optional[ThreadPoolExecutor] = None
+    _futures: List[Tuple[str, Optional[ConversionJob], Future]] = []
+    _poll_future: Optional[Future] = None
+    _prefs = None
+    _paths: Optional[AiRenderPaths] = None
+    _style_upload: Optional[_SharedStyleUpload] = None
+    _asset_cache: Optional[AssetUploadCache] = None
+
+    def _set_status(self, state, status: str, message: str = "") -> None:
+        _set_job_status(state, status, message)
+
+    def _collect_frames(self, context, state) -> List[Tuple[int, object]]:
+        scene = context.scene
+        if self.frame_source == "LIST":
+            frames = parse_frame_list(getattr(state, "queue_frames", "") or "")
+            return [(frame, _camera_at_frame(scene, frame)) for frame in frames]
+        shot = validate_scene.active_shot_context(context)
+        if shot is None:
+            raise RuntimeError("No active SHOT. Select a SHOT to convert its camera markers.")
+        return _shot_camera_markers(scene, shot)
+
+    def _build_jobs(self, context, state, prefs) -> Tuple[List[ConversionJob], int]:
+        frames = self._collect_frames(context, state)
+        if not frames:
+            raise RuntimeError("No frames to convert")
+        shot = validate_scene.active_shot_context(context)
+        mode = state.mode
+        detail_text = (state.detail_text or "").strip()
+        if mode == "SKETCH_PLUS" and not detail_text:
+            raise RuntimeError("Details are required for Sketch + Details mode")
+        has_style = bool((getattr(state, "style_image_path", "") or "").strip())
+        use_style = bool(getattr(state, "llm_use_style_reference", False))
+        rewrite = mode == "SKETCH_PLUS" and getattr(state, "rewrite_with_llm", True) and has_openrouter_api_key()
+        base_prompt = _build_prompt(mode, detail_text, has_style, use_style)
+        style_path = None
+        if has_style:
+            candidate = Path(state.style_image_path)
+            if candidate.exists():
+                style_path = _persist_style_image(candidate, self._paths.styles_dir)
+        generation_id = time.strftime("%Y%m%d_%H%M%S")
+        model_path = _krea_model_path(prefs)
+
+        jobs: List[ConversionJob] = []
+        missing = 0
+        seen = set()
+        for frame, camera in frames:
+            ctx = _frame_context_for(context, shot, camera, frame)
+            source_path = self._paths.sources_dir / _build_source_filename(ctx)
+            if not source_path.exists():
+                missing += 1
+                continue
+            key = f"F{ctx.frame:04d}C{ctx.cam_idx}"
+            if key in seen:
+                continue
+            seen.add(key)
+            jobs.append(
+                ConversionJob(
+                    key=key,
+                    frame=ctx.frame,
+                    payload={
+                        "ctx": ctx,
+                        "source_path": source_path,
+                        "source_size": _resolve_source_size(source_path),
+                        "style_path": style_path,
+                        "mode": mode,
+                        "prompt": base_prompt,
+                        "rewrite_details": rewrite,
+                        "detail_text": detail_text,
+                        "has_style": has_style,
+                        "use_style": use_style,
+                        "source_strength": getattr(state, "source_strength", 1.6),
+                        "style_strength": getattr(state, "style_strength", 0.6),
+                        "retry_strategy": state.retry_strategy,
+                        "model_path": model_path,
+                        "generation_id": generation_id,
+                    },
+                )
+            )
+        self._asset_cache = _krea_asset_cache(self._paths)
+        self._style_upload = _SharedStyleUpload(style_path, self._asset_cache)
+        return jobs, missing
+
+    def invoke(self, context, event):
+        scene = context.scene
+        state = getattr(scene, "lime_ai_render", None)
+        if state is None:
+            self.report({"ERROR"}, "AI Render state not available")
+            return {"CANCELLED"}
+        if state.is_busy:
+            self.report({"WARNING"}, "AI job already running")
+            return {"CANCELLED"}
+        prefs = _addon_prefs(context)
+        if prefs is None:
+            self.report({"ERROR"}, "Addon preferences unavailable")
+            return {"CANCELLED"}
+        if not has_krea_api_key():
+            self.report({"ERROR"}, "Krea API key not found in .env")
+            return {"CANCELLED"}
+
+        try:
+            self._paths = _ensure_ai_dirs(context.window_manager.lime_pipeline)
+            jobs, missing = self._build_jobs(context, state, prefs)
+        except ValueError:
+            self.report({"ERROR"}, "Invalid frame list. Use values like 1, 12, 20-24")
+            return {"CANCELLED"}
+        except Exception as ex:
+            self.report({"ERROR"}, str(ex))
+            return {"CANCELLED"}
+        if missing:
+            self.report({"WARNING"}, f"Skipping {missing} frame(s) without a source render")
+        if not jobs:
+            self.report({"ERROR"}, "No source renders found for the requested frames")
+            return {"CANCELLED"}
+
+        max_jobs = int(getattr(state, "queue_max_jobs", 3) or 3)
+        self._prefs = _prefs_snapshot(prefs)
+        self._queue = ConversionQueue(jobs, max_in_flight=max_jobs)
+        self._pool = ThreadPoolExecutor(max_workers=max_jobs + 2, thread_name_prefix="lime_ai_queue")
+        self._futures = []
+        self._poll_future = None
+
+        state.is_busy = True
+        state.queue_active = True
+        state.cancel_requested = False
+        state.last_error = ""
+        self._update_progress(state)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(_QUEUE_TICK_SECONDS, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def _update_progress(self, state) -> None:
+        counts = self._queue.counts()
+        state.queue_total = counts["total"]
+        state.queue_done = counts["completed"]
+        state.queue_failed = counts["failed"]
+        message = (
+            f"Queue {counts['completed']}/{counts['total']} done, {counts['active']} running, "
+            f"{counts['pending']} waiting, {counts['failed']} failed"
+        )
+        status = "PROCESSING" if (counts["active"] or counts["downloading"]) else "QUEUED"
+        self._set_status(state, status, message)
+
+    def _submit(self, kind: str, job: Optional[ConversionJob], fn, *args) -> Future:
+        future = self._pool.submit(fn, *args)
+        self._futures.append((kind, job, future))
+        return future
+
+    def _drain_futures(self, context, state, now: float) -> None:
+        queue = self._queue
+        pending: List[Tuple[str, Optional[ConversionJob], Future]] = []
+        for kind, job, future in self._futures:
+            if not future.done():
+                pending.append((kind, job, future))
+                continue
+            err = future.exception()
+            if kind == "submit":
+                if err is not None:
+                    queue.mark_submit_failed(job, str(err), now, rate_limited=isinstance(err, KreaRateLimitError))
+                    if job.status == JOB_FAILED:
+                        state.last_error = f"{job.key}: {err}"
+                    continue
+                result = future.result()
+                job.payload["prompt_used"] = result["prompt"]
+                job.payload["asset_urls"] = result["asset_urls"]
+                normalized = _normalized_status(str(result["status_raw"]))
+                queue.mark_submitted(job, str(result["job_id"]), normalized, now)
+                state.job_id = job.job_id
+            elif kind == "download":
+                if err is not None:
+                    queue.mark_failed(job, f"Download failed: {err}")
+                    state.last_error = f"{job.key}: download failed: {err}"
+                    continue
+                output_paths = future.result()
+                queue.mark_completed(job)
+                if output_paths:
+                    new_path = output_paths[0].as_posix()
+                    if state.result_image_path != new_path:
+                        state.result_image_path = new_path
+                    state.last_result_path = state.result_image_path
+                refresh_ai_render_assets(context, background=True)
+        self._futures = pending
+
+    def _apply_poll_results(self, state, now: float) -> None:
+        future = self._poll_future
+        if future is None or not future.done():
+            return
+        self._poll_future = None
+        if future.exception() is not None:
+            _debug_log(self._prefs, f"Queue poll round failed: {future.exception()}")
+            return
+        queue = self._queue
+        by_key = {job.key: job for job in queue.jobs}
+        for key, info in future.result():
+            job = by_key.get(key)
+            if job is None:
+                continue
+            status_raw = info.get("status", "processing")
+            if status_raw == "error" and int(info.get("http_status") or 0) == 429:
+                queue.record_rate_limited(job, now)
+                continue
+            status = _normalized_status(str(status_raw))
+            if status == "FAILED":
+                message = str(info.get("error") or "Krea job failed")
+                queue.record_poll(job, status, now, message=message)
+                state.last_error = f"{job.key}: {message}"
+                continue
+            queue.record_poll(job, status, now)
+            if status == "COMPLETED":
+                urls = list(info.get("urls") or [])
+                if not urls:
+                    queue.mark_failed(job, "Krea job completed with no outputs")
+                    continue
+                self._submit("download", job, _queue_download_job, self._paths, job, urls)
+
+    def modal(self, context, event):
+        scene = context.scene
+        state = getattr(scene, "lime_ai_render", None)
+        if state is None:
+            self._shutdown(context)
+            return {"CANCELLED"}
+
+        if getattr(state, "cancel_requested", False) or event.type in {"ESC"}:
+            state.cancel_requested = False
+            remote = [job.job_id for job in self._queue.cancel_all()]
+            if remote:
+                _start_queue_cancel(self._prefs, remote)
+            # Submissions already sent cannot be interrupted; cancel the jobs they create
+            # once their ids arrive. Futures dropped by the pool shutdown below are skipped.
+            prefs = self._prefs
+            for kind, _job, future in self._futures:
+                if kind == "submit":
+                    cancel_when_submitted(future, lambda job_id: _start_queue_cancel(prefs, [job_id]))
+            self._update_progress(state)
+            self._set_status(state, "CANCELLED", "Queue cancelled by user")
+            self._shutdown(context)
+            return {"CANCELLED"}
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        now = time.monotonic()
+        queue = self._queue
+        self._drain_futures(context, state, now)
+        self._apply_poll_results(state, now)
+
+        for job in queue.take_submissions(now):
+            self._submit(
+                "submit", job, _queue_submit_job, self._prefs, job.payload, self._style_upload, self._asset_cache
+            )
+
+        if self._poll_future is None:
+            due = queue.due_for_poll(now)
+            if due:
+                targets = [(job.key, job.job_id) for job in due]
+                self._poll_future = self._pool.submit(_queue_poll_jobs, self._prefs, targets)
+
+        self._update_progress(state)
+        if queue.is_done() and not self._futures and self._poll_future is None:
+            counts = queue.counts()
+            summary = f"Queue finished: {counts['completed']} converted, {counts['failed']} failed"
+            self._set_status(state, "COMPLETED" if counts["completed"] else "FAILED", summary)
+            refresh_ai_render_assets(context, force=True)
+            self._shutdown(context)
+            self.report({"INFO"} if not counts["failed"] else {"WARNING"}, summary)
+            return {"FINISHED"}
+        return {"PASS_THROUGH"}
+
+    def _shutdown(self, context) -> None:
+        wm = context.window_manager
+        if self._timer is not None:
+            try:
+                wm.event_timer_remove(self._timer)
+            except Exception:
+                pass
+            self._timer = None
+        if self._pool is not None:
+            # Running downloads finish in the background; nothing new is started.
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        state = getattr(context.scene, "lime_ai_render", None)
+        if state is not None:
+            state.is_busy = False
+            state.queue_active = False
 
 
 class LIME_OT_ai_render_retry(Operator):
@@ -1150,6 +2040,17 @@ class LIME_OT_ai_render_cancel(Operator):
     def execute(self, context):
         scene = context.scene
         state = getattr(scene, "lime_ai_render", None)
+        if state is not None and getattr(state, "batch_active", False):
+            state.cancel_requested = True
+            state.job_message = "Cancel requested"
+            self.report({"INFO"}, "Source render batch cancel requested")
+            return {"FINISHED"}
+        if state is not None and getattr(state, "queue_active", False):
+            # The queue operator cancels its own remote jobs on the next tick.
+            state.cancel_requested = True
+            state.job_message = "Cancel requested"
+            self.report({"INFO"}, "Queue cancel requested")
+            return {"FINISHED"}
         if state is None or not state.job_id:
             self.report({"WARNING"}, "No active job to cancel")
             return {"CANCELLED"}
@@ -1345,9 +2246,16 @@ class LIME_OT_ai_render_delete_selected(Operator):
             return {"CANCELLED"}
         if self.target == "STYLE":
             state.style_image_path = ""
+            _style_index(path.parent).remove(path)
         elif self.target == "RESULT":
             state.result_image_path = ""
             state.result_exists = False
+            try:
+                _generation_index(_ensure_ai_dirs(context.window_manager.lime_pipeline)).record_deleted_outputs(
+                    [path.as_posix()]
+                )
+            except Exception:
+                pass
         else:
             state.source_image_path = ""
             state.source_exists = False
@@ -1403,13 +2311,22 @@ class LIME_OT_ai_render_delete_batch(Operator):
             folder = paths.outputs_dir
 
         removed = 0
+        removed_paths: List[str] = []
         targets = _list_manifests(folder) if self.target == "MANIFESTS" else _list_images(folder)
         for path in targets:
             try:
                 path.unlink()
                 removed += 1
+                removed_paths.append(path.as_posix())
             except Exception:
                 continue
+        if self.target == "MANIFESTS":
+            _drop_generation_index(paths)
+        elif self.target == "STYLES":
+            for removed_path in removed_paths:
+                _style_index(paths.styles_dir).remove(Path(removed_path))
+        elif self.target == "RESULTS" and removed_paths:
+            _generation_index(paths).record_deleted_outputs(removed_paths)
 
         if self.target == "SOURCES":
             state.source_image_path = ""
@@ -1576,6 +2493,7 @@ __all__ = [
     "unregister_ai_render_handlers",
     "LIME_OT_ai_render_refresh",
     "LIME_OT_ai_render_frame",
+    "LIME_OT_ai_render_frames_batch",
     "LIME_OT_ai_render_generate",
     "LIME_OT_ai_render_retry",
     "LIME_OT_ai_render_cancel",
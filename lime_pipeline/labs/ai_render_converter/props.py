@@ -7,9 +7,13 @@ prompt details, job status, and previews).
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 import json
+import os
 import re
+import time
 import bpy
 from bpy.types import PropertyGroup, Image
 from bpy.props import (
@@ -22,6 +26,20 @@ from bpy.props import (
 )
 import bpy.utils.previews
 
+from ...core.preview_budget import (
+    DEFAULT_BUDGET_BYTES,
+    DEFAULT_THUMBNAIL_SIZE,
+    LruBudget,
+    stale_thumbnails,
+    thumbnail_cost,
+    thumbnail_dimensions,
+    thumbnail_name,
+)
+
+
+_LARGE_PREVIEW_TAG = "lime_ai_preview"
+_LARGE_PREVIEW_KEEP = 6
+
 
 def _load_image_from_path(path_str: str) -> Image | None:
     path = (path_str or "").strip()
@@ -31,7 +49,12 @@ def _load_image_from_path(path_str: str) -> Image | None:
         path_obj = Path(path)
         if not path_obj.exists():
             return None
-        return bpy.data.images.load(path_obj.as_posix(), check_existing=True)
+        count_before = len(bpy.data.images)
+        img = bpy.data.images.load(path_obj.as_posix(), check_existing=True)
+        if len(bpy.data.images) > count_before:
+            # Only images created for the panel are released again by _release_large_previews.
+            img[_LARGE_PREVIEW_TAG] = True
+        return img
     except Exception:
         return None
 
@@ -40,6 +63,19 @@ _PREVIEW_PENDING: set[tuple[int, str]] = set()
 _ASSET_PREVIEWS = None
 _FRAME_RE = re.compile(r"_F(\d{1,6})_", re.IGNORECASE)
 
+# Thumbnails are decoded lazily: enum item callbacks request icons for the
+# entries that can be on screen, a timer loads a few per tick from low-res
+# copies in the AI thumbs folder, and an LRU budget evicts what was not used.
+_ICON_WINDOW = 48
+_ICON_LOADS_PER_TICK = 4
+_ICON_TICK_SECONDS = 0.05
+_THUMBS_DIR: Path | None = None
+_ICON_SOURCES: dict[str, tuple[str, float]] = {}
+_ICON_REQUESTS: "OrderedDict[str, None]" = OrderedDict()
+_ICON_BUDGET = LruBudget(DEFAULT_BUDGET_BYTES)
+_LARGE_PREVIEWS = LruBudget(_LARGE_PREVIEW_KEEP)
+_ENUM_ITEMS_KEEPALIVE: dict[str, list[tuple]] = {}
+
 
 def _ensure_asset_previews():
     global _ASSET_PREVIEWS
@@ -50,6 +86,15 @@ def _ensure_asset_previews():
 
 def _clear_asset_previews() -> None:
     global _ASSET_PREVIEWS
+    try:
+        if bpy.app.timers.is_registered(_load_requested_icons):
+            bpy.app.timers.unregister(_load_requested_icons)
+    except Exception:
+        pass
+    _ICON_REQUESTS.clear()
+    _ICON_SOURCES.clear()
+    _ICON_BUDGET.clear()
+    _ENUM_ITEMS_KEEPALIVE.clear()
     if _ASSET_PREVIEWS is None:
         return
     try:
@@ -59,9 +104,30 @@ def _clear_asset_previews() -> None:
     _ASSET_PREVIEWS = None
 
 
-def _asset_preview_icon_id(key: str) -> int:
+def _preview_budget_bytes() -> int:
+    try:
+        prefs = bpy.context.preferences.addons[__package__.split(".")[0]].preferences
+        return int(getattr(prefs, "ai_render_preview_budget_mb", 0) or 0) * 1024 * 1024 or DEFAULT_BUDGET_BYTES
+    except Exception:
+        return DEFAULT_BUDGET_BYTES
+
+
+def _remove_icons(keys) -> None:
+    pcoll = _ensure_asset_previews()
+    for key in keys:
+        _ICON_BUDGET.discard(key)
+        if key in pcoll:
+            try:
+                pcoll.remove(key)
+            except Exception:
+                pass
+
+
+def _asset_preview_icon_id(key: str, touch: bool = True) -> int:
     pcoll = _ensure_asset_previews()
     if key in pcoll:
+        if touch:
+            _remove_icons(_ICON_BUDGET.touch(key, time.monotonic()))
         try:
             return int(pcoll[key].icon_id)
         except Exception:
@@ -69,15 +135,112 @@ def _asset_preview_icon_id(key: str) -> int:
     return 0
 
 
-def _cached_entries(json_blob: str) -> list[dict[str, str]]:
+def _request_icon(key: str) -> None:
+    if key in _ICON_REQUESTS or key not in _ICON_SOURCES:
+        return
+    _ICON_REQUESTS[key] = None
+    if not bpy.app.timers.is_registered(_load_requested_icons):
+        bpy.app.timers.register(_load_requested_icons, first_interval=_ICON_TICK_SECONDS)
+
+
+def _ensure_thumbnail(path_str: str, mtime: float) -> str | None:
+    """Return a low-res PNG copy of path_str from the thumbs folder, creating it if needed."""
+    if _THUMBS_DIR is None:
+        return None
+    thumb = _THUMBS_DIR / thumbnail_name(path_str, mtime, DEFAULT_THUMBNAIL_SIZE)
+    if thumb.exists():
+        return thumb.as_posix()
+    img = None
+    try:
+        _THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+        img = bpy.data.images.load(path_str, check_existing=False)
+        width, height = int(img.size[0]), int(img.size[1])
+        if max(width, height) <= DEFAULT_THUMBNAIL_SIZE:
+            return None
+        img.scale(*thumbnail_dimensions(width, height, DEFAULT_THUMBNAIL_SIZE))
+        tmp = thumb.with_name(thumb.stem + ".tmp.png")
+        img.filepath_raw = tmp.as_posix()
+        img.file_format = "PNG"
+        img.save()
+        os.replace(tmp, thumb)
+        return thumb.as_posix()
+    except Exception:
+        return None
+    finally:
+        if img is not None:
+            try:
+                bpy.data.images.remove(img)
+            except Exception:
+                pass
+
+
+def _tag_panel_redraw() -> None:
+    try:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == "VIEW_3D":
+                    area.tag_redraw()
+    except Exception:
+        pass
+
+
+def _load_requested_icons():
+    """Timer: load a few requested thumbnails per tick while they fit in the budget."""
+    pcoll = _ensure_asset_previews()
+    now = time.monotonic()
+    _remove_icons(_ICON_BUDGET.set_budget(_preview_budget_bytes()))
+    cost = thumbnail_cost(DEFAULT_THUMBNAIL_SIZE, DEFAULT_THUMBNAIL_SIZE)
+    loaded = 0
+    while _ICON_REQUESTS and loaded < _ICON_LOADS_PER_TICK:
+        key, _unused = _ICON_REQUESTS.popitem(last=False)
+        source = _ICON_SOURCES.get(key)
+        if source is None or key in pcoll:
+            continue
+        evicted = _ICON_BUDGET.make_room(cost, now)
+        if evicted is None:
+            # Everything cached was on screen within the last second; retry once it goes idle.
+            _ICON_REQUESTS[key] = None
+            _ICON_REQUESTS.move_to_end(key, last=False)
+            return 1.0
+        _remove_icons(evicted)
+        path_str, mtime = source
+        try:
+            pcoll.load(key, _ensure_thumbnail(path_str, mtime) or path_str, "IMAGE")
+        except Exception:
+            continue
+        _remove_icons(_ICON_BUDGET.touch(key, now, cost))
+        loaded += 1
+    if loaded:
+        _tag_panel_redraw()
+    return _ICON_TICK_SECONDS if _ICON_REQUESTS else None
+
+
+def _release_large_previews(keep_name: str) -> None:
+    """Keep the most recently viewed large previews; drop older panel-created images."""
+    for name in _LARGE_PREVIEWS.touch(keep_name, time.monotonic(), 1):
+        img = bpy.data.images.get(name)
+        if img is None or not img.get(_LARGE_PREVIEW_TAG) or img.users > 0:
+            continue
+        try:
+            bpy.data.images.remove(img)
+        except Exception:
+            pass
+
+
+def _cached_entries(json_blob: str) -> tuple[dict[str, str], ...]:
+    return _parse_cached_entries(json_blob or "")
+
+
+@lru_cache(maxsize=8)
+def _parse_cached_entries(json_blob: str) -> tuple[dict[str, str], ...]:
     if not json_blob:
-        return []
+        return ()
     try:
         data = json.loads(json_blob)
     except Exception:
-        return []
+        return ()
     if not isinstance(data, list):
-        return []
+        return ()
     out = []
     for item in data:
         if not isinstance(item, dict):
@@ -91,7 +254,7 @@ def _cached_entries(json_blob: str) -> list[dict[str, str]]:
         if icon_key:
             entry["icon_key"] = icon_key
         out.append(entry)
-    return out
+    return tuple(out)
 
 
 def _path_in_cache(json_blob: str, path: str) -> bool:
@@ -104,27 +267,43 @@ def _path_in_cache(json_blob: str, path: str) -> bool:
     return False
 
 
-def _enum_items_from_cache(json_blob: str) -> list[tuple]:
+def _enum_items_from_cache(json_blob: str, selected: str = "", keepalive_key: str = "") -> list[tuple]:
+    entries = _cached_entries(json_blob)
+    selected_idx = next((idx for idx, item in enumerate(entries) if item["path"] == selected), -1)
     items = []
-    for idx, item in enumerate(_cached_entries(json_blob)):
+    for idx, item in enumerate(entries):
         key = item["path"]
         name = item["name"]
         icon_key = item.get("icon_key") or key
-        icon_id = _asset_preview_icon_id(icon_key)
+        # Only the newest entries and the neighbours of the selection are decoded and
+        # count as used; the rest keep their icon without refreshing its LRU position.
+        visible = idx < _ICON_WINDOW or abs(idx - selected_idx) <= 2
+        icon_id = _asset_preview_icon_id(icon_key, touch=visible)
+        if icon_id == 0 and visible:
+            _request_icon(icon_key)
         items.append((key, name, key, icon_id, idx))
+    if keepalive_key:
+        # Blender does not own dynamic enum strings; keep them referenced.
+        _ENUM_ITEMS_KEEPALIVE[keepalive_key] = items
     return items
 
 
 def _items_source_assets(self, context):
-    return _enum_items_from_cache(getattr(self, "source_assets_json", ""))
+    return _enum_items_from_cache(
+        getattr(self, "source_assets_json", ""), getattr(self, "source_image_path", ""), "source"
+    )
 
 
 def _items_style_assets(self, context):
-    return _enum_items_from_cache(getattr(self, "style_assets_json", ""))
+    return _enum_items_from_cache(
+        getattr(self, "style_assets_json", ""), getattr(self, "style_image_path", ""), "style"
+    )
 
 
 def _items_result_assets(self, context):
-    return _enum_items_from_cache(getattr(self, "result_assets_json", ""))
+    return _enum_items_from_cache(
+        getattr(self, "result_assets_json", ""), getattr(self, "result_image_path", ""), "result"
+    )
 
 
 def _frame_from_path(path_str: str) -> int | None:
@@ -176,6 +355,7 @@ def _schedule_preview(state, path_attr: str, image_attr: str, exists_attr: str |
                 setattr(state, exists_attr, True)
         except Exception:
             pass
+        _release_large_previews(img.name)
         return None
 
     bpy.app.timers.register(_load, first_interval=0.15)
@@ -260,7 +440,24 @@ def _update_result_pick(self, context):
         self.result_image_path = path
 
 
-def update_ai_render_asset_cache(state, source_paths, style_paths, result_paths, *, force_reload: bool = False) -> None:
+def update_ai_render_asset_cache(
+    state,
+    source_paths,
+    style_paths,
+    result_paths,
+    *,
+    force_reload: bool = False,
+    mtimes: dict[str, float] | None = None,
+    thumbs_dir: Path | None = None,
+) -> None:
+    """Publish asset listings to the panel state.
+
+    Thumbnails are not decoded here; they are requested lazily by the enum
+    item callbacks and loaded within the preview memory budget.
+    """
+    global _THUMBS_DIR
+    if thumbs_dir is not None:
+        _THUMBS_DIR = Path(thumbs_dir)
     pcoll = _ensure_asset_previews()
     asset_sets = {
         "source_assets_json": source_paths,
@@ -268,43 +465,39 @@ def update_ai_render_asset_cache(state, source_paths, style_paths, result_paths,
         "result_assets_json": result_paths,
     }
     keep_keys = set()
+    icon_sources: dict[str, tuple[str, float]] = {}
     cache_entries = {}
     for json_attr, paths in asset_sets.items():
         entries = []
         for path in paths:
-            try:
-                mtime = path.stat().st_mtime
-            except Exception:
-                mtime = 0.0
+            mtime = mtimes.get(path.as_posix()) if mtimes is not None else None
+            if mtime is None:
+                try:
+                    mtime = path.stat().st_mtime
+                except Exception:
+                    mtime = 0.0
             try:
                 icon_key = f"{path.as_posix()}::{int(mtime)}"
                 keep_keys.add(icon_key)
+                icon_sources[icon_key] = (path.as_posix(), float(mtime))
                 entries.append({"path": path.as_posix(), "name": path.name, "icon_key": icon_key})
             except Exception:
                 continue
         cache_entries[json_attr] = entries
 
-    for key in list(pcoll.keys()):
-        if key not in keep_keys:
+    _remove_icons([key for key in pcoll.keys() if force_reload or key not in keep_keys])
+    _ICON_SOURCES.clear()
+    _ICON_SOURCES.update(icon_sources)
+    for key in [key for key in _ICON_REQUESTS if key not in keep_keys]:
+        _ICON_REQUESTS.pop(key, None)
+    if force_reload and _THUMBS_DIR is not None:
+        live = {thumbnail_name(path_str, mtime, DEFAULT_THUMBNAIL_SIZE) for path_str, mtime in icon_sources.values()}
+        for stale in stale_thumbnails(_THUMBS_DIR, live):
             try:
-                pcoll.remove(key)
-            except Exception:
+                stale.unlink()
+            except OSError:
                 pass
 
-    for key in keep_keys:
-        if key in pcoll and force_reload:
-            try:
-                pcoll.remove(key)
-            except Exception:
-                pass
-        if key in pcoll:
-            continue
-        try:
-            file_path = key.split("::", 1)[0]
-            pcoll.load(key, file_path, "IMAGE")
-        except Exception:
-            pass
-
     try:
         state.assets_refreshing = True
         for json_attr, entries in cache_entries.items():
@@ -410,6 +603,41 @@ class LimeAIRenderState(PropertyGroup):
     is_busy: BoolProperty(default=False, options={"HIDDEN"})
     cancel_requested: BoolProperty(default=False, options={"HIDDEN"})
 
+    queue_frames: StringProperty(
+        name="Queue Frames",
+        description="Frames for the conversion queue and batch source renders, e.g. 1, 12, 20-24",
+        default="",
+    )
+    queue_max_jobs: IntProperty(
+        name="Max Parallel Jobs",
+        description="Number of Krea jobs kept in flight by the conversion queue",
+        default=3,
+        min=1,
+        max=8,
+    )
+    batch_low_samples: BoolProperty(
+        name="Low Samples",
+        description="Render batch source frames with preview samples (restored afterwards)",
+        default=True,
+    )
+    batch_preview_samples: IntProperty(
+        name="Preview Samples",
+        description="Render samples used for batch source frames when Low Samples is enabled",
+        default=16,
+        min=1,
+        max=4096,
+    )
+    batch_skip_unchanged: BoolProperty(
+        name="Skip Unchanged",
+        description="Skip frames whose source render exists and whose scene state did not change since it was rendered",
+        default=True,
+    )
+    batch_active: BoolProperty(default=False, options={"HIDDEN"})
+    queue_active: BoolProperty(default=False, options={"HIDDEN"})
+    queue_total: IntProperty(default=0, options={"HIDDEN"})
+    queue_done: IntProperty(default=0, options={"HIDDEN"})
+    queue_failed: IntProperty(default=0, options={"HIDDEN"})
+
     retry_strategy: EnumProperty(
         name="Retry Strategy",
         items=[
@@ -441,6 +669,7 @@ class LimeAIRenderState(PropertyGroup):
     )
     assets_refreshing: BoolProperty(default=False, options={"HIDDEN"})
     assets_last_scan: FloatProperty(default=0.0, options={"HIDDEN"})
+    assets_scan_token: StringProperty(default="", options={"HIDDEN"})
     delete_confirm_action: StringProperty(default="", options={"HIDDEN"})
     delete_confirm_time: FloatProperty(default=0.0, options={"HIDDEN"})
 
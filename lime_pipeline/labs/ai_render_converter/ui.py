@@ -38,6 +38,18 @@ class LIME_PT_ai_render_converter(Panel):
         render_text = "Re-render Frame" if state.source_exists else "Render Current Frame"
         render_row.operator("lime.ai_render_frame", text=render_text, icon="RENDER_STILL")
 
+        batch_col = source_box.column(align=True)
+        batch_col.enabled = not state.is_busy
+        batch_opts = batch_col.row(align=True)
+        batch_opts.prop(state, "batch_low_samples", toggle=True)
+        samples_sub = batch_opts.row(align=True)
+        samples_sub.enabled = state.batch_low_samples
+        samples_sub.prop(state, "batch_preview_samples", text="Samples")
+        batch_opts.prop(state, "batch_skip_unchanged", toggle=True)
+        batch_row = batch_col.row(align=True)
+        batch_row.operator("lime.ai_render_frames_batch", text="Render SHOT Markers", icon="MARKER_HLT").frame_source = "MARKERS"
+        batch_row.operator("lime.ai_render_frames_batch", text="Render Frame List", icon="RENDER_ANIMATION").frame_source = "LIST"
+
         source_row = source_box.row(align=True)
         source_row.label(text="Found" if state.source_exists else "Missing", icon="CHECKMARK" if state.source_exists else "ERROR")
 
@@ -105,6 +117,21 @@ class LIME_PT_ai_render_converter(Panel):
         retry_row.enabled = bool(state.last_prompt) and not state.is_busy
         retry_row.operator("lime.ai_render_retry", text="Retry", icon="FILE_REFRESH")
 
+        queue_col = actions.column(align=True)
+        queue_col.label(text="Conversion Queue", icon="SEQ_STRIP_DUPLICATE")
+        queue_col.prop(state, "queue_max_jobs", text="Parallel Jobs")
+        queue_col.enabled = not state.is_busy
+        queue_row = queue_col.row(align=True)
+        queue_row.operator("lime.ai_render_generate_queue", text="Convert SHOT Markers", icon="MARKER_HLT").frame_source = "MARKERS"
+        list_row = queue_col.row(align=True)
+        list_row.prop(state, "queue_frames", text="")
+        list_row.operator("lime.ai_render_generate_queue", text="Convert Frames", icon="PLAY").frame_source = "LIST"
+        if getattr(state, "queue_active", False):
+            actions.label(
+                text=f"Queue: {state.queue_done}/{state.queue_total} done, {state.queue_failed} failed",
+                icon="TIME",
+            )
+
         cancel_row = actions.row(align=True)
         cancel_row.enabled = bool(state.is_busy)
         cancel_row.operator("lime.ai_render_cancel", text="Cancel Job", icon="CANCEL")
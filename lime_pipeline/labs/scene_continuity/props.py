@@ -28,7 +28,7 @@ class LimeSceneContinuityState(PropertyGroup):
             return [("NONE", "No SHOTs found", "", 0)]
         try:
             items = [("NONE", "No SHOTs found", "", 0)]
-            for idx, (coll, sh_idx) in enumerate(_vs.list_shot_roots(scene), 1):
+            for idx, (coll, sh_idx) in enumerate(_vs.shot_roots_for_draw(context), 1):
                 name = getattr(coll, "name", f"SHOT {sh_idx:02d}") or f"SHOT {sh_idx:02d}"
                 items.append((name, name, "", idx))
             return items
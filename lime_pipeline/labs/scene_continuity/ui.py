@@ -40,7 +40,7 @@ class LIME_TB_PT_scene_continuity_lab(Panel):
         valid_shot = getattr(st, "scene_continuity_shot_name", "NONE") != "NONE"
         # Also allow contextual detection of active SHOT to avoid hard disable
         if not valid_shot:
-            valid_shot = validate_scene.active_shot_context(ctx) is not None
+            valid_shot = validate_scene.active_shot_for_draw(ctx) is not None
         row.enabled = valid_shot
         row.operator("lime.stage_create_next_scene_file", icon='FILE_NEW')
 
@@ -32,7 +32,7 @@ class LIME_OT_add_missing_collections(Operator):
 
     @classmethod
     def poll(cls, ctx):
-        return validate_scene.active_shot_context(ctx) is not None
+        return validate_scene.active_shot_for_draw(ctx) is not None
 
     def execute(self, context):
         shot = validate_scene.active_shot_context(context)
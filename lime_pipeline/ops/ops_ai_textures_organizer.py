@@ -2,27 +2,50 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 import json
 import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 import bpy
 from bpy.types import Operator
 
+from ..core.jsonl_log import JsonlWriter
+from ..core.texture_fingerprint import (
+    file_stat_signature,
+    scan_context_signature,
+    texture_fingerprint,
+    usage_signature,
+)
 from ..core.texture_naming import sanitize_filename_stem
+from ..core.texture_node_index import pointer_key
+from ..core.udim_tiles import (
+    UDIM_TOKEN,
+    combined_udim_digest,
+    copy_udim_tiles,
+    enumerate_udim_tiles,
+    hash_udim_tiles,
+    udim_source_stem,
+    udim_tile_set_exists,
+    unique_udim_destination,
+)
 from .texture_workflow_common import (
-    ai_suggest_texture_name,
+    TextureNamingRequest,
+    TextureNamingResult,
+    ai_suggest_texture_names_batch,
     blend_dir,
+    build_texture_naming_request,
     canonical_filename_for_item,
     collect_image_usages_from_materials,
     collect_materials_from_selected_objects,
     copy_texture_file,
     deduce_project_root,
     exists_for_scan,
+    find_resumable_apply_log,
     infer_scan_classification,
+    load_apply_resume_changes,
+    plan_texture_naming_batches,
     project_token_for_naming,
     protected_roots_for_context,
     read_sha256_index,
@@ -31,6 +54,7 @@ from .texture_workflow_common import (
     resolve_texture_root_for_context,
     safe_mkdir,
     sha256_file,
+    texture_naming_model_and_headers,
     unique_destination,
     usage_socket_targets,
     utc_now_iso,
@@ -42,6 +66,32 @@ from .ai_http import has_openrouter_api_key
 
 _ADOPTABLE_CLASSES = {"EXTERNAL_ADOPTABLE", "IN_PROJECT_ADOPTABLE", "ADOPTABLE"}
 
+# Item fields carried over by incremental Analyze when a texture is unchanged.
+_REUSABLE_ITEM_FIELDS = (
+    "item_id",
+    "image_name",
+    "raw_filepath",
+    "abs_filepath",
+    "classification",
+    "issue_summary",
+    "map_type",
+    "materials_summary",
+    "socket_targets_json",
+    "hint_text",
+    "initial_suggestion",
+    "refined_suggestion",
+    "final_filename",
+    "dest_preview_path",
+    "status",
+    "last_error",
+    "read_only",
+    "selected_for_apply",
+    "fingerprint",
+)
+# Statuses that always trigger re-analysis (AI never produced a usable result).
+_NON_REUSABLE_STATUSES = {"AI_BLOCKED", "ERROR"}
+_REUSE_YIELD_EVERY = 200
+
 
 def _state_from_context(context):
     scene = getattr(context, "scene", None)
@@ -164,6 +214,47 @@ def _resolve_image_for_item(item, usage_by_image: Dict[int, Tuple[Any, List[Any]
     return None
 
 
+def _item_fingerprint(image: Any, usages: Sequence[Any], abs_path: Optional[Path], raw_filepath: str, context_sig: str) -> str:
+    flags = []
+    if getattr(image, "packed_file", None) is not None:
+        flags.append("packed")
+    if getattr(image, "library", None) is not None:
+        flags.append("linked")
+    return texture_fingerprint(
+        image_name=getattr(image, "name", "") or "",
+        image_source=getattr(image, "source", "") or "",
+        raw_filepath=raw_filepath,
+        abs_filepath=str(abs_path) if abs_path is not None else "",
+        stat_signature=file_stat_signature(abs_path),
+        usage_sig=usage_signature(usages),
+        flags=flags,
+        context_signature=context_sig,
+    )
+
+
+def _mark_item_ai_blocked(item, row: Dict[str, object], error: str) -> None:
+    item.status = "AI_BLOCKED"
+    item.last_error = error
+    item.selected_for_apply = False
+    row["status"] = "AI_BLOCKED"
+    row["last_error"] = error
+
+
+def _snapshot_reusable_items(state) -> Dict[int, Dict[str, object]]:
+    """Return prior item fields keyed by image pointer (image_ref survives file reloads)."""
+    out: Dict[int, Dict[str, object]] = {}
+    for item in list(getattr(state, "items", []) or []):
+        if not (getattr(item, "fingerprint", "") or ""):
+            continue
+        if (getattr(item, "status", "") or "").upper() in _NON_REUSABLE_STATUSES:
+            continue
+        image = getattr(item, "image_ref", None)
+        if image is None:
+            continue
+        out[pointer_key(image)] = {field: getattr(item, field) for field in _REUSABLE_ITEM_FIELDS}
+    return out
+
+
 def _make_report_dir(dest_root: Path) -> tuple[Optional[Path], Optional[str]]:
     report_dir = dest_root / "_manifests"
     err = safe_mkdir(report_dir)
@@ -180,6 +271,117 @@ def _write_json(path: Path, payload: Dict[str, object]) -> Optional[str]:
         return str(ex)
 
 
+def _resumed_change_for(resume_changes: Dict[str, Dict[str, object]], abs_path: Path) -> Optional[Tuple[str, int]]:
+    """Return (digest, bytes) from a partial apply log when its copy is still intact on disk."""
+    record = resume_changes.get(str(abs_path))
+    if record is None:
+        return None
+    digest = str(record.get("content_sha256") or "")
+    dest_raw = str(record.get("dest_abs_filepath") or "")
+    try:
+        byte_count = int(record.get("bytes") or 0)
+        if not digest or not dest_raw:
+            return None
+        if os.stat(str(abs_path)).st_size != byte_count or os.stat(dest_raw).st_size != byte_count:
+            return None
+    except (OSError, TypeError, ValueError):
+        return None
+    return digest, byte_count
+
+
+def _run_tile_job(state, label: str, verb: str, tile_count: int, job) -> Iterator[None]:
+    """Run a tile-set job in a worker thread, reporting per-tile progress in the panel."""
+    progress = {"done": 0}
+    box: Dict[str, object] = {}
+
+    def _progress(done: int, _total: int) -> None:
+        progress["done"] = done
+
+    def _worker() -> None:
+        try:
+            box["result"] = job(_progress)
+        except Exception as ex:
+            box["error"] = ex
+
+    worker = threading.Thread(target=_worker, daemon=True)
+    worker.start()
+    while worker.is_alive():
+        state.progress_text = f"UDIM {label}: {verb} {progress['done']}/{tile_count} tiles"
+        yield None
+    state.progress_text = ""
+    if "error" in box:
+        raise box["error"]  # type: ignore[misc]
+    return box.get("result")
+
+
+def _adopt_udim_tile_set(
+    state,
+    *,
+    abs_path: Path,
+    stem: str,
+    ext: str,
+    dest_root: Path,
+    hash_to_dest: Dict[str, Path],
+    sha256_index: Dict[str, str],
+    outcome: Dict[str, object],
+) -> Iterator[None]:
+    """Hash, deduplicate and copy a UDIM tile set as a unit; fills ``outcome``."""
+    tiles = enumerate_udim_tiles(abs_path)
+    if not tiles:
+        outcome.update(classification="MISSING", error="No UDIM tiles found on disk")
+        return
+    label = udim_source_stem(abs_path.name) or abs_path.name
+
+    try:
+        digests = yield from _run_tile_job(
+            state,
+            label,
+            "hashing",
+            len(tiles),
+            lambda progress: hash_udim_tiles(tiles, progress=progress),
+        )
+    except Exception as ex:
+        outcome.update(classification="HASH_ERROR", error=f"Failed hashing UDIM tiles: {ex}")
+        return
+    digest = combined_udim_digest(digests)
+    byte_count = sum(tile.size for tile in digests)
+
+    existing = hash_to_dest.get(digest)
+    if existing is None:
+        indexed = (sha256_index.get(digest) or "").strip()
+        if indexed and udim_tile_set_exists(dest_root / indexed, digests):
+            existing = dest_root / indexed
+
+    if existing is not None:
+        action = "RELINK_EXISTING"
+        dest_path = existing
+    else:
+        dest_path = unique_udim_destination(dest_root, stem, ext, [tile.number for tile in tiles])
+        try:
+            yield from _run_tile_job(
+                state,
+                label,
+                "copying",
+                len(tiles),
+                lambda progress: copy_udim_tiles(tiles, dest_path, progress=progress),
+            )
+        except Exception as ex:
+            outcome.update(classification="COPY_ERROR", error=f"Failed copying UDIM tiles: {ex}")
+            return
+        if not udim_tile_set_exists(dest_path, digests):
+            outcome.update(classification="COPY_VERIFY_FAILED", error="Copy verification failed: UDIM tile size mismatch")
+            return
+        action = "COPIED"
+
+    outcome.update(
+        dest_path=dest_path,
+        digest=digest,
+        bytes=byte_count,
+        action=action,
+        tile_count=len(tiles),
+    )
+
+
 class _ModalRunnerMixin:
     _timer = None
     _runner = None
@@ -216,6 +418,12 @@ class _ModalRunnerMixin:
                 except Exception:
                     pass
                 self._timer = None
+            if self._runner is not None:
+                # Closing the generator runs its finally blocks (e.g. flushing report logs).
+                try:
+                    self._runner.close()
+                except Exception:
+                    pass
             self._runner = None
             self._runner_result = {"CANCELLED"}
             self.report({"WARNING"}, "Operation cancelled by user")
@@ -258,6 +466,9 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
             return
 
         _mark_busy(state, True)
+        prior_items: Dict[int, Dict[str, object]] = {}
+        if bool(getattr(state, "incremental_analyze", False)):
+            prior_items = _snapshot_reusable_items(state)
         state.last_error = ""
         state.ai_blocked = False
         state.phase = "IDLE"
@@ -278,6 +489,12 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
         protected_roots = protected_roots_for_context(context)
         dest_root = resolve_texture_root_for_context(project_root, local_mode=local_mode)
         project_token = project_token_for_naming(project_root=project_root) or "Project"
+        context_sig = scan_context_signature(
+            project_root=project_root,
+            texture_root=dest_root,
+            protected_roots=protected_roots,
+            project_token=project_token,
+        )
 
         report_dir, err = _make_report_dir(dest_root)
         if err:
@@ -294,6 +511,8 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
             state.last_error = ai_error
 
         analysis_items: List[Dict[str, object]] = []
+        reused_count = 0
+        pending_ai: List[Tuple[int, Dict[str, object], TextureNamingRequest, str, bool, str]] = []
         wm = context.window_manager
         total_jobs = max(1, int(len(usage_by_image)))
         try:
@@ -301,7 +520,46 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
         except Exception:
             pass
 
-        for idx, (_img_key, (image, usages)) in enumerate(usage_by_image.items(), 1):
+        for idx, (img_key, (image, usages)) in enumerate(usage_by_image.items(), 1):
+            raw_filepath = (getattr(image, "filepath", "") or "").strip()
+            abs_path, path_reasons = resolve_abs_image_path(image)
+            fingerprint = _item_fingerprint(image, usages, abs_path, raw_filepath, context_sig)
+
+            prior = prior_items.get(img_key)
+            if prior is not None and prior.get("fingerprint") == fingerprint:
+                # Unchanged since the previous Analyze: keep classification and reviewed suggestions.
+                reused_count += 1
+                item = state.items.add()
+                for field, value in prior.items():
+                    setattr(item, field, value)
+                try:
+                    item.image_ref = image
+                except Exception:
+                    pass
+                analysis_items.append(
+                    {
+                        "image_name": item.image_name,
+                        "raw_filepath": item.raw_filepath,
+                        "abs_filepath": item.abs_filepath,
+                        "classification": item.classification,
+                        "reasons": [item.issue_summary] if item.issue_summary else [],
+                        "map_type": item.map_type,
+                        "socket_targets": _socket_targets_from_item(item),
+                        "initial_suggestion": item.initial_suggestion,
+                        "final_filename": item.final_filename,
+                        "status": item.status,
+                        "last_error": item.last_error,
+                        "reused": True,
+                    }
+                )
+                if (reused_count % _REUSE_YIELD_EVERY) == 0:
+                    try:
+                        wm.progress_update(idx)
+                    except Exception:
+                        pass
+                    yield None
+                continue
+
             yield None
             try:
                 wm.progress_update(idx)
@@ -313,8 +571,6 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
                 except Exception:
                     pass
 
-            raw_filepath = (getattr(image, "filepath", "") or "").strip()
-            abs_path, path_reasons = resolve_abs_image_path(image)
             exists = exists_for_scan(abs_path, raw_filepath=raw_filepath)
 
             classification, reasons = infer_scan_classification(
@@ -335,7 +591,11 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
             map_type = getattr(first, "map_type", "") or "Generic"
             socket_targets = usage_socket_targets(usages)
             ext = ((abs_path.suffix if abs_path is not None else "") or ".png").lower()
-            source_stem = sanitize_filename_stem(abs_path.stem if abs_path is not None else "") or "Texture"
+            is_udim = UDIM_TOKEN in raw_filepath
+            if is_udim:
+                source_stem = sanitize_filename_stem(udim_source_stem(abs_path.name if abs_path is not None else "")) or "Texture"
+            else:
+                source_stem = sanitize_filename_stem(abs_path.stem if abs_path is not None else "") or "Texture"
 
             initial_suggestion = ""
             refined_suggestion = ""
@@ -344,56 +604,17 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
             item_status = "ANALYZED"
             item_error = ""
 
+            pending_request: Optional[TextureNamingRequest] = None
             if is_adoptable:
                 if ai_runtime_ok:
-                    ai_box: Dict[str, tuple[str, str | None, str | None, str | None, Dict[str, object] | None, str | None]] = {}
-
-                    def _run_ai() -> None:
-                        try:
-                            ai_box["result"] = ai_suggest_texture_name(
-                                context=context,
-                                original_filename=(abs_path.name if abs_path is not None else getattr(image, "name", "") or "texture.png"),
-                                material_name=getattr(first, "material_name", "") if first is not None else "",
-                                map_type=map_type,
-                                socket_targets=socket_targets,
-                                manual_hint="",
-                                prior_suggestion="",
-                                include_preview=bool(getattr(state, "ai_include_preview", False)),
-                                image=image,
-                            )
-                        except Exception as ex:
-                            ai_box["result"] = ("", None, None, None, None, f"OpenRouter request failed: {ex}")
-
-                    ai_thread = threading.Thread(target=_run_ai, daemon=True)
-                    ai_thread.start()
-                    while ai_thread.is_alive():
-                        try:
-                            bpy.ops.wm.redraw_timer(type="DRAW_WIN_SWAP", iterations=1)
-                        except Exception:
-                            pass
-                        yield None
-
-                    suggested, ai_map_type, _explanation, _image_summary, _preview_meta, ai_err = ai_box.get(
-                        "result",
-                        ("", None, None, None, None, "OpenRouter request returned no result"),
+                    pending_request = build_texture_naming_request(
+                        original_filename=(abs_path.name if abs_path is not None else getattr(image, "name", "") or "texture.png"),
+                        material_name=getattr(first, "material_name", "") if first is not None else "",
+                        map_type=map_type,
+                        socket_targets=socket_targets,
+                        include_preview=bool(getattr(state, "ai_include_preview", False)),
+                        image=image,
                     )
-                    if suggested:
-                        map_for_name = ai_map_type or map_type
-                        initial_suggestion = suggested
-                        final_filename = canonical_filename_for_item(
-                            project_token=project_token,
-                            source_stem=suggested,
-                            map_type=map_for_name,
-                            ext=ext,
-                        )
-                        item_status = "READY"
-                    else:
-                        ai_runtime_ok = False
-                        ai_error = ai_err or "OpenRouter request failed"
-                        state.ai_blocked = True
-                        state.last_error = ai_error
-                        item_status = "AI_BLOCKED"
-                        item_error = ai_error
                 else:
                     item_status = "AI_BLOCKED"
                     item_error = ai_error or "AI unavailable"
@@ -404,6 +625,7 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
                         source_stem=source_stem,
                         map_type=map_type,
                         ext=ext,
+                        udim=is_udim,
                     )
                 dest_preview_path = str(dest_root / final_filename)
 
@@ -437,22 +659,99 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
             item.last_error = item_error
             item.read_only = read_only
             item.selected_for_apply = bool(is_adoptable and item_status == "READY")
+            # Pending AI names get their fingerprint once named, so a cancelled or failed
+            # Analyze leaves them unfingerprinted and the next incremental pass asks again.
+            item.fingerprint = "" if pending_request is not None else fingerprint
+
+            row = {
+                "image_name": item.image_name,
+                "raw_filepath": item.raw_filepath,
+                "abs_filepath": item.abs_filepath,
+                "classification": classification,
+                "reasons": reasons,
+                "map_type": map_type,
+                "socket_targets": socket_targets,
+                "initial_suggestion": initial_suggestion,
+                "final_filename": final_filename,
+                "status": item_status,
+                "last_error": item_error,
+                "reused": False,
+            }
+            analysis_items.append(row)
+            if pending_request is not None:
+                pending_ai.append((len(state.items) - 1, row, pending_request, ext, is_udim, fingerprint))
+
+        if pending_ai:
+            model, headers = texture_naming_model_and_headers(context)
+            requests = [entry[2] for entry in pending_ai]
+            for batch in plan_texture_naming_batches(requests):
+                if not ai_runtime_ok:
+                    for pos in batch:
+                        item_index, row = pending_ai[pos][:2]
+                        _mark_item_ai_blocked(state.items[item_index], row, ai_error or "AI unavailable")
+                    continue
 
-            analysis_items.append(
-                {
-                    "image_name": item.image_name,
-                    "raw_filepath": item.raw_filepath,
-                    "abs_filepath": item.abs_filepath,
-                    "classification": classification,
-                    "reasons": reasons,
-                    "map_type": map_type,
-                    "socket_targets": socket_targets,
-                    "initial_suggestion": initial_suggestion,
-                    "final_filename": final_filename,
-                    "status": item_status,
-                    "last_error": item_error,
-                }
-            )
+                ai_box: Dict[str, tuple[Optional[List[TextureNamingResult]], Optional[str]]] = {}
+                batch_requests = [requests[pos] for pos in batch]
+
+                def _run_ai() -> None:
+                    try:
+                        ai_box["result"] = ai_suggest_texture_names_batch(
+                            model=model,
+                            headers=headers,
+                            requests=batch_requests,
+                        )
+                    except Exception as ex:
+                        ai_box["result"] = (None, f"OpenRouter request failed: {ex}")
+
+                ai_thread = threading.Thread(target=_run_ai, daemon=True)
+                ai_thread.start()
+                while ai_thread.is_alive():
+                    try:
+                        bpy.ops.wm.redraw_timer(type="DRAW_WIN_SWAP", iterations=1)
+                    except Exception:
+                        pass
+                    yield None
+
+                results, batch_err = ai_box.get("result", (None, "OpenRouter request returned no result"))
+                if results is None:
+                    ai_runtime_ok = False
+                    ai_error = batch_err or "OpenRouter request failed"
+                    state.ai_blocked = True
+                    state.last_error = ai_error
+                    for pos in batch:
+                        item_index, row = pending_ai[pos][:2]
+                        _mark_item_ai_blocked(state.items[item_index], row, ai_error)
+                    continue
+
+                for pos, result in zip(batch, results):
+                    item_index, row, request, ext, is_udim, fingerprint = pending_ai[pos]
+                    item = state.items[item_index]
+                    if not result.stem:
+                        _mark_item_ai_blocked(item, row, result.error or "OpenRouter request failed")
+                        continue
+                    final_filename = canonical_filename_for_item(
+                        project_token=project_token,
+                        source_stem=result.stem,
+                        map_type=result.map_type or request.map_type,
+                        ext=ext,
+                        udim=is_udim,
+                    )
+                    item.initial_suggestion = result.stem
+                    item.final_filename = final_filename
+                    item.dest_preview_path = str(dest_root / final_filename)
+                    item.status = "READY"
+                    item.last_error = ""
+                    item.selected_for_apply = True
+                    item.fingerprint = fingerprint
+                    row.update(
+                        {
+                            "initial_suggestion": result.stem,
+                            "final_filename": final_filename,
+                            "status": "READY",
+                            "last_error": "",
+                        }
+                    )
 
         _update_state_counts(state)
         if len(state.items) > 0:
@@ -469,8 +768,10 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
             "texture_root": str(dest_root),
             "ai_blocked": bool(state.ai_blocked),
             "ai_error": ai_error or "",
+            "incremental": bool(getattr(state, "incremental_analyze", False)),
             "summary": {
                 "total": int(state.total_count),
+                "reused": int(reused_count),
                 "adoptable": int(state.adoptable_count),
                 "protected": int(state.protected_count),
                 "missing": int(state.missing_count),
@@ -499,7 +800,8 @@ class LIME_OT_texture_analyze(_ModalRunnerMixin, Operator):
                     {"INFO"},
                     (
                         f"Texture analysis completed. Adoptable: {state.adoptable_count}, "
-                        f"Protected: {state.protected_count}, Missing: {state.missing_count}."
+                        f"Protected: {state.protected_count}, Missing: {state.missing_count}, "
+                        f"Reused: {reused_count}."
                     ),
                 )
             self._runner_result = {"FINISHED"}
@@ -573,37 +875,39 @@ class LIME_OT_texture_refine(_ModalRunnerMixin, Operator):
             pass
 
         global_error = ""
-        for idx, item in enumerate(selected_items, 1):
-            yield None
-            try:
-                wm.progress_update(idx)
-            except Exception:
-                pass
-
-            image = getattr(item, "image_ref", None)
-            original_name = Path((getattr(item, "abs_filepath", "") or "").strip()).name or (getattr(item, "image_name", "") or "texture.png")
-            socket_targets = _socket_targets_from_item(item)
-            map_type = (getattr(item, "map_type", "") or "Generic").strip() or "Generic"
-            prior = (getattr(item, "refined_suggestion", "") or "").strip() or (getattr(item, "initial_suggestion", "") or "").strip()
-            hint = (getattr(item, "hint_text", "") or "").strip()
+        requests: List[TextureNamingRequest] = []
+        for item in selected_items:
+            requests.append(
+                build_texture_naming_request(
+                    original_filename=Path((getattr(item, "abs_filepath", "") or "").strip()).name
+                    or (getattr(item, "image_name", "") or "texture.png"),
+                    material_name=(getattr(item, "materials_summary", "") or "").split(",")[0].strip(),
+                    map_type=(getattr(item, "map_type", "") or "Generic").strip() or "Generic",
+                    socket_targets=_socket_targets_from_item(item),
+                    manual_hint=(getattr(item, "hint_text", "") or "").strip(),
+                    prior_suggestion=(getattr(item, "refined_suggestion", "") or "").strip()
+                    or (getattr(item, "initial_suggestion", "") or "").strip(),
+                    include_preview=bool(getattr(state, "ai_include_preview", False)),
+                    image=getattr(item, "image_ref", None),
+                )
+            )
 
-            ai_box: Dict[str, tuple[str, str | None, str | None, str | None, Dict[str, object] | None, str | None]] = {}
+        model, headers = texture_naming_model_and_headers(context)
+        done = 0
+        for batch in plan_texture_naming_batches(requests):
+            yield None
+            ai_box: Dict[str, tuple[Optional[List[TextureNamingResult]], Optional[str]]] = {}
+            batch_requests = [requests[pos] for pos in batch]
 
             def _run_ai() -> None:
                 try:
-                    ai_box["result"] = ai_suggest_texture_name(
-                        context=context,
-                        original_filename=original_name,
-                        material_name=(getattr(item, "materials_summary", "") or "").split(",")[0].strip(),
-                        map_type=map_type,
-                        socket_targets=socket_targets,
-                        manual_hint=hint,
-                        prior_suggestion=prior,
-                        include_preview=bool(getattr(state, "ai_include_preview", False)),
-                        image=image,
+                    ai_box["result"] = ai_suggest_texture_names_batch(
+                        model=model,
+                        headers=headers,
+                        requests=batch_requests,
                     )
                 except Exception as ex:
-                    ai_box["result"] = ("", None, None, None, None, f"OpenRouter request failed: {ex}")
+                    ai_box["result"] = (None, f"OpenRouter request failed: {ex}")
 
             ai_thread = threading.Thread(target=_run_ai, daemon=True)
             ai_thread.start()
@@ -614,49 +918,70 @@ class LIME_OT_texture_refine(_ModalRunnerMixin, Operator):
                     pass
                 yield None
 
-            suggested, ai_map_type, explanation, image_summary, preview_meta, ai_err = ai_box.get(
-                "result",
-                ("", None, None, None, None, "OpenRouter request returned no result"),
-            )
-            if not suggested:
-                global_error = ai_err or "OpenRouter request failed"
-                item.status = "AI_BLOCKED"
-                item.last_error = global_error
+            results, batch_err = ai_box.get("result", (None, "OpenRouter request returned no result"))
+            if results is None:
+                global_error = batch_err or "OpenRouter request failed"
+                for pos in batch:
+                    item = selected_items[pos]
+                    item.status = "AI_BLOCKED"
+                    item.last_error = global_error
+                    refine_rows.append(
+                        {
+                            "item_id": item.item_id,
+                            "status": "AI_BLOCKED",
+                            "error": global_error,
+                        }
+                    )
+                break
+
+            for pos, result in zip(batch, results):
+                item = selected_items[pos]
+                request = requests[pos]
+                if not result.stem:
+                    item.status = "AI_BLOCKED"
+                    item.last_error = result.error or "OpenRouter request failed"
+                    refine_rows.append(
+                        {
+                            "item_id": item.item_id,
+                            "status": "AI_BLOCKED",
+                            "error": item.last_error,
+                        }
+                    )
+                    continue
+
+                ext = Path((getattr(item, "final_filename", "") or "")).suffix or Path((getattr(item, "abs_filepath", "") or "")).suffix or ".png"
+                map_for_name = result.map_type or request.map_type
+                final_filename = canonical_filename_for_item(
+                    project_token=project_token,
+                    source_stem=result.stem,
+                    map_type=map_for_name,
+                    ext=ext,
+                    udim=UDIM_TOKEN in (getattr(item, "raw_filepath", "") or ""),
+                )
+                item.refined_suggestion = result.stem
+                item.final_filename = final_filename
+                item.dest_preview_path = str(dest_root / final_filename)
+                item.status = "READY"
+                item.last_error = ""
                 refine_rows.append(
                     {
                         "item_id": item.item_id,
-                        "status": "AI_BLOCKED",
-                        "error": global_error,
+                        "status": "READY",
+                        "hint": request.manual_hint,
+                        "suggested": result.stem,
+                        "map_type": map_for_name,
+                        "final_filename": final_filename,
+                        "ai_explanation": result.explanation,
+                        "ai_image_summary": result.image_summary,
+                        "ai_preview_meta": result.preview_meta,
                     }
                 )
-                break
 
-            ext = Path((getattr(item, "final_filename", "") or "")).suffix or Path((getattr(item, "abs_filepath", "") or "")).suffix or ".png"
-            map_for_name = ai_map_type or map_type
-            final_filename = canonical_filename_for_item(
-                project_token=project_token,
-                source_stem=suggested,
-                map_type=map_for_name,
-                ext=ext,
-            )
-            item.refined_suggestion = suggested
-            item.final_filename = final_filename
-            item.dest_preview_path = str(dest_root / final_filename)
-            item.status = "READY"
-            item.last_error = ""
-            refine_rows.append(
-                {
-                    "item_id": item.item_id,
-                    "status": "READY",
-                    "hint": hint,
-                    "suggested": suggested,
-                    "map_type": map_for_name,
-                    "final_filename": final_filename,
-                    "ai_explanation": explanation,
-                    "ai_image_summary": image_summary,
-                    "ai_preview_meta": preview_meta,
-                }
-            )
+            done += len(batch)
+            try:
+                wm.progress_update(done)
+            except Exception:
+                pass
 
         if global_error:
             state.ai_blocked = True
@@ -757,8 +1082,6 @@ class LIME_OT_texture_apply(_ModalRunnerMixin, Operator):
         index_path = report_dir / "texture_sha256_index.json"
         sha256_index = read_sha256_index(index_path)
 
-        changes: List[Dict[str, object]] = []
-        skipped: List[Dict[str, object]] = []
         relinked_images: Set[int] = set()
         stats = {
             "total_selected_ready": len(selected_ready),
@@ -766,8 +1089,54 @@ class LIME_OT_texture_apply(_ModalRunnerMixin, Operator):
             "relinked_existing": 0,
             "skipped": 0,
             "errors": 0,
+            "resumed": 0,
         }
 
+        # Per-item results are streamed to a JSONL log so an interrupted run keeps
+        # everything processed so far; the next Apply resumes from that log.
+        resume_path = find_resumable_apply_log(report_dir)
+        resume_changes: Dict[str, Dict[str, object]] = {}
+        log_path = resume_path or (report_dir / f"texture_apply_{utc_timestamp()}.jsonl")
+        if resume_path is not None:
+            resume_changes = load_apply_resume_changes(resume_path)
+            for record in resume_changes.values():
+                digest = str(record.get("content_sha256") or "")
+                dest_name = Path(str(record.get("dest_abs_filepath") or "")).name
+                if digest and dest_name:
+                    sha256_index[digest] = dest_name
+        try:
+            apply_log = JsonlWriter(log_path)
+        except Exception as ex:
+            _mark_busy(state, False)
+            self.report({"ERROR"}, f"Cannot open texture apply log: {ex}")
+            self._runner_result = {"CANCELLED"}
+            return
+
+        # Only the log I/O is guarded here: copy/relink failures go through the
+        # per-item error paths below, and a failed log write stops the run.
+        log_errors: List[str] = []
+
+        def write_log(record: Dict[str, object]) -> None:
+            if log_errors:
+                return
+            try:
+                apply_log.write(record)
+            except OSError as ex:
+                log_errors.append(str(ex))
+
+        write_log(
+            {
+                "kind": "resume" if resume_path is not None else "header",
+                "generated_at": utc_now_iso(),
+                "blend_filepath": (getattr(bpy.data, "filepath", "") or "").strip(),
+                "blend_dir": str(blend_dir()),
+                "project_root": str(project_root) if project_root is not None else None,
+                "texture_root": str(dest_root),
+                "scan_scope": getattr(state, "scan_scope", "ALL_SCENE"),
+                "resumed_changes": len(resume_changes),
+            }
+        )
+
         wm = context.window_manager
         total_jobs = max(1, len(selected_ready))
         try:
@@ -775,226 +1144,278 @@ class LIME_OT_texture_apply(_ModalRunnerMixin, Operator):
         except Exception:
             pass
 
-        for idx, item in enumerate(selected_ready, 1):
-            yield None
-            try:
-                wm.progress_update(idx)
-            except Exception:
-                pass
-
-            image = _resolve_image_for_item(item, usage_by_image)
-            if image is None:
-                item.status = "ERROR"
-                item.last_error = "Image datablock not found for this plan item"
-                stats["errors"] += 1
-                skipped.append(
-                    {
-                        "item_id": item.item_id,
-                        "classification": "IMAGE_NOT_FOUND",
-                        "reason": item.last_error,
-                    }
-                )
-                continue
-
-            raw_filepath = (getattr(image, "filepath", "") or "").strip()
-            source_kind = (getattr(image, "source", "") or "").upper()
-            abs_path, path_reasons = resolve_abs_image_path(image)
-            exists = exists_for_scan(abs_path, raw_filepath=raw_filepath)
-            usages = []
-            try:
-                key = int(image.as_pointer())
-                usages = usage_by_image.get(key, (None, []))[1]
-            except Exception:
-                pass
-
-            classification, reasons = infer_scan_classification(
-                image=image,
-                usages=usages,
-                abs_path=abs_path,
-                raw_filepath=raw_filepath,
-                exists=exists,
-                project_root=project_root,
-                protected_roots=protected_roots,
-                dest_root=dest_root,
-            )
-            reasons = list(path_reasons) + list(reasons)
-            if classification not in _ADOPTABLE_CLASSES:
-                item.status = "SKIPPED"
-                item.last_error = reasons[0] if reasons else f"Skipped ({classification})"
-                stats["skipped"] += 1
-                skipped.append(
-                    {
-                        "item_id": item.item_id,
-                        "classification": classification,
-                        "reasons": reasons,
-                    }
-                )
-                continue
-
-            if abs_path is None or not os.path.isfile(str(abs_path)):
-                item.status = "ERROR"
-                item.last_error = "Resolved source file does not exist"
-                stats["errors"] += 1
-                skipped.append(
-                    {
-                        "item_id": item.item_id,
-                        "classification": "MISSING",
-                        "reasons": ["Resolved source file does not exist"],
-                    }
-                )
-                continue
-
-            try:
-                digest, byte_count = sha256_file(abs_path)
-            except Exception as ex:
-                item.status = "ERROR"
-                item.last_error = f"Failed hashing file: {ex}"
-                stats["errors"] += 1
-                skipped.append(
-                    {
-                        "item_id": item.item_id,
-                        "classification": "HASH_ERROR",
-                        "reasons": [item.last_error],
-                    }
-                )
-                continue
-
-            filename_raw = (getattr(item, "final_filename", "") or "").strip()
-            stem = sanitize_filename_stem(Path(filename_raw).stem) or sanitize_filename_stem(abs_path.stem) or "Texture"
-            ext = (abs_path.suffix or ".png").lower()
-            filename = f"{stem}{ext}"
-
-            existing = hash_to_dest.get(digest)
-            if existing is None:
-                indexed = (sha256_index.get(digest) or "").strip()
-                if indexed:
-                    candidate = dest_root / indexed
-                    if candidate.exists():
-                        existing = candidate
-
-            if existing is not None:
-                dest_path = existing
-                action = "RELINK_EXISTING"
-            else:
-                dest_path = unique_destination(dest_root, filename, digest)
+        try:
+            for idx, item in enumerate(selected_ready, 1):
+                if log_errors:
+                    break
+                yield None
                 try:
-                    copy_texture_file(abs_path, dest_path)
-                except Exception as ex:
+                    wm.progress_update(idx)
+                except Exception:
+                    pass
+
+                image = _resolve_image_for_item(item, usage_by_image)
+                if image is None:
                     item.status = "ERROR"
-                    item.last_error = f"Failed copying file: {ex}"
+                    item.last_error = "Image datablock not found for this plan item"
                     stats["errors"] += 1
-                    skipped.append(
+                    write_log(
                         {
+                            "kind": "skipped",
                             "item_id": item.item_id,
-                            "classification": "COPY_ERROR",
-                            "reasons": [item.last_error],
+                            "classification": "IMAGE_NOT_FOUND",
+                            "reason": item.last_error,
                         }
                     )
                     continue
+
+                raw_filepath = (getattr(image, "filepath", "") or "").strip()
+                source_kind = (getattr(image, "source", "") or "").upper()
+                abs_path, path_reasons = resolve_abs_image_path(image)
+                exists = exists_for_scan(abs_path, raw_filepath=raw_filepath)
+                usages = []
                 try:
-                    if not dest_path.exists():
-                        raise FileNotFoundError("Destination file not found after copy")
-                    if dest_path.stat().st_size != int(byte_count):
-                        raise OSError("Destination file size mismatch after copy")
-                except Exception as ex:
-                    item.status = "ERROR"
-                    item.last_error = f"Copy verification failed: {ex}"
-                    stats["errors"] += 1
-                    skipped.append(
+                    key = int(image.as_pointer())
+                    usages = usage_by_image.get(key, (None, []))[1]
+                except Exception:
+                    pass
+
+                classification, reasons = infer_scan_classification(
+                    image=image,
+                    usages=usages,
+                    abs_path=abs_path,
+                    raw_filepath=raw_filepath,
+                    exists=exists,
+                    project_root=project_root,
+                    protected_roots=protected_roots,
+                    dest_root=dest_root,
+                )
+                reasons = list(path_reasons) + list(reasons)
+                if classification not in _ADOPTABLE_CLASSES:
+                    item.status = "SKIPPED"
+                    item.last_error = reasons[0] if reasons else f"Skipped ({classification})"
+                    stats["skipped"] += 1
+                    write_log(
                         {
+                            "kind": "skipped",
                             "item_id": item.item_id,
-                            "classification": "COPY_VERIFY_FAILED",
-                            "reasons": [item.last_error],
+                            "classification": classification,
+                            "reasons": reasons,
                         }
                     )
                     continue
-                action = "COPIED"
 
-            hash_to_dest[digest] = dest_path
-            sha256_index[digest] = dest_path.name
+                filename_raw = (getattr(item, "final_filename", "") or "").strip()
+                stem = sanitize_filename_stem(Path(filename_raw).stem) or sanitize_filename_stem(abs_path.stem) or "Texture"
+                ext = (abs_path.suffix or ".png").lower()
+                filename = f"{stem}{ext}"
+
+                is_udim = UDIM_TOKEN in raw_filepath
+                if is_udim:
+                    stem = (
+                        sanitize_filename_stem(udim_source_stem(Path(filename_raw).name))
+                        or sanitize_filename_stem(udim_source_stem(abs_path.name))
+                        or "Texture"
+                    )
+                    tile_outcome: Dict[str, object] = {}
+                    yield from _adopt_udim_tile_set(
+                        state,
+                        abs_path=abs_path,
+                        stem=stem,
+                        ext=ext,
+                        dest_root=dest_root,
+                        hash_to_dest=hash_to_dest,
+                        sha256_index=sha256_index,
+                        outcome=tile_outcome,
+                    )
+                    if tile_outcome.get("error"):
+                        item.status = "ERROR"
+                        item.last_error = str(tile_outcome["error"])
+                        stats["errors"] += 1
+                        write_log(
+                            {
+                                "kind": "skipped",
+                                "item_id": item.item_id,
+                                "classification": tile_outcome.get("classification", "UDIM_ERROR"),
+                                "reasons": [item.last_error],
+                            }
+                        )
+                        continue
+                    dest_path = tile_outcome["dest_path"]
+                    digest = str(tile_outcome["digest"])
+                    byte_count = int(tile_outcome["bytes"])
+                    action = str(tile_outcome["action"])
+                    tile_count = int(tile_outcome["tile_count"])
+                else:
+                    tile_count = 0
+                    if abs_path is None or not os.path.isfile(str(abs_path)):
+                        item.status = "ERROR"
+                        item.last_error = "Resolved source file does not exist"
+                        stats["errors"] += 1
+                        write_log(
+                            {
+                                "kind": "skipped",
+                                "item_id": item.item_id,
+                                "classification": "MISSING",
+                                "reasons": ["Resolved source file does not exist"],
+                            }
+                        )
+                        continue
 
-            try:
-                img_key = int(image.as_pointer())
-            except Exception:
-                img_key = id(image)
+                    resumed = _resumed_change_for(resume_changes, abs_path)
+                    if resumed is not None:
+                        digest, byte_count = resumed
+                    else:
+                        try:
+                            digest, byte_count = sha256_file(abs_path)
+                        except Exception as ex:
+                            item.status = "ERROR"
+                            item.last_error = f"Failed hashing file: {ex}"
+                            stats["errors"] += 1
+                            write_log(
+                                {
+                                    "kind": "skipped",
+                                    "item_id": item.item_id,
+                                    "classification": "HASH_ERROR",
+                                    "reasons": [item.last_error],
+                                }
+                            )
+                            continue
+
+                    existing = hash_to_dest.get(digest)
+                    if existing is None:
+                        indexed = (sha256_index.get(digest) or "").strip()
+                        if indexed:
+                            candidate = dest_root / indexed
+                            if candidate.exists():
+                                existing = candidate
+
+                    if existing is not None:
+                        dest_path = existing
+                        action = "RESUMED" if resumed is not None else "RELINK_EXISTING"
+                    else:
+                        try:
+                            dest_path = unique_destination(dest_root, filename, digest)
+                            copy_texture_file(abs_path, dest_path)
+                        except Exception as ex:
+                            item.status = "ERROR"
+                            item.last_error = f"Failed copying file: {ex}"
+                            stats["errors"] += 1
+                            write_log(
+                                {
+                                    "kind": "skipped",
+                                    "item_id": item.item_id,
+                                    "classification": "COPY_ERROR",
+                                    "reasons": [item.last_error],
+                                }
+                            )
+                            continue
+                        try:
+                            if not dest_path.exists():
+                                raise FileNotFoundError("Destination file not found after copy")
+                            if dest_path.stat().st_size != int(byte_count):
+                                raise OSError("Destination file size mismatch after copy")
+                        except Exception as ex:
+                            item.status = "ERROR"
+                            item.last_error = f"Copy verification failed: {ex}"
+                            stats["errors"] += 1
+                            write_log(
+                                {
+                                    "kind": "skipped",
+                                    "item_id": item.item_id,
+                                    "classification": "COPY_VERIFY_FAILED",
+                                    "reasons": [item.last_error],
+                                }
+                            )
+                            continue
+                        action = "COPIED"
+
+                hash_to_dest[digest] = dest_path
+                sha256_index[digest] = dest_path.name
 
-            if img_key not in relinked_images:
-                blender_path, rel_reasons = relpath_for_blender(dest_path, project_root=project_root)
                 try:
-                    image.filepath = blender_path
+                    img_key = int(image.as_pointer())
+                except Exception:
+                    img_key = id(image)
+
+                if img_key not in relinked_images:
+                    blender_path, rel_reasons = relpath_for_blender(dest_path, project_root=project_root)
                     try:
-                        image.filepath_raw = blender_path  # type: ignore[attr-defined]
-                    except Exception:
-                        pass
-                    image.name = dest_path.stem
-                    image.reload()
-                    relinked_images.add(img_key)
-                except Exception as ex:
-                    item.status = "ERROR"
-                    item.last_error = f"Failed relinking image: {ex}"
-                    stats["errors"] += 1
-                    skipped.append(
-                        {
-                            "item_id": item.item_id,
-                            "classification": "RELINK_ERROR",
-                            "reasons": [item.last_error],
-                        }
-                    )
-                    continue
-            else:
-                blender_path, rel_reasons = relpath_for_blender(dest_path, project_root=project_root)
+                        image.filepath = blender_path
+                        try:
+                            image.filepath_raw = blender_path  # type: ignore[attr-defined]
+                        except Exception:
+                            pass
+                        image.name = udim_source_stem(dest_path.name) if is_udim else dest_path.stem
+                        image.reload()
+                        relinked_images.add(img_key)
+                    except Exception as ex:
+                        item.status = "ERROR"
+                        item.last_error = f"Failed relinking image: {ex}"
+                        stats["errors"] += 1
+                        write_log(
+                            {
+                                "kind": "skipped",
+                                "item_id": item.item_id,
+                                "classification": "RELINK_ERROR",
+                                "reasons": [item.last_error],
+                            }
+                        )
+                        continue
+                else:
+                    blender_path, rel_reasons = relpath_for_blender(dest_path, project_root=project_root)
+
+                item.status = "APPLIED"
+                item.last_error = ""
+                item.dest_preview_path = str(dest_path)
+                if action == "COPIED":
+                    stats["adopted"] += 1
+                elif action == "RESUMED":
+                    stats["resumed"] += 1
+                else:
+                    stats["relinked_existing"] += 1
 
-            item.status = "APPLIED"
-            item.last_error = ""
-            item.dest_preview_path = str(dest_path)
-            if action == "COPIED":
-                stats["adopted"] += 1
-            else:
-                stats["relinked_existing"] += 1
-
-            changes.append(
-                {
-                    "item_id": item.item_id,
-                    "image_name": getattr(image, "name", "") or "",
-                    "image_source": source_kind,
-                    "original_raw_filepath": raw_filepath,
-                    "original_abs_filepath": str(abs_path),
-                    "content_sha256": digest,
-                    "bytes": int(byte_count),
-                    "action": action,
-                    "dest_abs_filepath": str(dest_path),
-                    "dest_blender_filepath": blender_path,
-                    "relpath_notes": rel_reasons,
-                }
-            )
+                write_log(
+                    {
+                        "kind": "change",
+                        "item_id": item.item_id,
+                        "image_name": getattr(image, "name", "") or "",
+                        "image_source": source_kind,
+                        "original_raw_filepath": raw_filepath,
+                        "original_abs_filepath": str(abs_path),
+                        "content_sha256": digest,
+                        "bytes": int(byte_count),
+                        "action": action,
+                        "udim_tiles": tile_count,
+                        "dest_abs_filepath": str(dest_path),
+                        "dest_blender_filepath": blender_path,
+                        "relpath_notes": rel_reasons,
+                    }
+                )
+
+            write_log({"kind": "summary", "generated_at": utc_now_iso(), "stats": stats})
+        finally:
+            try:
+                apply_log.close()
+            except OSError as ex:
+                log_errors.append(str(ex))
+        write_err = log_errors[0] if log_errors else None
 
-        payload = {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "blend_filepath": (getattr(bpy.data, "filepath", "") or "").strip(),
-            "blend_dir": str(blend_dir()),
-            "project_root": str(project_root) if project_root is not None else None,
-            "texture_root": str(dest_root),
-            "scan_scope": getattr(state, "scan_scope", "ALL_SCENE"),
-            "stats": stats,
-            "changes": changes,
-            "skipped": skipped,
-        }
-        manifest_path = report_dir / f"texture_apply_{utc_timestamp()}.json"
-        write_err = _write_json(manifest_path, payload)
         if write_err:
-            self.report({"ERROR"}, f"Failed writing texture apply manifest: {write_err}")
+            self.report({"ERROR"}, f"Failed writing texture apply log: {write_err}")
             self._runner_result = {"CANCELLED"}
         else:
             try:
                 write_sha256_index(index_path, sha256_index)
-            except Exception:
-                pass
-            state.apply_manifest_path = str(manifest_path)
+            except Exception as ex:
+                self.report({"WARNING"}, f"Failed compacting texture sha256 index: {ex}")
+            state.apply_manifest_path = str(log_path)
             state.phase = "APPLIED"
             self.report(
                 {"INFO"},
                 (
                     f"Texture apply complete. Copied: {stats['adopted']}, Relinked existing: {stats['relinked_existing']}, "
+                    f"Resumed: {stats['resumed']}, "
                     f"Skipped: {stats['skipped']}, Errors: {stats['errors']}."
                 ),
             )
@@ -28,6 +28,7 @@ from bpy.props import StringProperty, IntProperty, EnumProperty, FloatProperty
 from pathlib import Path
 
 from ..core import validate_scene
+from ..core.name_registry import NameRegistry, numbered_suffix
 from ..data.templates import C_CAM
 from ..scene.scene_utils import ensure_camera_margin_backgrounds
 
@@ -263,7 +264,13 @@ def _set_root_bone_theme03(rig_objects):
         print(f"[LimePV] Could not apply Root bone color: {e}")
 
 
-def _rename_parent_armature_for_camera(cam_obj, shot_idx_hint: int | None = None, cam_idx_hint: int | None = None) -> None:
+def _rename_parent_armature_for_camera(
+    cam_obj,
+    shot_idx_hint: int | None = None,
+    cam_idx_hint: int | None = None,
+    names: NameRegistry | None = None,
+) -> None:
+    """Rename the camera's top armature to CAM_RIG_SH##_N; names: object name registry of a bulk rename."""
     try:
         import bpy as _bpy  # local import for safety
         if getattr(cam_obj, "type", None) != 'CAMERA':
@@ -294,13 +301,13 @@ def _rename_parent_armature_for_camera(cam_obj, shot_idx_hint: int | None = None
                 break
         if arm is None:
             return
-        final = desired
-        guard = 1
+        if names is None:
+            names = NameRegistry(_bpy.data.objects.keys())
+        final = names.unique(desired, current=arm.name, suffix=numbered_suffix)
         try:
-            while final in _bpy.data.objects.keys() and _bpy.data.objects[final] is not arm:
-                guard += 1
-                final = f"{desired}_{guard}"
+            old_name = arm.name
             arm.name = final
+            names.rename(old_name, arm.name)
             if getattr(arm, 'data', None) is not None:
                 try:
                     arm.data.name = final + ".Data"
@@ -539,10 +546,8 @@ class LIME_OT_duplicate_active_camera(Operator):
                             try:
                                 scene = bpy.context.scene
                                 if scene is not None:
-                                    from ..ui.ui_cameras_manager import _fill_cam_items, _compute_cam_token
-                                    current_token = _compute_cam_token(scene)
-                                    _fill_cam_items(scene)
-                                    scene.lime_render_cameras_token = current_token
+                                    from ..ui.ui_cameras_manager import _sync_cam_list
+                                    _sync_cam_list(scene, force=True)
                                     print("[LimePV] Forced camera list update after re-enabling handler")
                             except Exception as e:
                                 print(f"[LimePV] Could not force update after re-enabling handler: {e}")
@@ -668,10 +673,7 @@ class LIME_OT_rename_shot_cameras(Operator):
 
     @classmethod
     def poll(cls, ctx):
-        shot = validate_scene.active_shot_context(ctx)
-        if shot is None:
-            return False
-        cam_coll = validate_scene.get_shot_child_by_basename(shot, C_CAM)
+        cam_coll = validate_scene.active_shot_child_for_draw(ctx, C_CAM)
         if cam_coll is None:
             return False
         cams = [obj for obj in cam_coll.objects if getattr(obj, "type", None) == 'CAMERA']
@@ -1204,7 +1206,7 @@ class LIME_OT_add_simple_camera(Operator):
 
     @classmethod
     def poll(cls, ctx):
-        shot = validate_scene.active_shot_context(ctx)
+        shot = validate_scene.active_shot_for_draw(ctx)
         return shot is not None
 
     def execute(self, context):
@@ -1305,7 +1307,7 @@ class LIME_OT_add_camera_rig(Operator):
 
     @classmethod
     def poll(cls, ctx):
-        shot = validate_scene.active_shot_context(ctx)
+        shot = validate_scene.active_shot_for_draw(ctx)
         return shot is not None
 
     def execute(self, context):
@@ -13,7 +13,7 @@ from ..core.naming import hydrate_state_from_filepath
 from ..core.naming import parse_blend_details
 from ..core.paths import RAMV_DIR_1
 from ..core.paths import paths_for_type
-from ..core.validate_scene import active_shot_context, parse_shot_index
+from ..core.validate_scene import active_shot_context, active_shot_for_draw, parse_shot_index
 
 
 _NODE_PREFIX = "LP_VL_"
@@ -192,7 +192,7 @@ class LIME_OT_setup_view_layer_outputs(Operator):
         view_layer = getattr(ctx, "view_layer", None)
         if scene is None or view_layer is None:
             return False
-        shot = active_shot_context(ctx)
+        shot = active_shot_for_draw(ctx)
         return shot is not None
 
     def execute(self, context):
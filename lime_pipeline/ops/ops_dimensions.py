@@ -19,11 +19,12 @@ Key Features:
 - Real-time updates during object manipulation
 """
 
-import math
 from typing import NamedTuple
 
 from mathutils import Matrix, Vector
 import bpy
+import numpy as np
+from bpy.app.handlers import persistent
 # NOTE: bmesh import removed; Edit Mode overlay no longer used.
 import blf
 import gpu
@@ -31,6 +32,24 @@ from bpy.props import BoolProperty, EnumProperty
 from bpy_extras import view3d_utils
 from gpu_extras.batch import batch_for_shader
 
+from ..core.dimension_tracker import DimensionTracker
+from ..core.point_cloud import (
+    EMPTY_POINTS,
+    PointMoments,
+    axes_from_covariance,
+    axes_xy_from_covariance,
+    combine_moments,
+    concat_points,
+    extreme_points,
+    min_volume_axes,
+    oriented_bounds,
+    principal_axes,
+    principal_axes_xy,
+    sphere_directions,
+    subsample_points,
+    transform_points,
+)
+
 DIM_ENVELOPE_PROP = "lp_dimension_envelope"
 
 DIM_LABEL_PROP = "lp_dimension_label"
@@ -72,6 +91,7 @@ ORIENTATION_MODE_ITEMS = [
     ('LCA', "Lowest Common Ancestor", "Align to the closest shared parent rotation."),
     ('PCA3D', "PCA 3D", "Align to the principal components of the geometry."),
     ('PCA_ZUP', "PCA Z-Up", "Align PCA in XY while preserving global Z up."),
+    ('MIN_VOLUME', "Min Volume", "Smallest box from rotating calipers on the convex hull (honors Lock Z-Up)."),
 
 ]
 
@@ -81,9 +101,9 @@ DEFAULT_ORIENTATION_MODE = 'LCA'
 
 ORIENTATION_MODE_KEYS = set(ORIENTATION_MODE_LABELS.keys())
 
-PCA_POINT_SAMPLE_LIMIT = 40000
+LOCK_Z_MODES = {'PCA3D', 'MIN_VOLUME'}
 
-PCA_EPSILON = 1e-6
+PCA_POINT_SAMPLE_LIMIT = 40000
 
 _OVERLAY_DRAW_HANDLE = None
 
@@ -91,6 +111,24 @@ _DIMENSION_LIVE_HANDLER = None
 
 _DIMENSION_LIVE_GUARD = False
 
+# Seconds between coalesced live updates; updates arriving meanwhile join the same pass
+DIMENSION_LIVE_INTERVAL = 1.0 / 30.0
+
+# Directions used to reduce a target to the hull points that narrow the live 3D Min Volume search
+LIVE_HULL_DIRECTIONS = 256
+
+_LIVE_HULL_DIRS = sphere_directions(LIVE_HULL_DIRECTIONS)
+
+_DIM_TRACKER = DimensionTracker()
+
+_DIM_LIVE = {"pending": False, "rebuild": True, "count": -1, "scene": None}
+
+# Live updates: depsgraph_update_post only marks the envelopes whose targets changed
+# (registry in _DIM_TRACKER); one timer pass per DIMENSION_LIVE_INTERVAL recomputes them.
+# Transform-only changes reuse each target's cached local-space points (bounds) and
+# moments (PCA) instead of re-evaluating the mesh; hull points for the 3D Min Volume
+# search are computed on first use and cached with them.
+#
 # NOTE(known-issue): The Dimension Checker helper is parented to the active object and
 # updated via a depsgraph handler. During interactive scaling (without applying scale),
 # the envelope may visually drift or not match the parent's scale proportion in real time.
@@ -162,9 +200,14 @@ def _filtered_selection(context: bpy.types.Context) -> list[bpy.types.Object]:
 class OrientationPick(NamedTuple):
     matrix: Matrix
     effective_mode: str
-    points: list[Vector] | None
+    points: np.ndarray | None
     message: str | None
 
+class TargetCloud(NamedTuple):
+    points: np.ndarray
+    moments: PointMoments
+    hull: np.ndarray | None = None
+
 def _object_ancestry(obj: bpy.types.Object | None) -> list[bpy.types.Object]:
     ancestry: list[bpy.types.Object] = []
     current = obj
@@ -223,16 +266,29 @@ def _rotation_matrix_from_object(obj: bpy.types.Object | None) -> Matrix | None:
     matrix.translation = Vector((0.0, 0.0, 0.0))
     return matrix
 
+def _mesh_vertex_coords(mesh) -> np.ndarray | None:
+    """Vertex positions of mesh as an (N, 3) float32 array read in one ``foreach_get``."""
+    vertices = getattr(mesh, "vertices", None)
+    if not vertices:
+        return None
+    coords = np.empty(len(vertices) * 3, dtype=np.float32)
+    try:
+        vertices.foreach_get("co", coords)
+    except Exception:
+        return None
+    return coords.reshape(-1, 3)
+
 def _collect_world_points(
     context: bpy.types.Context,
     objects: list[bpy.types.Object],
     *,
     sample_limit: int | None = None,
     depsgraph_override=None,
-) -> list[Vector]:
+) -> np.ndarray:
+    """World-space vertices and bound-box corners of objects (and their instances) as an (N, 3) array."""
     if not objects:
-        return []
-    points: list[Vector] = []
+        return EMPTY_POINTS
+    chunks: list[np.ndarray] = []
     depsgraph = depsgraph_override
     if depsgraph is None:
         try:
@@ -265,28 +321,23 @@ def _collect_world_points(
             mesh = obj_eval.to_mesh()
         except Exception:
             mesh = None
-        if mesh is not None and getattr(mesh, "vertices", None):
-            mw = obj_eval.matrix_world
-            for vertex in mesh.vertices:
-                try:
-                    points.append(mw @ vertex.co)
-                except Exception:
-                    continue
-            updated = True
+        if mesh is not None:
+            coords = _mesh_vertex_coords(mesh)
+            if coords is not None and len(coords):
+                chunks.append(transform_points(coords, obj_eval.matrix_world))
+                updated = True
         bbox_source = obj_eval if getattr(obj_eval, "bound_box", None) else obj
         bbox = getattr(bbox_source, "bound_box", None)
         if bbox:
             mw = getattr(obj_eval, "matrix_world", obj.matrix_world)
-            for corner in bbox:
-                try:
-                    points.append(mw @ Vector(corner))
-                except Exception:
-                    continue
-            updated = True
+            try:
+                chunks.append(transform_points(bbox, mw))
+                updated = True
+            except Exception:
+                pass
         if not updated:
-            mw = obj.matrix_world
             try:
-                points.append(mw.translation.copy())
+                chunks.append(np.array([obj.matrix_world.translation], dtype=np.float64))
             except Exception:
                 pass
         if mesh is not None:
@@ -333,68 +384,13 @@ def _collect_world_points(
                 matrix_world = getattr(instance, "matrix_world", None)
                 if matrix_world is None:
                     continue
-                for corner in bbox:
-                    try:
-                        points.append(matrix_world @ Vector(corner))
-                    except Exception:
-                        continue
+                try:
+                    chunks.append(transform_points(bbox, matrix_world))
+                except Exception:
+                    continue
         except Exception:
             pass
-    if sample_limit and sample_limit > 0 and len(points) > sample_limit:
-        step = max(1, len(points) // sample_limit)
-        points = points[::step]
-        if len(points) > sample_limit:
-            points = points[:sample_limit]
-    return points
-
-def _jacobi_eigen_decomposition(matrix_values: list[list[float]]) -> tuple[list[float], list[Vector]]:
-    a = [[float(matrix_values[r][c]) for c in range(3)] for r in range(3)]
-    v = [
-        [1.0, 0.0, 0.0],
-        [0.0, 1.0, 0.0],
-        [0.0, 0.0, 1.0],
-    ]
-    for _ in range(32):
-        candidates = (
-            (0, 1, abs(a[0][1])),
-            (0, 2, abs(a[0][2])),
-            (1, 2, abs(a[1][2])),
-        )
-        p, q, max_val = max(candidates, key=lambda item: item[2])
-        if max_val <= 1e-9:
-            break
-        apq = a[p][q]
-        if abs(apq) <= 1e-20:
-            continue
-        app = a[p][p]
-        aqq = a[q][q]
-        tau = (aqq - app) / (2.0 * apq)
-        t = math.copysign(1.0 / (abs(tau) + math.sqrt(1.0 + tau * tau)), tau)
-        c = 1.0 / math.sqrt(1.0 + t * t)
-        s = t * c
-        for r in range(3):
-            if r == p or r == q:
-                continue
-            arp = a[r][p]
-            arq = a[r][q]
-            a[r][p] = c * arp - s * arq
-            a[p][r] = a[r][p]
-            a[r][q] = s * arp + c * arq
-            a[q][r] = a[r][q]
-        app_new = c * c * app - 2.0 * s * c * apq + s * s * aqq
-        aqq_new = s * s * app + 2.0 * s * c * apq + c * c * aqq
-        a[p][p] = app_new
-        a[q][q] = aqq_new
-        a[p][q] = 0.0
-        a[q][p] = 0.0
-        for r in range(3):
-            vip = v[r][p]
-            viq = v[r][q]
-            v[r][p] = c * vip - s * viq
-            v[r][q] = s * vip + c * viq
-    eigenvalues = [a[0][0], a[1][1], a[2][2]]
-    eigenvectors = [Vector((v[0][i], v[1][i], v[2][i])) for i in range(3)]
-    return eigenvalues, eigenvectors
+    return subsample_points(concat_points(chunks), sample_limit)
 
 def _axes_to_matrix(x_axis: Vector, y_axis: Vector, z_axis: Vector) -> Matrix:
     mat3 = Matrix((
@@ -406,101 +402,35 @@ def _axes_to_matrix(x_axis: Vector, y_axis: Vector, z_axis: Vector) -> Matrix:
     mat4.translation = Vector((0.0, 0.0, 0.0))
     return mat4
 
-def _axes_from_pca3d(points: list[Vector]) -> Matrix | None:
-    if len(points) < 3:
-        return None
-    centroid = Vector((0.0, 0.0, 0.0))
-    for p in points:
-        centroid += p
-    centroid /= len(points)
-    cov_xx = cov_xy = cov_xz = cov_yy = cov_yz = cov_zz = 0.0
-    for p in points:
-        d = p - centroid
-        cov_xx += d.x * d.x
-        cov_xy += d.x * d.y
-        cov_xz += d.x * d.z
-        cov_yy += d.y * d.y
-        cov_yz += d.y * d.z
-        cov_zz += d.z * d.z
-    if len(points) > 1:
-        scale = 1.0 / float(len(points) - 1)
-        cov_xx *= scale
-        cov_xy *= scale
-        cov_xz *= scale
-        cov_yy *= scale
-        cov_yz *= scale
-        cov_zz *= scale
-    cov_matrix = [
-        [cov_xx, cov_xy, cov_xz],
-        [cov_xy, cov_yy, cov_yz],
-        [cov_xz, cov_yz, cov_zz],
-    ]
-    eigenvalues, eigenvectors = _jacobi_eigen_decomposition(cov_matrix)
-    axis_data = sorted(zip(eigenvalues, eigenvectors), key=lambda item: item[0], reverse=True)
-    axes: list[Vector] = []
-    for _, axis in axis_data:
-        length = axis.length
-        if length <= PCA_EPSILON:
-            return None
-        axes.append(axis / length)
-    if len(axes) < 3:
+def _matrix_from_axes(axes) -> Matrix | None:
+    if axes is None:
         return None
-    if axes[0].cross(axes[1]).dot(axes[2]) < 0.0:
-        axes[2] = -axes[2]
-    return _axes_to_matrix(axes[0], axes[1], axes[2])
+    return _axes_to_matrix(Vector(axes[:, 0].tolist()), Vector(axes[:, 1].tolist()), Vector(axes[:, 2].tolist()))
 
-def _axes_from_pca_xy(points: list[Vector]) -> Matrix | None:
-    if not points:
-        return None
-    centroid = Vector((0.0, 0.0, 0.0))
-    for p in points:
-        centroid += p
-    centroid /= len(points)
-    cov_xx = cov_xy = cov_yy = 0.0
-    for p in points:
-        dx = p.x - centroid.x
-        dy = p.y - centroid.y
-        cov_xx += dx * dx
-        cov_xy += dx * dy
-        cov_yy += dy * dy
-    if len(points) > 1:
-        scale = 1.0 / float(len(points) - 1)
-        cov_xx *= scale
-        cov_xy *= scale
-        cov_yy *= scale
-    diff = cov_xx - cov_yy
-    discriminant = math.sqrt(max(0.0, diff * diff + 4.0 * cov_xy * cov_xy))
-    lambda1 = 0.5 * (cov_xx + cov_yy + discriminant)
-    if abs(cov_xy) > PCA_EPSILON:
-        vec = Vector((lambda1 - cov_yy, cov_xy))
-    else:
-        vec = Vector((1.0, 0.0)) if cov_xx >= cov_yy else Vector((0.0, 1.0))
-    if vec.length <= PCA_EPSILON:
-        vec = Vector((1.0, 0.0))
-    x_axis = Vector((vec.x, vec.y, 0.0)).normalized()
-    if x_axis.length <= PCA_EPSILON:
-        x_axis = Vector((1.0, 0.0, 0.0))
-    if x_axis.dot(Vector((1.0, 0.0, 0.0))) < 0.0:
-        x_axis = -x_axis
-    z_axis = Vector((0.0, 0.0, 1.0))
-    y_axis = z_axis.cross(x_axis)
-    if y_axis.length <= PCA_EPSILON:
-        y_axis = Vector((0.0, 1.0, 0.0))
-        x_axis = y_axis.cross(z_axis)
-    x_axis.normalize()
-    y_axis.normalize()
-    z_axis.normalize()
-    if x_axis.cross(y_axis).dot(z_axis) < 0.0:
-        y_axis = -y_axis
-    return _axes_to_matrix(x_axis, y_axis, z_axis)
+def _axes_from_pca3d(points: np.ndarray) -> Matrix | None:
+    return _matrix_from_axes(principal_axes(subsample_points(points, PCA_POINT_SAMPLE_LIMIT)))
+
+def _axes_from_pca_xy(points: np.ndarray) -> Matrix | None:
+    return _matrix_from_axes(principal_axes_xy(subsample_points(points, PCA_POINT_SAMPLE_LIMIT)))
 
 def _compute_pca_matrix(
-    points: list[Vector],
+    points: np.ndarray,
     *,
     lock_z_up: bool,
     fallback_to_z_up: bool = True,
+    moments: PointMoments | None = None,
 ) -> Matrix | None:
-    if not points:
+    if moments is not None:
+        if not moments.count:
+            return None
+        cov = moments.covariance()
+        if lock_z_up:
+            return _matrix_from_axes(axes_xy_from_covariance(cov))
+        matrix = _matrix_from_axes(axes_from_covariance(cov)) if moments.count >= 3 else None
+        if matrix is None and fallback_to_z_up:
+            matrix = _matrix_from_axes(axes_xy_from_covariance(cov))
+        return matrix
+    if not len(points):
         return None
     if lock_z_up:
         return _axes_from_pca_xy(points)
@@ -509,6 +439,9 @@ def _compute_pca_matrix(
         matrix = _axes_from_pca_xy(points)
     return matrix
 
+def _points_or_none(points: np.ndarray | None) -> np.ndarray | None:
+    return points if points is not None and len(points) else None
+
 def _pick_reference_rotation(
     context: bpy.types.Context,
     objects: list[bpy.types.Object],
@@ -516,23 +449,21 @@ def _pick_reference_rotation(
     *,
     lock_z_up: bool = False,
     depsgraph=None,
+    points: np.ndarray | None = None,
+    moments: PointMoments | None = None,
 ) -> OrientationPick:
+    """Orientation for objects; points/moments skip re-reading meshes (moments drive PCA)."""
     identity = Matrix.Identity(4)
     if not objects:
         return OrientationPick(identity, 'WORLD', None, None)
     desired_mode = (mode or DEFAULT_ORIENTATION_MODE).upper()
     if desired_mode not in ORIENTATION_MODE_KEYS:
         desired_mode = DEFAULT_ORIENTATION_MODE
-    points_cache: list[Vector] | None = None
-    def ensure_points() -> list[Vector]:
+    points_cache: np.ndarray | None = points
+    def ensure_points() -> np.ndarray:
         nonlocal points_cache
         if points_cache is None:
-            points_cache = _collect_world_points(
-                context,
-                objects,
-                sample_limit=PCA_POINT_SAMPLE_LIMIT,
-                depsgraph_override=depsgraph,
-            )
+            points_cache = _collect_world_points(context, objects, depsgraph_override=depsgraph)
         return points_cache
     if desired_mode == 'WORLD':
         return OrientationPick(identity, 'WORLD', None, None)
@@ -541,31 +472,37 @@ def _pick_reference_rotation(
         if rotation is not None:
             return OrientationPick(rotation, 'ROOT', None, None)
         points = ensure_points()
-        matrix = _compute_pca_matrix(points, lock_z_up=True, fallback_to_z_up=False)
+        matrix = _compute_pca_matrix(points, lock_z_up=True, fallback_to_z_up=False, moments=moments)
         message = "Mixed roots detected; using PCA Z-Up instead."
-        return OrientationPick(matrix or identity, 'PCA_ZUP' if matrix else 'WORLD', points or None, message)
+        return OrientationPick(matrix or identity, 'PCA_ZUP' if matrix else 'WORLD', _points_or_none(points), message)
     if desired_mode == 'LCA':
         rotation = _rotation_matrix_from_object(_find_lowest_common_ancestor(objects))
         if rotation is not None:
             return OrientationPick(rotation, 'LCA', None, None)
         points = ensure_points()
-        matrix = _compute_pca_matrix(points, lock_z_up=True, fallback_to_z_up=False)
+        matrix = _compute_pca_matrix(points, lock_z_up=True, fallback_to_z_up=False, moments=moments)
         message = "No common ancestor; using PCA Z-Up instead."
-        return OrientationPick(matrix or identity, 'PCA_ZUP' if matrix else 'WORLD', points or None, message)
+        return OrientationPick(matrix or identity, 'PCA_ZUP' if matrix else 'WORLD', _points_or_none(points), message)
     if desired_mode == 'PCA3D':
         points = ensure_points()
-        matrix = _compute_pca_matrix(points, lock_z_up=lock_z_up, fallback_to_z_up=not lock_z_up)
+        matrix = _compute_pca_matrix(points, lock_z_up=lock_z_up, fallback_to_z_up=not lock_z_up, moments=moments)
         if matrix is not None:
             effective = 'PCA_ZUP' if lock_z_up else 'PCA3D'
-            return OrientationPick(matrix, effective, points or None, None)
+            return OrientationPick(matrix, effective, _points_or_none(points), None)
         message = "PCA 3D failed; using World axes."
-        return OrientationPick(identity, 'WORLD', points or None, message)
+        return OrientationPick(identity, 'WORLD', _points_or_none(points), message)
     if desired_mode == 'PCA_ZUP':
         points = ensure_points()
-        matrix = _compute_pca_matrix(points, lock_z_up=True, fallback_to_z_up=False)
+        matrix = _compute_pca_matrix(points, lock_z_up=True, fallback_to_z_up=False, moments=moments)
         if matrix is not None:
-            return OrientationPick(matrix, 'PCA_ZUP', points or None, None)
-        return OrientationPick(identity, 'WORLD', points or None, "PCA Z-Up failed; using World axes.")
+            return OrientationPick(matrix, 'PCA_ZUP', _points_or_none(points), None)
+        return OrientationPick(identity, 'WORLD', _points_or_none(points), "PCA Z-Up failed; using World axes.")
+    if desired_mode == 'MIN_VOLUME':
+        points = ensure_points()
+        result = min_volume_axes(points, lock_z_up=lock_z_up) if len(points) else None
+        if result is not None:
+            return OrientationPick(_matrix_from_axes(result[0]), 'MIN_VOLUME', _points_or_none(points), None)
+        return OrientationPick(identity, 'WORLD', _points_or_none(points), "Min Volume failed; using World axes.")
     return OrientationPick(identity, 'WORLD', None, None)
 
 def _compute_oriented_aabb(
@@ -573,7 +510,7 @@ def _compute_oriented_aabb(
     objects: list[bpy.types.Object],
     orientation_matrix: Matrix,
     *,
-    points_override: list[Vector] | None = None,
+    points_override: np.ndarray | None = None,
     depsgraph=None,
 ) -> tuple[Vector, Vector] | None:
     if not objects:
@@ -582,43 +519,14 @@ def _compute_oriented_aabb(
         rotation = orientation_matrix.to_3x3()
     except Exception:
         rotation = Matrix.Identity(3)
-    try:
-        world_to_ref = rotation.inverted()
-    except Exception:
-        world_to_ref = Matrix.Identity(3)
-    min_corner = Vector((float('inf'), float('inf'), float('inf')))
-    max_corner = Vector((float('-inf'), float('-inf'), float('-inf')))
-    has_points = False
-    def accumulate(world_co: Vector) -> None:
-        nonlocal has_points, min_corner, max_corner
-        if world_co is None:
-            return
-        try:
-            oriented = world_to_ref @ world_co
-        except Exception:
-            oriented = Vector((float(world_co[0]), float(world_co[1]), float(world_co[2])))
-        for idx in range(3):
-            value = oriented[idx]
-            if value < min_corner[idx]:
-                min_corner[idx] = value
-            if value > max_corner[idx]:
-                max_corner[idx] = value
-        has_points = True
-    if points_override:
-        for point in points_override:
-            accumulate(point)
-    else:
-        points = _collect_world_points(
-            context,
-            objects,
-            sample_limit=PCA_POINT_SAMPLE_LIMIT,
-            depsgraph_override=depsgraph,
-        )
-        for point in points:
-            accumulate(point)
-    if not has_points:
+    points = points_override
+    if points is None or not len(points):
+        points = _collect_world_points(context, objects, depsgraph_override=depsgraph)
+    bounds = oriented_bounds(points, rotation)
+    if bounds is None:
         return None
-    return min_corner, max_corner
+    min_corner, max_corner = bounds
+    return Vector(min_corner.tolist()), Vector(max_corner.tolist())
 def _ensure_dimension_collection(scene: bpy.types.Scene) -> bpy.types.Collection:
 
     collection = bpy.data.collections.get(DIMENSION_COLLECTION_NAME)
@@ -765,19 +673,22 @@ def disable_dimension_overlay_guard() -> None:
     _overlay_debug_print('Disabling overlay draw handler from unregister')
     _remove_overlay_draw_handler()
 
-def _resolve_dimension_targets(scene: bpy.types.Scene, raw_targets) -> list[bpy.types.Object]:
+def _dimension_target_names(raw_targets) -> list[str]:
     if not raw_targets:
         return []
-    names: list[str] = []
+    if hasattr(raw_targets, "to_list"):
+        raw_targets = raw_targets.to_list()
     if isinstance(raw_targets, (list, tuple)):
-        names = [str(item) for item in raw_targets if item]
-    elif isinstance(raw_targets, str):
-        names = [item for item in raw_targets.split("|") if item]
-    else:
-        try:
-            names = [str(raw_targets)]
-        except Exception:
-            names = []
+        return [str(item) for item in raw_targets if item]
+    if isinstance(raw_targets, str):
+        return [item for item in raw_targets.split("|") if item]
+    try:
+        return [str(raw_targets)]
+    except Exception:
+        return []
+
+def _resolve_dimension_targets(scene: bpy.types.Scene, raw_targets) -> list[bpy.types.Object]:
+    names = _dimension_target_names(raw_targets)
     if not names:
         return []
     resolved: list[bpy.types.Object] = []
@@ -790,66 +701,201 @@ def _resolve_dimension_targets(scene: bpy.types.Scene, raw_targets) -> list[bpy.
         resolved.append(obj)
     return resolved
 
-def _dimension_live_update_handler(depsgraph) -> None:
+def _sync_dimension_registry(scene: bpy.types.Scene, *, force: bool = False) -> None:
+    """Rebuild the target -> envelope registry when envelopes may have been added, removed or edited."""
+    count = len(scene.objects)
+    if _DIM_LIVE["scene"] != scene.name:
+        _DIM_TRACKER.clear()
+        force = True
+    if not force and not _DIM_LIVE["rebuild"] and count == _DIM_LIVE["count"]:
+        return
+    _DIM_TRACKER.sync({
+        obj.name: _dimension_target_names(obj.get(DIM_TARGETS_PROP))
+        for obj in scene.objects
+        if obj.get(DIM_ENVELOPE_PROP)
+    })
+    _DIM_LIVE.update(rebuild=False, count=count, scene=scene.name)
+
+def _local_cloud(world_points: np.ndarray, matrix_world) -> TargetCloud | None:
+    if not len(world_points):
+        return None
+    try:
+        to_local = np.linalg.inv(np.asarray(matrix_world, dtype=np.float64))
+    except Exception:
+        return None
+    local = transform_points(world_points, to_local)
+    return TargetCloud(local.astype(np.float32), PointMoments.of(local))
+
+def _live_target_points(
+    context: bpy.types.Context,
+    target: bpy.types.Object,
+    depsgraph,
+    *,
+    hull: bool = False,
+) -> TargetCloud:
+    """World points and moments of target (plus hull points when asked), re-reading its mesh only after geometry changes."""
+    cloud = _DIM_TRACKER.cached(target.name)
+    if cloud is None:
+        world = _collect_world_points(context, [target], depsgraph_override=depsgraph)
+        cloud = _local_cloud(world, target.matrix_world)
+        if cloud is None:
+            # Zero scale: nothing to cache in local space
+            return TargetCloud(world, PointMoments.of(world), world if hull else None)
+        _DIM_TRACKER.store(target.name, cloud)
+    if hull and cloud.hull is None:
+        # Only the 3D Min Volume search uses hull points; computed once per geometry change
+        cloud = cloud._replace(hull=extreme_points(cloud.points, _LIVE_HULL_DIRS))
+        _DIM_TRACKER.store(target.name, cloud)
+    matrix = target.matrix_world
+    return TargetCloud(
+        transform_points(cloud.points, matrix),
+        cloud.moments.transformed(matrix),
+        transform_points(cloud.hull, matrix) if hull else None,
+    )
+
+def _refresh_live_envelope(
+    context: bpy.types.Context,
+    scene: bpy.types.Scene,
+    envelope: bpy.types.Object,
+    depsgraph,
+) -> None:
+    targets = _resolve_dimension_targets(scene, envelope.get(DIM_TARGETS_PROP))
+    if not targets:
+        return
+    parent = getattr(envelope, "parent", None)
+    if parent is not None:
+        try:
+            envelope.inherit_scale = 'NONE'
+        except Exception:
+            pass
+    try:
+        envelope.lock_scale = (True, True, True)
+    except Exception:
+        pass
+    mode = envelope.get(DIM_ORIENTATION_PROP, DEFAULT_ORIENTATION_MODE)
+    lock_z = bool(envelope.get(DIM_LOCK_Z_PROP, False))
+    use_lock_z = bool(lock_z and mode in LOCK_Z_MODES)
+    # Hull points only narrow the 3D Min Volume search (Z-up uses the exact planar hull);
+    # bounds are always measured on every point
+    use_hull = str(mode).upper() == 'MIN_VOLUME' and not use_lock_z
+    clouds = [_live_target_points(context, target, depsgraph, hull=use_hull) for target in targets]
+    points = concat_points([cloud.points for cloud in clouds])
+    orientation = _pick_reference_rotation(
+        context,
+        targets,
+        mode,
+        lock_z_up=use_lock_z,
+        depsgraph=depsgraph,
+        points=concat_points([cloud.hull for cloud in clouds]) if use_hull else points,
+        moments=combine_moments(cloud.moments for cloud in clouds),
+    )
+    bounds = _compute_oriented_aabb(
+        context,
+        targets,
+        orientation.matrix,
+        points_override=points,
+        depsgraph=depsgraph,
+    )
+    if not bounds:
+        return
+    min_corner, max_corner = bounds
+    size = max_corner - min_corner
+    center_o = (max_corner + min_corner) * 0.5
+    _update_envelope_geometry(envelope, size, center_o, orientation.matrix)
+    if envelope.get(DIM_ORIENTATION_PROP) != orientation.effective_mode:
+        envelope[DIM_ORIENTATION_PROP] = orientation.effective_mode
+
+def _dimension_live_timer():
     global _DIMENSION_LIVE_GUARD
+    _DIM_LIVE["pending"] = False
+    context = bpy.context
+    scene = getattr(context, "scene", None)
+    if scene is None:
+        return None
+    _DIMENSION_LIVE_GUARD = True
+    try:
+        _sync_dimension_registry(scene)
+        dirty = _DIM_TRACKER.take_dirty()
+        if not dirty:
+            return None
+        try:
+            depsgraph = context.evaluated_depsgraph_get()
+        except Exception:
+            depsgraph = None
+        for name in dirty:
+            envelope = scene.objects.get(name)
+            if envelope is None:
+                continue
+            try:
+                _refresh_live_envelope(context, scene, envelope, depsgraph)
+            except Exception as exc:
+                _dimension_live_debug(f"Failed to update envelope {name}: {exc}")
+    except Exception as exc:
+        _dimension_live_debug(f"Live update failed: {exc}")
+    finally:
+        _DIMENSION_LIVE_GUARD = False
+    return None
+
+def _schedule_dimension_live_update() -> None:
+    # Throttle, not debounce: the envelope keeps following an interactive transform
+    if _DIM_LIVE["pending"]:
+        return
+    try:
+        bpy.app.timers.register(_dimension_live_timer, first_interval=DIMENSION_LIVE_INTERVAL)
+        _DIM_LIVE["pending"] = True
+    except Exception:
+        pass
+
+def _mark_dimension_updates(depsgraph) -> None:
+    for update in depsgraph.updates:
+        obj = getattr(update.id, "original", None) or update.id
+        if not isinstance(obj, bpy.types.Object):
+            continue
+        geometry = bool(update.is_updated_geometry)
+        transform = bool(update.is_updated_transform)
+        if obj.get(DIM_ENVELOPE_PROP):
+            # Envelope edits never dirty envelopes; property or name edits may retarget them
+            if not (geometry or transform):
+                _DIM_LIVE["rebuild"] = True
+            continue
+        if geometry or transform:
+            _DIM_TRACKER.mark_target(obj.name, geometry=geometry)
+
+@persistent
+def _dimension_live_update_handler(scene=None, depsgraph=None) -> None:
+    """Mark envelopes whose targets changed and schedule one coalesced update."""
     if _DIMENSION_LIVE_GUARD:
         return
-    _DIMENSION_LIVE_GUARD = True
     try:
-        scene = None
-        if depsgraph is not None:
-            scene = getattr(depsgraph, "scene", None) or getattr(depsgraph, "scene_eval", None)
         if scene is None:
             scene = getattr(bpy.context, "scene", None)
         if scene is None:
             return
-        envelopes = [obj for obj in scene.objects if obj.get(DIM_ENVELOPE_PROP)]
-        if not envelopes:
-            return
-        context = bpy.context
-        for envelope in envelopes:
-            try:
-                targets = _resolve_dimension_targets(scene, envelope.get(DIM_TARGETS_PROP))
-                if not targets:
-                    continue
-                parent = getattr(envelope, "parent", None)
-                if parent is not None:
-                    try:
-                        envelope.inherit_scale = 'NONE'
-                    except Exception:
-                        pass
-                try:
-                    envelope.lock_scale = (True, True, True)
-                except Exception:
-                    pass
-                mode = envelope.get(DIM_ORIENTATION_PROP, DEFAULT_ORIENTATION_MODE)
-                lock_z = bool(envelope.get(DIM_LOCK_Z_PROP, False))
-                use_lock_z = bool(lock_z and mode == 'PCA3D')
-                orientation = _pick_reference_rotation(
-                    context,
-                    targets,
-                    mode,
-                    lock_z_up=use_lock_z,
-                    depsgraph=depsgraph,
-                )
-                bounds = _compute_oriented_aabb(
-                    context,
-                    targets,
-                    orientation.matrix,
-                    points_override=orientation.points,
-                    depsgraph=depsgraph,
-                )
-                if not bounds:
-                    continue
-                min_corner, max_corner = bounds
-                size = max_corner - min_corner
-                center_o = (max_corner + min_corner) * 0.5
-                _update_envelope_geometry(envelope, size, center_o, orientation.matrix)
-                envelope[DIM_ORIENTATION_PROP] = orientation.effective_mode
-            except Exception as exc:
-                _dimension_live_debug(f"Failed to update envelope {envelope.name}: {exc}")
-    finally:
-        _DIMENSION_LIVE_GUARD = False
+        if len(scene.objects) != _DIM_LIVE["count"] or scene.name != _DIM_LIVE["scene"]:
+            _DIM_LIVE["rebuild"] = True
+        if depsgraph is None:
+            _DIM_TRACKER.mark_all()
+        else:
+            _mark_dimension_updates(depsgraph)
+        if _DIM_TRACKER.has_dirty or _DIM_LIVE["rebuild"]:
+            _schedule_dimension_live_update()
+    except Exception as exc:
+        _dimension_live_debug(f"Failed to track updates: {exc}")
+
+@persistent
+def _dimension_live_reset_handler(*_args) -> None:
+    """Drop cached clouds after undo/redo/load; restored envelopes are already up to date."""
+    _DIM_TRACKER.clear()
+    _DIM_LIVE.update(rebuild=True, count=-1, scene=None)
+    try:
+        scene = bpy.context.scene
+        if scene is not None:
+            _sync_dimension_registry(scene, force=True)
+            _DIM_TRACKER.take_dirty()
+    except Exception:
+        pass
+
+_DIMENSION_RESET_HANDLER_LISTS = ("undo_post", "redo_post", "load_post")
 
 def enable_dimension_live_updates() -> None:
     global _DIMENSION_LIVE_HANDLER
@@ -857,11 +903,26 @@ def enable_dimension_live_updates() -> None:
         _DIMENSION_LIVE_HANDLER = _dimension_live_update_handler
     if _DIMENSION_LIVE_HANDLER not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(_DIMENSION_LIVE_HANDLER)
+    for list_name in _DIMENSION_RESET_HANDLER_LISTS:
+        handlers = getattr(bpy.app.handlers, list_name, None)
+        if handlers is not None and _dimension_live_reset_handler not in handlers:
+            handlers.append(_dimension_live_reset_handler)
 
 def disable_dimension_live_updates() -> None:
     global _DIMENSION_LIVE_HANDLER
     if _DIMENSION_LIVE_HANDLER in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(_DIMENSION_LIVE_HANDLER)
+    for list_name in _DIMENSION_RESET_HANDLER_LISTS:
+        handlers = getattr(bpy.app.handlers, list_name, None)
+        if handlers is not None and _dimension_live_reset_handler in handlers:
+            handlers.remove(_dimension_live_reset_handler)
+    try:
+        if bpy.app.timers.is_registered(_dimension_live_timer):
+            bpy.app.timers.unregister(_dimension_live_timer)
+    except Exception:
+        pass
+    _DIM_LIVE.update(pending=False, rebuild=True, count=-1, scene=None)
+    _DIM_TRACKER.clear()
 
 def _dimension_unit_visibility() -> dict[str, bool]:
     state = getattr(getattr(bpy, "context", None), "window_manager", None)
@@ -1078,7 +1139,7 @@ class LIME_OT_dimension_envelope(bpy.types.Operator):
 
     lock_z_up: BoolProperty(
         name="Lock Z-Up",
-        description="Keep the global Z axis upright when PCA orientation is used.",
+        description="Keep the global Z axis upright when PCA 3D or Min Volume orientation is used.",
         default=False,
     )
 
@@ -1095,7 +1156,7 @@ class LIME_OT_dimension_envelope(bpy.types.Operator):
         except Exception:
             pass
         envelope = _create_envelope_object(scene)
-        use_lock_z = bool(self.lock_z_up and self.orientation_mode == 'PCA3D')
+        use_lock_z = bool(self.lock_z_up and self.orientation_mode in LOCK_Z_MODES)
         try:
             depsgraph = context.evaluated_depsgraph_get()
         except Exception:
@@ -1127,6 +1188,7 @@ class LIME_OT_dimension_envelope(bpy.types.Operator):
         _remove_existing_labels(envelope)
         display_label = selection[0].name if len(selection) == 1 else "Group"
         envelope.name = f"{display_label} {DIMENSION_HELPER_SUFFIX}"
+        _DIM_TRACKER.set_envelope(envelope.name, _dimension_target_names(envelope[DIM_TARGETS_PROP]), dirty=False)
         _ensure_overlay_draw_handler()
         active = getattr(context.view_layer.objects, "active", None)
         parent_candidate = active if active in selection else selection[0]
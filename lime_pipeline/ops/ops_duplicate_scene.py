@@ -25,10 +25,10 @@ from uuid import uuid4
 
 import bpy
 import re
-import string
 from bpy.types import Collection, Object, Operator, Scene
 
 from ..core import validate_scene
+from ..core.name_registry import NameRegistry
 from ..data.templates import C_CAM
 from .ops_alpha_manager import ensure_event_tracks, rebuild_all_drivers
 from .ops_cameras import _rename_parent_armature_for_camera  # reuse rig rename helper
@@ -144,38 +144,12 @@ def _replace_sh_tokens(text: str, origin_index: int | None, new_index: int) -> s
     return _SH_TOKEN_RE.sub(repl, text)
 
 
-def _ensure_unique(datablocks, owner, desired: str) -> str:
+def _ensure_unique(names: NameRegistry, owner, desired: str) -> str:
+    """desired without numeric suffix, or with the first free _A.._Z/_1.. suffix."""
     base = _strip_numeric_suffix(desired).strip()
     if not base:
         return owner.name
-    if _is_available(datablocks, owner, base):
-        return base
-    for suffix in _suffix_sequence():
-        candidate = f"{base}{suffix}"
-        if _is_available(datablocks, owner, candidate):
-            return candidate
-    return base
-
-
-def _is_available(datablocks, owner, name: str) -> bool:
-    try:
-        existing = datablocks.get(name)
-    except AttributeError:
-        existing = None
-        for item in datablocks:
-            if getattr(item, "name", None) == name:
-                existing = item
-                break
-    return existing is None or existing == owner
-
-
-def _suffix_sequence() -> Iterator[str]:
-    for letter in string.ascii_uppercase:
-        yield f"_{letter}"
-    idx = 1
-    while True:
-        yield f"_{idx}"
-        idx += 1
+    return names.unique(base, current=owner.name)
 
 
 def _iter_collection_tree(root: Collection) -> Iterator[Collection]:
@@ -208,39 +182,8 @@ def _resolve_rig_prefix(name: str) -> str | None:
 
 
 def _find_max_shot_index() -> int:
-    max_idx = 0
-    for scene in bpy.data.scenes:
-        match = _match_shot_root(scene.name)
-        if match:
-            max_idx = max(max_idx, int(match[1]))
-        try:
-            for _shot_coll, idx in validate_scene.list_shot_roots(scene):
-                max_idx = max(max_idx, idx)
-        except Exception:
-            pass
-        root = getattr(scene, "collection", None)
-        if root is not None:
-            base_name = _strip_numeric_suffix(root.name)
-            match_root = _match_shot_root(base_name)
-            if match_root:
-                max_idx = max(max_idx, int(match_root[1]))
-            for child in root.children:
-                child_base = _strip_numeric_suffix(child.name)
-                match_child = _match_shot_root(child_base)
-                if match_child:
-                    max_idx = max(max_idx, int(match_child[1]))
-                sh_match = _match_sh_prefixed(child_base)
-                if sh_match:
-                    max_idx = max(max_idx, int(sh_match[0]))
-    for coll in bpy.data.collections:
-        base = _strip_numeric_suffix(coll.name)
-        match = _match_shot_root(base)
-        if match:
-            max_idx = max(max_idx, int(match[1]))
-        sh_match = _match_sh_prefixed(base)
-        if sh_match:
-            max_idx = max(max_idx, int(sh_match[0]))
-    return max_idx
+    """Highest SHOT index used by scene names, SHOT roots and SH-prefixed collections."""
+    return validate_scene.shot_index_registry().max_any_index()
 
 
 def _target_collection_name(name: str, new_index: int, origin_index: int | None) -> str:
@@ -294,11 +237,11 @@ _DATA_COLLECTION_BY_TYPE = {
     'CURVES': 'curves',
 }
 
-def _data_blocks_for_object(obj: Object):
+def _data_attr_for_object(obj: Object) -> str | None:
     attr = _DATA_COLLECTION_BY_TYPE.get(getattr(obj, 'type', ''), None)
-    if not attr:
+    if not attr or getattr(bpy.data, attr, None) is None:
         return None
-    return getattr(bpy.data, attr, None)
+    return attr
 
 
 def _detect_scene_shot_index(scene: Scene) -> int | None:
@@ -349,6 +292,8 @@ class _ShotSceneRenamer:
         self.scene_objects = _collect_objects_from_collections(self.collections)
         self.log: list[tuple[str, str, str]] = []
         self._collection_cache: dict[int, tuple[int | None, int]] = {}
+        # bpy.data collection attribute -> names in use, snapshot once for the whole rename pass
+        self._names: dict[str, NameRegistry] = {}
         self._prime_collection_cache()
 
     def run(self) -> list[tuple[str, str, str]]:
@@ -368,6 +313,25 @@ class _ShotSceneRenamer:
     def _log(self, kind: str, before: str, after: str) -> None:
         self.log.append((kind, before, after))
 
+    def names(self, attr: str) -> NameRegistry:
+        registry = self._names.get(attr)
+        if registry is None:
+            registry = NameRegistry(getattr(bpy.data, attr).keys())
+            self._names[attr] = registry
+        return registry
+
+    def _apply_name(self, attr: str, block, unique: str) -> str | None:
+        """Rename block and keep the registry in sync; returns the old name, or None when unchanged."""
+        old_name = block.name
+        if unique == old_name:
+            return None
+        try:
+            block.name = unique
+        except Exception:
+            return None
+        self.names(attr).rename(old_name, block.name)
+        return old_name
+
     def _allocate_new_index(self) -> int:
         new_idx = max(self._next_available_index, self.start_index)
         self._next_available_index = new_idx + 1
@@ -441,14 +405,10 @@ class _ShotSceneRenamer:
                 continue
             old_idx, new_idx = self._resolve_collection_indices(coll)
             desired = _target_collection_name(coll.name, new_idx, old_idx)
-            unique = _ensure_unique(bpy.data.collections, coll, desired)
-            if unique != coll.name:
-                old_name = coll.name
-                try:
-                    coll.name = unique
-                except Exception:
-                    continue
-                self._log("COLLECTION", old_name, unique)
+            unique = _ensure_unique(self.names("collections"), coll, desired)
+            old_name = self._apply_name("collections", coll, unique)
+            if old_name is not None:
+                self._log("COLLECTION", old_name, coll.name)
 
     def _rename_cameras(self) -> None:
         cameras = [obj for obj in self.scene_objects if obj.type == 'CAMERA']
@@ -463,7 +423,7 @@ class _ShotSceneRenamer:
             ordered = sorted(grouped[new_idx], key=lambda o: _strip_numeric_suffix(o.name).lower())
             for idx, cam in enumerate(ordered, 1):
                 target = f"SHOT_{new_idx:0{width}d}_CAMERA_{idx}"
-                self._rename_object(cam, target, bpy.data.cameras)
+                self._rename_object(cam, target, "cameras")
 
     def _rename_rigs(self) -> None:
         rig_groups: dict[tuple[str, int], list[Object]] = {}
@@ -481,8 +441,7 @@ class _ShotSceneRenamer:
             width = _shot_index_width(new_idx)
             for idx, obj in enumerate(objs, 1):
                 target = f"{prefix}_SH{new_idx:0{width}d}_{idx}"
-                data_blocks = bpy.data.armatures if obj.type == 'ARMATURE' else None
-                self._rename_object(obj, target, data_blocks)
+                self._rename_object(obj, target, "armatures" if obj.type == 'ARMATURE' else None)
 
     def _rename_misc_objects(self) -> None:
         for obj in self.scene_objects:
@@ -495,28 +454,21 @@ class _ShotSceneRenamer:
             base = _strip_numeric_suffix(obj.name).strip()
             if not target or target == base:
                 continue
-            data_blocks = _data_blocks_for_object(obj)
-            self._rename_object(obj, target, data_blocks)
+            self._rename_object(obj, target, _data_attr_for_object(obj))
 
-    def _rename_object(self, obj: Object, desired: str, data_blocks) -> None:
-        unique = _ensure_unique(bpy.data.objects, obj, desired)
+    def _rename_object(self, obj: Object, desired: str, data_attr: str | None) -> None:
+        unique = _ensure_unique(self.names("objects"), obj, desired)
         if unique != obj.name:
-            old = obj.name
-            try:
-                obj.name = unique
-            except Exception:
+            old = self._apply_name("objects", obj, unique)
+            if old is None:
                 return
-            self._log("OBJECT", old, unique)
-        if data_blocks is not None and getattr(obj, "data", None) is not None:
-            data_target = f"{unique}.Data"
-            unique_data = _ensure_unique(data_blocks, obj.data, data_target)
-            if unique_data != obj.data.name:
-                old_data = obj.data.name
-                try:
-                    obj.data.name = unique_data
-                except Exception:
-                    return
-                self._log("DATA", old_data, unique_data)
+            self._log("OBJECT", old, obj.name)
+        if data_attr is not None and getattr(obj, "data", None) is not None:
+            data_target = f"{obj.name}.Data"
+            unique_data = _ensure_unique(self.names(data_attr), obj.data, data_target)
+            old_data = self._apply_name(data_attr, obj.data, unique_data)
+            if old_data is not None:
+                self._log("DATA", old_data, obj.data.name)
 
 
 _TAG_KEY = "_lp_src_uid"
@@ -876,7 +828,7 @@ class LIME_OT_duplicate_scene_sequential(Operator):
         try:
             for cam in [o for o in new_scene.objects if getattr(o, 'type', None) == 'CAMERA']:
                 try:
-                    _rename_parent_armature_for_camera(cam)
+                    _rename_parent_armature_for_camera(cam, names=renamer.names("objects"))
                 except Exception:
                     pass
         except Exception:
@@ -20,21 +20,27 @@ Key Features:
 
 from __future__ import annotations
 
+import os
+import shutil
+import time
 from pathlib import Path
 
 import bpy
 from bpy.types import Operator
-from bpy.props import StringProperty
+from bpy.props import BoolProperty, EnumProperty, IntProperty, StringProperty
 
 from ..core import validate_scene
+from ..core.background_render import DEFAULT_WORKERS, BackgroundRenderJob, worker_threads
 from ..core.naming import resolve_project_name
+from ..core.render_fingerprint import FingerprintStore
 from ..data.templates import C_CAM
 from ..ops.ops_save_templates import (
     _camera_index_for_shot,
     _ensure_editables_raw_dir,
     _resolve_prj_rev_sc,
 )
-from ..scene.scene_utils import create_shot, duplicate_shot, ensure_shot_tree
+from ..scene.render_state import content_extra, render_fingerprint
+from ..scene.scene_utils import create_shot, duplicate_shot, ensure_shot_tree, make_object_data_single_user
 
 try:
     # Imported lazily to avoid hard dependency at module import time
@@ -151,6 +157,28 @@ class LIME_OT_duplicate_shot(Operator):
         return {'FINISHED'}
 
 
+class LIME_OT_make_shot_data_unique(Operator):
+    bl_idname = "lime.make_shot_data_unique"
+    bl_label = "Make Data Unique"
+    bl_description = "Give the selected objects their own copy of data shared with other SHOTs, so edits stay in this SHOT"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, ctx):
+        return bool(getattr(ctx, "selected_objects", None))
+
+    def execute(self, context):
+        count = 0
+        for obj in list(context.selected_objects):
+            if make_object_data_single_user(obj):
+                count += 1
+        if not count:
+            self.report({'INFO'}, "Selected objects already have unique data")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Made data unique for {count} object(s)")
+        return {'FINISHED'}
+
+
 class LIME_OT_activate_shot(Operator):
     bl_idname = "lime.activate_shot"
     bl_label = "Activate Shot"
@@ -302,12 +330,131 @@ class LIME_OT_jump_to_first_shot_marker(Operator):
         return {'FINISHED'}
 
 
+# Background RAW render job (at most one per session), polled by a timer.
+_BACKGROUND_JOB: BackgroundRenderJob | None = None
+_BACKGROUND_STORE: FingerprintStore | None = None
+_BACKGROUND_POLL_INTERVAL = 0.5
+_RENDER_WORKER_SCRIPT = Path(__file__).resolve().parent.parent / "scene" / "render_worker.py"
+
+# Stored next to the RAW outputs: output filename -> fingerprint of the state it was rendered from.
+RAW_FINGERPRINTS_FILENAME = ".lime_raw_fingerprints.json"
+
+
+def _output_signature(path: Path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _record_background_events(job: BackgroundRenderJob, events: list[dict]) -> None:
+    store = _BACKGROUND_STORE
+    if store is None or not events:
+        return
+    for event in events:
+        task = job.task(event.get("key")) or {}
+        output = task.get("output")
+        if not output:
+            continue
+        name = Path(output).name
+        if event.get("status") == "done" and task.get("fingerprint"):
+            store.record(name, task["fingerprint"], Path(output))
+        else:
+            store.forget(name)
+    try:
+        store.save()
+    except Exception as ex:
+        print(f"[Lime Pipeline] Could not save render fingerprints: {ex}")
+
+
+def background_render_job() -> BackgroundRenderJob | None:
+    return _BACKGROUND_JOB
+
+
+def _tag_view3d_redraw() -> None:
+    try:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    except Exception:
+        pass
+
+
+def _poll_background_render():
+    job = _BACKGROUND_JOB
+    if job is None:
+        return None
+    try:
+        events = job.poll()
+        for event in events:
+            if event.get("status") != "done":
+                print(f"[Lime Pipeline] Background render failed: {event.get('key')}: {event.get('error')}")
+        _record_background_events(job, events)
+    except Exception as ex:
+        print(f"[Lime Pipeline] Background render poll error: {ex}")
+    _tag_view3d_redraw()
+    if job.running:
+        return _BACKGROUND_POLL_INTERVAL
+    print(f"[Lime Pipeline] Background render finished: {job.summary()}")
+    if not job.failed and not job.cancelled:
+        shutil.rmtree(job.work_dir, ignore_errors=True)
+    return None
+
+
+def _ensure_background_poll() -> None:
+    try:
+        if not bpy.app.timers.is_registered(_poll_background_render):
+            bpy.app.timers.register(_poll_background_render, first_interval=_BACKGROUND_POLL_INTERVAL)
+    except Exception:
+        pass
+
+
+def shutdown_background_render() -> None:
+    """Stop background workers and delete their work dir (add-on unregister)."""
+    global _BACKGROUND_JOB, _BACKGROUND_STORE
+    job = _BACKGROUND_JOB
+    _BACKGROUND_JOB = None
+    _BACKGROUND_STORE = None
+    try:
+        if bpy.app.timers.is_registered(_poll_background_render):
+            bpy.app.timers.unregister(_poll_background_render)
+    except Exception:
+        pass
+    if job is not None:
+        job.discard()
+
+
 class LIME_OT_render_shots_from_markers(Operator):
     bl_idname = "lime.render_shots_from_markers"
     bl_label = "Render Shots (RAW)"
     bl_description = "Render una imagen RAW por cada marcador de cámara en cada SHOT (modal, cancelable)"
     bl_options = {'REGISTER'}
 
+    mode: EnumProperty(
+        name="Mode",
+        items=[
+            ('INTERACTIVE', "Interactive", "Render in this session, one marker after another (ESC cancels)"),
+            ('BACKGROUND', "Background", "Render a saved snapshot in parallel headless Blender processes"),
+        ],
+        default='INTERACTIVE',
+        options={'SKIP_SAVE'},
+    )
+    workers: IntProperty(
+        name="Workers",
+        description="Number of background Blender processes; render threads are split between them",
+        default=DEFAULT_WORKERS,
+        min=1,
+        max=32,
+        options={'SKIP_SAVE'},
+    )
+    skip_unchanged: BoolProperty(
+        name="Skip Unchanged",
+        description="Do not render markers whose RAW image exists and whose camera, frame, render settings and SHOT contents did not change",
+        default=True,
+    )
+
     _state = None
     _raw_dir: Path | None = None
     _tasks: list[dict] | None = None
@@ -319,6 +466,10 @@ class LIME_OT_render_shots_from_markers(Operator):
     _prev_filepath = ""
     _rendering_task = None  # Holds info while a render window is running
     _ui_guard_prev = None
+    _store: FingerprintStore | None = None
+    _view_layer = None
+    _content_extra = None
+    _skipped = 0
 
     def _iter_coll_tree(self, root):
         stack = [root]
@@ -393,6 +544,38 @@ class LIME_OT_render_shots_from_markers(Operator):
         filename = f"RAW_{project_name}_Render_SH{shot_idx:02d}C{cam_idx}_SC{sc_number:03d}_Rev_{rev}.png"
         return self._raw_dir / filename
 
+    def _fingerprint(self, shot, camera) -> str | None:
+        """Fingerprint of the current frame seen from camera (call with the SHOT isolated)."""
+        try:
+            return render_fingerprint(
+                self._scene,
+                camera,
+                view_layer=self._view_layer,
+                extra={"shot": shot.name},
+                object_extra=self._content_extra,
+            )
+        except Exception as ex:
+            print(f"[Lime Pipeline] Render fingerprint failed for '{shot.name}': {ex}")
+            return None
+
+    def _is_unchanged(self, filepath: Path, fingerprint: str | None) -> bool:
+        return bool(self.skip_unchanged and fingerprint and self._store is not None
+                    and self._store.is_current(filepath.name, fingerprint, filepath))
+
+    def _record_output(self, filepath: Path, fingerprint: str | None, before) -> None:
+        """Remember fingerprint for filepath when the render wrote a new file."""
+        if self._store is None:
+            return
+        after = _output_signature(filepath)
+        if fingerprint and after is not None and after != before:
+            self._store.record(filepath.name, fingerprint, filepath)
+        else:
+            self._store.forget(filepath.name)
+        try:
+            self._store.save()
+        except Exception as ex:
+            print(f"[Lime Pipeline] Could not save render fingerprints: {ex}")
+
     def _prepare_tasks(self, context) -> bool:
         wm = context.window_manager
         state = getattr(wm, "lime_pipeline", None)
@@ -413,6 +596,14 @@ class LIME_OT_render_shots_from_markers(Operator):
             self.report({"WARNING"}, "No hay SHOTs en la escena.")
             return False
 
+        self._store = FingerprintStore(self._raw_dir / RAW_FINGERPRINTS_FILENAME)
+        try:
+            depsgraph = context.evaluated_depsgraph_get()
+        except Exception:
+            depsgraph = None
+        self._content_extra = content_extra(depsgraph)
+        self._view_layer = getattr(context, "view_layer", None)
+        self._skipped = 0
         self._scene = scene
         self._prev_frame = int(getattr(scene, "frame_current", 0) or 0)
         self._prev_camera = getattr(scene, "camera", None)
@@ -485,8 +676,9 @@ class LIME_OT_render_shots_from_markers(Operator):
         finally:
             self._ui_guard_prev = None
 
-        if not cancelled and self._renders_done > 0:
-            self.report({"INFO"}, f"Render RAW completado: {self._renders_done} imagen(es).")
+        self._content_extra = None
+        if not cancelled and (self._renders_done > 0 or self._skipped > 0):
+            self.report({"INFO"}, f"Render RAW completado: {self._renders_done} imagen(es), {self._skipped} sin cambios.")
 
     def _process_next(self, context) -> bool:
         if not self._tasks:
@@ -505,6 +697,8 @@ class LIME_OT_render_shots_from_markers(Operator):
                 # If we cannot detect, fall through and assume finished
                 pass
             # Render finished
+            rendering = self._rendering_task
+            self._record_output(rendering["filepath"], rendering["fingerprint"], rendering["before"])
             self._renders_done += 1
             task["index"] += 1
             self._rendering_task = None
@@ -553,28 +747,157 @@ class LIME_OT_render_shots_from_markers(Operator):
             task["index"] += 1
             return False
 
+        fingerprint = self._fingerprint(task["shot"], cam)
+        if self._is_unchanged(filepath, fingerprint):
+            self._skipped += 1
+            task["index"] += 1
+            return False
+        before = _output_signature(filepath)
+
         try:
             result = bpy.ops.render.render('INVOKE_DEFAULT', write_still=True)
             cancelled = (result == {'CANCELLED'}) or ('CANCELLED' in result and 'RUNNING_MODAL' not in result)
             if cancelled:
                 self.report({"ERROR"}, f"Render cancelled for {task['shot'].name} at frame {frame} (result: {result})")
+                self._record_output(filepath, None, before)
                 task["index"] += 1
                 return False
 
             if result == {'FINISHED'} or 'FINISHED' in result:
+                self._record_output(filepath, fingerprint, before)
                 self._renders_done += 1
                 task["index"] += 1
                 return False
 
             # When INVOKE_DEFAULT succeeds it usually returns RUNNING_MODAL; track until completion
-            self._rendering_task = {"shot": task["shot"], "frame": frame}
+            self._rendering_task = {
+                "shot": task["shot"],
+                "frame": frame,
+                "filepath": filepath,
+                "fingerprint": fingerprint,
+                "before": before,
+            }
             return False
         except Exception as ex:
             self.report({"ERROR"}, f"Render failed for {task['shot'].name} at frame {frame}: {ex}")
             task["index"] += 1
             return False
 
+    def _start_background(self, context):
+        global _BACKGROUND_JOB, _BACKGROUND_STORE
+        if _BACKGROUND_JOB is not None and _BACKGROUND_JOB.running:
+            self.report({"ERROR"}, "A background RAW render is already running.")
+            return {'CANCELLED'}
+        if not self._prepare_tasks(context):
+            return {'CANCELLED'}
+
+        # Fingerprints are taken here, with each SHOT isolated like the worker will do it
+        tasks: list[dict] = []
+        try:
+            for task in self._tasks or []:
+                shot = task["shot"]
+                restore = validate_scene.isolate_shots_temporarily(self._scene, shot, include_all=False)
+                try:
+                    for frame, cam, _marker in task["markers"]:
+                        try:
+                            output = self._build_raw_path(shot, cam, frame)
+                        except Exception as ex:
+                            self.report({"ERROR"}, f"Cannot prepare filepath for '{shot.name}': {ex}")
+                            continue
+                        self._scene.frame_set(frame)
+                        self._scene.camera = cam
+                        fingerprint = self._fingerprint(shot, cam)
+                        if self._is_unchanged(output, fingerprint):
+                            self._skipped += 1
+                            continue
+                        tasks.append({
+                            "key": f"{shot.name}|{frame}|{cam.name}",
+                            "shot": shot.name,
+                            "frame": int(frame),
+                            "camera": cam.name,
+                            "output": output.as_posix(),
+                            "fingerprint": fingerprint,
+                        })
+                finally:
+                    restore()
+        finally:
+            self._tasks = None
+            self._content_extra = None
+            try:
+                self._scene.frame_set(self._prev_frame)
+                self._scene.camera = self._prev_camera
+            except Exception:
+                pass
+        if not tasks:
+            if self._skipped:
+                self.report({"INFO"}, f"Render RAW: {self._skipped} imagen(es) sin cambios, nada que renderizar.")
+                return {'FINISHED'}
+            return {'CANCELLED'}
+
+        # Only the latest job can be retried; drop the previous snapshot before writing a new one
+        if _BACKGROUND_JOB is not None:
+            _BACKGROUND_JOB.discard()
+            _BACKGROUND_JOB = None
+            _BACKGROUND_STORE = None
+
+        # Snapshot of the current (possibly unsaved) state; relative paths are remapped to its folder
+        work_dir = self._raw_dir / ".lime_bg_render" / time.strftime("%Y%m%d_%H%M%S")
+        snapshot = work_dir / "snapshot.blend"
+        try:
+            work_dir.mkdir(parents=True, exist_ok=True)
+            bpy.ops.wm.save_as_mainfile(filepath=str(snapshot), copy=True, relative_remap=True)
+        except Exception as ex:
+            self.report({"ERROR"}, f"No se pudo guardar la copia temporal: {ex}")
+            return {'CANCELLED'}
+
+        workers = max(1, min(int(self.workers), len(tasks)))
+        threads = worker_threads(workers)
+        blender = bpy.app.binary_path
+
+        def _command(manifest: Path) -> list[str]:
+            return [
+                blender, "-b", str(snapshot), "-t", str(threads),
+                "--python-exit-code", "1",
+                "--python", str(_RENDER_WORKER_SCRIPT),
+                "--", str(manifest),
+            ]
+
+        view_layer = getattr(context, "view_layer", None)
+        job = BackgroundRenderJob(
+            work_dir,
+            _command,
+            workers=workers,
+            manifest_extra={"scene": context.scene.name, "view_layer": getattr(view_layer, "name", "")},
+        )
+        if not job.start(tasks):
+            self.report({"ERROR"}, "No se pudo iniciar Blender en segundo plano.")
+            return {'CANCELLED'}
+        _BACKGROUND_JOB = job
+        _BACKGROUND_STORE = self._store
+        _ensure_background_poll()
+        self.report(
+            {"INFO"},
+            f"Render RAW en segundo plano: {len(tasks)} imagen(es), {self._skipped} sin cambios, {workers} proceso(s).",
+        )
+        return {'FINISHED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "workers")
+        layout.prop(self, "skip_unchanged")
+
+    def execute(self, context):
+        if self.mode == 'BACKGROUND':
+            return self._start_background(context)
+        return self.invoke(context, None)
+
     def invoke(self, context, event):
+        if self.mode == 'BACKGROUND':
+            if not self.properties.is_property_set("workers"):
+                # One process per SHOT, capped by the available cores
+                shot_count = len(validate_scene.list_shot_roots(context.scene))
+                self.workers = max(1, min(os.cpu_count() or 1, shot_count))
+            return context.window_manager.invoke_props_dialog(self)
         if not self._prepare_tasks(context):
             return {'CANCELLED'}
 
@@ -609,3 +932,42 @@ class LIME_OT_render_shots_from_markers(Operator):
                 return {'FINISHED'}
 
         return {'PASS_THROUGH'}
+
+
+class LIME_OT_render_shots_background_cancel(Operator):
+    bl_idname = "lime.render_shots_background_cancel"
+    bl_label = "Cancel Background Render"
+    bl_description = "Stop the background RAW render workers (finished images are kept)"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, ctx):
+        return _BACKGROUND_JOB is not None and _BACKGROUND_JOB.running
+
+    def execute(self, context):
+        # Terminate only; the poll timer reaps the workers without blocking the UI
+        _BACKGROUND_JOB.cancel()
+        _tag_view3d_redraw()
+        self.report({"WARNING"}, f"Render RAW en segundo plano cancelado: {_BACKGROUND_JOB.summary()}")
+        return {'FINISHED'}
+
+
+class LIME_OT_render_shots_background_retry(Operator):
+    bl_idname = "lime.render_shots_background_retry"
+    bl_label = "Retry Failed Renders"
+    bl_description = "Render the failed or cancelled markers of the last background RAW render again"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, ctx):
+        job = _BACKGROUND_JOB
+        return job is not None and not job.running and bool(job.failed)
+
+    def execute(self, context):
+        count = len(_BACKGROUND_JOB.failed)
+        if not _BACKGROUND_JOB.retry_failed():
+            self.report({"ERROR"}, "No se pudo reiniciar el render en segundo plano.")
+            return {'CANCELLED'}
+        _ensure_background_poll()
+        self.report({"INFO"}, f"Reintentando {count} imagen(es) en segundo plano.")
+        return {'FINISHED'}
@@ -66,7 +66,7 @@ class LIME_OT_create_view_layers(Operator):
         view_layer = getattr(ctx, "view_layer", None)
         if scene is None or view_layer is None:
             return False
-        shot = validate_scene.active_shot_context(ctx)
+        shot = validate_scene.active_shot_for_draw(ctx)
         return shot is not None
 
     def execute(self, context):
@@ -15,13 +15,30 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import bpy
 
+from ..core.ai_asset_prompt import schema_json_object
+from ..core.ai_texture_batch import (
+    build_texture_batch_text,
+    estimate_entry_chars,
+    parse_texture_batch_response,
+    plan_texture_batches,
+    schema_texture_batch,
+    texture_batch_entry,
+    texture_batch_system_prompt,
+    texture_item_id,
+)
+from ..core.jsonl_log import atomic_write_json, iter_jsonl_records, last_record_of_kind
 from ..core.naming import normalize_project_name, parse_blend_details
 from ..core.texture_naming import (
     canonicalize_texture_stem,
-    map_type_from_socket_links,
     sanitize_filename_stem,
 )
+from ..core.texture_node_index import TextureNodeGraphIndex, pointer_key
 from ..core.texture_paths import classify_path, is_subpath
+from ..core.udim_tiles import (
+    UDIM_TOKEN,
+    enumerate_udim_tiles,
+    udim_template_filename,
+)
 from ..core.texture_workspace import (
     deduce_texture_project_workspace,
     extra_protected_texture_roots,
@@ -34,6 +51,7 @@ from .ai_http import (
     has_openrouter_api_key,
     http_post_json,
     openrouter_headers,
+    parse_json_from_text,
 )
 
 
@@ -77,101 +95,25 @@ def bool_attr(obj: object, name: str) -> bool:
         return False
 
 
-def node_tree_key(tree: object) -> int:
-    try:
-        return int(tree.as_pointer())
-    except Exception:
-        return id(tree)
-
-
-def iter_image_texture_nodes(node_tree: Any) -> Iterable[Any]:
-    visited: Set[int] = set()
-
-    def walk(tree: Any) -> Iterable[Any]:
-        if tree is None:
-            return
-        key = node_tree_key(tree)
-        if key in visited:
-            return
-        visited.add(key)
-        for node in list(getattr(tree, "nodes", []) or []):
-            ntype = getattr(node, "type", "") or ""
-            if ntype == "TEX_IMAGE":
-                yield node
-                continue
-            if ntype == "GROUP":
-                group_tree = getattr(node, "node_tree", None)
-                if group_tree is not None:
-                    yield from walk(group_tree)
-
-    yield from walk(node_tree)
-
-
-def node_target_socket_names(node: Any) -> Tuple[str, ...]:
-    names: List[str] = []
-    seen: Set[str] = set()
-    try:
-        for output in list(getattr(node, "outputs", []) or []):
-            for link in list(getattr(output, "links", []) or []):
-                socket_name = (getattr(getattr(link, "to_socket", None), "name", "") or "").strip()
-                if not socket_name:
-                    continue
-                key = socket_name.lower()
-                if key in seen:
-                    continue
-                seen.add(key)
-                names.append(socket_name)
-    except Exception:
-        pass
-    return tuple(names)
-
-
-def infer_map_type(material: Any, node: Any, image: Any) -> str:
-    parts = [
-        getattr(material, "name", "") or "",
-        getattr(node, "name", "") or "",
-        getattr(node, "label", "") or "",
-        getattr(image, "name", "") or "",
-        getattr(image, "filepath", "") or "",
-    ]
-    socket_names: List[str] = []
-    try:
-        for output in list(getattr(node, "outputs", []) or []):
-            parts.append(getattr(output, "name", "") or "")
-            for link in list(getattr(output, "links", []) or []):
-                socket_name = getattr(getattr(link, "to_socket", None), "name", "") or ""
-                parts.append(socket_name)
-                if socket_name:
-                    socket_names.append(socket_name)
-                parts.append(getattr(getattr(link, "to_node", None), "type", "") or "")
-                parts.append(getattr(getattr(link, "to_node", None), "name", "") or "")
-    except Exception:
-        pass
-    return map_type_from_socket_links(socket_names, fallback_text=" ".join(parts))
-
-
 def collect_image_usages_from_materials(materials: Iterable[Any]) -> Dict[int, Tuple[Any, List[TextureUsage]]]:
+    index = TextureNodeGraphIndex()
     out: Dict[int, Tuple[Any, List[TextureUsage]]] = {}
     for mat in list(materials or []):
         node_tree = getattr(mat, "node_tree", None)
         if node_tree is None or not bool_attr(mat, "use_nodes"):
             continue
+        mat_name = getattr(mat, "name", "") or ""
         mat_is_linked = getattr(mat, "library", None) is not None or bool_attr(mat, "is_library_indirect")
-        for node in iter_image_texture_nodes(node_tree):
-            image = getattr(node, "image", None)
-            if image is None:
-                continue
-            try:
-                image_key = int(image.as_pointer())
-            except Exception:
-                image_key = id(image)
+        for entry in index.image_entries(node_tree):
+            image = entry.image
+            image_key = pointer_key(image)
             usage = TextureUsage(
-                material_name=getattr(mat, "name", "") or "",
-                node_name=getattr(node, "name", "") or "",
-                node_label=getattr(node, "label", "") or "",
-                map_type=infer_map_type(mat, node, image),
+                material_name=mat_name,
+                node_name=entry.node_name,
+                node_label=entry.node_label,
+                map_type=entry.map_type_for(mat_name),
                 material_is_linked=mat_is_linked,
-                socket_targets=node_target_socket_names(node),
+                socket_targets=entry.socket_targets,
             )
             if image_key not in out:
                 out[image_key] = (image, [usage])
@@ -273,7 +215,7 @@ def resolve_abs_image_path(image: Any) -> tuple[Optional[Path], List[str]]:
     raw = (getattr(image, "filepath", "") or "").strip()
     if not raw:
         return None, ["Image has no filepath"]
-    if "<UDIM>" in raw:
+    if UDIM_TOKEN in raw:
         reasons.append("UDIM token detected in filepath")
     try:
         resolved = bpy.path.abspath(raw)
@@ -291,9 +233,8 @@ def resolve_abs_image_path(image: Any) -> tuple[Optional[Path], List[str]]:
 def exists_for_scan(abs_path: Optional[Path], *, raw_filepath: str) -> bool:
     if abs_path is None:
         return False
-    if "<UDIM>" in (raw_filepath or ""):
-        probe = str(abs_path).replace("<UDIM>", "1001")
-        return os.path.isfile(probe)
+    if UDIM_TOKEN in (raw_filepath or ""):
+        return bool(enumerate_udim_tiles(abs_path))
     return os.path.isfile(str(abs_path))
 
 
@@ -426,40 +367,6 @@ def looks_like_map_type_only(stem: str, map_type: str) -> bool:
     return False
 
 
-def parse_ai_json(text: str) -> Dict[str, str] | None:
-    raw = (text or "").strip()
-    if not raw:
-        return None
-    if raw.startswith("```"):
-        raw = raw.strip("`").strip()
-    try:
-        obj = json.loads(raw)
-        if isinstance(obj, dict):
-            out: Dict[str, str] = {}
-            for key in ("stem", "map_type", "explanation", "image_summary"):
-                val = obj.get(key)
-                if isinstance(val, str):
-                    out[key] = val
-            return out if out else None
-    except Exception:
-        pass
-    try:
-        start = raw.find("{")
-        end = raw.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            obj2 = json.loads(raw[start : end + 1])
-            if isinstance(obj2, dict):
-                out2: Dict[str, str] = {}
-                for key in ("stem", "map_type", "explanation", "image_summary"):
-                    val = obj2.get(key)
-                    if isinstance(val, str):
-                        out2[key] = val
-                return out2 if out2 else None
-    except Exception:
-        return None
-    return None
-
-
 def make_lowres_preview_data_url(image: Any, *, max_size: int, max_bytes: int) -> str | None:
     try:
         if image is None:
@@ -530,9 +437,30 @@ def make_lowres_preview_data_url_with_meta(
         return url, {"format": "png", "max_size": int(max_size)}
 
 
-def ai_suggest_texture_name(
+@dataclass(frozen=True, slots=True)
+class TextureNamingRequest:
+    original_filename: str
+    material_name: str
+    map_type: str
+    socket_targets: Tuple[str, ...]
+    manual_hint: str = ""
+    prior_suggestion: str = ""
+    preview_url: str | None = None
+    preview_meta: Dict[str, object] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TextureNamingResult:
+    stem: str
+    map_type: str | None
+    explanation: str | None
+    image_summary: str | None
+    preview_meta: Dict[str, object] | None
+    error: str | None
+
+
+def build_texture_naming_request(
     *,
-    context,
     original_filename: str,
     material_name: str,
     map_type: str,
@@ -541,13 +469,8 @@ def ai_suggest_texture_name(
     prior_suggestion: str = "",
     include_preview: bool = False,
     image: Any = None,
-) -> tuple[str, str | None, str | None, str | None, Dict[str, object] | None, str | None]:
-    if not has_openrouter_api_key():
-        return "", None, None, None, None, "OpenRouter API key not found in .env"
-
-    prefs = context.preferences.addons[__package__.split(".")[0]].preferences
-    model = (getattr(prefs, "openrouter_model", "") or "").strip() or "google/gemini-3-flash-preview"
-
+) -> TextureNamingRequest:
+    # Previews touch bpy image data, so requests are built on the main thread.
     preview_url: str | None = None
     preview_meta: Dict[str, object] | None = None
     if include_preview and image is not None:
@@ -556,53 +479,140 @@ def ai_suggest_texture_name(
             max_size=96,
             max_bytes=120_000,
         )
+    return TextureNamingRequest(
+        original_filename=original_filename,
+        material_name=material_name,
+        map_type=map_type,
+        socket_targets=tuple(socket_targets or ()),
+        manual_hint=manual_hint,
+        prior_suggestion=prior_suggestion,
+        preview_url=preview_url,
+        preview_meta=preview_meta,
+    )
 
-    system_lines = [
-        "You help a Blender pipeline simplify texture filenames.",
-        "Return ONLY JSON.",
-        "JSON keys: stem, map_type, explanation.",
-        "stem must be filename-safe using letters, digits, underscore only.",
-        "Keep context from original filename and avoid generic map-only names.",
-        "If a manual hint is provided, prioritize that intent while keeping it concise.",
-        "map_type must be one of Generic, BaseColor, Normal, Roughness, Metallic, AO, Alpha, Height, Emission.",
-    ]
-    user_lines = [
-        f"Original filename: {original_filename}",
-        f"Material: {material_name}",
-        f"Current map type: {map_type}",
-        f"Socket targets: {', '.join(list(socket_targets)[:10]) if socket_targets else 'None'}",
-        f"Manual hint: {manual_hint or 'None'}",
-        f"Prior suggestion: {prior_suggestion or 'None'}",
+
+def _texture_batch_entry_for(item_id: str, request: TextureNamingRequest) -> Dict[str, object]:
+    return texture_batch_entry(
+        item_id,
+        original_filename=request.original_filename,
+        material_name=request.material_name,
+        map_type=request.map_type,
+        socket_targets=request.socket_targets,
+        manual_hint=request.manual_hint,
+        prior_suggestion=request.prior_suggestion,
+        has_preview=bool(request.preview_url),
+    )
+
+
+def plan_texture_naming_batches(requests: Sequence[TextureNamingRequest]) -> List[List[int]]:
+    costs = [
+        estimate_entry_chars(
+            _texture_batch_entry_for(texture_item_id(idx), request),
+            preview_chars=len(request.preview_url or ""),
+        )
+        for idx, request in enumerate(requests)
     ]
-    content_parts: List[Dict[str, object]] = [{"type": "text", "text": "\n".join(user_lines)}]
-    if preview_url:
-        content_parts.append({"type": "image_url", "image_url": {"url": preview_url}})
+    return plan_texture_batches(costs)
+
+
+def texture_naming_model_and_headers(context) -> tuple[str, Dict[str, str]]:
+    prefs = context.preferences.addons[__package__.split(".")[0]].preferences
+    model = (getattr(prefs, "openrouter_model", "") or "").strip() or "google/gemini-3-flash-preview"
+    return model, openrouter_headers(prefs)
+
+
+def _naming_result_from_entry(request: TextureNamingRequest, entry: Dict[str, str]) -> TextureNamingResult:
+    stem = sanitize_filename_stem((entry.get("stem") or "").strip())
+    ai_map_type = normalize_ai_map_type((entry.get("map_type") or "").strip())
+    explanation = (entry.get("explanation") or "").strip()
+    image_summary = (entry.get("image_summary") or "").strip()
+    if not stem:
+        return TextureNamingResult("", None, None, None, request.preview_meta, "OpenRouter returned an empty/invalid stem")
+    if len(stem) > 48:
+        stem = stem[:48]
+    if looks_like_map_type_only(stem, request.map_type):
+        return TextureNamingResult("", None, None, None, request.preview_meta, "AI suggested map-type-only stem")
+    return TextureNamingResult(
+        stem,
+        ai_map_type or None,
+        explanation or None,
+        image_summary or None,
+        request.preview_meta,
+        None,
+    )
+
+
+def _request_texture_batch(
+    *,
+    model: str,
+    headers: Dict[str, str],
+    requests: Sequence[TextureNamingRequest],
+) -> tuple[Optional[Dict[str, Dict[str, str]]], List[str], Optional[str], bool]:
+    ids = [texture_item_id(idx) for idx in range(len(requests))]
+    entries = [_texture_batch_entry_for(item_id, request) for item_id, request in zip(ids, requests)]
+    content_parts: List[Dict[str, object]] = [{"type": "text", "text": build_texture_batch_text(entries)}]
+    for item_id, request in zip(ids, requests):
+        if request.preview_url:
+            content_parts.append({"type": "text", "text": f"Preview for {item_id}:"})
+            content_parts.append({"type": "image_url", "image_url": {"url": request.preview_url}})
 
     payload: Dict[str, object] = {
         "model": model,
         "messages": [
-            {"role": "system", "content": "\n".join(system_lines)},
+            {"role": "system", "content": texture_batch_system_prompt()},
             {"role": "user", "content": content_parts},
         ],
         "temperature": 0.2,
     }
-    result = http_post_json(OPENROUTER_CHAT_URL, payload, headers=openrouter_headers(prefs), timeout=30)
-    if not isinstance(result, dict):
-        return "", None, None, None, preview_meta, "OpenRouter request failed"
-
-    content = extract_message_content(result) or ""
-    parsed = parse_ai_json(content)
-    stem = sanitize_filename_stem((parsed.get("stem") or "").strip()) if parsed else ""
-    ai_map_type = normalize_ai_map_type((parsed.get("map_type") or "").strip()) if parsed else ""
-    explanation = (parsed.get("explanation") or "").strip() if parsed else ""
-    image_summary = (parsed.get("image_summary") or "").strip() if parsed else ""
-    if not stem:
-        return "", None, None, None, preview_meta, "OpenRouter returned an empty/invalid stem"
-    if len(stem) > 48:
-        stem = stem[:48]
-    if looks_like_map_type_only(stem, map_type):
-        return "", None, None, None, preview_meta, "AI suggested map-type-only stem"
-    return stem, (ai_map_type or None), (explanation or None), (image_summary or None), preview_meta, None
+    parse_error: Optional[str] = None
+    got_response = False
+    for response_format in (schema_texture_batch(), schema_json_object()):
+        payload["response_format"] = response_format
+        result = http_post_json(OPENROUTER_CHAT_URL, payload, headers=headers, timeout=30 + 5 * len(requests))
+        if not isinstance(result, dict):
+            # Models without json_schema support reject the strict format; try the next one.
+            continue
+        got_response = True
+        parsed = parse_json_from_text(extract_message_content(result) or "")
+        by_id, parse_error = parse_texture_batch_response(parsed, expected_ids=ids)
+        if by_id is not None:
+            return by_id, ids, None, False
+    if not got_response:
+        return None, ids, "OpenRouter request failed", False
+    return None, ids, parse_error or "AI response was not valid JSON for the expected schema", True
+
+
+def ai_suggest_texture_names_batch(
+    *,
+    model: str,
+    headers: Dict[str, str],
+    requests: Sequence[TextureNamingRequest],
+) -> tuple[Optional[List[TextureNamingResult]], Optional[str]]:
+    """Name several textures with one chat completion; safe to call from a worker thread.
+
+    Responses must cover every requested ID exactly once. When a multi-item batch
+    comes back malformed it is split in halves and retried, so one confusing
+    texture does not fail its neighbours.
+    """
+    if not requests:
+        return [], None
+    if not has_openrouter_api_key():
+        return None, "OpenRouter API key not found in .env"
+
+    by_id, ids, err, retryable = _request_texture_batch(model=model, headers=headers, requests=requests)
+    if by_id is not None:
+        return [_naming_result_from_entry(request, by_id[item_id]) for item_id, request in zip(ids, requests)], None
+    if not retryable or len(requests) <= 1:
+        return None, err
+
+    half = len(requests) // 2
+    head, head_err = ai_suggest_texture_names_batch(model=model, headers=headers, requests=requests[:half])
+    if head is None:
+        return None, head_err
+    tail, tail_err = ai_suggest_texture_names_batch(model=model, headers=headers, requests=requests[half:])
+    if tail is None:
+        return None, tail_err
+    return head + tail, None
 
 
 def read_sha256_index(index_path: Path) -> Dict[str, str]:
@@ -622,9 +632,34 @@ def write_sha256_index(index_path: Path, sha256_to_file: Dict[str, str]) -> None
         "updated_at": utc_now_iso(),
         "sha256_to_file": sha256_to_file,
     }
-    tmp = index_path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
-    tmp.replace(index_path)
+    atomic_write_json(index_path, payload)
+
+
+def find_resumable_apply_log(report_dir: Path) -> Optional[Path]:
+    """Return the newest texture apply JSONL log that has no summary record (interrupted run)."""
+    try:
+        candidates = sorted(report_dir.glob("texture_apply_*.jsonl"), key=lambda p: p.name)
+    except Exception:
+        return None
+    if not candidates:
+        return None
+    # Only the newest log counts: once a later run finished, older partial logs are stale.
+    newest = candidates[-1]
+    if last_record_of_kind(newest, "summary") is None:
+        return newest
+    return None
+
+
+def load_apply_resume_changes(log_path: Path) -> Dict[str, Dict[str, object]]:
+    """Map original absolute source path -> last ``change`` record of a partial apply log."""
+    out: Dict[str, Dict[str, object]] = {}
+    for record in iter_jsonl_records(log_path):
+        if record.get("kind") != "change":
+            continue
+        source = str(record.get("original_abs_filepath") or "")
+        if source:
+            out[source] = record
+    return out
 
 
 def infer_scan_classification(
@@ -668,17 +703,20 @@ def infer_scan_classification(
         return "PROTECTED", reasons + ["Protected (linked/library/protected root)"]
     if abs_path is None:
         return "UNKNOWN", reasons
-    if not exists and "<UDIM>" not in raw_filepath:
+    is_udim = UDIM_TOKEN in raw_filepath
+    if not exists:
+        if is_udim:
+            return "MISSING", reasons + ["No UDIM tiles found on disk"]
         return "MISSING", reasons + ["Resolved file does not exist"]
 
     try:
-        if abs_path is not None and abs_path.is_file() and is_subpath(abs_path, dest_root):
+        if abs_path is not None and (is_udim or abs_path.is_file()) and is_subpath(abs_path, dest_root):
             return "IN_TEXTURE_ROOT", reasons + ["Already inside texture root"]
     except Exception:
         pass
 
-    if "<UDIM>" in raw_filepath:
-        return "UDIM_SKIP", reasons
+    if is_udim:
+        reasons.append("UDIM tile set (adopted as a unit)")
 
     if path_class.kind == "EXTERNAL":
         return "EXTERNAL_ADOPTABLE", reasons
@@ -693,10 +731,13 @@ def canonical_filename_for_item(
     source_stem: str,
     map_type: str,
     ext: str,
+    udim: bool = False,
 ) -> str:
     stem = sanitize_filename_stem(source_stem) or "Texture"
     clean_ext = ext.lower() if ext.startswith(".") else f".{ext.lower()}"
     canonical = canonicalize_texture_stem(project_token=project_token, stem=stem, map_type=map_type)
+    if udim:
+        return udim_template_filename(canonical, clean_ext)
     return f"{canonical}{clean_ext}"
 
 
@@ -24,7 +24,7 @@ from pathlib import Path
 
 import bpy
 from bpy.types import AddonPreferences
-from bpy.props import StringProperty, IntProperty, BoolProperty, CollectionProperty
+from bpy.props import StringProperty, IntProperty, BoolProperty, CollectionProperty, EnumProperty
 
 from .props import LimeRenderPresetSlot
 from .core.env_config import env_file_path, has_krea_api_key, has_openrouter_api_key
@@ -84,6 +84,20 @@ class LimePipelinePrefs(AddonPreferences):
         description="Automatically scan and rename materials after duplicating a scene.",
         default=False,
     )
+    shot_duplicate_data: EnumProperty(
+        name="SHOT Duplicate Data",
+        items=[
+            ('SHARED', "Shared", "Copy cameras, lights, rigs and animated data; keep static geometry linked"),
+            ('FULL', "Full Copy", "Copy the data of every object in the SHOT"),
+        ],
+        default='SHARED',
+        description="How object data is handled when duplicating a SHOT (override per object or collection with a 'lime_dup_data' property set to COPY or LINK)",
+    )
+    shot_duplicate_link_types: StringProperty(
+        name="Linked Types",
+        default="MESH, CURVE, SURFACE, FONT, META, CURVES",
+        description="Object types whose static data stays linked in Shared mode (comma-separated)",
+    )
     # --- OpenRouter (AI features) ---
     openrouter_model: StringProperty(
         name="OpenRouter Model",
@@ -121,6 +135,13 @@ class LimePipelinePrefs(AddonPreferences):
         default=False,
         description="Log Krea request/response info to the console for troubleshooting",
     )
+    ai_render_preview_budget_mb: IntProperty(
+        name="Thumbnail Memory (MB)",
+        default=64,
+        min=8,
+        max=1024,
+        description="Memory budget for AI Render Converter thumbnails; least recently viewed ones are unloaded beyond it",
+    )
     global_render_presets: CollectionProperty(type=LimeRenderPresetSlot, options={'HIDDEN'})
     defaults_render_presets: CollectionProperty(type=LimeRenderPresetSlot, options={'HIDDEN'})
 
@@ -138,6 +159,11 @@ class LimePipelinePrefs(AddonPreferences):
         col.prop(self, "remember_last_rev")
         col.prop(self, "enable_dimension_utilities")
         col.prop(self, "auto_normalize_materials_after_duplicate")
+        row = col.row()
+        row.prop(self, "shot_duplicate_data")
+        sub = row.row()
+        sub.enabled = self.shot_duplicate_data == 'SHARED'
+        sub.prop(self, "shot_duplicate_link_types")
         col.separator()
         col.prop(self, "libraries_override_dir")
         col.separator()
@@ -165,6 +191,7 @@ class LimePipelinePrefs(AddonPreferences):
         krea_box.prop(self, "krea_base_url")
         krea_box.prop(self, "krea_model")
         krea_box.prop(self, "krea_debug")
+        krea_box.prop(self, "ai_render_preview_budget_mb")
         krea_box.separator()
         krea_box.operator("lime.ai_render_test_connection", text="Test Krea Connection")
 
@@ -265,16 +265,14 @@ class LimePipelineState(PropertyGroup):
             return [("NONE", "No Camera", "", 0)]
         items = []
         try:
-            shot = validate_scene.active_shot_context(context)
-            if shot is not None:
-                base = getattr(templates, "C_CAM", "00_CAM")
-                cam_coll = validate_scene.get_shot_child_by_basename(shot, base)
-                if cam_coll is not None:
-                    cams = [obj for obj in cam_coll.objects if getattr(obj, "type", None) == 'CAMERA']
-                    # Stable order by name
-                    cams.sort(key=lambda o: o.name)
-                    for idx, cam in enumerate(cams, 1):
-                        items.append((cam.name, f"Cam {idx}: {cam.name}", "", idx))
+            base = getattr(templates, "C_CAM", "00_CAM")
+            cam_coll = validate_scene.active_shot_child_for_draw(context, base)
+            if cam_coll is not None:
+                cams = [obj for obj in cam_coll.objects if getattr(obj, "type", None) == 'CAMERA']
+                # Stable order by name
+                cams.sort(key=lambda o: o.name)
+                for idx, cam in enumerate(cams, 1):
+                    items.append((cam.name, f"Cam {idx}: {cam.name}", "", idx))
         except Exception:
             pass
         return items or [("NONE", "No Camera", "", 0)]
@@ -444,7 +442,7 @@ class LimePipelineState(PropertyGroup):
     )
     dimension_lock_z_up: BoolProperty(
         name="Dimension Lock Z-Up",
-        description="Force global Z upright when using PCA orientations.",
+        description="Force global Z upright when using PCA 3D or Min Volume orientations.",
         default=False,
     )
     dimension_show_mm: BoolProperty(
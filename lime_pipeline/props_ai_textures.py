@@ -58,6 +58,7 @@ class LimeAITextureItem(PropertyGroup):
     status: EnumProperty(name="Status", items=_ITEM_STATUS_ITEMS, default="ANALYZED")
     last_error: StringProperty(name="Last Error", default="")
     read_only: BoolProperty(name="Read Only", default=True)
+    fingerprint: StringProperty(name="Fingerprint", default="")
 
 
 class LimeAITextureState(PropertyGroup):
@@ -69,10 +70,16 @@ class LimeAITextureState(PropertyGroup):
         description="Send low-res preview content to OpenRouter when suggesting texture names",
         default=False,
     )
+    incremental_analyze: BoolProperty(
+        name="Incremental Analyze",
+        description="Reuse previous results (classification, reviewed suggestions) for textures whose file and usage are unchanged",
+        default=True,
+    )
     phase: EnumProperty(name="Phase", items=_PHASE_ITEMS, default="IDLE")
     ai_blocked: BoolProperty(name="AI Blocked", default=False)
     is_busy: BoolProperty(name="Busy", default=False)
     last_error: StringProperty(name="Last Error", default="")
+    progress_text: StringProperty(name="Progress", default="")
 
     total_count: IntProperty(name="Total", default=0)
     adoptable_count: IntProperty(name="Adoptable", default=0)
@@ -0,0 +1,418 @@
+"""
+Render State Descriptions
+
+Describes, as plain data, everything in a scene that affects one rendered
+still: frame, camera, render/color settings and the renderable objects with
+their transforms, data blocks and materials. The description is hashed by
+`core.render_fingerprint` so renders whose inputs did not change can be skipped.
+
+Call these helpers after `scene.frame_set(frame)` and after assigning the
+render camera, so animated transforms are evaluated for the right frame.
+
+Key Features:
+- Camera matrix and lens/sensor/shift/clip/DOF settings
+- Engine, resolution, samples, output format and color management
+- Renderable objects (view layer + render visibility) with transforms, data names and sizes, materials,
+  modifier settings and light/camera data settings; world settings and node tree
+- Optional content digests (evaluated geometry, material node settings) memoized per frame in a render batch;
+  objects whose data cannot be digested never match a previous fingerprint
+- Low-sample preview overrides that can be applied and restored around a batch
+"""
+
+from __future__ import annotations
+
+from array import array
+import hashlib
+import os
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ..core.render_fingerprint import stable_digest
+
+
+# Types whose evaluated geometry `to_mesh` can digest
+GEOMETRY_TYPES = {"MESH", "CURVE", "SURFACE", "FONT", "META"}
+
+# Types without renderable data of their own (lights/cameras are described by `object_state`)
+NO_GEOMETRY_TYPES = {"EMPTY", "LIGHT", "CAMERA", "ARMATURE", "LATTICE", "LIGHT_PROBE", "LIGHTPROBE", "SPEAKER"}
+
+# RNA properties that never change a render (ID bookkeeping and UI state)
+_SKIPPED_RNA = {
+    "rna_type",
+    "name",
+    "name_full",
+    "session_uid",
+    "is_evaluated",
+    "original",
+    "users",
+    "use_fake_user",
+    "use_extra_user",
+    "is_embedded_data",
+    "is_library_indirect",
+    "is_missing",
+    "is_runtime_data",
+    "library",
+    "library_weak_reference",
+    "override_library",
+    "asset_data",
+    "preview",
+    "tag",
+    "id_type",
+    "is_active",
+    "is_override_data",
+    "show_expanded",
+    "show_viewport",
+    "show_in_editmode",
+    "show_on_cage",
+    "persistent_uid",
+}
+
+
+def _matrix_values(matrix) -> List[float]:
+    try:
+        return [float(v) for row in matrix for v in row]
+    except Exception:
+        return []
+
+
+def _plain(value):
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, (set, frozenset)):
+        return sorted(str(v) for v in value)
+    try:
+        return [float(v) for v in value]
+    except Exception:
+        return getattr(value, "name", None) or str(type(value).__name__)
+
+
+def rna_state(owner, depth: int = 1) -> Dict[str, object]:
+    """Values of owner's RNA properties; ID pointers by name, nested structs up to depth levels."""
+    out: Dict[str, object] = {}
+    try:
+        props = list(owner.bl_rna.properties)
+    except Exception:
+        return out
+    for prop in props:
+        ident = prop.identifier
+        if ident in _SKIPPED_RNA or prop.type == "COLLECTION":
+            continue
+        try:
+            value = getattr(owner, ident)
+        except Exception:
+            continue
+        if prop.type == "POINTER":
+            if value is None or hasattr(value, "users"):
+                out[ident] = getattr(value, "name", None)
+            elif depth > 0:
+                out[ident] = rna_state(value, depth - 1)
+            continue
+        out[ident] = _plain(value)
+    return out
+
+
+def node_tree_state(tree) -> Dict[str, object]:
+    """Node types, unlinked input values, images and links of a node tree."""
+    if tree is None:
+        return {}
+    nodes = []
+    for node in tree.nodes:
+        inputs = []
+        for socket in node.inputs:
+            if socket.is_linked or not hasattr(socket, "default_value"):
+                continue
+            inputs.append([socket.identifier, _plain(socket.default_value)])
+        entry = [node.name, node.bl_idname, inputs]
+        image = getattr(node, "image", None)
+        if image is not None:
+            entry.append([image.name, image.filepath, getattr(image.colorspace_settings, "name", None)])
+        nodes.append(entry)
+    return {
+        "nodes": sorted(nodes, key=lambda item: item[0]),
+        "links": sorted(
+            [link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier]
+            for link in tree.links
+        ),
+    }
+
+
+def _data_with_nodes_state(data) -> Dict[str, object]:
+    """RNA settings of a light or world plus its node tree when nodes are used."""
+    if data is None:
+        return {}
+    out: Dict[str, object] = {"name": data.name, "settings": rna_state(data)}
+    if getattr(data, "use_nodes", False):
+        out.update(node_tree_state(getattr(data, "node_tree", None)))
+    return out
+
+
+def camera_state(camera) -> Dict[str, object]:
+    if camera is None:
+        return {}
+    data = getattr(camera, "data", None)
+    out: Dict[str, object] = {"name": camera.name, "matrix": _matrix_values(camera.matrix_world)}
+    if data is None:
+        return out
+    out["settings"] = rna_state(data)
+    for attr in (
+        "type",
+        "lens",
+        "lens_unit",
+        "ortho_scale",
+        "sensor_fit",
+        "sensor_width",
+        "sensor_height",
+        "shift_x",
+        "shift_y",
+        "clip_start",
+        "clip_end",
+    ):
+        out[attr] = getattr(data, attr, None)
+    dof = getattr(data, "dof", None)
+    if dof is not None and getattr(dof, "use_dof", False):
+        out["dof"] = [
+            getattr(dof, "focus_distance", None),
+            getattr(dof, "aperture_fstop", None),
+            getattr(getattr(dof, "focus_object", None), "name", None),
+        ]
+    return out
+
+
+def render_settings_state(scene) -> Dict[str, object]:
+    render = scene.render
+    image_settings = render.image_settings
+    view = scene.view_settings
+    engine = render.engine
+    samples = None
+    if engine == "CYCLES":
+        cycles = getattr(scene, "cycles", None)
+        samples = [
+            getattr(cycles, "samples", None),
+            getattr(cycles, "use_adaptive_sampling", None),
+            getattr(cycles, "use_denoising", None),
+        ]
+    else:
+        samples = getattr(getattr(scene, "eevee", None), "taa_render_samples", None)
+    return {
+        "engine": engine,
+        "resolution": [render.resolution_x, render.resolution_y, render.resolution_percentage],
+        "pixel_aspect": [render.pixel_aspect_x, render.pixel_aspect_y],
+        "film_transparent": render.film_transparent,
+        "samples": samples,
+        "format": [image_settings.file_format, image_settings.color_mode, image_settings.color_depth],
+        "color": [view.view_transform, view.look, view.exposure, view.gamma],
+        "world": _data_with_nodes_state(getattr(scene, "world", None)),
+    }
+
+
+def object_state(obj) -> Dict[str, object]:
+    data = getattr(obj, "data", None)
+    out: Dict[str, object] = {
+        "name": obj.name,
+        "type": obj.type,
+        "matrix": _matrix_values(obj.matrix_world),
+        "data": getattr(data, "name", None),
+    }
+    if obj.type == "MESH" and data is not None:
+        out["size"] = [len(data.vertices), len(data.polygons)]
+    elif obj.type == "LIGHT":
+        out["light"] = _data_with_nodes_state(data)
+    elif obj.type == "CAMERA" and data is not None:
+        out["camera"] = rna_state(data)
+    try:
+        out["materials"] = [getattr(slot.material, "name", None) for slot in obj.material_slots]
+    except Exception:
+        pass
+    try:
+        out["modifiers"] = [[mod.name, mod.type, mod.show_render, rna_state(mod)] for mod in obj.modifiers]
+    except Exception:
+        pass
+    return out
+
+
+def mesh_digest(mesh) -> Optional[str]:
+    """SHA-1 of vertex positions, face corners and material indices (None when unreadable)."""
+    try:
+        coords = array("f", [0.0]) * (len(mesh.vertices) * 3)
+        mesh.vertices.foreach_get("co", coords)
+        corners = array("i", [0]) * len(mesh.loops)
+        mesh.loops.foreach_get("vertex_index", corners)
+        sizes = array("i", [0]) * len(mesh.polygons)
+        mesh.polygons.foreach_get("loop_total", sizes)
+        mat_indices = array("i", [0]) * len(mesh.polygons)
+        mesh.polygons.foreach_get("material_index", mat_indices)
+    except Exception:
+        return None
+    digest = hashlib.sha1()
+    for values in (coords, corners, sizes, mat_indices):
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def material_state(material) -> Dict[str, object]:
+    """Node setup of a material: node types, unlinked input values, images and links."""
+    if material is None:
+        return {}
+    out: Dict[str, object] = {
+        "name": material.name,
+        "blend": getattr(material, "blend_method", None),
+        "color": _plain(getattr(material, "diffuse_color", None)),
+    }
+    tree = getattr(material, "node_tree", None) if getattr(material, "use_nodes", False) else None
+    out.update(node_tree_state(tree))
+    return out
+
+
+def evaluated_geometry_digest(obj, depsgraph=None) -> Optional[str]:
+    """`mesh_digest` of obj's evaluated geometry (modifiers, shape keys, armature deformation)."""
+    evaluated = obj
+    if depsgraph is not None:
+        try:
+            evaluated = obj.evaluated_get(depsgraph)
+        except Exception:
+            return None
+    try:
+        mesh = evaluated.to_mesh()
+    except Exception:
+        return None
+    if mesh is None:
+        return None
+    try:
+        return mesh_digest(mesh)
+    finally:
+        try:
+            evaluated.to_mesh_clear()
+        except Exception:
+            pass
+
+
+def content_extra(depsgraph=None) -> Callable[[object], Dict[str, object]]:
+    """``object_extra`` for `render_fingerprint` adding evaluated geometry digests and material states.
+
+    Pass the evaluated depsgraph so deformation, modifiers and curve/text
+    geometry are digested. Digests are memoized per object / material and
+    frame, so create one per render batch and drop it afterwards. Objects
+    whose data cannot be digested get a random token and are never skipped.
+    """
+    geometry: Dict[tuple, Optional[str]] = {}
+    materials: Dict[tuple, Dict[str, object]] = {}
+
+    def _frame():
+        return getattr(getattr(depsgraph, "scene", None), "frame_current", None)
+
+    def _extra(obj) -> Dict[str, object]:
+        out: Dict[str, object] = {}
+        frame = _frame()
+        if obj.type in GEOMETRY_TYPES:
+            key = (obj.as_pointer(), frame)
+            if key not in geometry:
+                geometry[key] = evaluated_geometry_digest(obj, depsgraph)
+            out["data_digest"] = geometry[key]
+        if obj.type not in NO_GEOMETRY_TYPES and out.get("data_digest") is None:
+            out["undigested"] = os.urandom(8).hex()
+        states = []
+        try:
+            slots = list(obj.material_slots)
+        except Exception:
+            slots = []
+        for slot in slots:
+            material = slot.material
+            if material is None:
+                states.append({})
+                continue
+            key = (material.as_pointer(), frame)
+            if key not in materials:
+                try:
+                    materials[key] = material_state(material)
+                except Exception:
+                    materials[key] = {"name": material.name}
+            states.append(materials[key])
+        out["material_states"] = states
+        return out
+
+    return _extra
+
+
+def renderable_objects(scene, view_layer=None) -> List[object]:
+    """Objects of the view layer that render (object and every owning collection not render-hidden)."""
+    layer = view_layer or scene.view_layers[0]
+    objects = []
+    for obj in layer.objects:
+        if obj.hide_render:
+            continue
+        collections = list(getattr(obj, "users_collection", []) or [])
+        if collections and all(getattr(coll, "hide_render", False) for coll in collections):
+            continue
+        objects.append(obj)
+    return objects
+
+
+def render_fingerprint(
+    scene,
+    camera,
+    *,
+    objects: Optional[Iterable[object]] = None,
+    view_layer=None,
+    extra: Optional[Dict[str, object]] = None,
+    object_extra: Optional[Callable[[object], Dict[str, object]]] = None,
+) -> str:
+    """Hash of the state that determines the still rendered from camera at the current frame."""
+    if objects is None:
+        objects = renderable_objects(scene, view_layer)
+    described = []
+    for obj in objects:
+        state = object_state(obj)
+        if object_extra is not None:
+            state.update(object_extra(obj))
+        described.append(state)
+    described.sort(key=lambda item: str(item["name"]))
+    return stable_digest(
+        {
+            "frame": int(scene.frame_current),
+            "camera": camera_state(camera),
+            "render": render_settings_state(scene),
+            "objects": described,
+            "extra": extra or {},
+        }
+    )
+
+
+def apply_preview_samples(scene, samples: int, resolution_percentage: Optional[int] = None) -> Callable[[], None]:
+    """Lower render samples (and optionally resolution); returns a callable restoring the previous values."""
+    saved = []
+
+    def _set(owner, attr, value):
+        if owner is None or not hasattr(owner, attr):
+            return
+        saved.append((owner, attr, getattr(owner, attr)))
+        setattr(owner, attr, value)
+
+    samples = max(1, int(samples))
+    _set(getattr(scene, "cycles", None), "samples", samples)
+    _set(getattr(scene, "eevee", None), "taa_render_samples", samples)
+    if resolution_percentage is not None:
+        _set(scene.render, "resolution_percentage", max(1, min(100, int(resolution_percentage))))
+
+    def _restore():
+        for owner, attr, value in reversed(saved):
+            try:
+                setattr(owner, attr, value)
+            except Exception:
+                pass
+
+    return _restore
+
+
+__all__ = [
+    "apply_preview_samples",
+    "camera_state",
+    "content_extra",
+    "evaluated_geometry_digest",
+    "material_state",
+    "mesh_digest",
+    "node_tree_state",
+    "object_state",
+    "render_fingerprint",
+    "render_settings_state",
+    "renderable_objects",
+    "rna_state",
+]
@@ -0,0 +1,100 @@
+"""
+Background Render Worker
+
+Script run by headless Blender processes started for Render Shots (RAW) in
+background mode:
+
+    blender -b snapshot.blend -t N --python render_worker.py -- manifest.json
+
+The manifest lists the scene and the tasks of this worker (SHOT root name,
+frame, camera name, output path, key). For every task the worker isolates the
+SHOT (other SHOT roots stop rendering, the SHOT subtree is enabled), sets frame
+and camera, renders a still and appends a progress record to the manifest's
+progress file. The snapshot is a throwaway copy, so nothing is restored.
+
+This file is executed by Blender directly and must not import the add-on.
+"""
+
+import json
+import re
+import sys
+import traceback
+
+import bpy
+
+
+_SHOT_ROOT_RE = re.compile(r"^SHOT (\d{2,3})$")
+
+
+def _manifest_path() -> str:
+    argv = sys.argv
+    if "--" not in argv:
+        raise SystemExit("render_worker: missing '-- manifest.json'")
+    return argv[argv.index("--") + 1]
+
+
+def _iter_layer_subtree(layer):
+    stack = [layer]
+    while stack:
+        lc = stack.pop()
+        yield lc
+        stack.extend(list(lc.children))
+
+
+def _isolate_shot(scene, view_layer, shot_name: str) -> None:
+    target = None
+    for coll in scene.collection.children:
+        if not _SHOT_ROOT_RE.match(coll.name):
+            continue
+        if coll.name == shot_name:
+            target = coll
+            coll.hide_render = False
+        else:
+            coll.hide_render = True
+    if target is None:
+        raise RuntimeError(f"SHOT '{shot_name}' not found")
+    for lc in view_layer.layer_collection.children:
+        if not _SHOT_ROOT_RE.match(lc.collection.name):
+            continue
+        if lc.collection is target:
+            for sub in _iter_layer_subtree(lc):
+                sub.exclude = False
+                sub.collection.hide_render = False
+        else:
+            lc.exclude = True
+
+
+def _render_task(scene, view_layer, task: dict) -> None:
+    _isolate_shot(scene, view_layer, task["shot"])
+    camera = bpy.data.objects.get(task["camera"])
+    if camera is None:
+        raise RuntimeError(f"camera '{task['camera']}' not found")
+    scene.frame_set(int(task["frame"]))
+    scene.camera = camera
+    scene.render.filepath = task["output"]
+    result = bpy.ops.render.render(write_still=True, scene=scene.name)
+    if "FINISHED" not in result:
+        raise RuntimeError(f"render returned {sorted(result)}")
+
+
+def main() -> None:
+    with open(_manifest_path(), "r", encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    scene = bpy.data.scenes.get(manifest.get("scene") or "") or bpy.context.scene
+    view_layer = scene.view_layers.get(manifest.get("view_layer") or "") or scene.view_layers[0]
+    with open(manifest["progress"], "a", encoding="utf-8", newline="\n") as progress:
+        for task in manifest.get("tasks", []):
+            record = {"key": task["key"], "output": task.get("output")}
+            try:
+                _render_task(scene, view_layer, task)
+                record["status"] = "done"
+            except Exception as ex:
+                traceback.print_exc()
+                record["status"] = "failed"
+                record["error"] = str(ex)
+            progress.write(json.dumps(record, ensure_ascii=False) + "\n")
+            progress.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,8 @@ from pathlib import Path
 
 import bpy
 
+from ..core.name_registry import NameRegistry, numbered_suffix
+from ..core.shot_data_policy import COPY, OVERRIDE_PROP, ShotDataPolicy, first_override
 from ..core.validate_scene import parse_shot_index, get_shot_child_by_basename
 from ..data import SHOT_TREE, C_CAM, C_MAIN_FMT, C_PROPS, C_BG
 
@@ -257,7 +259,51 @@ def _project_name_for_scene(scene: bpy.types.Scene) -> str:
         return "Project"
 
 
-def duplicate_shot(scene: bpy.types.Scene, src_shot: bpy.types.Collection, dst_index: int) -> bpy.types.Collection:
+def shot_data_policy_from_prefs() -> ShotDataPolicy:
+    try:
+        prefs = bpy.context.preferences.addons[__package__.split(".")[0]].preferences
+        return ShotDataPolicy.from_settings(
+            getattr(prefs, "shot_duplicate_data", ""),
+            getattr(prefs, "shot_duplicate_link_types", ""),
+        )
+    except Exception:
+        return ShotDataPolicy()
+
+
+def _data_is_animated(data) -> bool:
+    """True when data (or its shape keys) has an action or drivers."""
+    for owner in (data, getattr(data, "shape_keys", None)):
+        anim = getattr(owner, "animation_data", None)
+        if anim is None:
+            continue
+        try:
+            if anim.action is not None or len(anim.drivers) > 0:
+                return True
+        except Exception:
+            return True
+    return False
+
+
+def make_object_data_single_user(obj: bpy.types.Object) -> bool:
+    """Give obj its own copy of a shared data block (copy-on-edit for linked SHOT duplicates)."""
+    data = getattr(obj, "data", None)
+    if data is None or getattr(data, "users", 1) <= 1:
+        return False
+    try:
+        obj.data = data.copy()
+    except Exception:
+        return False
+    return True
+
+
+def duplicate_shot(
+    scene: bpy.types.Scene,
+    src_shot: bpy.types.Collection,
+    dst_index: int,
+    policy: ShotDataPolicy | None = None,
+) -> bpy.types.Collection:
+    """Duplicate src_shot as SHOT dst_index; object data is copied or linked according to policy."""
+    policy = policy or shot_data_policy_from_prefs()
     # Crear solo el root del SHOT destino sin prepopular subcolecciones
     name = _format_shot_name(dst_index)
     if _find_child_by_name(scene.collection, name):
@@ -267,6 +313,7 @@ def duplicate_shot(scene: bpy.types.Scene, src_shot: bpy.types.Collection, dst_i
 
     # Phase 1: replicate collection tree from source, but rename subcollections to new SH## prefix
     coll_map: Dict[bpy.types.Collection, bpy.types.Collection] = {src_shot: dst_shot}
+    src_parent: Dict[bpy.types.Collection, bpy.types.Collection] = {}
 
     _SH_PREFIX_RE = re.compile(r"^SH(\d{2,3})_(.+)$")
 
@@ -299,6 +346,7 @@ def duplicate_shot(scene: bpy.types.Scene, src_shot: bpy.types.Collection, dst_i
                 pass
             dst_parent.children.link(new_child)
             coll_map[child] = new_child
+            src_parent.setdefault(child, src)
             clone_tree(child)
 
     # Copy color tag for root too
@@ -340,14 +388,39 @@ def duplicate_shot(scene: bpy.types.Scene, src_shot: bpy.types.Collection, dst_i
         if dot and rest.isdigit() and len(rest) == 3:
             return core, "." + rest
         return n, ""
+
+    def _data_override(src_obj: bpy.types.Object, colls: List[bpy.types.Collection]):
+        """Nearest lime_dup_data override: object first, then its collections up to the SHOT root."""
+        values = [src_obj.get(OVERRIDE_PROP)]
+        for coll in colls:
+            cur = coll
+            while cur is not None:
+                values.append(cur.get(OVERRIDE_PROP))
+                cur = src_parent.get(cur)
+        return first_override(values)
+
+    # Duplicates that received their own data block; only those get their data renamed
+    copied_data: set = set()
+
+    def _rename_data(dup_obj: bpy.types.Object, new_name: str) -> None:
+        if dup_obj in copied_data and getattr(dup_obj, "data", None) is not None:
+            dup_obj.data.name = new_name + ".Data"
+
     for src_obj, colls in obj_to_colls.items():
         dup = src_obj.copy()
-        # Duplicate data for cameras/lights/rigs; duplicate others as well to keep shots isolated
+        # Cameras/lights/rigs and animated data are copied; static geometry stays linked unless overridden
         if src_obj.data is not None:
-            try:
-                dup.data = src_obj.data.copy()
-            except Exception:
-                pass
+            action = policy.data_action(
+                src_obj.type,
+                animated=_data_is_animated(src_obj.data),
+                override=_data_override(src_obj, colls),
+            )
+            if action == COPY:
+                try:
+                    dup.data = src_obj.data.copy()
+                    copied_data.add(dup)
+                except Exception:
+                    pass
         obj_map[src_obj] = dup
         # Link duplicate to each mirrored collection
         for c in colls:
@@ -364,8 +437,7 @@ def duplicate_shot(scene: bpy.types.Scene, src_shot: bpy.types.Collection, dst_i
                     cam_idx = int(m.group(2))
                     new_name = f"SHOT_{dst_index:02d}_CAMERA_{cam_idx}"
                     dup.name = new_name
-                    if getattr(dup, "data", None) is not None:
-                        dup.data.name = new_name + ".Data"
+                    _rename_data(dup, new_name)
                 else:
                     # Fall back to generic SH##_ rename if matches that scheme
                     m2 = _SHOBJ_PREFIX_RE.match(core)
@@ -373,16 +445,14 @@ def duplicate_shot(scene: bpy.types.Scene, src_shot: bpy.types.Collection, dst_i
                         base = m2.group(2)
                         new_name = f"SH{dst_index:02d}_{base}{suffix}"
                         dup.name = new_name
-                        if getattr(dup, "data", None) is not None:
-                            dup.data.name = new_name + ".Data"
+                        _rename_data(dup, new_name)
             else:
                 m2 = _SHOBJ_PREFIX_RE.match(core)
                 if m2:
                     base = m2.group(2)
                     new_name = f"SH{dst_index:02d}_{base}{suffix}"
                     dup.name = new_name
-                    if getattr(dup, "data", None) is not None:
-                        dup.data.name = new_name + ".Data"
+                    _rename_data(dup, new_name)
         except Exception:
             pass
 
@@ -517,46 +587,40 @@ def duplicate_shot(scene: bpy.types.Scene, src_shot: bpy.types.Collection, dst_i
                     cameras.sort(key=lambda o: o.name)
                 except Exception:
                     pass
+                # Object names snapshot once; kept current as cameras and rigs are renamed
+                names = NameRegistry(bpy.data.objects.keys())
                 # Avoid name collisions: temp names first
                 temp_map = {}
                 for cam in cameras:
                     base = f"__TMP_CAM__{cam.name}"
-                    tmp = base
-                    guard = 1
                     try:
-                        while tmp in bpy.data.objects.keys():
-                            if bpy.data.objects[tmp] is cam:
-                                break
-                            guard += 1
-                            tmp = f"{base}_{guard}"
+                        tmp = names.unique(base, current=cam.name, suffix=numbered_suffix)
+                        old_name = cam.name
                         cam.name = tmp
-                        if getattr(cam, 'data', None) is not None:
-                            try:
-                                cam.data.name = tmp + ".Data"
-                            except Exception:
-                                pass
+                        names.rename(old_name, cam.name)
+                        try:
+                            _rename_data(cam, tmp)
+                        except Exception:
+                            pass
                         temp_map[cam] = tmp
                     except Exception:
                         temp_map[cam] = cam.name
                 # Final names
                 for i, cam in enumerate(cameras, 1):
                     target = f"SHOT_{dst_index:02d}_CAMERA_{i}"
-                    final = target
-                    guard = 1
                     try:
-                        while final in bpy.data.objects.keys() and bpy.data.objects[final] is not cam:
-                            guard += 1
-                            final = f"{target}_{guard}"
+                        final = names.unique(target, current=cam.name, suffix=numbered_suffix)
+                        old_name = cam.name
                         cam.name = final
-                        if getattr(cam, 'data', None) is not None:
-                            try:
-                                cam.data.name = final + ".Data"
-                            except Exception:
-                                pass
+                        names.rename(old_name, cam.name)
+                        try:
+                            _rename_data(cam, final)
+                        except Exception:
+                            pass
                         # Rename parent armature rig to match new shot and camera indices
                         try:
                             from ..ops.ops_cameras import _rename_parent_armature_for_camera
-                            _rename_parent_armature_for_camera(cam, shot_idx_hint=dst_index, cam_idx_hint=i)
+                            _rename_parent_armature_for_camera(cam, shot_idx_hint=dst_index, cam_idx_hint=i, names=names)
                         except Exception:
                             pass
                     except Exception:
@@ -86,6 +86,8 @@ class LIME_TB_PT_ai_textures_organizer(Panel):
         )
         if bool(getattr(state, "is_busy", False)):
             header.label(text="Working...", icon="TIME")
+            if getattr(state, "progress_text", ""):
+                header.label(text=str(state.progress_text))
         if bool(getattr(state, "ai_blocked", False)):
             alert = layout.box()
             alert.alert = True
@@ -118,6 +120,7 @@ class LIME_TB_PT_ai_textures_analyze(Panel):
         col.enabled = not bool(getattr(state, "is_busy", False))
         col.prop(state, "scan_scope", text="Scope")
         col.prop(state, "ai_include_preview", text="AI include preview (low-res)")
+        col.prop(state, "incremental_analyze", text="Reuse unchanged results")
         col.operator("lime.texture_analyze", text="Analyze Textures", icon="FILE_REFRESH")
 
 
@@ -16,9 +16,11 @@ from bpy.props import (
     IntProperty,
 )
 import re
+import time
 from pathlib import Path
 
 from ..core import validate_scene
+from ..data.templates import C_CAM
 from ..scene.scene_utils import ensure_camera_margin_backgrounds
 
 
@@ -53,6 +55,171 @@ def _camera_has_rig(cam_obj) -> bool:
     return False
 
 
+# Camera list sync. The depsgraph handler only looks at what changed: object
+# additions/removals (object count), collection membership, scene camera and
+# selection/rename updates (object updates without transform or geometry flags).
+# Transform and geometry edits are ignored; relevant changes are coalesced into
+# one debounced timer that rebuilds the list only when the camera names differ.
+_CAM_SYNC_DEBOUNCE = 0.15
+_CAM_SYNC = {"pending": False, "deadline": 0.0, "signature": None}
+# Camera object pointer -> name for the cameras currently listed (rename detection).
+_CAM_REGISTRY = {}
+
+
+def _pointer(value) -> int:
+    if value is None:
+        return 0
+    try:
+        return int(value.as_pointer())
+    except Exception:
+        return id(value)
+
+
+def _cams_in_scene(scene, prefer_active_shot: bool = True):
+    try:
+        if prefer_active_shot:
+            shot = validate_scene.active_shot_context(bpy.context)
+            if shot:
+                cam_coll = validate_scene.get_shot_child_by_basename(shot, C_CAM)
+                if cam_coll:
+                    return [o for o in cam_coll.objects if getattr(o, 'type', None) == 'CAMERA']
+    except Exception:
+        pass
+    try:
+        return [o for o in scene.objects if getattr(o, 'type', None) == 'CAMERA']
+    except Exception:
+        return []
+
+
+def _cam_token(scene, cams) -> str:
+    names = sorted(getattr(o, 'name', '') or '' for o in cams)
+    return f"{getattr(scene, 'name', '')}:{len(names)}|" + "|".join(names)
+
+
+def _compute_cam_token(scene=None) -> str:
+    try:
+        sc = scene or bpy.context.scene
+        return _cam_token(sc, _cams_in_scene(sc))
+    except Exception:
+        return ""
+
+
+def _fill_cam_items(scene, cams=None):
+    try:
+        items = getattr(scene, 'lime_render_cameras', None)
+        if items is None:
+            return
+        items.clear()
+        cams = list(cams) if cams is not None else _cams_in_scene(scene, prefer_active_shot=True)
+        cams.sort(key=lambda cam_obj: _camera_name_sort_key(getattr(cam_obj, "name", "") or ""))
+        seen_names = set()
+        for cam in cams:
+            name = getattr(cam, 'name', '') or ''
+            if not name or name in seen_names:
+                continue
+            seen_names.add(name)
+            it = items.add()
+            it.name = name
+        try:
+            active_name = getattr(scene.camera, 'name', '') if getattr(scene, 'camera', None) else ''
+            if active_name:
+                for i, it in enumerate(items):
+                    if it.name == active_name:
+                        scene.lime_render_cameras_index = i
+                        break
+        except Exception:
+            pass
+    except Exception:
+        pass
+
+
+def _cam_sync_signature(scene) -> tuple:
+    """Cheap state the listed cameras depend on besides collection membership."""
+    ctx = bpy.context
+    try:
+        object_count = len(bpy.data.objects)
+    except Exception:
+        object_count = -1
+    try:
+        active_layer = ctx.view_layer.active_layer_collection.collection
+    except Exception:
+        active_layer = None
+    return (
+        _pointer(scene),
+        object_count,
+        _pointer(getattr(scene, 'camera', None)),
+        _pointer(getattr(ctx, 'active_object', None)),
+        _pointer(active_layer),
+    )
+
+
+def _sync_cam_list(scene, force: bool = False) -> bool:
+    """Rebuild the camera list of scene when its camera names changed; returns True when rebuilt."""
+    cams = _cams_in_scene(scene)
+    cur = _cam_token(scene, cams)
+    _CAM_REGISTRY.clear()
+    _CAM_REGISTRY.update({_pointer(o): getattr(o, 'name', '') for o in cams})
+    _CAM_SYNC["signature"] = _cam_sync_signature(scene)
+    if not force and cur == (getattr(scene, 'lime_render_cameras_token', '') or ''):
+        return False
+    _fill_cam_items(scene, cams)
+    scene.lime_render_cameras_token = cur
+    return True
+
+
+def _cam_sync_timer():
+    remaining = _CAM_SYNC["deadline"] - time.monotonic()
+    if remaining > 0.0:
+        return remaining
+    _CAM_SYNC["pending"] = False
+    try:
+        scene = bpy.context.scene
+        if scene is not None:
+            _sync_cam_list(scene)
+    except Exception:
+        pass
+    return None
+
+
+def _schedule_cam_sync() -> None:
+    _CAM_SYNC["deadline"] = time.monotonic() + _CAM_SYNC_DEBOUNCE
+    if _CAM_SYNC["pending"]:
+        return
+    try:
+        bpy.app.timers.register(_cam_sync_timer, first_interval=_CAM_SYNC_DEBOUNCE)
+        _CAM_SYNC["pending"] = True
+    except Exception:
+        pass
+
+
+def _cam_updates_relevant(depsgraph) -> bool:
+    if depsgraph is None:
+        return True
+    if depsgraph.id_type_updated('COLLECTION'):
+        return True
+    for update in depsgraph.updates:
+        ob = getattr(update.id, 'original', update.id)
+        if not isinstance(ob, bpy.types.Object):
+            continue
+        if getattr(ob, 'type', None) == 'CAMERA' and _CAM_REGISTRY.get(_pointer(ob)) != ob.name:
+            return True
+        if not (update.is_updated_transform or update.is_updated_geometry):
+            # Selection, rename, visibility or relink: may change the active SHOT or its cameras.
+            return True
+    return False
+
+
+def _cam_depsgraph_update_post(scene, depsgraph=None):
+    scene = bpy.context.scene
+    if scene is None:
+        return
+    try:
+        if _CAM_SYNC["signature"] != _cam_sync_signature(scene) or _cam_updates_relevant(depsgraph):
+            _schedule_cam_sync()
+    except Exception:
+        _schedule_cam_sync()
+
+
 class LIME_PT_render_cameras(Panel):
     """Cameras manager panel in 3D Viewport > UI > Lime Pipeline."""
     bl_space_type = 'VIEW_3D'
@@ -255,103 +422,6 @@ def register_camera_list_props():
 
     bpy.types.Scene.lime_render_cameras_token = StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
 
-    from ..data.templates import C_CAM
-    def _cams_in_scene(scene, prefer_active_shot: bool = True):
-        try:
-            if prefer_active_shot:
-                shot = validate_scene.active_shot_context(bpy.context)
-                if shot:
-                    cam_coll = validate_scene.get_shot_child_by_basename(shot, C_CAM)
-                    if cam_coll:
-                        return [o for o in cam_coll.objects if getattr(o, 'type', None) == 'CAMERA']
-        except Exception:
-            pass
-        try:
-            return [o for o in scene.objects if getattr(o, 'type', None) == 'CAMERA']
-        except Exception:
-            return []
-
-    def _compute_cam_token(scene=None) -> str:
-        try:
-            sc = scene or bpy.context.scene
-            names = sorted([o.name for o in _cams_in_scene(sc)])
-            return f"{getattr(sc, 'name', '')}:{len(names)}|" + "|".join(names)
-        except Exception:
-            return ""
-
-    def _fill_cam_items(scene):
-        try:
-            items = getattr(scene, 'lime_render_cameras', None)
-            if items is None:
-                return
-            items.clear()
-            cams = _cams_in_scene(scene, prefer_active_shot=True)
-            cams.sort(key=lambda cam_obj: _camera_name_sort_key(getattr(cam_obj, "name", "") or ""))
-            seen_names = set()
-            for cam in cams:
-                name = getattr(cam, 'name', '') or ''
-                if not name or name in seen_names:
-                    continue
-                seen_names.add(name)
-                it = items.add()
-                it.name = name
-            try:
-                active_name = getattr(scene.camera, 'name', '') if getattr(scene, 'camera', None) else ''
-                if active_name:
-                    for i, it in enumerate(items):
-                        if it.name == active_name:
-                            scene.lime_render_cameras_index = i
-                            break
-            except Exception:
-                pass
-        except Exception:
-            pass
-
-    def _cam_depsgraph_update_post(_deps):
-        scene = bpy.context.scene
-        if scene is None:
-            return
-        try:
-            cur = _compute_cam_token(scene)
-            prev = getattr(scene, 'lime_render_cameras_token', '') or ''
-            if cur != prev:
-                _fill_cam_items(scene)
-                scene.lime_render_cameras_token = cur
-                # Always do recheck to ensure consistency, but with improved logic
-                def _recheck():
-                    try:
-                        sc = bpy.context.scene
-                        if sc is None:
-                            return None
-                        now = _compute_cam_token(sc)
-                        prev2 = getattr(sc, 'lime_render_cameras_token', '') or ''
-                        if now != prev2:
-                            _fill_cam_items(sc)
-                            sc.lime_render_cameras_token = now
-                        # Also check again after a short delay to catch any remaining changes
-                        def _delayed_recheck():
-                            try:
-                                s = bpy.context.scene
-                                if s is None:
-                                    return None
-                                current = _compute_cam_token(s)
-                                prev3 = getattr(s, 'lime_render_cameras_token', '') or ''
-                                if current != prev3:
-                                    _fill_cam_items(s)
-                                    s.lime_render_cameras_token = current
-                            except Exception:
-                                pass
-                            return None
-                        import bpy as _bpy3
-                        _bpy3.app.timers.register(_delayed_recheck, first_interval=0.2)
-                    except Exception:
-                        pass
-                    return None
-                import bpy as _bpy2
-                _bpy2.app.timers.register(_recheck, first_interval=0.1)
-        except Exception:
-            pass
-
     global _CAM_LIST_HANDLER
     if _CAM_LIST_HANDLER is None:
         _CAM_LIST_HANDLER = _cam_depsgraph_update_post
@@ -360,10 +430,7 @@ def register_camera_list_props():
     try:
         scene = bpy.context.scene
         if scene is not None:
-            cur = _compute_cam_token(scene)
-            if cur != (getattr(scene, 'lime_render_cameras_token', '') or ''):
-                _fill_cam_items(scene)
-                scene.lime_render_cameras_token = cur
+            _sync_cam_list(scene)
     except Exception:
         pass
 
@@ -385,6 +452,14 @@ def unregister_camera_list_props():
         except Exception:
             pass
         _CAM_LIST_HANDLER = None
+    try:
+        if bpy.app.timers.is_registered(_cam_sync_timer):
+            bpy.app.timers.unregister(_cam_sync_timer)
+    except Exception:
+        pass
+    _CAM_SYNC["pending"] = False
+    _CAM_SYNC["signature"] = None
+    _CAM_REGISTRY.clear()
     for cls in (
         LIME_UL_render_cameras,
         LimeRenderCamItem,
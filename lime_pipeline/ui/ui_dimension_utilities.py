@@ -151,7 +151,7 @@ class LIME_PT_dimension_utilities(Panel):
         if state is not None:
             dim_box.prop(state, "dimension_orientation_mode", text="Orientation Mode")
             lock_row = dim_box.row()
-            lock_row.enabled = state.dimension_orientation_mode == 'PCA3D'
+            lock_row.enabled = state.dimension_orientation_mode in {'PCA3D', 'MIN_VOLUME'}
             lock_row.prop(state, "dimension_lock_z_up", text="Lock Z-Up")
         op = dim_box.operator("lime.dimension_envelope", text="Dimension Checker", icon='MESH_CUBE')
         if state is not None:
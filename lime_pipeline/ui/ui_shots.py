@@ -70,12 +70,26 @@ class LIME_PT_shots(Panel):
         col.separator()
         col.operator("lime.sync_shot_list", text='', icon='FILE_REFRESH')
         col.operator("lime.duplicate_shot_and_sync", text='', icon='DUPLICATE')
+        col.operator("lime.make_shot_data_unique", text='', icon='UNLINKED')
         col.operator("lime.add_missing_collections", text='', icon='WARNING_LARGE')
 
         layout.separator()
         render_box = layout.box()
         render_box.label(text="RAW Renders per SHOT", icon='RENDER_STILL')
         render_box.operator("lime.render_shots_from_markers", text="Render Shots (RAW)", icon='RENDER_STILL')
+        bg_row = render_box.row(align=True)
+        op = bg_row.operator("lime.render_shots_from_markers", text="Render Shots (Background)", icon='RENDER_RESULT')
+        op.mode = 'BACKGROUND'
+        try:
+            from ..ops.ops_shots import background_render_job
+            job = background_render_job()
+        except Exception:
+            job = None
+        if job is not None:
+            status = render_box.row(align=True)
+            status.label(text=job.summary(), icon='TIME' if job.running else ('ERROR' if job.failed else 'CHECKMARK'))
+            status.operator("lime.render_shots_background_cancel", text='', icon='CANCEL')
+            status.operator("lime.render_shots_background_retry", text='', icon='FILE_REFRESH')
 
 
 
@@ -87,7 +101,7 @@ class LIME_UL_shots(UIList):
     bl_idname = "LIME_UL_shots"
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index=0):
-        active_shot = validate_scene.active_shot_context(context)
+        active_shot = validate_scene.active_shot_for_draw(context)
         is_active = False
         try:
             is_active = (active_shot is not None and active_shot.name == item.name)
@@ -34,7 +34,7 @@ class LIME_PT_stage_setup(Panel):
 
     def draw(self, ctx):
         layout = self.layout
-        shot_active = validate_scene.active_shot_context(ctx)
+        shot_active = validate_scene.active_shot_for_draw(ctx)
 
         layout.operator("lime.duplicate_scene_sequential", text="Duplicate Shot Scene", icon='SCENE_DATA')
         row = layout.row()
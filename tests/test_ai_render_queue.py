@@ -0,0 +1,123 @@
+from concurrent.futures import Future
+import importlib.util
+import pathlib
+import random
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "ai_render_queue.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.ai_render_queue",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+ai_render_queue = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+ai_render_queue.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.ai_render_queue"] = ai_render_queue
+SPEC.loader.exec_module(ai_render_queue)  # type: ignore[arg-type]
+
+
+def _queue(count, **kwargs):
+    jobs = [ai_render_queue.ConversionJob(key=f"F{i:04d}", frame=i) for i in range(1, count + 1)]
+    return ai_render_queue.ConversionQueue(jobs, rng=random.Random(7), **kwargs)
+
+
+class FrameListTests(unittest.TestCase):
+    def test_parse_frame_list_expands_ranges_and_dedupes(self):
+        self.assertEqual(ai_render_queue.parse_frame_list("12, 1; 20-22, 21, 5-3"), [1, 3, 4, 5, 12, 20, 21, 22])
+        self.assertEqual(ai_render_queue.parse_frame_list(""), [])
+
+    def test_parse_frame_list_rejects_garbage(self):
+        with self.assertRaises(ValueError):
+            ai_render_queue.parse_frame_list("1, abc")
+
+
+class ConversionQueueTests(unittest.TestCase):
+    def test_submissions_respect_max_in_flight(self):
+        queue = _queue(40, max_in_flight=3)
+        taken = queue.take_submissions(0.0)
+        self.assertEqual([job.key for job in taken], ["F0001", "F0002", "F0003"])
+        self.assertEqual(queue.take_submissions(0.0), [])
+
+        queue.mark_submitted(taken[0], "job-1", "QUEUED", 0.0)
+        self.assertEqual(queue.take_submissions(0.0), [])
+        queue.record_poll(taken[0], "COMPLETED", 5.0)
+        self.assertEqual(taken[0].status, ai_render_queue.JOB_DOWNLOADING)
+        self.assertEqual([job.key for job in queue.take_submissions(5.0)], ["F0004"])
+
+    def test_poll_schedule_slows_running_jobs(self):
+        queue = _queue(1, poll_interval=2.0, max_poll_interval=6.0)
+        job = queue.take_submissions(0.0)[0]
+        queue.mark_submitted(job, "job-1", "QUEUED", 0.0)
+        self.assertEqual(queue.due_for_poll(0.0), [])
+        self.assertEqual(queue.due_for_poll(10.0), [job])
+        for _ in range(5):
+            queue.record_poll(job, "PROCESSING", 10.0)
+        self.assertEqual(job.poll_interval, 6.0)
+        self.assertGreaterEqual(job.next_poll_at, 10.0 + 6.0 * 0.8)
+
+    def test_rate_limit_blocks_whole_queue_once_per_window(self):
+        queue = _queue(4, max_in_flight=2)
+        first, second = queue.take_submissions(0.0)
+        queue.mark_submitted(first, "a", "QUEUED", 0.0)
+        queue.mark_submitted(second, "b", "QUEUED", 0.0)
+        queue.record_rate_limited(first, 10.0)
+        queue.record_rate_limited(second, 10.0)
+        self.assertEqual(queue.backoff.level, 1)
+        blocked_until = queue.backoff.blocked_until
+        self.assertGreater(blocked_until, 10.0)
+        self.assertEqual(queue.due_for_poll(10.0), [])
+        self.assertEqual(queue.take_submissions(10.0), [])
+        self.assertTrue(queue.due_for_poll(blocked_until + 100.0))
+
+    def test_rate_limited_submission_is_retried_then_failed(self):
+        queue = _queue(1, max_submit_attempts=2)
+        job = queue.take_submissions(0.0)[0]
+        queue.mark_submit_failed(job, "429", 0.0, rate_limited=True)
+        self.assertEqual(job.status, ai_render_queue.JOB_PENDING)
+        job = queue.take_submissions(1000.0)[0]
+        queue.mark_submit_failed(job, "429", 1000.0, rate_limited=True)
+        self.assertEqual(job.status, ai_render_queue.JOB_FAILED)
+
+    def test_cancel_all_returns_remote_jobs_and_finishes_queue(self):
+        queue = _queue(3, max_in_flight=2)
+        first, second = queue.take_submissions(0.0)
+        queue.mark_submitted(first, "remote-1", "PROCESSING", 0.0)
+        remote = queue.cancel_all()
+        self.assertEqual([job.job_id for job in remote], ["remote-1"])
+        self.assertTrue(queue.is_done())
+        self.assertEqual(queue.counts()["cancelled"], 3)
+
+    def test_submit_resolving_after_cancel_cancels_remote_job(self):
+        cancelled = []
+        in_flight, failed, dropped = Future(), Future(), Future()
+        in_flight.set_running_or_notify_cancel()
+        failed.set_running_or_notify_cancel()
+        dropped.cancel()
+        for future in (in_flight, failed, dropped):
+            ai_render_queue.cancel_when_submitted(future, cancelled.append)
+        self.assertEqual(cancelled, [])
+        in_flight.set_result({"job_id": "remote-7", "status_raw": "queued"})
+        failed.set_exception(RuntimeError("boom"))
+        self.assertEqual(cancelled, ["remote-7"])
+
+
+if __name__ == "__main__":
+    unittest.main()
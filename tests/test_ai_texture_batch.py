@@ -0,0 +1,106 @@
+import importlib.util
+import pathlib
+import sys
+import types
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "ai_texture_batch.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.ai_texture_batch",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+module = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+module.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.ai_texture_batch"] = module
+SPEC.loader.exec_module(module)  # type: ignore[arg-type]
+
+plan_texture_batches = module.plan_texture_batches
+parse_texture_batch_response = module.parse_texture_batch_response
+texture_batch_entry = module.texture_batch_entry
+texture_item_id = module.texture_item_id
+
+
+class AITextureBatchTests(unittest.TestCase):
+    def test_plan_respects_item_cap(self):
+        batches = plan_texture_batches([10] * 10, budget_chars=10_000, max_items=4)
+        self.assertEqual(batches, [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+
+    def test_plan_respects_char_budget(self):
+        batches = plan_texture_batches([400, 400, 400, 5000, 100], budget_chars=1000, max_items=10)
+        self.assertEqual(batches, [[0, 1], [2], [3], [4]])
+
+    def test_entry_omits_empty_optional_fields(self):
+        entry = texture_batch_entry(
+            texture_item_id(0),
+            original_filename="wood.png",
+            material_name="MAT_Wood",
+            map_type="BaseColor",
+            socket_targets=["Base Color"],
+        )
+        self.assertEqual(entry["id"], "tx_001")
+        self.assertNotIn("manual_hint", entry)
+        self.assertNotIn("preview", entry)
+
+    def test_parse_requires_full_id_coverage(self):
+        parsed = {"items": [{"id": "tx_001", "stem": "Oak", "map_type": "BaseColor"}]}
+        out, err = parse_texture_batch_response(parsed, expected_ids=["tx_001", "tx_002"])
+        self.assertIsNone(out)
+        self.assertIn("missing IDs", err)
+
+    def test_parse_rejects_duplicates(self):
+        parsed = {
+            "items": [
+                {"id": "tx_001", "stem": "Oak", "map_type": "BaseColor"},
+                {"id": "tx_001", "stem": "Oak", "map_type": "BaseColor"},
+            ]
+        }
+        out, err = parse_texture_batch_response(parsed, expected_ids=["tx_001"])
+        self.assertIsNone(out)
+        self.assertIn("duplicated", err)
+
+    def test_parse_returns_entries_by_id(self):
+        parsed = {
+            "items": [
+                {"id": "tx_002", "stem": " Brushed_Steel ", "map_type": "Metallic"},
+                {"id": "tx_001", "stem": "Oak", "map_type": "BaseColor", "explanation": "wood"},
+            ]
+        }
+        out, err = parse_texture_batch_response(parsed, expected_ids=["tx_001", "tx_002"])
+        self.assertIsNone(err)
+        self.assertEqual(out["tx_002"]["stem"], "Brushed_Steel")
+        self.assertEqual(out["tx_001"]["explanation"], "wood")
+        self.assertEqual(out["tx_002"]["explanation"], "")
+
+    def test_parse_truncates_overlong_stem_and_keeps_batch(self):
+        parsed = {
+            "items": [
+                {"id": "tx_001", "stem": "Very_Long_" * 20, "map_type": "BaseColor"},
+                {"id": "tx_002", "stem": "Oak", "map_type": "BaseColor"},
+            ]
+        }
+        out, err = parse_texture_batch_response(parsed, expected_ids=["tx_001", "tx_002"])
+        self.assertIsNone(err)
+        self.assertLessEqual(len(out["tx_001"]["stem"]), 96)
+        self.assertTrue(out["tx_001"]["stem"].startswith("Very_Long_Very"))
+        self.assertEqual(out["tx_002"]["stem"], "Oak")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import importlib.util
+import os
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "asset_upload_cache.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.asset_upload_cache",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+asset_upload_cache = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+asset_upload_cache.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.asset_upload_cache"] = asset_upload_cache
+SPEC.loader.exec_module(asset_upload_cache)  # type: ignore[arg-type]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class AssetUploadCacheTests(unittest.TestCase):
+    def test_store_persists_and_requires_validation_in_new_session(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = pathlib.Path(tmp) / "cache.json"
+            clock = _Clock()
+            cache = asset_upload_cache.AssetUploadCache(cache_path, ttl_seconds=100, clock=clock)
+            cache.store("abc", {"id": "asset-1", "url": "https://example/a.png"})
+            self.assertFalse(cache.needs_validation("abc"))
+
+            reloaded = asset_upload_cache.AssetUploadCache(cache_path, ttl_seconds=100, clock=clock)
+            self.assertEqual(reloaded.lookup("abc"), {"id": "asset-1", "url": "https://example/a.png"})
+            self.assertTrue(reloaded.needs_validation("abc"))
+            reloaded.mark_validated("abc")
+            self.assertFalse(reloaded.needs_validation("abc"))
+
+    def test_entries_expire(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            clock = _Clock()
+            cache = asset_upload_cache.AssetUploadCache(pathlib.Path(tmp) / "cache.json", ttl_seconds=100, clock=clock)
+            cache.store("abc", {"id": "asset-1", "url": "https://example/a.png"})
+            clock.now += 101
+            self.assertIsNone(cache.lookup("abc"))
+
+    def test_invalidate_removes_entry(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = asset_upload_cache.AssetUploadCache(pathlib.Path(tmp) / "cache.json", clock=_Clock())
+            cache.store("abc", {"id": "asset-1", "url": "https://example/a.png"})
+            cache.invalidate("abc")
+            self.assertIsNone(cache.lookup("abc"))
+            self.assertTrue(cache.needs_validation("abc"))
+
+    def test_file_digest_memoized_by_stat_signature(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            image = root / "Style.png"
+            image.write_bytes(b"one")
+            cache = asset_upload_cache.AssetUploadCache(root / "cache.json", clock=_Clock())
+            first = cache.file_digest(image)
+            calls = []
+            original = asset_upload_cache._sha256_file
+            asset_upload_cache._sha256_file = lambda path: calls.append(path) or original(path)
+            try:
+                self.assertEqual(cache.file_digest(image), first)
+                self.assertEqual(calls, [])
+                image.write_bytes(b"two!")
+                st = image.stat()
+                os.utime(image, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+                self.assertNotEqual(cache.file_digest(image), first)
+                self.assertEqual(len(calls), 1)
+            finally:
+                asset_upload_cache._sha256_file = original
+
+
+if __name__ == "__main__":
+    unittest.main()
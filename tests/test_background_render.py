@@ -0,0 +1,159 @@
+import importlib.util
+import json
+import pathlib
+import tempfile
+import time
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "background_render.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.background_render",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+background_render = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+background_render.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.background_render"] = background_render
+SPEC.loader.exec_module(background_render)  # type: ignore[arg-type]
+
+
+FAKE_WORKER = """
+import json, sys, time
+manifest = json.load(open(sys.argv[1], encoding="utf-8"))
+with open(manifest["progress"], "a", encoding="utf-8") as fh:
+    for task in manifest["tasks"]:
+        if task.get("crash"):
+            sys.exit(3)
+        time.sleep(task.get("sleep", 0))
+        fh.write(json.dumps({"key": task["key"], "status": "done"}) + "\\n")
+        fh.flush()
+"""
+
+
+def _wait(job, timeout=20.0):
+    deadline = time.time() + timeout
+    events = []
+    while True:
+        events.extend(job.poll())
+        if not job.running or time.time() > deadline:
+            return events
+        time.sleep(0.02)
+
+
+class BackgroundRenderTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self._tmp.name)
+        self.script = self.root / "fake_worker.py"
+        self.script.write_text(FAKE_WORKER, encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _job(self, workers=2):
+        return background_render.BackgroundRenderJob(
+            self.root / "work",
+            lambda manifest: [sys.executable, str(self.script), str(manifest)],
+            workers=workers,
+            manifest_extra={"scene": "Scene"},
+        )
+
+    def test_shard_tasks_round_robin(self):
+        tasks = [{"key": str(i)} for i in range(5)]
+        shards = background_render.shard_tasks(tasks, 2)
+        self.assertEqual([[t["key"] for t in s] for s in shards], [["0", "2", "4"], ["1", "3"]])
+        self.assertEqual(len(background_render.shard_tasks(tasks[:1], 4)), 1)
+
+    def test_worker_threads_split_cores(self):
+        self.assertEqual(background_render.worker_threads(4, cpu_count=16), 4)
+        self.assertEqual(background_render.worker_threads(32, cpu_count=8), 1)
+
+    def test_read_progress_keeps_partial_line(self):
+        path = self.root / "p.jsonl"
+        path.write_text('{"key": "a", "status": "done"}\n{"key": "b"', encoding="utf-8")
+        records, offset = background_render.read_progress(path)
+        self.assertEqual([r["key"] for r in records], ["a"])
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(', "status": "done"}\n')
+        records, offset = background_render.read_progress(path, offset)
+        self.assertEqual([r["key"] for r in records], ["b"])
+        self.assertEqual(offset, path.stat().st_size)
+
+    def test_all_tasks_reported_done(self):
+        job = self._job(workers=3)
+        tasks = [{"key": f"SHOT 01|{i}|CAM"} for i in range(7)]
+        self.assertEqual(job.start(tasks), 3)
+        manifest = json.loads((self.root / "work" / "a01_w00.json").read_text(encoding="utf-8"))
+        self.assertEqual(manifest["scene"], "Scene")
+        events = _wait(job)
+        self.assertFalse(job.running)
+        self.assertEqual(len(events), 7)
+        self.assertEqual(set(job.done), {t["key"] for t in tasks})
+        self.assertEqual(job.failed, {})
+        self.assertEqual(job.summary(), "7/7 rendered")
+
+    def test_task_keeps_caller_fields(self):
+        job = self._job(workers=1)
+        job.start([{"key": "a", "fingerprint": "abc"}])
+        _wait(job)
+        self.assertEqual(job.task("a")["fingerprint"], "abc")
+        self.assertIsNone(job.task("missing"))
+
+    def test_crash_fails_unreported_tasks_and_retry_renders_them(self):
+        job = self._job(workers=1)
+        tasks = [{"key": "a"}, {"key": "b", "crash": True}, {"key": "c"}]
+        job.start(tasks)
+        _wait(job)
+        self.assertEqual(set(job.done), {"a"})
+        self.assertEqual(set(job.failed), {"b", "c"})
+        self.assertIn("code 3", job.failed["b"])
+
+        job._tasks["b"].pop("crash")
+        self.assertEqual(job.retry_failed(), 1)
+        _wait(job)
+        self.assertEqual(set(job.done), {"a", "b", "c"})
+        self.assertEqual(job.failed, {})
+
+    def test_cancel_does_not_wait_and_poll_reaps(self):
+        job = self._job(workers=1)
+        job.start([{"key": "a", "sleep": 30}])
+        started = time.time()
+        job.cancel()
+        self.assertLess(time.time() - started, 2.0)
+        _wait(job)
+        self.assertFalse(job.running)
+        self.assertEqual(job.failed, {"a": background_render.CANCELLED_ERROR})
+        self.assertTrue(job.work_dir.exists())
+        job.discard()
+        self.assertFalse(job.work_dir.exists())
+
+    def test_spawn_error_fails_shard(self):
+        def _broken(*_args, **_kwargs):
+            raise OSError("no blender")
+
+        job = background_render.BackgroundRenderJob(self.root / "work", lambda m: ["x"], popen=_broken)
+        self.assertEqual(job.start([{"key": "a"}]), 0)
+        self.assertFalse(job.running)
+        self.assertIn("no blender", job.failed["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import importlib.util
+import pathlib
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "collection_hierarchy.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.collection_hierarchy",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+collection_hierarchy = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+collection_hierarchy.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.collection_hierarchy"] = collection_hierarchy
+SPEC.loader.exec_module(collection_hierarchy)  # type: ignore[arg-type]
+
+
+class _Coll:
+    def __init__(self, name, *children):
+        self.name = name
+        self.children = list(children)
+
+    def __repr__(self):
+        return f"_Coll({self.name!r})"
+
+
+class CollectionHierarchyTests(unittest.TestCase):
+    def setUp(self):
+        self.cam_1 = _Coll("SH01_00_CAM")
+        self.props_1 = _Coll("SH01_PROPS", _Coll("deep", _Coll("deeper")))
+        self.shared = _Coll("SHARED")
+        self.shot_1 = _Coll("SHOT 01", self.cam_1, self.props_1, self.shared)
+        self.shot_2 = _Coll("SHOT 02", _Coll("SH02_00_CAM"), self.shared)
+        self.loose = _Coll("Loose")
+        self.root = _Coll("Scene Collection", self.shot_1, self.shot_2, self.loose)
+        self.index = collection_hierarchy.CollectionHierarchy(self.root, [self.shot_1, self.shot_2])
+
+    def test_shot_root_of_nested_collections(self):
+        deeper = self.props_1.children[0].children[0]
+        self.assertIs(self.index.shot_root_of(deeper), self.shot_1)
+        self.assertIs(self.index.shot_root_of(self.shot_2.children[0]), self.shot_2)
+        self.assertIs(self.index.shot_root_of(self.shot_1), self.shot_1)
+
+    def test_collections_outside_shots(self):
+        self.assertIn(self.loose, self.index)
+        self.assertIsNone(self.index.shot_root_of(self.loose))
+        self.assertIsNone(self.index.shot_root_of(self.root))
+
+    def test_linked_collection_reports_every_shot_in_priority_order(self):
+        self.assertEqual(self.index.shots_of(self.shared), [self.shot_1, self.shot_2])
+        self.assertIs(self.index.shot_root_of(self.shared), self.shot_1)
+        self.assertEqual(self.index.parents_of(self.shared), [self.shot_1, self.shot_2])
+
+    def test_unknown_collections(self):
+        orphan = _Coll("Orphan")
+        self.assertNotIn(orphan, self.index)
+        self.index.mark_outside(orphan)
+        self.assertIn(orphan, self.index)
+        self.assertIsNone(self.index.shot_root_of(orphan))
+
+    def test_cycles_do_not_hang(self):
+        a = _Coll("A")
+        b = _Coll("B", a)
+        a.children.append(b)
+        shot = _Coll("SHOT 03", a)
+        index = collection_hierarchy.CollectionHierarchy(_Coll("root", shot), [shot])
+        self.assertIs(index.shot_root_of(b), shot)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import importlib.util
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "content_index.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.content_index",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+content_index = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+content_index.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.content_index"] = content_index
+SPEC.loader.exec_module(content_index)  # type: ignore[arg-type]
+
+
+class ContentIndexTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = pathlib.Path(self._tmp.name)
+        self.index_path = self.folder / ".index.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _index(self):
+        return content_index.ContentIndex(self.folder, self.index_path, extensions={".png"})
+
+    def _digest(self, data):
+        probe = self.folder / "probe.bin"
+        probe.write_bytes(data)
+        try:
+            return content_index.sha256_file(probe)
+        finally:
+            probe.unlink()
+
+    def test_finds_duplicate_added_on_import(self):
+        index = self._index()
+        style = self.folder / "Style_a.png"
+        style.write_bytes(b"style-a")
+        index.add(style)
+        self.assertEqual(index.find_duplicate(self._digest(b"style-a"), 7), style)
+        self.assertIsNone(index.find_duplicate(self._digest(b"style-b"), 7))
+
+    def test_unchanged_files_are_not_rehashed_after_reload(self):
+        style = self.folder / "Style_a.png"
+        style.write_bytes(b"style-a")
+        self._index().add(style)
+        digest = self._digest(b"style-a")
+        reloaded = self._index()
+        with mock.patch.object(content_index, "sha256_file", side_effect=AssertionError("rehashed")):
+            self.assertEqual(reloaded.find_duplicate(digest, 7), style)
+
+    def test_files_copied_in_externally_are_indexed_on_lookup(self):
+        index = self._index()
+        (self.folder / "other_size.png").write_bytes(b"a much longer payload")
+        manual = self.folder / "manual.png"
+        manual.write_bytes(b"style-c")
+        digest = self._digest(b"style-c")
+        calls = []
+        real = content_index.sha256_file
+
+        def _tracking(path):
+            calls.append(pathlib.Path(path).name)
+            return real(path)
+
+        with mock.patch.object(content_index, "sha256_file", side_effect=_tracking):
+            self.assertEqual(index.find_duplicate(digest, 7), manual)
+        self.assertEqual(calls, ["manual.png"])
+
+    def test_modified_and_removed_files_are_revalidated(self):
+        index = self._index()
+        style = self.folder / "Style_a.png"
+        style.write_bytes(b"style-a")
+        index.add(style)
+        style.write_bytes(b"style-x")
+        self.assertIsNone(index.find_duplicate(self._digest(b"style-a"), 7))
+        index.remove(style)
+        style.unlink()
+        self.assertIsNone(index.find_duplicate(self._digest(b"style-x"), 7))
+
+    def test_lookup_in_synced_folder_does_not_list_it(self):
+        # Digests first: the probe file would change the folder mtime
+        digest_a, digest_b, digest_x = (self._digest(data) for data in (b"style-a", b"style-b", b"style-x"))
+        index = self._index()
+        (self.folder / "Style_b.png").write_bytes(b"style-b")
+        self.assertIsNone(index.find_duplicate(digest_x, 7))
+        style = self.folder / "Style_a.png"
+        style.write_bytes(b"style-a")
+        index.add(style)
+        with mock.patch.object(content_index.os, "scandir", side_effect=AssertionError("listed")):
+            self.assertEqual(index.find_duplicate(digest_a, 7), style)
+            self.assertEqual(index.find_duplicate(digest_b, 7), self.folder / "Style_b.png")
+            self.assertIsNone(index.find_duplicate(digest_x, 7))
+
+    def test_in_place_edit_falls_back_to_full_sync(self):
+        digest_a, digest_x = self._digest(b"style-a"), self._digest(b"style-x")
+        index = self._index()
+        style = self.folder / "Style_a.png"
+        style.write_bytes(b"style-a")
+        index.find_duplicate(digest_a, 7)
+        style.write_bytes(b"style-x")
+        self.assertIsNone(index.find_duplicate(digest_a, 7))
+        self.assertEqual(index.find_duplicate(digest_x, 7), style)
+
+
+if __name__ == "__main__":
+    unittest.main()
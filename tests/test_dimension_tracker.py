@@ -0,0 +1,88 @@
+import importlib.util
+import pathlib
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "dimension_tracker.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.dimension_tracker",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+dimension_tracker = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+dimension_tracker.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.dimension_tracker"] = dimension_tracker
+SPEC.loader.exec_module(dimension_tracker)  # type: ignore[arg-type]
+
+
+class DimensionTrackerTests(unittest.TestCase):
+    def _tracker(self):
+        tracker = dimension_tracker.DimensionTracker()
+        tracker.sync({"Box Dimension Checker": ["Box"], "Group Dimension Checker": ["Box", "Lid"]})
+        tracker.take_dirty()
+        return tracker
+
+    def test_sync_marks_only_new_or_retargeted_envelopes(self):
+        tracker = self._tracker()
+        self.assertEqual(tracker.envelopes_for("Box"), {"Box Dimension Checker", "Group Dimension Checker"})
+        self.assertEqual(tracker.sync({"Box Dimension Checker": ["Box"], "Group Dimension Checker": ["Box", "Lid"]}), 0)
+        self.assertFalse(tracker.has_dirty)
+        changed = tracker.sync({"Box Dimension Checker": ["Box"], "Group Dimension Checker": ["Lid"], "New": ["Cup"]})
+        self.assertEqual(changed, 2)
+        self.assertEqual(tracker.take_dirty(), ["Group Dimension Checker", "New"])
+        self.assertEqual(tracker.envelopes_for("Box"), {"Box Dimension Checker"})
+
+    def test_unrelated_targets_mark_nothing(self):
+        tracker = self._tracker()
+        self.assertEqual(tracker.mark_target("Camera", geometry=True), 0)
+        self.assertFalse(tracker.has_dirty)
+        self.assertEqual(tracker.mark_target("Lid", geometry=False), 1)
+        self.assertEqual(tracker.take_dirty(), ["Group Dimension Checker"])
+        self.assertFalse(tracker.has_dirty)
+
+    def test_transform_keeps_cache_and_geometry_drops_it(self):
+        tracker = self._tracker()
+        tracker.store("Box", "cloud")
+        tracker.store("Camera", "ignored")
+        self.assertIsNone(tracker.cached("Camera"))
+        tracker.mark_target("Box", geometry=False)
+        self.assertEqual(tracker.cached("Box"), "cloud")
+        tracker.mark_target("Box", geometry=True)
+        self.assertIsNone(tracker.cached("Box"))
+        self.assertEqual(tracker.take_dirty(), ["Box Dimension Checker", "Group Dimension Checker"])
+
+    def test_removing_last_envelope_drops_target_cache(self):
+        tracker = self._tracker()
+        tracker.store("Lid", "cloud")
+        tracker.sync({"Box Dimension Checker": ["Box"]})
+        self.assertFalse(tracker.is_target("Lid"))
+        self.assertIsNone(tracker.cached("Lid"))
+        self.assertNotIn("Group Dimension Checker", tracker)
+
+    def test_set_envelope_without_dirty(self):
+        tracker = dimension_tracker.DimensionTracker()
+        self.assertTrue(tracker.set_envelope("Box Dimension Checker", ["Box", "Box", ""], dirty=False))
+        self.assertEqual(tracker.targets_of("Box Dimension Checker"), ("Box",))
+        self.assertFalse(tracker.has_dirty)
+        self.assertFalse(tracker.set_envelope("Box Dimension Checker", ["Box"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import importlib.util
+import os
+import pathlib
+import tempfile
+import time
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "dir_scan.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.dir_scan",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+dir_scan = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+dir_scan.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.dir_scan"] = dir_scan
+SPEC.loader.exec_module(dir_scan)  # type: ignore[arg-type]
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class DirectoryScannerTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = pathlib.Path(self._tmp.name)
+        self.clock = _Clock(time.time() + 100.0)
+        self.scanner = dir_scan.DirectoryScanner({".png"}, revalidate_after=30.0, clock=self.clock)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _touch_dir(self, offset):
+        stamp = time.time() + offset
+        os.utime(self.folder, (stamp, stamp))
+
+    def test_lists_matching_files_only(self):
+        (self.folder / "a.png").write_bytes(b"x")
+        (self.folder / "b.txt").write_bytes(b"x")
+        (self.folder / "sub.png").mkdir()
+        listing = self.scanner.scan(self.folder)
+        self.assertTrue(listing.rescanned)
+        self.assertEqual([entry.name for entry in listing.entries], ["a.png"])
+        self.assertEqual(listing.entries[0].size, 1)
+
+    def test_unchanged_folder_is_not_rescanned(self):
+        (self.folder / "a.png").write_bytes(b"x")
+        self._touch_dir(-60)
+        first = self.scanner.scan(self.folder)
+        second = self.scanner.scan(self.folder)
+        self.assertFalse(second.rescanned)
+        self.assertEqual(first.token, second.token)
+        self.assertEqual(first.entries, second.entries)
+
+    def test_new_file_changes_token(self):
+        (self.folder / "a.png").write_bytes(b"x")
+        self._touch_dir(-60)
+        first = self.scanner.scan(self.folder)
+        (self.folder / "b.png").write_bytes(b"yy")
+        self._touch_dir(-30)
+        second = self.scanner.scan(self.folder)
+        self.assertTrue(second.rescanned)
+        self.assertNotEqual(first.token, second.token)
+        self.assertEqual([entry.name for entry in second.entries], ["a.png", "b.png"])
+
+    def test_recent_folder_mtime_is_not_trusted(self):
+        self.clock.now = time.time()
+        (self.folder / "a.png").write_bytes(b"x")
+        self._touch_dir(0)
+        self.scanner.scan(self.folder)
+        self.assertTrue(self.scanner.scan(self.folder).rescanned)
+
+    def test_revalidation_picks_up_in_place_rewrites(self):
+        target = self.folder / "a.png"
+        target.write_bytes(b"x")
+        stamp = time.time() - 60
+        os.utime(self.folder, (stamp, stamp))
+        first = self.scanner.scan(self.folder)
+        target.write_bytes(b"xyz")
+        os.utime(self.folder, (stamp, stamp))
+        self.assertFalse(self.scanner.scan(self.folder).rescanned)
+        self.clock.now += 31.0
+        revalidated = self.scanner.scan(self.folder)
+        self.assertTrue(revalidated.rescanned)
+        self.assertEqual(revalidated.entries[0].size, 3)
+        self.assertNotEqual(first.token, revalidated.token)
+
+    def test_missing_folder_yields_empty_listing(self):
+        listing = self.scanner.scan(self.folder / "missing")
+        self.assertEqual(listing.entries, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import importlib.util
+import pathlib
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "draw_memo.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.draw_memo",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+draw_memo = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+draw_memo.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.draw_memo"] = draw_memo
+SPEC.loader.exec_module(draw_memo)  # type: ignore[arg-type]
+
+
+class DrawMemoTests(unittest.TestCase):
+    def test_answer_computed_once_per_scope(self):
+        memo = draw_memo.DrawMemo()
+        calls = []
+
+        def _resolve():
+            calls.append(1)
+            return "SHOT 01"
+
+        rows = [memo.get(("win", "area"), "active_shot", _resolve) for _ in range(60)]
+        self.assertEqual(rows, ["SHOT 01"] * 60)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(memo.hits, 59)
+        self.assertEqual(memo.misses, 1)
+
+    def test_scopes_and_names_are_independent(self):
+        memo = draw_memo.DrawMemo()
+        self.assertEqual(memo.get("a", "x", lambda: 1), 1)
+        self.assertEqual(memo.get("a", "y", lambda: 2), 2)
+        self.assertEqual(memo.get("b", "x", lambda: 3), 3)
+        self.assertEqual(memo.get("a", "x", lambda: 99), 1)
+
+    def test_none_is_memoized(self):
+        memo = draw_memo.DrawMemo()
+        calls = []
+        memo.get("a", "shot", lambda: calls.append(1))
+        memo.get("a", "shot", lambda: calls.append(1))
+        self.assertEqual(len(calls), 1)
+
+    def test_invalidate_drops_answers(self):
+        memo = draw_memo.DrawMemo()
+        memo.get("a", "x", lambda: 1)
+        memo.invalidate()
+        self.assertEqual(memo.generation, 1)
+        self.assertEqual(len(memo), 0)
+        self.assertEqual(memo.get("a", "x", lambda: 2), 2)
+
+    def test_invalidated_during_compute_is_not_stored(self):
+        memo = draw_memo.DrawMemo()
+
+        def _compute():
+            memo.invalidate()
+            return 1
+
+        self.assertEqual(memo.get("a", "x", _compute), 1)
+        self.assertEqual(memo.get("a", "x", lambda: 2), 2)
+
+    def test_failed_compute_is_not_stored(self):
+        memo = draw_memo.DrawMemo()
+
+        def _fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            memo.get("a", "x", _fail)
+        self.assertEqual(memo.get("a", "x", lambda: 5), 5)
+
+    def test_least_recently_used_scope_dropped(self):
+        memo = draw_memo.DrawMemo(max_scopes=2)
+        memo.get("a", "x", lambda: 1)
+        memo.get("b", "x", lambda: 2)
+        memo.get("a", "x", lambda: 0)
+        memo.get("c", "x", lambda: 3)
+        self.assertEqual(len(memo), 2)
+        self.assertEqual(memo.get("a", "x", lambda: 0), 1)
+        self.assertEqual(memo.get("b", "x", lambda: 20), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import importlib.util
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "generation_index.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.generation_index",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+generation_index = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+generation_index.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.generation_index"] = generation_index
+SPEC.loader.exec_module(generation_index)  # type: ignore[arg-type]
+
+
+def _record(frame, version, *, cam=1, mode="SKETCH"):
+    stem = f"Prj_SB_SC010_SH01C{cam}_F{frame:04d}_{mode}"
+    return {
+        "project_name": "Prj",
+        "sc_number": 10,
+        "rev": "A",
+        "shot_idx": 1,
+        "cam_idx": cam,
+        "frame": frame,
+        "mode": mode,
+        "generation_id": f"g{frame}_{version}",
+        "output_paths": [f"/ai/outputs/{stem}_V{version:02d}_Rev_A.png"],
+        "version": version,
+        "base_stem": stem,
+    }
+
+
+class GenerationIndexTests(unittest.TestCase):
+    def test_parse_output_version(self):
+        self.assertEqual(
+            generation_index.parse_output_version("/x/Prj_SB_SC010_SH01C1_F0010_SKETCH_V03_Rev_B_02.png"),
+            ("Prj_SB_SC010_SH01C1_F0010_SKETCH", "B", 3),
+        )
+        self.assertIsNone(generation_index.parse_output_version("Prj_SB_SC010_SH01C1_F0010_SKETCH_Rev_B.png"))
+
+    def test_append_query_and_reload(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "generations.jsonl"
+            index = generation_index.GenerationIndex(path)
+            index.append(_record(10, 1))
+            index.append(_record(10, 2))
+            index.append(_record(20, 1, cam=2, mode="SKETCH_PLUS"))
+            index.close()
+
+            reloaded = generation_index.GenerationIndex(path)
+            self.assertEqual(len(reloaded), 3)
+            self.assertEqual(len(reloaded.query(frame=10)), 2)
+            self.assertEqual(len(reloaded.query(frame=10, shot_idx=1, cam_idx=1, version=2)), 1)
+            self.assertEqual([r["frame"] for r in reloaded.query(mode="SKETCH_PLUS")], [20])
+            self.assertEqual(reloaded.latest_version("Prj_SB_SC010_SH01C1_F0010_SKETCH", "A"), 2)
+
+    def test_reserve_version_never_repeats(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            index = generation_index.GenerationIndex(pathlib.Path(tmp) / "generations.jsonl")
+            index.append(_record(10, 4))
+            stem = "Prj_SB_SC010_SH01C1_F0010_SKETCH"
+            self.assertEqual(index.reserve_version(stem, "A"), 5)
+            self.assertEqual(index.reserve_version(stem, "A"), 6)
+            self.assertEqual(index.reserve_version(stem, "B"), 1)
+
+    def test_delete_and_compact(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "generations.jsonl"
+            index = generation_index.GenerationIndex(path, compact_threshold=1)
+            first_output = index.append(_record(10, 1))["output_paths"][0]
+            index.append(_record(10, 2))
+            index.record_deleted_outputs([first_output])
+            self.assertIsNone(index.record_for_output(first_output))
+            self.assertTrue(index.needs_compaction())
+            index.compact()
+            self.assertFalse(index.needs_compaction())
+            lines = path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(lines), 2)
+            self.assertNotIn('"delete"', path.read_text(encoding="utf-8"))
+
+            reloaded = generation_index.GenerationIndex(path)
+            self.assertEqual(reloaded.query(frame=10)[0]["output_paths"], [])
+
+    def test_frame_manifest_export_matches_legacy_layout(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            index = generation_index.GenerationIndex(pathlib.Path(tmp) / "generations.jsonl")
+            record = dict(_record(10, 1), source={"path": "/src.png", "hash": "abc"}, updated_at="now")
+            index.append(record)
+            manifest = index.frame_manifest((1, 1, 10))
+            self.assertEqual(manifest["frame"], 10)
+            self.assertEqual(manifest["context"]["sc_number"], 10)
+            self.assertEqual(manifest["source"], {"path": "/src.png", "hash": "abc"})
+            self.assertEqual(manifest["generations"][0]["generation_id"], "g10_1")
+            self.assertNotIn("shot_idx", manifest["generations"][0])
+
+    def test_reset_removes_log(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "generations.jsonl"
+            index = generation_index.GenerationIndex(path)
+            index.append(_record(10, 1))
+            index.reset()
+            self.assertFalse(path.exists())
+            self.assertEqual(len(index), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import hashlib
+import base64
+import importlib.util
+import io
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+import urllib.error
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "http_download.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.http_download",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+http_download = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+http_download.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.http_download"] = http_download
+SPEC.loader.exec_module(http_download)  # type: ignore[arg-type]
+
+
+class _Response:
+    def __init__(self, body, *, status=200, headers=None, fail_after=None):
+        self._stream = io.BytesIO(body)
+        self.status = status
+        self.headers = headers or {}
+        self._fail_after = fail_after
+        self._sent = 0
+
+    def read(self, size):
+        if self._fail_after is not None and self._sent >= self._fail_after:
+            raise ConnectionResetError("dropped")
+        chunk = self._stream.read(size)
+        self._sent += len(chunk)
+        return chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+class _Server:
+    """Serves payload, dropping the first connection after drop_at bytes; honors Range."""
+
+    def __init__(self, payload, *, drop_at=None, honor_range=True, extra_headers=None, range_shift=0):
+        self.payload = payload
+        self.range_shift = range_shift
+        self.drop_at = drop_at
+        self.honor_range = honor_range
+        self.extra_headers = extra_headers or {}
+        self.ranges = []
+
+    def __call__(self, req, timeout=None):
+        range_header = req.get_header("Range")
+        self.ranges.append(range_header)
+        if range_header and self.honor_range:
+            start = int(range_header.split("=", 1)[1].rstrip("-")) + self.range_shift
+            self.range_shift = 0
+            body = self.payload[start:]
+            headers = {
+                "Content-Length": str(len(body)),
+                "Content-Range": f"bytes {start}-{len(self.payload) - 1}/{len(self.payload)}",
+            }
+            headers.update(self.extra_headers)
+            return _Response(body, status=206, headers=headers)
+        headers = {"Content-Length": str(len(self.payload))}
+        headers.update(self.extra_headers)
+        fail_after = self.drop_at
+        self.drop_at = None
+        return _Response(self.payload, headers=headers, fail_after=fail_after)
+
+
+class HttpDownloadTests(unittest.TestCase):
+    def test_resumes_with_range_after_drop(self):
+        payload = bytes(range(256)) * 40
+        server = _Server(payload, drop_at=4096)
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = pathlib.Path(tmp) / "Result.png"
+            written = http_download.download_to_file(
+                "https://example/r.png", dest, chunk_size=1024, opener=server, sleep=lambda _s: None
+            )
+            self.assertEqual(written, len(payload))
+            self.assertEqual(dest.read_bytes(), payload)
+            self.assertEqual(server.ranges, [None, "bytes=4096-"])
+            self.assertFalse(http_download.part_path_for(dest).exists())
+
+    def test_restarts_when_server_ignores_range(self):
+        payload = b"x" * 5000
+        server = _Server(payload, drop_at=2048, honor_range=False)
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = pathlib.Path(tmp) / "Result.png"
+            http_download.download_to_file("https://e/r", dest, chunk_size=1024, opener=server, sleep=lambda _s: None)
+            self.assertEqual(dest.read_bytes(), payload)
+
+    def test_restarts_when_server_returns_a_different_range(self):
+        payload = bytes(range(256)) * 20
+        server = _Server(payload, drop_at=2048, range_shift=-1024)
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = pathlib.Path(tmp) / "Result.png"
+            http_download.download_to_file("https://e/r", dest, chunk_size=512, opener=server, sleep=lambda _s: None)
+            self.assertEqual(dest.read_bytes(), payload)
+            self.assertEqual(server.ranges, [None, "bytes=2048-", None])
+
+    def test_size_mismatch_removes_part_file(self):
+        server = _Server(b"x" * 100, extra_headers={"Content-Length": "50"})
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = pathlib.Path(tmp) / "Result.png"
+            with self.assertRaises(http_download.DownloadError):
+                http_download.download_to_file("https://e/r", dest, opener=server, sleep=lambda _s: None)
+            self.assertFalse(dest.exists())
+            self.assertFalse(http_download.part_path_for(dest).exists())
+
+    def test_server_digest_mismatch_is_rejected(self):
+        payload = b"image-bytes"
+        wrong = base64.b64encode(hashlib.sha256(b"other").digest()).decode("ascii")
+        server = _Server(payload, extra_headers={"Digest": f"sha-256={wrong}"})
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = pathlib.Path(tmp) / "Result.png"
+            with self.assertRaises(http_download.DownloadError):
+                http_download.download_to_file("https://e/r", dest, opener=server, sleep=lambda _s: None)
+            self.assertFalse(dest.exists())
+            self.assertFalse(http_download.part_path_for(dest).exists())
+
+    def test_server_digest_match_is_accepted(self):
+        payload = b"image-bytes"
+        good = base64.b64encode(hashlib.sha256(payload).digest()).decode("ascii")
+        server = _Server(payload, extra_headers={"x-amz-checksum-sha256": good})
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = pathlib.Path(tmp) / "Result.png"
+            http_download.download_to_file("https://e/r", dest, opener=server, sleep=lambda _s: None)
+            self.assertEqual(dest.read_bytes(), payload)
+
+    def test_non_retryable_http_error_raises_immediately(self):
+        calls = []
+
+        def opener(req, timeout=None):
+            calls.append(req)
+            raise urllib.error.HTTPError(req.full_url, 404, "Not Found", {}, None)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(http_download.DownloadError):
+                http_download.download_to_file("https://e/r", pathlib.Path(tmp) / "a.png", opener=opener)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
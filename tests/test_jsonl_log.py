@@ -0,0 +1,87 @@
+import importlib.util
+import json
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "jsonl_log.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.jsonl_log",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+jsonl_log = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+jsonl_log.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.jsonl_log"] = jsonl_log
+SPEC.loader.exec_module(jsonl_log)  # type: ignore[arg-type]
+
+
+class JsonlLogTests(unittest.TestCase):
+    def test_writer_appends_one_compact_record_per_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "log.jsonl"
+            with jsonl_log.JsonlWriter(path, fsync_every=2) as log:
+                log.write({"kind": "header", "n": 1})
+                log.write({"kind": "change", "name": "Wood_BaseColor.png"})
+                log.write({"kind": "summary"})
+            lines = path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertEqual(lines[0], '{"kind":"header","n":1}')
+
+            with jsonl_log.JsonlWriter(path) as log:
+                log.write({"kind": "resume"})
+            kinds = [r["kind"] for r in jsonl_log.iter_jsonl_records(path)]
+            self.assertEqual(kinds, ["header", "change", "summary", "resume"])
+
+    def test_reader_skips_truncated_last_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "log.jsonl"
+            path.write_text('{"kind":"change","i":1}\n{"kind":"change","i":2}\n{"kind":"cha', encoding="utf-8")
+            records = list(jsonl_log.iter_jsonl_records(path))
+            self.assertEqual([r["i"] for r in records], [1, 2])
+            self.assertIsNone(jsonl_log.last_record_of_kind(path, "summary"))
+            self.assertEqual(jsonl_log.last_record_of_kind(path, "change")["i"], 2)
+
+    def test_writer_terminates_truncated_last_line_before_appending(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "log.jsonl"
+            path.write_text('{"kind":"change","i":1}\n{"kind":"cha', encoding="utf-8")
+            with jsonl_log.JsonlWriter(path) as log:
+                log.write({"kind": "resume"})
+            kinds = [r["kind"] for r in jsonl_log.iter_jsonl_records(path)]
+            self.assertEqual(kinds, ["change", "resume"])
+
+    def test_reader_handles_missing_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(list(jsonl_log.iter_jsonl_records(pathlib.Path(tmp) / "none.jsonl")), [])
+
+    def test_atomic_write_json_replaces_without_leftover_tmp(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "index.json"
+            path.write_text("old", encoding="utf-8")
+            jsonl_log.atomic_write_json(path, {"sha256_to_file": {"a": "b.png"}})
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), {"sha256_to_file": {"a": "b.png"}})
+            self.assertNotIn("\n", path.read_text(encoding="utf-8"))
+            self.assertEqual(sorted(p.name for p in pathlib.Path(tmp).iterdir()), ["index.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import importlib.util
+import pathlib
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "layer_index.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.layer_index",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+layer_index = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+layer_index.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.layer_index"] = layer_index
+SPEC.loader.exec_module(layer_index)  # type: ignore[arg-type]
+
+
+class _Coll:
+    def __init__(self, name):
+        self.name = name
+
+
+class _Layer:
+    def __init__(self, coll, children=(), exclude=False):
+        self.collection = coll
+        self.children = list(children)
+        self.exclude = exclude
+        self.hide_viewport = False
+
+
+class _CountingLayer(_Layer):
+    writes = 0
+
+    def __setattr__(self, name, value):
+        if name in ("exclude", "hide_viewport") and name in self.__dict__:
+            self.__dict__["writes"] = self.writes + 1
+        super().__setattr__(name, value)
+
+
+def _tree():
+    colls = {name: _Coll(name) for name in ("Scene", "SHOT 01", "A", "B", "SHOT 02", "C")}
+    shot1 = _Layer(colls["SHOT 01"], [_Layer(colls["A"], [_Layer(colls["B"])])])
+    shot2 = _Layer(colls["SHOT 02"], [_Layer(colls["C"])])
+    root = _Layer(colls["Scene"], [shot1, shot2])
+    return root, colls
+
+
+class LayerCollectionIndexTests(unittest.TestCase):
+    def test_lookup_and_subtree_from_one_walk(self):
+        root, colls = _tree()
+        index = layer_index.LayerCollectionIndex(root)
+        self.assertEqual(len(index), 6)
+        self.assertIs(index.get(colls["C"]).collection, colls["C"])
+        self.assertEqual([lc.collection.name for lc in index.subtree(colls["SHOT 01"])], ["SHOT 01", "A", "B"])
+        self.assertEqual([lc.collection.name for lc in index.subtree(colls["SHOT 02"])], ["SHOT 02", "C"])
+        self.assertEqual(len(list(index.subtree(colls["Scene"]))), 6)
+
+    def test_missing_collection(self):
+        root, _colls = _tree()
+        index = layer_index.LayerCollectionIndex(root)
+        self.assertIsNone(index.get(_Coll("Other")))
+        self.assertEqual(list(index.subtree(_Coll("Other"))), [])
+        self.assertEqual(len(layer_index.LayerCollectionIndex(None)), 0)
+
+    def test_collection_linked_twice_resolves_to_first_layer(self):
+        shared = _Coll("Shared")
+        first = _Layer(shared)
+        root = _Layer(_Coll("Scene"), [_Layer(_Coll("X"), [first]), _Layer(_Coll("Y"), [_Layer(shared)])])
+        self.assertIs(layer_index.LayerCollectionIndex(root).get(shared), first)
+
+
+class FlagBatchTests(unittest.TestCase):
+    def test_restore_puts_originals_back(self):
+        layers = [_Layer(_Coll("a")), _Layer(_Coll("b"), exclude=True)]
+        flags = layer_index.FlagBatch()
+        flags.set_many(layers, {"exclude": True, "hide_viewport": True})
+        self.assertTrue(all(lc.exclude and lc.hide_viewport for lc in layers))
+        flags.set(layers[0], "exclude", False)
+        flags.restore()
+        self.assertEqual([lc.exclude for lc in layers], [False, True])
+        self.assertEqual([lc.hide_viewport for lc in layers], [False, False])
+
+    def test_matching_values_are_not_written(self):
+        layer = _CountingLayer(_Coll("a"), exclude=True)
+        flags = layer_index.FlagBatch()
+        self.assertFalse(flags.set(layer, "exclude", True))
+        self.assertTrue(flags.set(layer, "hide_viewport", True))
+        self.assertEqual(layer.writes, 1)
+        flags.restore()
+        self.assertEqual(layer.writes, 2)
+        self.assertEqual(flags.writes, 1)
+
+    def test_missing_attribute_is_ignored(self):
+        flags = layer_index.FlagBatch()
+        self.assertFalse(flags.set(_Coll("a"), "exclude", True))
+        self.assertEqual(len(flags), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
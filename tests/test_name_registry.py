@@ -0,0 +1,83 @@
+import importlib.util
+import pathlib
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "name_registry.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.name_registry",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+name_registry = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+name_registry.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.name_registry"] = name_registry
+SPEC.loader.exec_module(name_registry)  # type: ignore[arg-type]
+
+
+class NameRegistryTests(unittest.TestCase):
+    def test_free_base_is_returned(self):
+        names = name_registry.NameRegistry(["Cube"])
+        self.assertEqual(names.unique("Sphere"), "Sphere")
+
+    def test_letter_suffixes_then_numbers(self):
+        taken = ["Cam"] + [f"Cam_{c}" for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+        names = name_registry.NameRegistry(taken)
+        self.assertEqual(names.unique("Cam"), "Cam_1")
+        names = name_registry.NameRegistry(["Cam", "Cam_A"])
+        self.assertEqual(names.unique("Cam"), "Cam_B")
+
+    def test_numbered_suffix_starts_at_two(self):
+        names = name_registry.NameRegistry(["Rig"])
+        self.assertEqual(names.unique("Rig", suffix=name_registry.numbered_suffix), "Rig_2")
+
+    def test_current_name_is_available_to_its_owner(self):
+        names = name_registry.NameRegistry(["Cam", "Cam_A"])
+        self.assertEqual(names.unique("Cam", current="Cam"), "Cam")
+        self.assertEqual(names.unique("Cam", current="Cam_A"), "Cam_A")
+
+    def test_renames_keep_registry_current(self):
+        names = name_registry.NameRegistry(["Cam"])
+        first = names.unique("Cam", current="Other")
+        names.rename("Other", first)
+        self.assertNotIn("Other", names)
+        self.assertIn("Cam_A", names)
+        self.assertEqual(names.unique("Cam"), "Cam_B")
+
+    def test_freed_suffix_is_reused(self):
+        names = name_registry.NameRegistry(["Cam", "Cam_A", "Cam_B"])
+        self.assertEqual(names.unique("Cam"), "Cam_C")
+        names.rename("Cam_A", "Elsewhere")
+        self.assertEqual(names.unique("Cam"), "Cam_A")
+
+    def test_repeated_bases_resume_after_handed_out_suffixes(self):
+        names = name_registry.NameRegistry(["Obj"])
+        produced = []
+        for _ in range(40):
+            candidate = names.unique("Obj")
+            names.add(candidate)
+            produced.append(candidate)
+        self.assertEqual(len(set(produced)), 40)
+        self.assertEqual(produced[0], "Obj_A")
+        self.assertEqual(produced[26], "Obj_1")
+
+
+if __name__ == "__main__":
+    unittest.main()
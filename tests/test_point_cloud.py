@@ -0,0 +1,219 @@
+import importlib.util
+import math
+import pathlib
+import types
+import sys
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ships with Blender
+    np = None
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+point_cloud = None
+if np is not None:
+    MODULE_PATH = LIME_ROOT / "core" / "point_cloud.py"
+    SPEC = importlib.util.spec_from_file_location(
+        "lime_pipeline.core.point_cloud",
+        MODULE_PATH,
+        submodule_search_locations=[str(LIME_ROOT / "core")],
+    )
+    point_cloud = importlib.util.module_from_spec(SPEC)
+    assert SPEC.loader is not None
+    point_cloud.__package__ = "lime_pipeline.core"
+    sys.modules["lime_pipeline.core.point_cloud"] = point_cloud
+    SPEC.loader.exec_module(point_cloud)  # type: ignore[arg-type]
+
+
+def _rotation_z(angle):
+    c, s = math.cos(angle), math.sin(angle)
+    return [[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]]
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class PointCloudTests(unittest.TestCase):
+    def test_transform_applies_rotation_and_translation(self):
+        matrix = [
+            [0.0, -1.0, 0.0, 10.0],
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 2.0, -1.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ]
+        coords = np.array([1.0, 0.0, 0.0, 0.0, 1.0, 1.0], dtype=np.float32)
+        out = point_cloud.transform_points(coords, matrix)
+        self.assertEqual(out.shape, (2, 3))
+        np.testing.assert_allclose(out, [[10.0, 1.0, -1.0], [9.0, 0.0, 1.0]])
+
+    def test_empty_inputs(self):
+        self.assertEqual(point_cloud.transform_points([], np.identity(4)).shape, (0, 3))
+        self.assertEqual(point_cloud.concat_points([None, np.empty((0, 3))]).shape, (0, 3))
+        self.assertIsNone(point_cloud.oriented_bounds(point_cloud.EMPTY_POINTS, np.identity(3)))
+
+    def test_subsample_keeps_every_kth_point_up_to_limit(self):
+        points = np.arange(30, dtype=np.float64).reshape(10, 3)
+        sampled = point_cloud.subsample_points(points, 4)
+        self.assertEqual(len(sampled), 4)
+        np.testing.assert_array_equal(sampled[:, 0], [0.0, 6.0, 12.0, 18.0])
+        self.assertIs(point_cloud.subsample_points(points, None), points)
+        self.assertIs(point_cloud.subsample_points(points, 50), points)
+
+    def test_covariance_matches_sample_covariance(self):
+        rng = np.random.default_rng(4)
+        points = rng.normal(size=(200, 3)) * [3.0, 1.0, 0.2]
+        centroid, cov = point_cloud.centroid_and_covariance(points)
+        np.testing.assert_allclose(centroid, points.mean(axis=0))
+        np.testing.assert_allclose(cov, np.cov(points, rowvar=False))
+        _, cov_xy = point_cloud.centroid_and_covariance(points, dims=2)
+        self.assertEqual(cov_xy.shape, (2, 2))
+
+    def test_oriented_bounds_in_rotated_frame(self):
+        box = np.array([[x, y, z] for x in (-2.0, 2.0) for y in (-1.0, 1.0) for z in (0.0, 0.5)])
+        rotation = _rotation_z(math.radians(30.0))
+        world = box @ np.asarray(rotation).T
+        low, high = point_cloud.oriented_bounds(world, rotation)
+        np.testing.assert_allclose(low, [-2.0, -1.0, 0.0], atol=1e-9)
+        np.testing.assert_allclose(high, [2.0, 1.0, 0.5], atol=1e-9)
+
+
+def _jacobi_reference(cov):
+    """Eigenvectors of a symmetric 3x3 matrix (the solver the Dimension Checker used before NumPy)."""
+    a = [list(map(float, row)) for row in cov]
+    v = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    for _ in range(64):
+        p, q = max(((0, 1), (0, 2), (1, 2)), key=lambda pq: abs(a[pq[0]][pq[1]]))
+        if abs(a[p][q]) <= 1e-12:
+            break
+        tau = (a[q][q] - a[p][p]) / (2.0 * a[p][q])
+        t = math.copysign(1.0 / (abs(tau) + math.sqrt(1.0 + tau * tau)), tau)
+        c = 1.0 / math.sqrt(1.0 + t * t)
+        s = t * c
+        rot = np.identity(3)
+        rot[p, p] = rot[q, q] = c
+        rot[p, q], rot[q, p] = s, -s
+        a = (rot.T @ np.asarray(a) @ rot).tolist()
+        v = (np.asarray(v) @ rot).tolist()
+    order = np.argsort([-a[i][i] for i in range(3)])
+    return np.asarray(v)[:, order]
+
+
+def _box_points(size, rotation, count=2000, seed=7):
+    rng = np.random.default_rng(seed)
+    local = rng.uniform(-0.5, 0.5, size=(count, 3)) * np.asarray(size)
+    corners = np.array([[x, y, z] for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)]) * size
+    return np.vstack((local, corners)) @ np.asarray(rotation).T
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class OrientationEngineTests(unittest.TestCase):
+    def test_principal_axes_match_reference_solver(self):
+        points = _box_points((6.0, 2.0, 0.5), _rotation_z(math.radians(35.0)))
+        axes = point_cloud.principal_axes(points)
+        reference = _jacobi_reference(point_cloud.centroid_and_covariance(points)[1])
+        for i in range(3):
+            self.assertAlmostEqual(abs(float(axes[:, i] @ reference[:, i])), 1.0, places=6)
+        self.assertAlmostEqual(float(np.linalg.det(axes)), 1.0, places=9)
+        low, high = point_cloud.oriented_bounds(points, axes)
+        np.testing.assert_allclose(np.sort(high - low)[::-1], [6.0, 2.0, 0.5], atol=0.05)
+
+    def test_principal_axes_need_three_points(self):
+        self.assertIsNone(point_cloud.principal_axes([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]))
+
+    def test_principal_axes_xy_keeps_z_up(self):
+        points = _box_points((5.0, 1.0, 3.0), _rotation_z(math.radians(-20.0)))
+        axes = point_cloud.principal_axes_xy(points)
+        np.testing.assert_allclose(axes[:, 2], [0.0, 0.0, 1.0], atol=1e-12)
+        self.assertGreater(axes[0, 0], 0.0)
+        self.assertAlmostEqual(math.degrees(math.atan2(axes[1, 0], axes[0, 0])), -20.0, delta=1.0)
+
+    def test_extreme_points_keep_box_corners(self):
+        points = _box_points((4.0, 2.0, 1.0), _rotation_z(0.3), count=20000)
+        reduced = point_cloud.extreme_points(points)
+        self.assertLess(len(reduced), 300)
+        corners = points[-8:]
+        for corner in corners:
+            self.assertTrue(np.any(np.all(np.isclose(reduced, corner), axis=1)))
+
+    def test_convex_hull_2d_of_square_with_interior_points(self):
+        rng = np.random.default_rng(1)
+        inner = rng.uniform(-0.9, 0.9, size=(500, 2))
+        square = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0], [0.0, -1.0]])
+        hull = point_cloud.convex_hull_2d(np.vstack((inner, square)))
+        self.assertEqual(len(hull), 4)
+        self.assertEqual({tuple(p) for p in hull.tolist()}, {tuple(p) for p in square[:4].tolist()})
+        area = 0.5 * sum(hull[i - 1, 0] * hull[i, 1] - hull[i, 0] * hull[i - 1, 1] for i in range(len(hull)))
+        self.assertAlmostEqual(area, 4.0)  # positive shoelace area: counter-clockwise
+
+    def test_convex_hull_2d_keeps_every_vertex_of_round_hull(self):
+        rng = np.random.default_rng(2)
+        angles = np.linspace(0.0, 2.0 * math.pi, 200, endpoint=False)
+        ring = np.column_stack((np.cos(angles), np.sin(angles))) * 3.0
+        radius = np.sqrt(rng.uniform(0.0, 0.95, size=70000)) * 3.0
+        theta = rng.uniform(0.0, 2.0 * math.pi, size=70000)
+        inner = np.column_stack((radius * np.cos(theta), radius * np.sin(theta)))
+        hull = point_cloud.convex_hull_2d(np.vstack((inner, ring)))
+        self.assertEqual(len(hull), 200)
+        self.assertEqual({tuple(p) for p in np.round(hull, 9).tolist()}, {tuple(p) for p in np.round(ring, 9).tolist()})
+
+    def test_min_area_rectangle_finds_rotated_rectangle(self):
+        angle = math.radians(30.0)
+        rect = np.array([[-2.0, -0.5], [2.0, -0.5], [2.0, 0.5], [-2.0, 0.5]])
+        rot = np.array([[math.cos(angle), -math.sin(angle)], [math.sin(angle), math.cos(angle)]])
+        found, area = point_cloud.min_area_rectangle(point_cloud.convex_hull_2d(rect @ rot.T))
+        self.assertAlmostEqual(area, 4.0, places=9)
+        self.assertAlmostEqual(math.degrees(found) % 90.0, 30.0, places=6)
+
+    def test_min_volume_z_up_beats_axis_aligned_box(self):
+        points = _box_points((6.0, 2.0, 1.0), _rotation_z(math.radians(25.0)))
+        axes, volume = point_cloud.min_volume_axes(points, lock_z_up=True)
+        np.testing.assert_allclose(axes[:, 2], [0.0, 0.0, 1.0], atol=1e-12)
+        self.assertAlmostEqual(volume, 12.0, places=6)
+        low, high = point_cloud.oriented_bounds(points, axes)
+        np.testing.assert_allclose(high - low, [6.0, 2.0, 1.0], atol=1e-9)
+        world_low, world_high = point_cloud.oriented_bounds(points, np.identity(3))
+        self.assertLess(volume, float(np.prod(world_high - world_low)))
+
+    def test_min_volume_3d_matches_pca_box_for_tilted_box(self):
+        tilt = np.array([[1.0, 0.0, 0.0], [0.0, math.cos(0.4), -math.sin(0.4)], [0.0, math.sin(0.4), math.cos(0.4)]])
+        points = _box_points((5.0, 2.0, 1.0), np.asarray(_rotation_z(0.7)) @ tilt)
+        axes, volume = point_cloud.min_volume_axes(points)
+        self.assertAlmostEqual(float(np.linalg.det(axes)), 1.0, places=9)
+        low, high = point_cloud.oriented_bounds(points, axes)
+        np.testing.assert_allclose(high - low, [5.0, 2.0, 1.0], atol=1e-6)
+        self.assertAlmostEqual(volume, 10.0, places=5)
+
+    def test_moments_follow_transforms_and_combine(self):
+        rng = np.random.default_rng(3)
+        local = rng.uniform(-1.0, 1.0, size=(500, 3)) * [4.0, 1.0, 0.5]
+        other = rng.normal(size=(300, 3)) + [5.0, 0.0, 1.0]
+        matrix = np.identity(4)
+        matrix[:3, :3] = np.asarray(_rotation_z(0.6)) @ np.diag([2.0, 1.0, 0.5])
+        matrix[:3, 3] = [1.0, 2.0, 3.0]
+        world = point_cloud.transform_points(local, matrix)
+        moved = point_cloud.PointMoments.of(local).transformed(matrix)
+        combined = point_cloud.combine_moments([moved, point_cloud.PointMoments.of(other)])
+        centroid, cov = point_cloud.centroid_and_covariance(np.vstack((world, other)))
+        self.assertEqual(combined.count, 800)
+        np.testing.assert_allclose(combined.mean, centroid)
+        np.testing.assert_allclose(combined.covariance(), cov, atol=1e-9)
+        np.testing.assert_allclose(
+            point_cloud.axes_from_covariance(moved.covariance()), point_cloud.principal_axes(world), atol=1e-9
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import importlib.util
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "preview_budget.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.preview_budget",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+preview_budget = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+preview_budget.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.preview_budget"] = preview_budget
+SPEC.loader.exec_module(preview_budget)  # type: ignore[arg-type]
+
+
+class LruBudgetTests(unittest.TestCase):
+    def test_touch_evicts_least_recently_used(self):
+        budget = preview_budget.LruBudget(30)
+        budget.touch("a", 0.0, 10)
+        budget.touch("b", 1.0, 10)
+        budget.touch("c", 2.0, 10)
+        budget.touch("a", 3.0)
+        self.assertEqual(budget.touch("d", 4.0, 10), ["b"])
+        self.assertEqual(budget.keys(), ["c", "a", "d"])
+        self.assertEqual(budget.total, 30)
+
+    def test_oversized_entry_is_kept_alone(self):
+        budget = preview_budget.LruBudget(10)
+        budget.touch("a", 0.0, 5)
+        self.assertEqual(budget.touch("big", 1.0, 50), ["a"])
+        self.assertEqual(budget.keys(), ["big"])
+
+    def test_can_admit_respects_recently_used_entries(self):
+        budget = preview_budget.LruBudget(20)
+        budget.touch("a", 0.0, 10)
+        budget.touch("b", 5.0, 10)
+        self.assertTrue(budget.can_admit(10, now=5.5, min_idle=1.0))
+        self.assertFalse(budget.can_admit(20, now=5.5, min_idle=1.0))
+        self.assertFalse(budget.can_admit(10, now=0.5, min_idle=1.0))
+
+    def test_make_room_evicts_idle_entries_only(self):
+        budget = preview_budget.LruBudget(30)
+        for idx, key in enumerate("abc"):
+            budget.touch(key, float(idx), 10)
+        self.assertIsNone(budget.make_room(10, now=0.5, min_idle=1.0))
+        self.assertEqual(len(budget), 3)
+        self.assertEqual(budget.make_room(20, now=3.0, min_idle=1.0), ["a", "b"])
+        self.assertEqual(budget.keys(), ["c"])
+        self.assertEqual(budget.make_room(10, now=3.0), [])
+
+    def test_shrinking_budget_evicts(self):
+        budget = preview_budget.LruBudget(30)
+        for idx, key in enumerate("abc"):
+            budget.touch(key, float(idx), 10)
+        self.assertEqual(budget.set_budget(10), ["a", "b"])
+        budget.discard("c")
+        self.assertEqual(budget.total, 0)
+
+
+class ThumbnailHelperTests(unittest.TestCase):
+    def test_dimensions_keep_aspect_and_never_upscale(self):
+        self.assertEqual(preview_budget.thumbnail_dimensions(1920, 1080, 256), (256, 144))
+        self.assertEqual(preview_budget.thumbnail_dimensions(1080, 1920, 256), (144, 256))
+        self.assertEqual(preview_budget.thumbnail_dimensions(100, 50, 256), (100, 50))
+
+    def test_name_tracks_source_version(self):
+        first = preview_budget.thumbnail_name("/ai/outputs/a.png", 100.7)
+        self.assertEqual(first, preview_budget.thumbnail_name("/ai/outputs/a.png", 100.2))
+        self.assertNotEqual(first, preview_budget.thumbnail_name("/ai/outputs/a.png", 101.0))
+        self.assertNotEqual(first, preview_budget.thumbnail_name("/ai/outputs/b.png", 100.7))
+
+    def test_stale_thumbnails(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = pathlib.Path(tmp)
+            live = preview_budget.thumbnail_name("/a.png", 1.0)
+            (folder / live).write_bytes(b"")
+            (folder / "old_1_256.png").write_bytes(b"")
+            stale = preview_budget.stale_thumbnails(folder, {live})
+            self.assertEqual([p.name for p in stale], ["old_1_256.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
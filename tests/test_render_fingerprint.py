@@ -0,0 +1,178 @@
+import importlib.util
+import os
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "render_fingerprint.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.render_fingerprint",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+render_fingerprint = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+render_fingerprint.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.render_fingerprint"] = render_fingerprint
+SPEC.loader.exec_module(render_fingerprint)  # type: ignore[arg-type]
+
+
+class StableDigestTests(unittest.TestCase):
+    def test_key_order_and_float_noise_do_not_matter(self):
+        first = render_fingerprint.stable_digest({"a": 1.0000001, "b": [1, 2], "c": -0.0000001})
+        second = render_fingerprint.stable_digest({"c": 0.0, "b": (1, 2), "a": 1.0})
+        self.assertEqual(first, second)
+
+    def test_real_changes_change_digest(self):
+        base = {"frame": 10, "camera": {"lens": 50.0}}
+        self.assertNotEqual(
+            render_fingerprint.stable_digest(base),
+            render_fingerprint.stable_digest({"frame": 10, "camera": {"lens": 35.0}}),
+        )
+
+
+class FingerprintStoreTests(unittest.TestCase):
+    def test_current_only_while_fingerprint_and_output_match(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = pathlib.Path(tmp)
+            output = folder / "frame.png"
+            output.write_bytes(b"png")
+            store = render_fingerprint.FingerprintStore(folder / "fingerprints.json")
+            self.assertTrue(store.record("frame.png", "fp1", output))
+            store.save()
+
+            reloaded = render_fingerprint.FingerprintStore(folder / "fingerprints.json")
+            self.assertTrue(reloaded.is_current("frame.png", "fp1", output))
+            self.assertFalse(reloaded.is_current("frame.png", "fp2", output))
+
+            output.write_bytes(b"changed png")
+            self.assertFalse(reloaded.is_current("frame.png", "fp1", output))
+
+            output.unlink()
+            self.assertFalse(reloaded.is_current("frame.png", "fp1", output))
+
+    def test_record_missing_output_forgets_key(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = pathlib.Path(tmp)
+            output = folder / "frame.png"
+            output.write_bytes(b"png")
+            store = render_fingerprint.FingerprintStore(folder / "fingerprints.json")
+            store.record("frame.png", "fp1", output)
+            os.remove(output)
+            self.assertFalse(store.record("frame.png", "fp1", output))
+            self.assertEqual(len(store), 0)
+
+
+if "lime_pipeline.scene" not in sys.modules:
+    scene_package = types.ModuleType("lime_pipeline.scene")
+    scene_package.__path__ = [str(LIME_ROOT / "scene")]
+    sys.modules["lime_pipeline.scene"] = scene_package
+
+STATE_SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.scene.render_state",
+    LIME_ROOT / "scene" / "render_state.py",
+    submodule_search_locations=[str(LIME_ROOT / "scene")],
+)
+render_state = importlib.util.module_from_spec(STATE_SPEC)
+assert STATE_SPEC.loader is not None
+render_state.__package__ = "lime_pipeline.scene"
+sys.modules["lime_pipeline.scene.render_state"] = render_state
+STATE_SPEC.loader.exec_module(render_state)  # type: ignore[arg-type]
+
+
+class _Collection(list):
+    def foreach_get(self, attr, out):
+        values = [v for item in self for v in (getattr(item, attr) if attr == "co" else [getattr(item, attr)])]
+        out[:] = type(out)(out.typecode, values)
+
+
+class _Item:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+class _Mesh:
+    def __init__(self, coords):
+        self.vertices = _Collection(_Item(co=list(co)) for co in coords)
+        self.loops = _Collection(_Item(vertex_index=i) for i in range(len(coords)))
+        self.polygons = _Collection([_Item(loop_total=len(coords), material_index=0)])
+
+
+class _Object:
+    def __init__(self, obj_type, evaluated_coords=None):
+        self.type = obj_type
+        self.name = obj_type.title()
+        self.evaluated_coords = evaluated_coords
+        self.material_slots = []
+
+    def as_pointer(self):
+        return id(self)
+
+    def evaluated_get(self, _depsgraph):
+        return self
+
+    def to_mesh(self):
+        return _Mesh(self.evaluated_coords) if self.evaluated_coords is not None else None
+
+    def to_mesh_clear(self):
+        pass
+
+
+class _Property:
+    def __init__(self, identifier, prop_type="FLOAT"):
+        self.identifier = identifier
+        self.type = prop_type
+
+
+class _Light:
+    def __init__(self, energy):
+        self.name = "Key"
+        self.energy = energy
+        self.color = (1.0, 1.0, 1.0)
+        self.use_nodes = False
+        self.bl_rna = _Item(properties=[_Property("rna_type", "POINTER"), _Property("energy"), _Property("color")])
+
+
+class ContentStateTests(unittest.TestCase):
+    def test_evaluated_geometry_is_digested(self):
+        extra = render_state.content_extra()
+        rest = _Object("MESH", [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)])
+        posed = _Object("MESH", [(0.0, 0.0, 0.0), (1.0, 0.0, 0.5), (0.0, 1.0, 0.0)])
+        curve = _Object("CURVE", [(0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (0.0, 1.0, 0.0)])
+        self.assertNotEqual(extra(rest)["data_digest"], extra(posed)["data_digest"])
+        self.assertIsNotNone(extra(curve)["data_digest"])
+        self.assertNotIn("undigested", extra(rest))
+
+    def test_undigestable_data_never_matches(self):
+        extra = render_state.content_extra()
+        volume = _Object("VOLUME")
+        self.assertNotEqual(extra(volume)["undigested"], extra(volume)["undigested"])
+        self.assertNotIn("undigested", extra(_Object("EMPTY")))
+
+    def test_light_settings_change_state(self):
+        self.assertEqual(render_state.rna_state(_Light(100.0)), {"energy": 100.0, "color": [1.0, 1.0, 1.0]})
+        self.assertNotEqual(
+            render_fingerprint.stable_digest(render_state._data_with_nodes_state(_Light(100.0))),
+            render_fingerprint.stable_digest(render_state._data_with_nodes_state(_Light(250.0))),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
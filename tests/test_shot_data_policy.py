@@ -0,0 +1,75 @@
+import importlib.util
+import pathlib
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "shot_data_policy.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.shot_data_policy",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+shot_data_policy = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+shot_data_policy.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.shot_data_policy"] = shot_data_policy
+SPEC.loader.exec_module(shot_data_policy)  # type: ignore[arg-type]
+
+
+class ShotDataPolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.policy = shot_data_policy.ShotDataPolicy()
+
+    def test_static_geometry_is_linked(self):
+        for obj_type in ("MESH", "CURVE", "FONT"):
+            self.assertEqual(self.policy.data_action(obj_type), shot_data_policy.LINK)
+
+    def test_cameras_lights_and_rigs_are_copied(self):
+        for obj_type in ("CAMERA", "LIGHT", "ARMATURE"):
+            self.assertEqual(self.policy.data_action(obj_type), shot_data_policy.COPY)
+
+    def test_animated_data_is_copied(self):
+        self.assertEqual(self.policy.data_action("MESH", animated=True), shot_data_policy.COPY)
+
+    def test_unknown_types_are_copied(self):
+        self.assertEqual(self.policy.data_action("VOLUME"), shot_data_policy.COPY)
+
+    def test_override_wins(self):
+        self.assertEqual(self.policy.data_action("MESH", override="copy"), shot_data_policy.COPY)
+        self.assertEqual(self.policy.data_action("CAMERA", override="LINK"), shot_data_policy.LINK)
+        self.assertEqual(self.policy.data_action("MESH", override="bogus"), shot_data_policy.LINK)
+
+    def test_full_mode_copies_everything(self):
+        policy = shot_data_policy.ShotDataPolicy.from_settings("FULL")
+        self.assertEqual(policy.data_action("MESH"), shot_data_policy.COPY)
+        self.assertEqual(policy.data_action("MESH", override="LINK"), shot_data_policy.LINK)
+
+    def test_from_settings_parses_link_types(self):
+        policy = shot_data_policy.ShotDataPolicy.from_settings("shared", "mesh; font")
+        self.assertEqual(policy.link_types, frozenset({"MESH", "FONT"}))
+        self.assertEqual(policy.data_action("CURVE"), shot_data_policy.COPY)
+        self.assertEqual(shot_data_policy.ShotDataPolicy.from_settings("odd", " ").mode, shot_data_policy.MODE_SHARED)
+
+    def test_first_override_takes_nearest_valid_value(self):
+        self.assertEqual(shot_data_policy.first_override([None, 3, "link", "COPY"]), shot_data_policy.LINK)
+        self.assertIsNone(shot_data_policy.first_override([None, ""]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import importlib.util
+import pathlib
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "shot_index_registry.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.shot_index_registry",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+shot_index_registry = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+shot_index_registry.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.shot_index_registry"] = shot_index_registry
+SPEC.loader.exec_module(shot_index_registry)  # type: ignore[arg-type]
+
+
+class ClassifyNameTests(unittest.TestCase):
+    def test_kinds(self):
+        info = shot_index_registry.classify_name("SHOT 12")
+        self.assertEqual((info.shot, info.loose, info.prefixed), (12, 12, None))
+        info = shot_index_registry.classify_name("shot 7.001")
+        self.assertEqual((info.shot, info.loose), (None, 7))
+        self.assertEqual(shot_index_registry.classify_name("SH123_00_CAM").prefixed, 123)
+        self.assertIsNone(shot_index_registry.classify_name("Props").prefixed)
+
+
+class ShotIndexRegistryTests(unittest.TestCase):
+    def test_max_and_next_follow_adds_renames_and_removals(self):
+        reg = shot_index_registry.ShotIndexRegistry()
+        self.assertEqual(reg.next_shot_index(), 1)
+        reg.sync_collections([(1, "SHOT 01"), (2, "SHOT 04"), (3, "SH04_00_CAM")])
+        self.assertEqual(reg.next_shot_index(), 5)
+        self.assertTrue(reg.set_collection(2, "SHOT 09"))
+        self.assertEqual(reg.max_shot_index(), 9)
+        reg.remove_collection(2)
+        self.assertEqual(reg.max_shot_index(), 1)
+        self.assertEqual(reg.max_any_index(), 4)
+
+    def test_sync_reports_only_changes(self):
+        reg = shot_index_registry.ShotIndexRegistry()
+        self.assertEqual(reg.sync_collections([(1, "SHOT 01"), (2, "A")]), 2)
+        self.assertEqual(reg.sync_collections([(1, "SHOT 01"), (2, "A")]), 0)
+        self.assertEqual(reg.sync_collections([(1, "SHOT 02")]), 2)
+        self.assertEqual(reg.max_shot_index(), 2)
+        self.assertEqual(len(reg), 1)
+
+    def test_duplicate_names_are_counted(self):
+        reg = shot_index_registry.ShotIndexRegistry()
+        reg.sync_collections([(1, "SHOT 03"), (2, "SHOT 03")])
+        reg.remove_collection(1)
+        self.assertEqual(reg.max_shot_index(), 3)
+
+    def test_scene_names(self):
+        reg = shot_index_registry.ShotIndexRegistry()
+        reg.sync_scenes([(10, "Shot 15"), (11, "Layout")])
+        self.assertEqual(reg.max_any_index(), 15)
+        self.assertEqual(reg.max_shot_index(), 0)
+        self.assertTrue(reg.set_scene(11, "Shot 20"))
+        self.assertFalse(reg.set_scene(11, "Shot 20"))
+        self.assertEqual(reg.max_any_index(), 20)
+        self.assertEqual(reg.sync_scenes([(10, "Shot 15")]), 1)
+        self.assertEqual(reg.max_any_index(), 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
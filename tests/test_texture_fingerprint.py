@@ -0,0 +1,98 @@
+import importlib.util
+import os
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "texture_fingerprint.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.texture_fingerprint",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+texture_fingerprint = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+texture_fingerprint.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.texture_fingerprint"] = texture_fingerprint
+SPEC.loader.exec_module(texture_fingerprint)  # type: ignore[arg-type]
+
+
+file_stat_signature = texture_fingerprint.file_stat_signature
+usage_signature = texture_fingerprint.usage_signature
+make_fingerprint = texture_fingerprint.texture_fingerprint
+
+
+def _usage(material, map_type="BaseColor", sockets=("Base Color",)):
+    return types.SimpleNamespace(
+        material_name=material,
+        map_type=map_type,
+        material_is_linked=False,
+        socket_targets=sockets,
+    )
+
+
+def _fp(**overrides):
+    values = {
+        "image_name": "wood",
+        "image_source": "FILE",
+        "raw_filepath": "//wood.png",
+        "abs_filepath": "/p/wood.png",
+        "stat_signature": "10:1",
+        "usage_sig": "abc",
+        "context_signature": "ctx",
+    }
+    values.update(overrides)
+    return make_fingerprint(**values)
+
+
+class TextureFingerprintTests(unittest.TestCase):
+    def test_stat_signature_tracks_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "tex.png"
+            self.assertEqual(file_stat_signature(path), "missing")
+            path.write_bytes(b"abc")
+            first = file_stat_signature(path)
+            path.write_bytes(b"abcdef")
+            os.utime(path, ns=(1, 1))
+            self.assertNotEqual(first, file_stat_signature(path))
+
+    def test_stat_signature_probes_first_udim_tile(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            (pathlib.Path(tmp) / "skin.1001.png").write_bytes(b"x")
+            self.assertNotEqual(file_stat_signature(pathlib.Path(tmp) / "skin.<UDIM>.png"), "missing")
+
+    def test_usage_signature_is_order_independent(self):
+        a = [_usage("MAT_A"), _usage("MAT_B")]
+        b = [_usage("MAT_B"), _usage("MAT_A")]
+        self.assertEqual(usage_signature(a), usage_signature(b))
+        self.assertNotEqual(usage_signature(a), usage_signature([_usage("MAT_A", "Normal"), _usage("MAT_B")]))
+
+    def test_fingerprint_changes_with_any_input(self):
+        base = _fp()
+        self.assertEqual(base, _fp())
+        self.assertNotEqual(base, _fp(stat_signature="11:1"))
+        self.assertNotEqual(base, _fp(raw_filepath="//other.png"))
+        self.assertNotEqual(base, _fp(usage_sig="def"))
+        self.assertNotEqual(base, _fp(context_signature="other"))
+        self.assertNotEqual(base, _fp(flags=("packed",)))
+
+
+if __name__ == "__main__":
+    unittest.main()
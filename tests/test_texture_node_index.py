@@ -0,0 +1,104 @@
+import importlib.util
+import pathlib
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "texture_node_index.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.texture_node_index",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+texture_node_index = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+texture_node_index.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.texture_node_index"] = texture_node_index
+SPEC.loader.exec_module(texture_node_index)  # type: ignore[arg-type]
+
+
+TextureNodeGraphIndex = texture_node_index.TextureNodeGraphIndex
+
+
+def _ns(**kwargs):
+    return types.SimpleNamespace(**kwargs)
+
+
+def _tex_node(name, image, socket_names=()):
+    links = [_ns(to_socket=_ns(name=s), to_node=_ns(type="BSDF_PRINCIPLED", name="Principled BSDF")) for s in socket_names]
+    return _ns(type="TEX_IMAGE", name=name, label="", image=image, outputs=[_ns(name="Color", links=links)])
+
+
+def _group_node(tree):
+    return _ns(type="GROUP", node_tree=tree)
+
+
+class TextureNodeGraphIndexTests(unittest.TestCase):
+    def test_shared_group_is_walked_once(self):
+        image = _ns(name="wood.png", filepath="//wood.png")
+        shared = _ns(nodes=[_tex_node("Wood", image, ["Base Color"])])
+        mat_trees = [_ns(nodes=[_group_node(shared)]) for _ in range(50)]
+
+        index = TextureNodeGraphIndex()
+        for tree in mat_trees:
+            entries = index.image_entries(tree)
+            self.assertEqual(len(entries), 1)
+            self.assertIs(entries[0].image, image)
+        self.assertEqual(index.trees_walked, 51)
+
+    def test_entries_preserve_walk_order_and_dedupe_groups(self):
+        img_a = _ns(name="a.png", filepath="")
+        img_b = _ns(name="b.png", filepath="")
+        img_c = _ns(name="c.png", filepath="")
+        inner = _ns(nodes=[_tex_node("B", img_b)])
+        tree = _ns(
+            nodes=[
+                _tex_node("A", img_a),
+                _group_node(inner),
+                _ns(type="TEX_IMAGE", name="Empty", label="", image=None, outputs=[]),
+                _group_node(inner),
+                _tex_node("C", img_c),
+            ]
+        )
+        names = [e.node_name for e in TextureNodeGraphIndex().image_entries(tree)]
+        self.assertEqual(names, ["A", "B", "C"])
+
+    def test_recursive_groups_terminate(self):
+        img = _ns(name="n.png", filepath="")
+        loop = _ns(nodes=[])
+        loop.nodes = [_tex_node("N", img), _group_node(loop)]
+        entries = TextureNodeGraphIndex().image_entries(_ns(nodes=[_group_node(loop)]))
+        self.assertEqual([e.node_name for e in entries], ["N"])
+
+    def test_socket_targets_and_map_type(self):
+        img = _ns(name="tex.png", filepath="")
+        node = _tex_node("Tex", img, ["Roughness", "roughness ", ""])
+        entry = TextureNodeGraphIndex().image_entries(_ns(nodes=[node]))[0]
+        self.assertEqual(entry.socket_targets, ("Roughness",))
+        self.assertEqual(entry.map_type_for("MAT_Any"), "Roughness")
+
+    def test_map_type_falls_back_to_material_text(self):
+        img = _ns(name="tex.png", filepath="")
+        node = _ns(type="TEX_IMAGE", name="Tex", label="", image=img, outputs=[])
+        entry = TextureNodeGraphIndex().image_entries(_ns(nodes=[node]))[0]
+        self.assertEqual(entry.map_type_for("MAT_Normal_Detail"), "Normal")
+        self.assertEqual(entry.map_type_for("MAT_Plain"), "Generic")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import importlib.util
+import pathlib
+import tempfile
+import types
+import sys
+import unittest
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LIME_ROOT = REPO_ROOT / "lime_pipeline"
+
+if "lime_pipeline" not in sys.modules:
+    package = types.ModuleType("lime_pipeline")
+    package.__path__ = [str(LIME_ROOT)]
+    sys.modules["lime_pipeline"] = package
+
+if "lime_pipeline.core" not in sys.modules:
+    core_package = types.ModuleType("lime_pipeline.core")
+    core_package.__path__ = [str(LIME_ROOT / "core")]
+    sys.modules["lime_pipeline.core"] = core_package
+
+
+MODULE_PATH = LIME_ROOT / "core" / "udim_tiles.py"
+SPEC = importlib.util.spec_from_file_location(
+    "lime_pipeline.core.udim_tiles",
+    MODULE_PATH,
+    submodule_search_locations=[str(LIME_ROOT / "core")],
+)
+udim_tiles = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+udim_tiles.__package__ = "lime_pipeline.core"
+sys.modules["lime_pipeline.core.udim_tiles"] = udim_tiles
+SPEC.loader.exec_module(udim_tiles)  # type: ignore[arg-type]
+
+
+def _write_tiles(root: pathlib.Path, name: str, numbers, payload=b"tile") -> pathlib.Path:
+    for number in numbers:
+        (root / name.replace("<UDIM>", str(number))).write_bytes(payload + str(number).encode())
+    return root / name
+
+
+class UdimTilesTests(unittest.TestCase):
+    def test_enumerate_matches_only_template_tiles(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            template = _write_tiles(root, "Skin.<UDIM>.png", [1003, 1001, 1002])
+            (root / "Skin.1001.jpg").write_bytes(b"x")
+            (root / "Skin.0999.png").write_bytes(b"x")
+            (root / "Other.1001.png").write_bytes(b"x")
+            tiles = udim_tiles.enumerate_udim_tiles(template)
+            self.assertEqual([t.number for t in tiles], [1001, 1002, 1003])
+
+    def test_combined_digest_is_order_independent_and_content_sensitive(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            template = _write_tiles(root, "A.<UDIM>.png", range(1001, 1011))
+            tiles = udim_tiles.enumerate_udim_tiles(template)
+            progress = []
+            digests = udim_tiles.hash_udim_tiles(tiles, max_workers=4, progress=lambda d, t: progress.append((d, t)))
+            self.assertEqual(len(digests), 10)
+            self.assertEqual(progress[-1], (10, 10))
+            forward = udim_tiles.combined_udim_digest(digests)
+            self.assertEqual(forward, udim_tiles.combined_udim_digest(list(reversed(digests))))
+            (root / "A.1005.png").write_bytes(b"changed")
+            changed = udim_tiles.hash_udim_tiles(udim_tiles.enumerate_udim_tiles(template))
+            self.assertNotEqual(forward, udim_tiles.combined_udim_digest(changed))
+
+    def test_copy_and_unique_destination(self):
+        with tempfile.TemporaryDirectory() as src_tmp, tempfile.TemporaryDirectory() as dst_tmp:
+            src = _write_tiles(pathlib.Path(src_tmp), "Body.<UDIM>.exr", [1001, 1002])
+            dest_root = pathlib.Path(dst_tmp)
+            tiles = udim_tiles.enumerate_udim_tiles(src)
+            digests = udim_tiles.hash_udim_tiles(tiles)
+
+            first = udim_tiles.unique_udim_destination(dest_root, "Proj_Body", ".exr", [1001, 1002])
+            self.assertEqual(first.name, "Proj_Body.<UDIM>.exr")
+            copied = udim_tiles.copy_udim_tiles(tiles, first)
+            self.assertEqual(sorted(copied), [1001, 1002])
+            self.assertTrue(udim_tiles.udim_tile_set_exists(first, digests))
+
+            second = udim_tiles.unique_udim_destination(dest_root, "Proj_Body", ".exr", [1002])
+            self.assertEqual(second.name, "Proj_Body_02.<UDIM>.exr")
+
+    def test_failed_copy_removes_copied_tiles(self):
+        with tempfile.TemporaryDirectory() as src_tmp, tempfile.TemporaryDirectory() as dst_tmp:
+            src = _write_tiles(pathlib.Path(src_tmp), "Body.<UDIM>.exr", [1001, 1002, 1003])
+            tiles = udim_tiles.enumerate_udim_tiles(src)
+            tiles[1].path.unlink()
+            dest = pathlib.Path(dst_tmp) / "Proj_Body.<UDIM>.exr"
+            with self.assertRaises(OSError):
+                udim_tiles.copy_udim_tiles(tiles, dest, max_workers=2)
+            self.assertEqual(list(pathlib.Path(dst_tmp).iterdir()), [])
+
+    def test_source_stem_strips_token(self):
+        self.assertEqual(udim_tiles.udim_source_stem("Skin_BaseColor.<UDIM>.png"), "Skin_BaseColor")
+        self.assertEqual(udim_tiles.udim_source_stem("Skin_<UDIM>.tif"), "Skin")
+
+
+if __name__ == "__main__":
+    unittest.main()
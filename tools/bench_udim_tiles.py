@@ -0,0 +1,99 @@
+"""Benchmark UDIM tile set hashing/copying (sequential vs concurrent).
+
+Builds a synthetic tile set (default: 100 tiles x 4 MiB) in a temporary folder
+and times `core.udim_tiles` with one worker versus the default worker count.
+Runs with plain Python; Blender is not required.
+
+Usage:
+    python tools/bench_udim_tiles.py [--tiles 100] [--tile-mib 4] [--workers 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+LIME_ROOT = ROOT / "lime_pipeline"
+
+
+def _load_udim_tiles():
+    if "lime_pipeline" not in sys.modules:
+        package = types.ModuleType("lime_pipeline")
+        package.__path__ = [str(LIME_ROOT)]
+        sys.modules["lime_pipeline"] = package
+    if "lime_pipeline.core" not in sys.modules:
+        core_package = types.ModuleType("lime_pipeline.core")
+        core_package.__path__ = [str(LIME_ROOT / "core")]
+        sys.modules["lime_pipeline.core"] = core_package
+    spec = importlib.util.spec_from_file_location("lime_pipeline.core.udim_tiles", LIME_ROOT / "core" / "udim_tiles.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    module.__package__ = "lime_pipeline.core"
+    sys.modules["lime_pipeline.core.udim_tiles"] = module
+    spec.loader.exec_module(module)  # type: ignore[arg-type]
+    return module
+
+
+def _write_tiles(root: Path, count: int, tile_bytes: int) -> Path:
+    template = root / "Synthetic_BaseColor.<UDIM>.exr"
+    for idx in range(count):
+        number = 1001 + idx
+        (root / f"Synthetic_BaseColor.{number}.exr").write_bytes(os.urandom(tile_bytes))
+    return template
+
+
+def _run(udim, template: Path, dest_root: Path, workers: int) -> tuple[float, float, float, str]:
+    t0 = time.perf_counter()
+    tiles = udim.enumerate_udim_tiles(template)
+    t1 = time.perf_counter()
+    digests = udim.hash_udim_tiles(tiles, max_workers=workers)
+    digest = udim.combined_udim_digest(digests)
+    t2 = time.perf_counter()
+    dest = udim.unique_udim_destination(dest_root, "Bench", ".exr", [t.number for t in tiles])
+    udim.copy_udim_tiles(tiles, dest, max_workers=workers)
+    t3 = time.perf_counter()
+    return t1 - t0, t2 - t1, t3 - t2, digest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tiles", type=int, default=100)
+    parser.add_argument("--tile-mib", type=float, default=4.0)
+    parser.add_argument("--workers", type=int, default=0, help="0 uses core.udim_tiles.DEFAULT_TILE_WORKERS")
+    args = parser.parse_args()
+
+    udim = _load_udim_tiles()
+    workers = args.workers or udim.DEFAULT_TILE_WORKERS
+    tile_bytes = int(args.tile_mib * 1024 * 1024)
+
+    with tempfile.TemporaryDirectory(prefix="lime_udim_bench_") as tmp:
+        src_root = Path(tmp) / "src"
+        src_root.mkdir()
+        template = _write_tiles(src_root, args.tiles, tile_bytes)
+        print(f"Tile set: {args.tiles} tiles x {args.tile_mib:g} MiB")
+
+        results = {}
+        for label, count in (("sequential", 1), (f"parallel x{workers}", workers)):
+            dest_root = Path(tmp) / f"dest_{count}"
+            dest_root.mkdir()
+            scan_s, hash_s, copy_s, digest = _run(udim, template, dest_root, count)
+            results[label] = digest
+            print(f"{label:>14}: scan {scan_s * 1000:7.1f} ms | hash {hash_s:6.3f} s | copy {copy_s:6.3f} s")
+
+        if len(set(results.values())) != 1:
+            print("ERROR: combined digests differ between runs")
+            return 1
+        print(f"Combined digest: {next(iter(results.values()))}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())